@@ -1,13 +1,37 @@
 """HTTP client for DuckDB Storage API."""
 
-from typing import Any, BinaryIO
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Callable, Iterator
 from pathlib import Path
+import hashlib
 import json
+import os
+import threading
+import time
 
 import httpx
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, DownloadColumn
+from rich.progress import (
+    Progress,
+    SpinnerColumn,
+    TextColumn,
+    BarColumn,
+    DownloadColumn,
+    TransferSpeedColumn,
+    TimeRemainingColumn,
+)
 
-from .config import CLIConfig, get_config
+from .config import CONFIG_DIR, CLIConfig, get_config
+
+
+# Files larger than one chunk are transferred as parallel chunks
+DEFAULT_CHUNK_SIZE = 32 * 1024 * 1024
+DEFAULT_PARALLEL = 4
+TRANSFER_RETRIES = 3
+TRANSFER_TIMEOUT = httpx.Timeout(60.0, read=600.0, write=600.0)
+
+# Upload keys of interrupted chunked uploads, so a rerun can resume them
+TRANSFER_STATE_DIR = CONFIG_DIR / "transfers"
 
 
 class APIError(Exception):
@@ -23,9 +47,17 @@ class APIError(Exception):
 class DuckDBClient:
     """HTTP client for DuckDB Storage API."""
 
-    def __init__(self, config: CLIConfig | None = None, verbose: bool = False):
+    def __init__(
+        self,
+        config: CLIConfig | None = None,
+        verbose: bool = False,
+        parallel: int = DEFAULT_PARALLEL,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
         self.config = config or get_config()
         self.verbose = verbose
+        self.parallel = max(1, parallel)
+        self.chunk_size = chunk_size
         self._client: httpx.Client | None = None
 
     @property
@@ -34,11 +66,11 @@ class DuckDBClient:
         if self._client is None:
             self._client = httpx.Client(
                 base_url=self.config.url,
-                headers={
-                    "Authorization": f"Bearer {self.config.api_key}",
-                    "Content-Type": "application/json",
-                },
+                # No default Content-Type: httpx sets it per request (json=, files=, content=)
+                headers={"Authorization": f"Bearer {self.config.api_key}"},
                 timeout=60.0,
+                # One connection per parallel transfer worker
+                limits=httpx.Limits(max_connections=max(self.parallel, 10)),
             )
         return self._client
 
@@ -104,6 +136,52 @@ class DuckDBClient:
         response = self.client.delete(path)
         return self._handle_response(response)
 
+    @contextmanager
+    def _progress(
+        self, description: str, total: int | None, show: bool
+    ) -> Iterator[Callable[[int], None]]:
+        """Show a progress bar with throughput; yields a thread-safe advance(n)."""
+        if not show:
+            yield lambda n: None
+            return
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            DownloadColumn(),
+            TransferSpeedColumn(),
+            TimeRemainingColumn(),
+        ) as progress:
+            task = progress.add_task(description, total=total)
+            yield lambda n: progress.update(task, advance=n)
+
+    def _send_with_retry(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """Send one chunk request, retrying network errors and 5xx responses."""
+        for attempt in range(TRANSFER_RETRIES + 1):
+            try:
+                response = self.client.request(method, path, timeout=TRANSFER_TIMEOUT, **kwargs)
+            except httpx.TransportError:
+                if attempt == TRANSFER_RETRIES:
+                    raise
+            else:
+                if response.status_code < 500 or attempt == TRANSFER_RETRIES:
+                    return response
+            time.sleep(min(2 ** attempt, 10))
+        raise AssertionError("unreachable")
+
+    def _run_parallel(self, func: Callable[..., None], jobs: list[tuple]) -> None:
+        """Run func(*job) for all jobs on the pooled client; re-raise the first failure."""
+        with ThreadPoolExecutor(max_workers=self.parallel) as pool:
+            futures = [pool.submit(func, *job) for job in jobs]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
     def upload_file(
         self,
         path: str,
@@ -111,7 +189,7 @@ class DuckDBClient:
         filename: str,
         show_progress: bool = True
     ) -> dict[str, Any]:
-        """Upload a file using multipart form data."""
+        """Upload a file using multipart form data (single request)."""
         if self.verbose:
             print(f"POST {path} (file upload)")
 
@@ -120,27 +198,12 @@ class DuckDBClient:
         file_size = file.tell()
         file.seek(0)
 
-        # Build full URL
-        full_url = f"{self.config.url}{path}"
-
-        # For multipart uploads, use a fresh request to avoid header conflicts
         files = {"file": (filename, file)}
-        headers = {"Authorization": f"Bearer {self.config.api_key}"}
-
-        if show_progress and file_size > 1024 * 1024:  # Show progress for files > 1MB
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                DownloadColumn(),
-            ) as progress:
-                task = progress.add_task(f"Uploading {filename}", total=file_size)
-
-                # Upload with progress tracking
-                response = httpx.post(full_url, files=files, headers=headers, timeout=60.0)
-                progress.update(task, completed=file_size)
-        else:
-            response = httpx.post(full_url, files=files, headers=headers, timeout=60.0)
+
+        # Show progress for files > 1MB
+        with self._progress(f"Uploading {filename}", file_size, show_progress and file_size > 1024 * 1024) as advance:
+            response = self.client.post(path, files=files, timeout=TRANSFER_TIMEOUT)
+            advance(file_size)
 
         return self._handle_response(response)
 
@@ -150,42 +213,101 @@ class DuckDBClient:
         output_path: Path,
         show_progress: bool = True
     ) -> None:
-        """Download a file to local path."""
+        """Download a file to local path.
+
+        Files larger than one chunk are fetched as parallel Range requests
+        into "<output>.part"; an interrupted download resumes from the
+        chunks already written as long as the file's ETag is unchanged.
+        """
         if self.verbose:
             print(f"GET {path} (file download)")
 
-        with self.client.stream("GET", path) as response:
+        headers = {"Range": f"bytes=0-{self.chunk_size - 1}"}
+        with self.client.stream("GET", path, headers=headers, timeout=TRANSFER_TIMEOUT) as response:
+            if response.status_code == 416:
+                # Nothing to read at offset 0: the file is empty
+                output_path.write_bytes(b"")
+                return
             if response.status_code >= 400:
-                # Read error body
-                error_body = b""
-                for chunk in response.iter_bytes():
-                    error_body += chunk
-                try:
-                    error_data = json.loads(error_body.decode())
-                    message = error_data.get("message", error_data.get("detail", "Download failed"))
-                except Exception:
-                    message = error_body.decode() or f"HTTP {response.status_code}"
-                raise APIError(response.status_code, message)
-
-            total = int(response.headers.get("content-length", 0))
-
-            if show_progress and total > 1024 * 1024:  # Show progress for files > 1MB
-                with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    BarColumn(),
-                    DownloadColumn(),
-                ) as progress:
-                    task = progress.add_task(f"Downloading to {output_path.name}", total=total or None)
+                self._raise_stream_error(response, "Download failed")
 
+            if response.status_code != 206:
+                # Server sent the whole file
+                total = int(response.headers.get("content-length", 0))
+                with self._progress(f"Downloading to {output_path.name}", total or None, show_progress and total > 1024 * 1024) as advance:
                     with open(output_path, "wb") as f:
-                        for chunk in response.iter_bytes(chunk_size=8192):
+                        for chunk in response.iter_bytes(chunk_size=1024 * 1024):
                             f.write(chunk)
-                            progress.update(task, advance=len(chunk))
-            else:
-                with open(output_path, "wb") as f:
-                    for chunk in response.iter_bytes(chunk_size=8192):
-                        f.write(chunk)
+                            advance(len(chunk))
+                return
+
+            total = int(response.headers["content-range"].rsplit("/", 1)[1])
+            etag = response.headers.get("etag")
+            first_chunk = response.read()
+
+        if total <= self.chunk_size:
+            output_path.write_bytes(first_chunk)
+            return
+
+        part_path = output_path.with_name(output_path.name + ".part")
+        state_path = output_path.with_name(output_path.name + ".part.json")
+        state = {"path": path, "etag": etag, "size": total, "chunk_size": self.chunk_size, "done": []}
+        done: set[int] = set()
+        if etag and part_path.exists() and state_path.exists():
+            saved = json.loads(state_path.read_text())
+            if all(saved.get(k) == state[k] for k in ("path", "etag", "size", "chunk_size")):
+                done = set(saved["done"])
+        if not done:
+            with open(part_path, "wb") as f:
+                f.truncate(total)
+
+        state_lock = threading.Lock()
+
+        def mark_done(offset: int) -> None:
+            with state_lock:
+                done.add(offset)
+                state_path.write_text(json.dumps({**state, "done": sorted(done)}))
+
+        def fetch(offset: int, advance: Callable[[int], None]) -> None:
+            end = min(offset + self.chunk_size, total) - 1
+            range_headers = {"Range": f"bytes={offset}-{end}"}
+            if etag:
+                range_headers["If-Match"] = etag
+            response = self._send_with_retry("GET", path, headers=range_headers)
+            if response.status_code == 412:
+                raise APIError(412, "File changed on the server during download; run the download again")
+            if response.status_code != 206:
+                self._handle_response(response)
+                raise APIError(response.status_code, "Server did not return the requested range")
+            with open(part_path, "r+b") as f:
+                f.seek(offset)
+                f.write(response.content)
+            mark_done(offset)
+            advance(len(response.content))
+
+        with self._progress(f"Downloading to {output_path.name}", total, show_progress) as advance:
+            if 0 not in done:
+                with open(part_path, "r+b") as f:
+                    f.write(first_chunk)
+                mark_done(0)
+            advance(sum(min(self.chunk_size, total - o) for o in done))
+
+            pending = [o for o in range(0, total, self.chunk_size) if o not in done]
+            self._run_parallel(fetch, [(offset, advance) for offset in pending])
+
+        os.replace(part_path, output_path)
+        state_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _raise_stream_error(response: httpx.Response, default_message: str) -> None:
+        """Raise APIError for a failed streaming response."""
+        error_body = response.read()
+        try:
+            error_data = json.loads(error_body.decode())
+            message = error_data.get("message", error_data.get("detail", default_message))
+        except Exception:
+            message = error_body.decode() or f"HTTP {response.status_code}"
+        raise APIError(response.status_code, message)
 
     # High-level file operations
 
@@ -197,8 +319,15 @@ class DuckDBClient:
     ) -> dict[str, Any]:
         """Upload a file using the 3-stage workflow.
 
+        Files larger than one chunk are uploaded as parallel chunks; if the
+        upload is interrupted, running it again sends only the missing chunks.
+
         Returns the registered file info including file ID.
         """
+        file_size = file_path.stat().st_size
+        if file_size > self.chunk_size:
+            return self._upload_chunked(project_id, file_path, file_size, show_progress)
+
         filename = file_path.name
         content_type = self._guess_content_type(filename)
 
@@ -226,6 +355,85 @@ class DuckDBClient:
 
         return file_info
 
+    def _upload_state_path(self, project_id: str, file_path: Path, file_size: int) -> Path:
+        """Local file remembering the upload key of an interrupted chunked upload."""
+        stat = file_path.stat()
+        identity = f"{self.config.url}|{project_id}|{file_path.resolve()}|{file_size}|{stat.st_mtime_ns}|{self.chunk_size}"
+        return TRANSFER_STATE_DIR / f"{hashlib.sha256(identity.encode()).hexdigest()[:32]}.json"
+
+    def _upload_chunked(
+        self,
+        project_id: str,
+        file_path: Path,
+        file_size: int,
+        show_progress: bool,
+    ) -> dict[str, Any]:
+        """Upload a large file as parallel chunks (resumable)."""
+        filename = file_path.name
+        state_path = self._upload_state_path(project_id, file_path, file_size)
+
+        # Resume a previous attempt if the server still has its session
+        upload_key = None
+        received: dict[int, dict[str, Any]] = {}
+        if state_path.exists():
+            saved_key = json.loads(state_path.read_text())["upload_key"]
+            try:
+                status = self.get(f"/projects/{project_id}/files/upload/{saved_key}")
+                upload_key = saved_key
+                received = {chunk["offset"]: chunk for chunk in status["chunks"]}
+            except APIError as e:
+                if e.status_code not in (404, 410):
+                    raise
+
+        if upload_key is None:
+            prepare_response = self.post(
+                f"/projects/{project_id}/files/prepare",
+                {
+                    "filename": filename,
+                    "content_type": self._guess_content_type(filename),
+                    "size_bytes": file_size,
+                },
+            )
+            upload_key = prepare_response["upload_key"]
+            TRANSFER_STATE_DIR.mkdir(parents=True, exist_ok=True)
+            state_path.write_text(json.dumps({"upload_key": upload_key, "file": str(file_path)}))
+
+        chunk_path = f"/projects/{project_id}/files/upload/{upload_key}/chunks"
+
+        def read_chunk(offset: int) -> bytes:
+            with open(file_path, "rb") as f:
+                f.seek(offset)
+                return f.read(self.chunk_size)
+
+        def send(offset: int, advance: Callable[[int], None]) -> None:
+            data = read_chunk(offset)
+            response = self._send_with_retry(
+                "PUT",
+                f"{chunk_path}/{offset}",
+                content=data,
+                headers={
+                    "Content-Type": "application/octet-stream",
+                    "X-Checksum-Sha256": hashlib.sha256(data).hexdigest(),
+                },
+            )
+            self._handle_response(response)
+            advance(len(data))
+
+        with self._progress(f"Uploading {filename}", file_size, show_progress) as advance:
+            pending = []
+            for offset in range(0, file_size, self.chunk_size):
+                chunk = received.get(offset)
+                # Skip chunks the server already has with the same content
+                if chunk and chunk["checksum_sha256"] == hashlib.sha256(read_chunk(offset)).hexdigest():
+                    advance(chunk["size_bytes"])
+                else:
+                    pending.append((offset, advance))
+            self._run_parallel(send, pending)
+
+        file_info = self.post(f"/projects/{project_id}/files", {"upload_key": upload_key})
+        state_path.unlink(missing_ok=True)
+        return file_info
+
     @staticmethod
     def _guess_content_type(filename: str) -> str:
         """Guess content type from filename."""
@@ -240,10 +448,10 @@ class DuckDBClient:
         return content_types.get(ext, "application/octet-stream")
 
 
-def get_client(verbose: bool = False) -> DuckDBClient:
+def get_client(verbose: bool = False, parallel: int = DEFAULT_PARALLEL) -> DuckDBClient:
     """Get a configured API client."""
     config = get_config()
     errors = config.validate()
     if errors:
         raise ValueError("\n".join(errors))
-    return DuckDBClient(config, verbose=verbose)
+    return DuckDBClient(config, verbose=verbose, parallel=parallel)
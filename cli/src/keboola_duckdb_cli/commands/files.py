@@ -4,7 +4,7 @@ from pathlib import Path
 
 import typer
 
-from ..client import get_client
+from ..client import DEFAULT_PARALLEL, get_client
 from ..output import print_table, print_json, print_success, print_error, format_bytes
 from ..main import state
 
@@ -61,6 +61,7 @@ def list_files(
 def upload_file(
     project: str = typer.Argument(..., help="Project ID"),
     file: Path = typer.Argument(..., help="Path to file to upload", exists=True, file_okay=True, dir_okay=False),
+    parallel: int = typer.Option(DEFAULT_PARALLEL, "--parallel", "-p", help="Parallel connections for files larger than one chunk"),
 ) -> None:
     """Upload a file to a project.
 
@@ -68,8 +69,11 @@ def upload_file(
     1. Prepare upload (get upload key)
     2. Upload file content
     3. Register file in project
+
+    Files larger than one chunk are uploaded in parallel chunks; rerunning
+    an interrupted upload sends only the missing chunks.
     """
-    client = get_client(verbose=state.verbose)
+    client = get_client(verbose=state.verbose, parallel=parallel)
 
     try:
         # Validate file exists and is readable
@@ -107,9 +111,10 @@ def download_file(
     project: str = typer.Argument(..., help="Project ID"),
     file_id: str = typer.Argument(..., help="File ID to download"),
     output: Path = typer.Argument(..., help="Output path for downloaded file"),
+    parallel: int = typer.Option(DEFAULT_PARALLEL, "--parallel", "-p", help="Parallel connections for files larger than one chunk"),
 ) -> None:
     """Download a file from a project."""
-    client = get_client(verbose=state.verbose)
+    client = get_client(verbose=state.verbose, parallel=parallel)
 
     try:
         # Check if output path exists and is a directory
@@ -1,14 +1,14 @@
 """Tables commands for Keboola DuckDB CLI."""
 
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 import csv
 import json
 import re
 from datetime import datetime
 import typer
 
-from ..client import get_client
+from ..client import DEFAULT_PARALLEL, get_client
 from ..output import print_table, print_json, print_success, print_dict, format_bytes
 from ..main import state
 
@@ -261,9 +261,10 @@ def import_table(
     file: Path = typer.Argument(..., help="CSV file to import", exists=True, dir_okay=False),
     branch: str = typer.Option("default", help="Branch ID"),
     incremental: bool = typer.Option(False, help="Incremental import (append/update)"),
+    parallel: int = typer.Option(DEFAULT_PARALLEL, "--parallel", "-p", help="Parallel connections for files larger than one chunk"),
 ) -> None:
     """Import data from CSV file into table."""
-    client = get_client()
+    client = get_client(parallel=parallel)
 
     # Step 1: Upload file
     if not state.json_output:
@@ -306,9 +307,10 @@ def export_table(
     table: str = typer.Argument(..., help="Table name"),
     output: Path = typer.Argument(..., help="Output CSV file path"),
     branch: str = typer.Option("default", help="Branch ID"),
+    parallel: int = typer.Option(DEFAULT_PARALLEL, "--parallel", "-p", help="Parallel connections for files larger than one chunk"),
 ) -> None:
     """Export table data to CSV file."""
-    client = get_client()
+    client = get_client(parallel=parallel)
 
     # Step 1: Export table to file
     if not state.json_output:
@@ -462,6 +464,14 @@ def profile_table(
         False, "--correlations", "-r",
         help="Show column correlations"
     ),
+    sample: Optional[int] = typer.Option(
+        None, "--sample", "-s", min=1,
+        help="Profile a random sample of this many rows (for large tables)"
+    ),
+    refresh: bool = typer.Option(
+        False, "--refresh",
+        help="Recompute instead of returning the stored profile"
+    ),
 ) -> None:
     """Get advanced statistical profile of a table.
 
@@ -473,6 +483,9 @@ def profile_table(
     - String pattern detection (email, UUID, URL, phone)
     - Column correlations
 
+    Profiles are stored on the server, so repeating the command returns
+    instantly until the table changes.
+
     Examples:
         # Basic profile
         keboola-duckdb tables profile my-project my-bucket my-table
@@ -485,6 +498,9 @@ def profile_table(
 
         # Show correlations
         keboola-duckdb tables profile my-project my-bucket my-table -r
+
+        # Large table: full analysis of a 1M-row sample
+        keboola-duckdb tables profile my-project my-bucket my-table -m full -s 1000000
     """
     client = get_client()
 
@@ -506,9 +522,15 @@ def profile_table(
     elif mode == "distribution":
         show_distribution = True
 
+    params: dict[str, Any] = {"mode": api_mode}
+    if sample is not None:
+        params["sample_size"] = sample
+    if refresh:
+        params["refresh"] = "true"
+
     result = client.post(
         f"/projects/{project}/branches/{branch}/buckets/{bucket}/tables/{table}/profile",
-        params={"mode": api_mode}
+        params=params
     )
 
     if state.json_output:
@@ -528,6 +550,13 @@ def profile_table(
     quality_label, quality_color = _get_quality_label(quality_score)
     typer.echo(f"\n[bold]Table: {bucket_name}.{table_name}[/bold]")
     typer.echo(f"Rows: {row_count:,} | Columns: {column_count} | Quality: [{quality_color}]{quality_score:.0f}% ({quality_label})[/{quality_color}]")
+    if result.get("sampled"):
+        typer.echo(
+            f"[dim]Sampled {result['profiled_rows']:,} rows "
+            f"(±{result['margin_of_error']:.2f} pp at 95% confidence)[/dim]"
+        )
+    if result.get("cached"):
+        typer.echo(f"[dim]Stored profile from {result.get('profiled_at')} (--refresh to recompute)[/dim]")
     typer.echo()
 
     if not statistics:
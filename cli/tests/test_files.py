@@ -1,5 +1,6 @@
 """Tests for file management commands."""
 
+import json
 from pathlib import Path
 from unittest.mock import Mock, patch, mock_open
 
@@ -489,3 +490,145 @@ class TestFilesMissingConfig:
 
         result = runner.invoke(app, ["files", "upload", "proj-1", str(test_file)])
         assert result.exit_code != 0
+
+
+class TestChunkedTransfers:
+    """Tests for parallel chunked uploads and ranged downloads in DuckDBClient."""
+
+    @pytest.fixture
+    def chunked_client(self, monkeypatch, tmp_path):
+        """Client with a tiny chunk size so small files take the chunked path."""
+        from keboola_duckdb_cli import client as client_module
+        from keboola_duckdb_cli.config import CLIConfig
+
+        monkeypatch.setattr(client_module, "TRANSFER_STATE_DIR", tmp_path / "transfers")
+        client = client_module.DuckDBClient(
+            CLIConfig(url="http://test-api", api_key="test-key"), parallel=3, chunk_size=4
+        )
+        yield client
+        client.close()
+
+    @staticmethod
+    def _range_server(content: bytes, etag: str = '"abc"'):
+        """respx side effect serving byte ranges of content."""
+
+        def serve(request):
+            if request.headers.get("if-match", etag) != etag:
+                return Response(412)
+            start, end = request.headers["range"].removeprefix("bytes=").split("-")
+            start, end = int(start), min(int(end), len(content) - 1)
+            return Response(
+                206,
+                content=content[start:end + 1],
+                headers={"Content-Range": f"bytes {start}-{end}/{len(content)}", "ETag": etag},
+            )
+
+        return serve
+
+    @respx.mock
+    def test_upload_in_parallel_chunks(self, chunked_client, tmp_path):
+        """Test that a file larger than one chunk is sent as checksummed chunks."""
+        import hashlib
+
+        source = tmp_path / "big.csv"
+        source.write_bytes(b"0123456789")
+        received = {}
+
+        def store_chunk(request, offset):
+            assert request.headers["x-checksum-sha256"] == hashlib.sha256(request.content).hexdigest()
+            received[int(offset)] = request.content
+            return Response(200, json={"offset": int(offset), "size_bytes": len(request.content)})
+
+        prepare = respx.post("http://test-api/projects/proj-1/files/prepare").mock(
+            return_value=Response(200, json={"upload_key": "key-1"})
+        )
+        respx.put(url__regex=r"http://test-api/projects/proj-1/files/upload/key-1/chunks/(?P<offset>\d+)").mock(
+            side_effect=store_chunk
+        )
+        respx.post("http://test-api/projects/proj-1/files").mock(
+            return_value=Response(201, json={"id": "file-1", "size_bytes": 10})
+        )
+
+        file_info = chunked_client.upload_file_3stage("proj-1", source, show_progress=False)
+
+        assert file_info["id"] == "file-1"
+        assert b"".join(received[offset] for offset in sorted(received)) == b"0123456789"
+        assert sorted(received) == [0, 4, 8]
+        assert json.loads(prepare.calls[0].request.content)["size_bytes"] == 10
+        assert not list((tmp_path / "transfers").iterdir())
+
+    @respx.mock
+    def test_upload_resumes_missing_chunks(self, chunked_client, tmp_path, monkeypatch):
+        """Test that a rerun after an interruption only sends chunks the server lacks."""
+        import hashlib
+        from keboola_duckdb_cli.client import APIError
+
+        monkeypatch.setattr("keboola_duckdb_cli.client.time.sleep", lambda seconds: None)
+        source = tmp_path / "big.csv"
+        source.write_bytes(b"0123456789")
+        sent = []
+
+        respx.post("http://test-api/projects/proj-1/files/prepare").mock(
+            return_value=Response(200, json={"upload_key": "key-1"})
+        )
+        chunks = respx.put(url__regex=r"http://test-api/projects/proj-1/files/upload/key-1/chunks/\d+")
+        chunks.mock(side_effect=[Response(200, json={}), Response(500), Response(500), Response(500), Response(500)])
+        chunked_client.parallel = 1
+        with pytest.raises(APIError):
+            chunked_client.upload_file_3stage("proj-1", source, show_progress=False)
+
+        respx.get("http://test-api/projects/proj-1/files/upload/key-1").mock(
+            return_value=Response(200, json={
+                "upload_key": "key-1",
+                "chunks": [
+                    {"offset": 0, "size_bytes": 4, "checksum_sha256": hashlib.sha256(b"0123").hexdigest()},
+                ],
+            })
+        )
+        chunks.mock(side_effect=lambda request: sent.append(request.url.path) or Response(200, json={}))
+        respx.post("http://test-api/projects/proj-1/files").mock(
+            return_value=Response(201, json={"id": "file-1"})
+        )
+
+        file_info = chunked_client.upload_file_3stage("proj-1", source, show_progress=False)
+
+        assert file_info["id"] == "file-1"
+        assert sorted(sent) == [
+            "/projects/proj-1/files/upload/key-1/chunks/4",
+            "/projects/proj-1/files/upload/key-1/chunks/8",
+        ]
+
+    @respx.mock
+    def test_download_in_parallel_ranges(self, chunked_client, tmp_path):
+        """Test that a large download is assembled from parallel Range requests."""
+        content = b"id,name\n1,alpha\n2,beta\n"
+        route = respx.get("http://test-api/projects/proj-1/files/file-1/download").mock(
+            side_effect=self._range_server(content)
+        )
+        output = tmp_path / "out.csv"
+
+        chunked_client.download_file("/projects/proj-1/files/file-1/download", output, show_progress=False)
+
+        assert output.read_bytes() == content
+        assert route.call_count == 6
+        assert all(call.request.headers["if-match"] == '"abc"' for call in route.calls[1:])
+        assert not (tmp_path / "out.csv.part").exists()
+        assert not (tmp_path / "out.csv.part.json").exists()
+
+    @respx.mock
+    def test_download_fails_when_file_changes(self, chunked_client, tmp_path):
+        """Test that a download stops if the file changes between ranges."""
+        from keboola_duckdb_cli.client import APIError
+
+        content = b"0123456789"
+        serve = self._range_server(content)
+        respx.get("http://test-api/projects/proj-1/files/file-1/download").mock(
+            side_effect=[serve, Response(412), Response(412)]
+        )
+        output = tmp_path / "out.bin"
+
+        with pytest.raises(APIError) as exc:
+            chunked_client.download_file("/projects/proj-1/files/file-1/download", output, show_progress=False)
+
+        assert exc.value.status_code == 412
+        assert not output.exists()
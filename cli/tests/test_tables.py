@@ -819,3 +819,32 @@ class TestTablesProfile:
         ])
         assert result.exit_code == 0
         assert "No matching columns found" in result.stdout
+
+    @respx.mock
+    def test_profile_table_sampled(self, mock_config):
+        """Test profile with --sample and --refresh."""
+        route = respx.post("http://test-api/projects/proj-1/branches/default/buckets/in.c-sales/tables/orders/profile").mock(
+            return_value=Response(200, json={
+                "table_name": "orders",
+                "bucket_name": "in.c-sales",
+                "row_count": 500000000,
+                "column_count": 1,
+                "statistics": [
+                    {"column_name": "id", "column_type": "BIGINT", "min": 1, "max": 500000000,
+                     "approx_unique": 100000, "count": 100000, "null_percentage": 0},
+                ],
+                "sampled": True,
+                "profiled_rows": 100000,
+                "margin_of_error": 0.31,
+                "cached": False,
+            })
+        )
+        result = runner.invoke(app, [
+            "tables", "profile", "proj-1", "in.c-sales", "orders",
+            "--sample", "100000", "--refresh"
+        ])
+        assert result.exit_code == 0
+        params = route.calls.last.request.url.params
+        assert params["sample_size"] == "100000"
+        assert params["refresh"] == "true"
+        assert "Sampled 100,000 rows" in result.stdout
@@ -52,6 +52,75 @@ class Settings(BaseSettings):
     duckdb_threads: int = 4
     duckdb_memory_limit: str = "4GB"
 
+    # Metadata DB connection settings
+    # A single long-lived connection is kept open and queries run on pooled
+    # cursors. Disable when several processes share metadata.duckdb
+    # (e.g. separate API and PG Wire containers) - DuckDB allows only one
+    # process to hold the file open.
+    metadata_persistent_connection: bool = True
+    metadata_cursor_pool_size: int = 8
+
+    # Table catalog cache (in-process cache of per-table metadata, validated
+    # against file mtime/size)
+    table_catalog_cache_max_entries: int = 10000
+
+    # API key cache: verified keys are cached for this long (0 disables the
+    # cache); last_used_at is collected in memory and written in one batch
+    # every flush interval instead of on every request
+    api_key_cache_ttl_seconds: int = 30
+    api_key_cache_max_entries: int = 10000
+    api_key_last_used_flush_interval_seconds: int = 60
+
+    # Idempotency (X-Idempotency-Key): recent responses are kept in an
+    # in-process LRU in front of the idempotency_keys table. Response bodies
+    # larger than the cap are not stored (replay returns status and headers
+    # only). A retry arriving while the first request still runs waits up to
+    # the in-flight timeout for its result.
+    idempotency_cache_max_entries: int = 1000
+    idempotency_max_response_bytes: int = 262144  # 256 KB
+    idempotency_in_flight_wait_seconds: int = 240
+
+    # Persisted table stats: how often the background reconciler compares
+    # table_stats with the files on disk and repairs drift (seconds)
+    table_stats_reconcile_interval_seconds: int = 600
+
+    # Storage gauges (bucket/table counts, storage sizes) are maintained by
+    # write paths; a filesystem rescan corrects drift at this interval
+    # (seconds) and once at startup
+    storage_metrics_rescan_interval_seconds: int = 3600
+
+    # Table profiling (full/quality mode): numeric columns included in the
+    # correlation matrix, computed in one aggregate pass. 0 disables the cap.
+    profile_max_correlation_columns: int = 10
+
+    # Thread pools for blocking DuckDB work called from async routes.
+    # "data" lane: imports, exports, snapshots, schema ops, profiling.
+    # "metadata" lane: table lookups and other short reads.
+    duckdb_data_executor_workers: int = 4
+    duckdb_metadata_executor_workers: int = 16
+
+    # Per-table write queue (ADR-005): max number of compatible queued
+    # writes (e.g. incremental imports) coalesced into one transaction
+    write_queue_max_batch_size: int = 16
+
+    # Snapshots (ADR-004): Parquet exports run on a dedicated executor lane
+    # with few workers and a per-export DuckDB thread cap, so snapshot I/O
+    # can't starve imports and queries
+    snapshot_executor_workers: int = 2
+    snapshot_duckdb_threads: int = 2
+
+    # Driver ExecuteQuery results: rows fetched per record batch (one
+    # streamed message per batch) and caps on the total result size.
+    # 0 disables a cap.
+    query_result_batch_rows: int = 10000
+    query_result_max_rows: int = 1000000
+    query_result_max_bytes: int = 268435456  # 256 MB
+
+    # Branch Copy-on-Write (ADR-007): "auto" clones table files with a
+    # reflink when the filesystem supports it, then falls back to
+    # copy_file_range and a plain copy; "copy" always does a plain copy
+    branch_cow_strategy: str = "auto"
+
     # Timeouts (seconds)
     operation_timeout: int = 240
     connection_timeout: int = 10
@@ -69,6 +138,10 @@ class Settings(BaseSettings):
     s3_region: str = "local"  # Region name (used in signature, can be anything)
     s3_sig_v4_max_age_seconds: int = 900  # Max age of signed request (15 minutes)
 
+    # S3 multipart uploads that are neither completed nor aborted are removed
+    # (with their parts) after this many hours
+    s3_multipart_upload_max_age_hours: int = 24
+
     # PG Wire server settings (Phase 11b)
     pgwire_host: str = "localhost"
     pgwire_port: int = 5432
@@ -77,6 +150,9 @@ class Settings(BaseSettings):
     pgwire_idle_timeout_seconds: int = 3600  # 1 hour
     pgwire_query_timeout_seconds: int = 300  # 5 minutes
     pgwire_session_memory_limit: str = "4GB"
+    # Tables are ATTACHed per session on first reference; least recently
+    # used ones are DETACHed above this cap (bounds open file handles)
+    pgwire_max_attached_tables: int = 256
     pgwire_ssl_mode: str = "prefer"
 
     @model_validator(mode="after")
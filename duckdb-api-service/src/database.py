@@ -9,13 +9,22 @@ ADR-009: Per-table file architecture
 Each table's data is stored in `main.data` table within its own .duckdb file.
 """
 
+import asyncio
+import bisect
+import contextvars
+import copy
+import math
+import os
 import shutil
 import threading
 import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Generator
+from typing import Any, Callable, Generator, Iterator
 
 import duckdb
 import structlog
@@ -28,6 +37,32 @@ logger = structlog.get_logger()
 # Standard table name within each per-table DuckDB file
 TABLE_DATA_NAME = "data"
 
+# Media type of Arrow IPC streaming responses (ADR-011)
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+# Regex patterns detected in string columns by table profiling (full/quality mode)
+PROFILE_PATTERNS = (
+    ("email", r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"),
+    ("uuid", r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[1-5][0-9a-fA-F]{3}-[89abAB][0-9a-fA-F]{3}-[0-9a-fA-F]{12}$"),
+    ("url", r"^https?://"),
+    ("phone", r"^\+?[0-9\s\-\(\)]{10,20}$"),
+    ("ipv4", r"^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$"),
+    ("date_iso", r"^\d{4}-\d{2}-\d{2}$"),
+    ("datetime_iso", r"^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}"),
+)
+
+# How load_table_to_workspace materializes a source table
+WORKSPACE_LOAD_MODES = ("clone", "view")
+
+# Source tables of workspace views, re-ATTACHed whenever the workspace is opened
+_WORKSPACE_SOURCES_DDL = """
+    CREATE TABLE IF NOT EXISTS _workspace_sources (
+        name VARCHAR PRIMARY KEY,
+        source_bucket VARCHAR NOT NULL,
+        source_table VARCHAR NOT NULL
+    )
+"""
+
 
 # ============================================
 # Table Lock Manager (Write Queue simplified)
@@ -45,6 +80,7 @@ class TableLockManager:
 
     Note: Keboola Storage API serializes writes on their side,
     so this is a safety net for standalone usage or future extensions.
+    Imports go through TableWriteQueue, whose worker holds this lock.
     """
 
     def __init__(self):
@@ -165,6 +201,1081 @@ class TableLockManager:
 table_lock_manager = TableLockManager()
 
 
+# ============================================
+# Table Catalog Cache
+# ============================================
+
+
+class TableCatalogCache:
+    """
+    In-process cache of table metadata (columns, PK, row count, size).
+
+    ADR-009: Every get_table() opens the table's .duckdb file and runs
+    information_schema queries plus COUNT(*). Listing a bucket with many
+    tables therefore costs one file open per table. This cache keeps the
+    result keyed by table file path.
+
+    Entries are validated against the file signature (inode, mtime, size of
+    the .duckdb file and its WAL), so changes made by other processes are
+    picked up on the next read. Write paths in this process also invalidate
+    explicitly, which covers writes within the filesystem timestamp
+    resolution.
+
+    Cached values are deep-copied on the way out - callers are free to
+    mutate what they get (e.g. adding a "source" field).
+    """
+
+    def __init__(self, max_entries: int | None = None):
+        self._entries: OrderedDict[tuple[str, str], tuple[tuple, dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    @property
+    def max_entries(self) -> int:
+        if self._max_entries is not None:
+            return self._max_entries
+        return settings.table_catalog_cache_max_entries
+
+    @staticmethod
+    def file_signature(table_path: Path) -> tuple | None:
+        """Return (inode, mtime_ns, size) of the table file and its WAL, or None if missing."""
+        try:
+            st = table_path.stat()
+        except FileNotFoundError:
+            return None
+        try:
+            wal = Path(f"{table_path}.wal").stat()
+            wal_sig = (wal.st_mtime_ns, wal.st_size)
+        except FileNotFoundError:
+            wal_sig = None
+        return (st.st_ino, st.st_mtime_ns, st.st_size, wal_sig)
+
+    def get_or_load(
+        self,
+        table_path: Path,
+        view: str,
+        loader: Callable[[], dict[str, Any] | None],
+    ) -> dict[str, Any] | None:
+        """
+        Return cached info for a table file, calling loader() on miss.
+
+        Args:
+            table_path: Path to the table's .duckdb file
+            view: Name of the cached shape (callers build different dicts)
+            loader: Reads the info from the file; None results are not cached
+
+        Returns:
+            Copy of the table info dict, or None
+        """
+        key = (str(table_path), view)
+        signature = self.file_signature(table_path)
+        if signature is None:
+            self.invalidate(table_path)
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(key)
+                metrics.TABLE_CATALOG_CACHE_HITS.inc()
+                return copy.deepcopy(entry[1])
+
+        metrics.TABLE_CATALOG_CACHE_MISSES.inc()
+        # Signature taken before reading: a concurrent write changes it,
+        # so the entry stored below will be treated as stale next time.
+        info = loader()
+        if info is None:
+            return None
+
+        with self._lock:
+            self._entries[key] = (signature, copy.deepcopy(info))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            metrics.TABLE_CATALOG_CACHE_SIZE.set(len(self._entries))
+        return info
+
+    def invalidate(self, table_path: Path) -> None:
+        """Drop all cached views of a table file (called by write paths)."""
+        path = str(table_path)
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == path]:
+                del self._entries[key]
+            metrics.TABLE_CATALOG_CACHE_SIZE.set(len(self._entries))
+
+    def invalidate_dir(self, dir_path: Path) -> None:
+        """Drop cached entries for all table files under a directory (bucket/project delete)."""
+        prefix = f"{dir_path}/"
+        with self._lock:
+            for key in [k for k in self._entries if k[0].startswith(prefix)]:
+                del self._entries[key]
+            metrics.TABLE_CATALOG_CACHE_SIZE.set(len(self._entries))
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+            metrics.TABLE_CATALOG_CACHE_SIZE.set(0)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Global singleton instance
+table_catalog_cache = TableCatalogCache()
+
+
+# ============================================
+# Storage Usage (Prometheus storage gauges)
+# ============================================
+
+
+class StorageUsage:
+    """
+    Bucket/table counts and storage sizes behind the storage gauges.
+
+    Walking duckdb_dir and files_dir on every /metrics scrape costs one
+    stat() per file. Instead, write paths report what they change (tables
+    via record_table_stats/forget_table_stats, bucket directories, Files
+    API register/delete) and the gauges are adjusted in place; a scrape
+    only reads them. rescan() walks the filesystem and resets the gauges -
+    it runs at startup and at a low frequency to correct drift from
+    changes the write paths don't report (S3-compatible API, upload
+    staging, files changed outside the service).
+
+    Table files counted by rescan() that have no table_stats row yet are
+    remembered, so their first record_table_stats/forget_table_stats
+    settles against the scanned size instead of counting them again.
+
+    Sizes by type:
+    - tables: table .duckdb files (project_*/<bucket>/*.duckdb)
+    - staging: Files API upload staging (files_dir/project_*/staging)
+    - files: everything else under files_dir
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values = dict.fromkeys(
+            ("buckets", "tables", "table_bytes", "staging_bytes", "file_bytes"), 0
+        )
+        # Table files counted by the last rescan without stats: key -> size
+        self._unrecorded: dict[str, int] = {}
+        self.last_scan_at: datetime | None = None
+        self._publish()
+
+    def _publish(self) -> None:
+        """Copy the values to the gauges (caller holds the lock)."""
+        metrics.BUCKETS_TOTAL.set(self._values["buckets"])
+        metrics.TABLES_TOTAL.set(self._values["tables"])
+        metrics.STORAGE_SIZE_BYTES.labels(type="tables").set(self._values["table_bytes"])
+        metrics.STORAGE_SIZE_BYTES.labels(type="staging").set(self._values["staging_bytes"])
+        metrics.STORAGE_SIZE_BYTES.labels(type="files").set(self._values["file_bytes"])
+
+    def adjust(
+        self,
+        buckets: int = 0,
+        tables: int = 0,
+        table_bytes: int = 0,
+        file_bytes: int = 0,
+    ) -> None:
+        """Apply a change reported by a write path."""
+        with self._lock:
+            self._values["buckets"] += buckets
+            self._values["tables"] += tables
+            self._values["table_bytes"] += table_bytes
+            self._values["file_bytes"] += file_bytes
+            self._publish()
+
+    def snapshot(self) -> dict[str, int]:
+        """Current values."""
+        with self._lock:
+            return dict(self._values)
+
+    @staticmethod
+    def _file_size(path: Path) -> int:
+        try:
+            return path.stat().st_size
+        except OSError:
+            return 0
+
+    def _directory_size(self, path: Path) -> int:
+        """Total size of all files under a directory."""
+        total = 0
+        for root, _, files in os.walk(path):
+            for name in files:
+                total += self._file_size(Path(root) / name)
+        return total
+
+    def claim_unrecorded(self, key: str) -> int | None:
+        """Pop the scanned size of a table file that had no stats row."""
+        with self._lock:
+            return self._unrecorded.pop(key, None)
+
+    def claim_unrecorded_under(self, prefix: str) -> tuple[int, int]:
+        """Pop scanned table files without stats under a directory; (count, size)."""
+        prefix = prefix.rstrip("/") + "/"
+        with self._lock:
+            keys = [key for key in self._unrecorded if key.startswith(prefix)]
+            return len(keys), sum(self._unrecorded.pop(key) for key in keys)
+
+    def scan(self) -> dict[str, int]:
+        """Walk the storage directories and return counts and sizes."""
+        return self._scan()[0]
+
+    def _scan(self) -> tuple[dict[str, int], dict[str, int]]:
+        """Return (counts and sizes, {table key: size}) from a filesystem walk."""
+        buckets = tables = table_bytes = 0
+        table_sizes: dict[str, int] = {}
+        duckdb_dir = settings.duckdb_dir
+        if duckdb_dir.exists():
+            for project_dir in duckdb_dir.iterdir():
+                if not (project_dir.is_dir() and project_dir.name.startswith("project_")):
+                    continue
+                for bucket_dir in project_dir.iterdir():
+                    if not bucket_dir.is_dir() or bucket_dir.name.startswith("_"):
+                        continue
+                    buckets += 1
+                    for table_file in bucket_dir.glob("*.duckdb"):
+                        size = self._file_size(table_file)
+                        tables += 1
+                        table_bytes += size
+                        table_sizes[str(table_file.relative_to(duckdb_dir))] = size
+
+        staging_bytes = file_bytes = 0
+        files_dir = settings.files_dir
+        if files_dir.exists():
+            for project_dir in files_dir.glob("project_*/staging"):
+                staging_bytes += self._directory_size(project_dir)
+            file_bytes = self._directory_size(files_dir) - staging_bytes
+
+        return {
+            "buckets": buckets,
+            "tables": tables,
+            "table_bytes": table_bytes,
+            "staging_bytes": staging_bytes,
+            "file_bytes": file_bytes,
+        }, table_sizes
+
+    def rescan(self) -> dict[str, int]:
+        """
+        Reset the gauges from a filesystem scan.
+
+        Returns:
+            Dict with the scanned values and the drift (scanned minus
+            tracked) of the incrementally maintained ones
+        """
+        result, table_sizes = self._scan()
+        try:
+            recorded = metadata_db.list_table_stats_signatures()
+        except Exception:
+            # Metadata DB not available yet - every table is unrecorded
+            recorded = {}
+        unrecorded = {
+            key: size for key, size in table_sizes.items() if key not in recorded
+        }
+
+        with self._lock:
+            drift = {
+                f"{key}_drift": value - self._values[key]
+                for key, value in result.items()
+                if key != "staging_bytes"
+            }
+            self._values = dict(result)
+            self._unrecorded = unrecorded
+            self.last_scan_at = datetime.now(timezone.utc)
+            self._publish()
+
+        return {**result, **drift}
+
+
+# Global singleton instance
+storage_usage = StorageUsage()
+
+
+# ============================================
+# API Key Cache (auth hot path)
+# ============================================
+
+
+class ApiKeyCache:
+    """
+    TTL cache of verified API keys, plus batched last_used_at tracking.
+
+    Authenticating a request used to cost a metadata read (key lookup by
+    prefix) and a metadata write with commit (last_used_at) - a write on
+    every read request. This cache keeps key records for
+    settings.api_key_cache_ttl_seconds, keyed by the key's SHA256 hash (the
+    raw key is never stored), and collects last_used_at timestamps in
+    memory for a background task to write in one batch.
+
+    Revoking or deleting keys in this process invalidates their entries
+    immediately; other processes sharing metadata.duckdb see the change
+    after at most one TTL. An entry never outlives the key's expires_at.
+    """
+
+    def __init__(self, ttl_seconds: int | None = None, max_entries: int | None = None):
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._last_used: dict[str, datetime] = {}
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    @property
+    def ttl_seconds(self) -> int:
+        if self._ttl_seconds is not None:
+            return self._ttl_seconds
+        return settings.api_key_cache_ttl_seconds
+
+    @property
+    def max_entries(self) -> int:
+        if self._max_entries is not None:
+            return self._max_entries
+        return settings.api_key_cache_max_entries
+
+    def get(self, key_hash: str) -> dict[str, Any] | None:
+        """Return the cached key record for a key hash, or None on miss/expiry."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key_hash)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key_hash)
+                metrics.API_KEY_CACHE_HITS.inc()
+                return dict(entry[1])
+            if entry is not None:
+                del self._entries[key_hash]
+                metrics.API_KEY_CACHE_SIZE.set(len(self._entries))
+
+        metrics.API_KEY_CACHE_MISSES.inc()
+        return None
+
+    def put(self, key_hash: str, record: dict[str, Any]) -> None:
+        """Cache a verified key record (no-op when the TTL is 0)."""
+        ttl = self.ttl_seconds
+        if ttl <= 0:
+            return
+
+        if record.get("expires_at"):
+            expires_at = datetime.fromisoformat(record["expires_at"])
+            if expires_at.tzinfo is None:
+                expires_at = expires_at.replace(tzinfo=timezone.utc)
+            remaining = (expires_at - datetime.now(timezone.utc)).total_seconds()
+            ttl = min(ttl, remaining)
+            if ttl <= 0:
+                return
+
+        with self._lock:
+            self._entries[key_hash] = (time.monotonic() + ttl, dict(record))
+            self._entries.move_to_end(key_hash)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            metrics.API_KEY_CACHE_SIZE.set(len(self._entries))
+
+    def invalidate_key(self, key_id: str) -> None:
+        """Drop the entry of a revoked or deleted key."""
+        with self._lock:
+            for key_hash in [h for h, (_, r) in self._entries.items() if r["id"] == key_id]:
+                del self._entries[key_hash]
+            metrics.API_KEY_CACHE_SIZE.set(len(self._entries))
+
+    def invalidate_project(self, project_id: str) -> None:
+        """Drop all entries of a project's keys."""
+        with self._lock:
+            for key_hash in [
+                h for h, (_, r) in self._entries.items() if r["project_id"] == project_id
+            ]:
+                del self._entries[key_hash]
+            metrics.API_KEY_CACHE_SIZE.set(len(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._last_used.clear()
+            metrics.API_KEY_CACHE_SIZE.set(0)
+
+    def record_use(self, key_id: str) -> None:
+        """Note that a key was used now; written by flush_last_used()."""
+        with self._lock:
+            self._last_used[key_id] = datetime.now(timezone.utc)
+
+    def flush_last_used(self, db: "MetadataDB") -> int:
+        """
+        Write collected last_used_at timestamps in one transaction.
+
+        Returns:
+            Number of keys updated. On failure the timestamps are kept for
+            the next flush and the exception is re-raised.
+        """
+        with self._lock:
+            pending = self._last_used
+            self._last_used = {}
+        if not pending:
+            return 0
+
+        try:
+            db.update_api_keys_last_used(pending)
+        except Exception:
+            with self._lock:
+                for key_id, used_at in pending.items():
+                    if key_id not in self._last_used:
+                        self._last_used[key_id] = used_at
+            raise
+        metrics.API_KEY_LAST_USED_FLUSHED.inc(len(pending))
+        return len(pending)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Global singleton instance
+api_key_cache = ApiKeyCache()
+
+
+# ============================================
+# Object Index (S3 ListObjectsV2)
+# ============================================
+
+
+class _ProjectObjectKeys:
+    """Sorted object keys of one project directory (or a build in progress)."""
+
+    def __init__(self):
+        self.keys: list[str] | None = None  # None until the first walk finishes
+        self.pending: list[tuple[bool, str]] = []  # (added, key) seen during the walk
+        self.build_lock = threading.Lock()
+
+
+class ObjectIndex:
+    """
+    In-process sorted index of object keys under files_dir/project_*/.
+
+    ListObjectsV2 used to walk the whole project directory on every call.
+    The index walks it once (on the first listing of a project) and keeps
+    the keys in a sorted list, so a page for a prefix / start-after /
+    continuation token is found with bisect in O(log n + page size).
+
+    Write paths in this process (S3 PutObject, multipart complete,
+    DeleteObject, Files API upload/register/delete, table export) call
+    add()/discard() with the absolute file path. Changes made while a
+    project is being walked are queued and replayed onto the result.
+    Listing stats each returned key, so files removed behind our back are
+    dropped lazily; files created by other processes appear after a
+    restart or invalidate().
+    """
+
+    def __init__(self):
+        self._projects: dict[str, _ProjectObjectKeys] = {}  # keyed by project dir
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _split(file_path: Path) -> tuple[str, str] | None:
+        """Return (project dir, key) for a path under files_dir/project_*/."""
+        try:
+            parts = file_path.relative_to(settings.files_dir).parts
+        except ValueError:
+            return None
+        if len(parts) < 2 or not parts[0].startswith("project_"):
+            return None
+        return str(settings.files_dir / parts[0]), "/".join(parts[1:])
+
+    def _apply(self, entry: _ProjectObjectKeys, added: bool, key: str) -> None:
+        if entry.keys is None:
+            entry.pending.append((added, key))
+            return
+        i = bisect.bisect_left(entry.keys, key)
+        present = i < len(entry.keys) and entry.keys[i] == key
+        if added and not present:
+            entry.keys.insert(i, key)
+            self._size += 1
+        elif not added and present:
+            del entry.keys[i]
+            self._size -= 1
+
+    def _update(self, file_path: Path, added: bool) -> None:
+        split = self._split(file_path)
+        if split is None:
+            return
+        with self._lock:
+            entry = self._projects.get(split[0])
+            # Projects not listed yet are picked up by their first walk
+            if entry is not None:
+                self._apply(entry, added, split[1])
+                metrics.S3_OBJECT_INDEX_KEYS.set(self._size)
+
+    def add(self, file_path: Path) -> None:
+        """Record a file written under files_dir."""
+        self._update(file_path, added=True)
+
+    def discard(self, file_path: Path) -> None:
+        """Record a file removed from files_dir."""
+        self._update(file_path, added=False)
+
+    def _load(self, project_dir: Path) -> _ProjectObjectKeys:
+        """Return the project's entry, walking its directory on first use."""
+        with self._lock:
+            entry = self._projects.setdefault(str(project_dir), _ProjectObjectKeys())
+            if entry.keys is not None:
+                return entry
+
+        with entry.build_lock:
+            if entry.keys is not None:
+                return entry
+
+            start_time = time.time()
+            keys = set()
+            for root, _dirs, files in os.walk(project_dir):
+                rel_root = os.path.relpath(root, project_dir)
+                for name in files:
+                    keys.add(name if rel_root == "." else f"{rel_root}/{name}")
+
+            with self._lock:
+                for added, key in entry.pending:
+                    if added:
+                        keys.add(key)
+                    else:
+                        keys.discard(key)
+                entry.pending = []
+                entry.keys = sorted(keys)
+                # Not counted if invalidate() dropped the project meanwhile
+                if self._projects.get(str(project_dir)) is entry:
+                    self._size += len(entry.keys)
+                    metrics.S3_OBJECT_INDEX_KEYS.set(self._size)
+
+            metrics.S3_OBJECT_INDEX_BUILDS.inc()
+            logger.info(
+                "object_index_built",
+                project_dir=project_dir.name,
+                keys=len(keys),
+                duration_ms=int((time.time() - start_time) * 1000),
+            )
+        return entry
+
+    def list_page(
+        self,
+        project_dir: Path,
+        prefix: str = "",
+        delimiter: str = "",
+        after: str = "",
+        after_common_prefix: bool = False,
+        max_keys: int = 1000,
+    ) -> tuple[list[tuple[bool, str]], bool]:
+        """
+        Return one ListObjectsV2 page.
+
+        Args:
+            project_dir: files_dir/project_<id>
+            prefix: Only keys starting with this prefix
+            delimiter: Roll keys up to the next delimiter after prefix into
+                common prefixes
+            after: Exclusive lower bound (start-after or continuation)
+            after_common_prefix: `after` is a common prefix returned on the
+                previous page; skip every key below it
+            max_keys: Maximum number of keys plus common prefixes
+
+        Returns:
+            ([(is_common_prefix, key_or_prefix), ...], is_truncated)
+        """
+        entry = self._load(project_dir)
+        results: list[tuple[bool, str]] = []
+
+        with self._lock:
+            keys = entry.keys
+            i = bisect.bisect_left(keys, prefix)
+            if after:
+                if after_common_prefix:
+                    i = max(i, bisect.bisect_left(keys, after + "\U0010ffff"))
+                else:
+                    i = max(i, bisect.bisect_right(keys, after))
+
+            while i < len(keys) and len(results) < max_keys:
+                key = keys[i]
+                if not key.startswith(prefix):
+                    break
+                if delimiter:
+                    pos = key.find(delimiter, len(prefix))
+                    if pos != -1:
+                        common_prefix = key[: pos + len(delimiter)]
+                        results.append((True, common_prefix))
+                        i = bisect.bisect_left(keys, common_prefix + "\U0010ffff", i)
+                        continue
+                results.append((False, key))
+                i += 1
+
+            is_truncated = i < len(keys) and keys[i].startswith(prefix)
+        return results, is_truncated
+
+    def invalidate(self, project_dir: Path) -> None:
+        """Forget a project's keys; the next listing walks its directory again."""
+        with self._lock:
+            entry = self._projects.pop(str(project_dir), None)
+            if entry is not None and entry.keys is not None:
+                self._size -= len(entry.keys)
+            metrics.S3_OBJECT_INDEX_KEYS.set(self._size)
+
+    def clear(self) -> None:
+        """Drop all projects."""
+        with self._lock:
+            self._projects.clear()
+            self._size = 0
+            metrics.S3_OBJECT_INDEX_KEYS.set(0)
+
+    def __len__(self) -> int:
+        return self._size
+
+
+# Global singleton instance
+object_index = ObjectIndex()
+
+
+# ============================================
+# Arrow IPC stream sink
+# ============================================
+
+
+class _ArrowChunkSink:
+    """
+    Write-only file object collecting Arrow IPC output between yields.
+
+    pyarrow writes the stream into this object; the streaming generator
+    drains the collected bytes after each record batch. tell() reports
+    the total bytes written so the IPC writer's alignment stays correct.
+    """
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        """Return and clear bytes written since the last drain."""
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+# ============================================
+# File cloning (ADR-007: branch Copy-on-Write)
+# ============================================
+
+# ioctl request number for FICLONE (linux/fs.h): share all extents of the
+# source file with the destination; supported by Btrfs, XFS (reflink=1),
+# bcachefs and OCFS2.
+_FICLONE = 0x40049409
+
+COW_STRATEGY_REFLINK = "reflink"
+COW_STRATEGY_COPY_RANGE = "copy_range"
+COW_STRATEGY_COPY = "copy"
+
+
+def _try_reflink(source: Path, target: Path) -> bool:
+    """Clone source into target with FICLONE; False if unsupported here."""
+    try:
+        import fcntl
+    except ImportError:  # Not on POSIX
+        return False
+
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+            return True
+        except OSError:
+            # EOPNOTSUPP / EXDEV / EINVAL: filesystem can't share extents
+            return False
+
+
+def _try_copy_file_range(source: Path, target: Path) -> bool:
+    """Copy inside the kernel with copy_file_range; False if unsupported."""
+    if not hasattr(os, "copy_file_range"):
+        return False
+
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        remaining = os.fstat(src.fileno()).st_size
+        try:
+            while remaining > 0:
+                copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        except OSError:
+            return False
+        return remaining == 0
+
+
+def clone_file(source: Path, target: Path, strategy: str = "auto") -> str:
+    """
+    Copy a file as cheaply as the filesystem allows.
+
+    With strategy "auto" tries, in order: a reflink (instant, blocks are
+    shared until either side writes), copy_file_range (no userspace
+    buffering; NFS 4.2 and SMB do it server-side, recent kernels reflink
+    on XFS/Btrfs) and a plain copy. "copy" forces the plain copy.
+    Metadata is preserved like shutil.copy2.
+
+    Returns the strategy that was used (COW_STRATEGY_*).
+    """
+    used = COW_STRATEGY_COPY
+    if strategy == "auto":
+        if _try_reflink(source, target):
+            used = COW_STRATEGY_REFLINK
+        elif _try_copy_file_range(source, target):
+            used = COW_STRATEGY_COPY_RANGE
+
+    if used == COW_STRATEGY_COPY:
+        shutil.copyfile(source, target)
+
+    shutil.copystat(source, target)
+    return used
+
+
+# ============================================
+# DuckDB Executor (keeps blocking work off the event loop)
+# ============================================
+
+
+class DuckDBExecutor:
+    """
+    Bounded thread pools for blocking DuckDB work called from async handlers.
+
+    DuckDB calls block the calling thread. Running them directly in an
+    ``async def`` route stalls the uvicorn event loop - one large import
+    holds up every other request on the worker. Routes hand that work to
+    this executor instead.
+
+    Three lanes, each its own pool so heavy work can't starve light calls:
+    - "data": imports, exports, snapshots, schema changes, profiling
+    - "metadata": table lookups and other short reads
+    - "snapshot": background Parquet snapshot exports (few workers, so
+      snapshot I/O is throttled and never competes with the data lane)
+
+    Usage:
+        result = await duckdb_executor.run("data", do_import, table_path)
+        future = duckdb_executor.submit("snapshot", export, path)  # fire and forget
+    """
+
+    LANES = ("data", "metadata", "snapshot")
+
+    def __init__(self):
+        self._executors: dict[str, ThreadPoolExecutor] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def lane_workers(lane: str) -> int:
+        """Configured pool size for a lane."""
+        if lane == "data":
+            return settings.duckdb_data_executor_workers
+        if lane == "snapshot":
+            return settings.snapshot_executor_workers
+        return settings.duckdb_metadata_executor_workers
+
+    def _get_executor(self, lane: str) -> ThreadPoolExecutor:
+        if lane not in self.LANES:
+            raise ValueError(f"Unknown executor lane: {lane}")
+
+        with self._lock:
+            executor = self._executors.get(lane)
+            if executor is None:
+                executor = ThreadPoolExecutor(
+                    max_workers=self.lane_workers(lane),
+                    thread_name_prefix=f"duckdb-{lane}",
+                )
+                self._executors[lane] = executor
+            return executor
+
+    def submit(self, lane: str, func: Callable[..., Any], *args, **kwargs) -> Future:
+        """
+        Queue func(*args, **kwargs) on the lane's pool without awaiting it.
+
+        Context variables are propagated like in run(). The returned
+        concurrent.futures.Future outlives the request (and event loop)
+        that submitted it.
+        """
+        executor = self._get_executor(lane)
+        ctx = contextvars.copy_context()
+        submitted_at = time.perf_counter()
+        metrics.DUCKDB_EXECUTOR_QUEUE_DEPTH.labels(lane=lane).inc()
+
+        def call() -> Any:
+            metrics.DUCKDB_EXECUTOR_QUEUE_DEPTH.labels(lane=lane).dec()
+            metrics.DUCKDB_EXECUTOR_WAIT_TIME.labels(lane=lane).observe(
+                time.perf_counter() - submitted_at
+            )
+            metrics.DUCKDB_EXECUTOR_ACTIVE.labels(lane=lane).inc()
+            try:
+                return ctx.run(func, *args, **kwargs)
+            finally:
+                metrics.DUCKDB_EXECUTOR_ACTIVE.labels(lane=lane).dec()
+
+        return executor.submit(call)
+
+    async def run(self, lane: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run func(*args, **kwargs) on the lane's pool and await the result.
+
+        Context variables (structlog request_id etc.) are propagated to the
+        worker thread. Exceptions raised by func (including HTTPException)
+        propagate to the caller.
+        """
+        future = self.submit(lane, func, *args, **kwargs)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # Cancelled while still queued: call() never ran
+            if future.cancelled():
+                metrics.DUCKDB_EXECUTOR_QUEUE_DEPTH.labels(lane=lane).dec()
+            raise
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down all lanes (pending work is cancelled)."""
+        with self._lock:
+            executors = list(self._executors.values())
+            self._executors.clear()
+
+        for executor in executors:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+# Global singleton instance
+duckdb_executor = DuckDBExecutor()
+
+
+# ============================================
+# Table Write Queue (ADR-005)
+# ============================================
+
+
+@dataclass
+class WriteJob:
+    """A queued write against one table file."""
+
+    func: Callable[[duckdb.DuckDBPyConnection], Any]
+    batch_key: str | None
+    row_count: Callable[[Any], int | None] | None = None
+    future: Future = field(default_factory=Future)
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+class TableWriteQueue:
+    """
+    Per-table write queue with batching of compatible writes.
+
+    ADR-005: Writers enqueue jobs instead of racing for the table lock. A
+    worker thread per table file with pending jobs drains its queue in
+    FIFO order and exits once the queue is empty. Queues are keyed by the
+    table file, so a branch copy never shares a worker with its main table.
+
+    A job is ``func(conn)``, run inside a transaction on a write connection
+    to the table file. Jobs must not commit or close the connection. Runs
+    of consecutive jobs with the same ``batch_key`` (e.g. several
+    incremental imports) are coalesced into one connection and one
+    transaction. If a batch fails it is rolled back and its jobs are
+    retried one by one, so each caller gets its own result or error.
+
+    Jobs that already know the table's row count after they ran pass a
+    ``row_count`` callable that reads it from their result, so recording
+    the table stats after commit does not need another COUNT(*).
+
+    The worker holds the table's TableLockManager lock while writing, so
+    queued writes are still serialized with the other write paths.
+    """
+
+    def __init__(self, max_batch_size: int | None = None):
+        self._queues: dict[str, deque[WriteJob]] = {}
+        self._workers: dict[str, threading.Thread] = {}
+        self._lock = threading.Lock()
+        self._max_batch_size = max_batch_size
+
+    @property
+    def max_batch_size(self) -> int:
+        if self._max_batch_size is not None:
+            return self._max_batch_size
+        return settings.write_queue_max_batch_size
+
+    def submit(
+        self,
+        project_id: str,
+        bucket_name: str,
+        table_name: str,
+        table_path: Path,
+        func: Callable[[duckdb.DuckDBPyConnection], Any],
+        batch_key: str | None = None,
+        row_count: Callable[[Any], int | None] | None = None,
+    ) -> Future:
+        """
+        Enqueue a write job for a table.
+
+        Args:
+            project_id: Project ID (lock key and metrics label)
+            bucket_name: Bucket name
+            table_name: Table name
+            table_path: Path to the table's .duckdb file
+            func: Job body, called with an open write connection
+            batch_key: Jobs with equal non-None keys may share a transaction
+            row_count: Reads the table's row count after the job from
+                func's return value (None = count it after commit)
+
+        Returns:
+            Future resolved with func's return value (or its exception)
+        """
+        job = WriteJob(func=func, batch_key=batch_key, row_count=row_count)
+        key = str(table_path)
+
+        with self._lock:
+            self._queues.setdefault(key, deque()).append(job)
+            metrics.WRITE_QUEUE_DEPTH.labels(project_id=project_id).inc()
+
+            if key not in self._workers:
+                worker = threading.Thread(
+                    target=self._drain,
+                    args=(key, project_id, bucket_name, table_name, table_path),
+                    name=f"write-queue-{key}",
+                    daemon=True,
+                )
+                self._workers[key] = worker
+                worker.start()
+
+        return job.future
+
+    def run(
+        self,
+        project_id: str,
+        bucket_name: str,
+        table_name: str,
+        table_path: Path,
+        func: Callable[[duckdb.DuckDBPyConnection], Any],
+        batch_key: str | None = None,
+        row_count: Callable[[Any], int | None] | None = None,
+    ) -> Any:
+        """Enqueue a write job and block until it has been committed."""
+        return self.submit(
+            project_id, bucket_name, table_name, table_path, func, batch_key, row_count
+        ).result()
+
+    def depth(self, table_path: Path) -> int:
+        """Number of jobs waiting for a table file (monitoring/debugging)."""
+        with self._lock:
+            return len(self._queues.get(str(table_path), ()))
+
+    def _next_batch(self, key: str) -> list[WriteJob]:
+        """Pop the next job plus compatible followers; retire the worker when empty."""
+        with self._lock:
+            queue = self._queues.get(key)
+            if not queue:
+                self._queues.pop(key, None)
+                self._workers.pop(key, None)
+                return []
+
+            batch = [queue.popleft()]
+            batch_key = batch[0].batch_key
+            while (
+                batch_key is not None
+                and queue
+                and queue[0].batch_key == batch_key
+                and len(batch) < self.max_batch_size
+            ):
+                batch.append(queue.popleft())
+            return batch
+
+    def _drain(
+        self,
+        key: str,
+        project_id: str,
+        bucket_name: str,
+        table_name: str,
+        table_path: Path,
+    ) -> None:
+        """Worker loop for one table file."""
+        while True:
+            batch = self._next_batch(key)
+            if not batch:
+                return
+
+            now = time.perf_counter()
+            metrics.WRITE_QUEUE_DEPTH.labels(project_id=project_id).dec(len(batch))
+            for job in batch:
+                metrics.WRITE_QUEUE_WAIT_TIME.labels(project_id=project_id).observe(
+                    now - job.enqueued_at
+                )
+
+            # Skip jobs whose callers gave up before we got to them
+            batch = [job for job in batch if job.future.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+
+            metrics.WRITE_QUEUE_BATCH_SIZE.observe(len(batch))
+
+            with table_lock_manager.acquire(project_id, bucket_name, table_name):
+                try:
+                    results = self._run_transaction(table_path, batch)
+                except Exception as e:
+                    if len(batch) == 1:
+                        batch[0].future.set_exception(e)
+                        continue
+
+                    logger.warning(
+                        "write_batch_failed_retrying_individually",
+                        table_key=key,
+                        batch_size=len(batch),
+                        error=str(e),
+                    )
+                    for job in batch:
+                        try:
+                            job.future.set_result(
+                                self._run_transaction(table_path, [job])[0]
+                            )
+                        except Exception as job_error:
+                            job.future.set_exception(job_error)
+                    continue
+
+            for job, result in zip(batch, results):
+                job.future.set_result(result)
+
+    @staticmethod
+    def _run_transaction(table_path: Path, jobs: list[WriteJob]) -> list[Any]:
+        """Run jobs in one transaction on one connection; record table stats."""
+        conn = duckdb.connect(str(table_path))
+        try:
+            conn.begin()
+            results = [job.func(conn) for job in jobs]
+            conn.commit()
+
+            # Committed - nothing below may fail the jobs (a retry would
+            # apply them twice). Without stats, record_table_stats reads the file.
+            try:
+                # Jobs run in order, so the last job sees the final row count
+                last = jobs[-1]
+                row_count = last.row_count(results[-1]) if last.row_count else None
+                stats = project_db_manager.collect_table_stats(conn, row_count=row_count)
+            except Exception:
+                stats = None
+        finally:
+            # Closing without commit rolls back a failed batch
+            conn.close()
+            table_catalog_cache.invalidate(table_path)
+        project_db_manager.record_table_stats(table_path, stats)
+        return results
+
+
+# Global singleton instance
+table_write_queue = TableWriteQueue()
+
+
 # ============================================
 # Schema definitions
 # ============================================
@@ -234,6 +1345,70 @@ CREATE TABLE IF NOT EXISTS stats (
     updated_at TIMESTAMPTZ DEFAULT now()
 );
 
+-- Persisted per-table stats (ADR-009 table files)
+-- Maintained by write paths so reads don't have to open the table file.
+-- Rows are trusted only while file_signature matches the file on disk.
+CREATE TABLE IF NOT EXISTS table_stats (
+    table_path VARCHAR PRIMARY KEY,     -- Table file path relative to duckdb_dir
+    row_count BIGINT NOT NULL,
+    size_bytes BIGINT NOT NULL,
+    columns JSON NOT NULL,
+    primary_key JSON,
+    file_signature VARCHAR NOT NULL,    -- inode:mtime_ns:size when stats were taken
+    updated_at TIMESTAMPTZ DEFAULT now()
+);
+
+-- Computed table profiles, reused until the table file changes
+CREATE TABLE IF NOT EXISTS table_profiles (
+    table_path VARCHAR NOT NULL,        -- Table file path relative to duckdb_dir
+    mode VARCHAR NOT NULL,              -- basic, full, distribution, quality
+    sample_size BIGINT NOT NULL,        -- Requested sample rows, 0 = whole table
+    file_signature VARCHAR NOT NULL,    -- inode:mtime_ns:size when profiled
+    profile JSON NOT NULL,
+    created_at TIMESTAMPTZ DEFAULT now(),
+    PRIMARY KEY (table_path, mode, sample_size)
+);
+
+-- Cached ETags (MD5) of objects under files_dir (S3-compatible API)
+-- Written when the file is written; trusted only while file_signature
+-- matches the file on disk, so HEAD/GET never have to hash the file.
+CREATE TABLE IF NOT EXISTS file_etags (
+    path VARCHAR PRIMARY KEY,           -- File path relative to files_dir
+    etag VARCHAR NOT NULL,              -- Hex digest, without quotes
+    file_signature VARCHAR NOT NULL,    -- mtime_ns:size when the ETag was computed
+    updated_at TIMESTAMPTZ DEFAULT now()
+);
+
+-- Upload sessions of the 3-stage files API (prepare -> upload -> register)
+-- Persisted so an upload survives restarts and can continue on any worker.
+CREATE TABLE IF NOT EXISTS upload_sessions (
+    upload_key VARCHAR PRIMARY KEY,
+    project_id VARCHAR NOT NULL,
+    filename VARCHAR NOT NULL,
+    content_type VARCHAR,
+    expected_size BIGINT,               -- Declared at prepare (optional)
+    tags JSON,
+    staging_path VARCHAR NOT NULL,      -- Relative to files_dir
+    size_bytes BIGINT,                  -- Set when the content is complete
+    checksum_sha256 VARCHAR,
+    checksum_md5 VARCHAR,
+    created_at TIMESTAMPTZ DEFAULT now(),
+    expires_at TIMESTAMPTZ NOT NULL,
+    uploaded_at TIMESTAMPTZ             -- NULL while chunks are still arriving
+);
+
+CREATE INDEX IF NOT EXISTS idx_upload_sessions_project ON upload_sessions(project_id);
+
+-- Chunks written into an upload session's staging file (resumable uploads)
+CREATE TABLE IF NOT EXISTS upload_chunks (
+    upload_key VARCHAR NOT NULL,
+    chunk_offset BIGINT NOT NULL,       -- Byte offset in the file
+    size_bytes BIGINT NOT NULL,
+    checksum_sha256 VARCHAR NOT NULL,
+    uploaded_at TIMESTAMPTZ DEFAULT now(),
+    PRIMARY KEY (upload_key, chunk_offset)
+);
+
 -- Bucket sharing tracking
 -- TODO: Expand this with more detailed sharing permissions when needed
 CREATE TABLE IF NOT EXISTS bucket_shares (
@@ -272,9 +1447,10 @@ CREATE TABLE IF NOT EXISTS idempotency_keys (
     endpoint VARCHAR(500) NOT NULL,
     request_hash VARCHAR(64),
     response_status INTEGER NOT NULL,
-    response_body TEXT,
+    response_body TEXT,                   -- NULL when the body exceeded the capture cap
     created_at TIMESTAMPTZ DEFAULT now(),
-    expires_at TIMESTAMPTZ NOT NULL
+    expires_at TIMESTAMPTZ NOT NULL,
+    response_headers TEXT                 -- JSON object
 );
 
 CREATE INDEX IF NOT EXISTS idx_idempotency_expires ON idempotency_keys(expires_at);
@@ -423,6 +1599,14 @@ class MetadataDB:
 
     Thread-safe connection management for the metadata.duckdb file.
     Note: db_path is read from settings on each access to support testing.
+
+    Connection model:
+    - One long-lived DuckDB connection per process (opened lazily, reopened
+      when settings.metadata_db_path changes)
+    - Queries run on cursors taken from a small pool; a cursor is a cheap
+      connection to the already-open database (no file open, no catalog load)
+    - Writes go through a single write lane (lock) so concurrent requests
+      never hit DuckDB transaction conflicts on metadata rows
     """
 
     _instance: "MetadataDB | None" = None
@@ -441,7 +1625,14 @@ class MetadataDB:
             return
 
         self._conn: duckdb.DuckDBPyConnection | None = None
+        self._conn_path: Path | None = None
         self._conn_lock = threading.Lock()
+        self._write_lock = threading.RLock()
+        self._cursor_pool: list[duckdb.DuckDBPyConnection] = []
+        # Checked-out cursors per root connection, and roots whose close is
+        # deferred until those cursors are returned
+        self._outstanding: dict[int, int] = {}
+        self._retired: dict[int, duckdb.DuckDBPyConnection] = {}
         self._initialized = True
 
     @property
@@ -449,26 +1640,125 @@ class MetadataDB:
         """Get db path from settings (allows runtime override in tests)."""
         return settings.metadata_db_path
 
-    def initialize(self) -> None:
-        """Initialize the metadata database and create schema."""
+    def _get_root_connection_locked(self) -> duckdb.DuckDBPyConnection:
+        """
+        Return the long-lived connection, opening it if needed (caller holds _conn_lock).
+
+        Reopens the connection when the configured path changed since it
+        was opened (tests swap settings.metadata_db_path per test).
+        """
         db_path = self._db_path
+        if self._conn is not None and self._conn_path == db_path:
+            return self._conn
+
+        self._close_locked()
+        self._conn = duckdb.connect(str(db_path))
+        self._conn_path = db_path
+        metrics.METADATA_CONNECTION_OPENS.inc()
+        logger.debug("metadata_db_connection_opened", path=str(db_path))
+        return self._conn
+
+    def _close_locked(self) -> None:
+        """
+        Close pooled cursors and the root connection (caller holds _conn_lock).
+
+        If cursors on the root are still checked out, closing is deferred
+        until the last one is returned - closing a DuckDB connection
+        invalidates all of its cursors mid-query.
+        """
+        for cursor in self._cursor_pool:
+            try:
+                cursor.close()
+            except Exception:
+                pass
+        self._cursor_pool.clear()
+
+        if self._conn is not None:
+            if self._outstanding.get(id(self._conn), 0) > 0:
+                self._retired[id(self._conn)] = self._conn
+            else:
+                self._outstanding.pop(id(self._conn), None)
+                try:
+                    self._conn.close()
+                except Exception:
+                    pass
+            logger.debug("metadata_db_connection_closed", path=str(self._conn_path))
+        self._conn = None
+        self._conn_path = None
+
+    def close(self) -> None:
+        """Close the long-lived connection (called on application shutdown)."""
         with self._conn_lock:
-            # Ensure parent directory exists
-            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._close_locked()
+
+    def _checkout_cursor(
+        self,
+    ) -> tuple[duckdb.DuckDBPyConnection, duckdb.DuckDBPyConnection]:
+        """Take a cursor from the pool or create a new one. Returns (root, cursor)."""
+        with self._conn_lock:
+            root = self._get_root_connection_locked()
+            # Pool is emptied on reconnect, so pooled cursors always belong to root
+            if self._cursor_pool:
+                cursor = self._cursor_pool.pop()
+                result = "reused"
+            else:
+                cursor = root.cursor()
+                result = "created"
+            self._outstanding[id(root)] = self._outstanding.get(id(root), 0) + 1
+        metrics.METADATA_CURSOR_CHECKOUTS.labels(result=result).inc()
+        return root, cursor
+
+    def _checkin_cursor(
+        self, cursor: duckdb.DuckDBPyConnection, root: duckdb.DuckDBPyConnection, healthy: bool
+    ) -> None:
+        """Return a cursor to the pool, or close it if unhealthy/stale/pool full."""
+        with self._conn_lock:
+            remaining = self._outstanding.get(id(root), 1) - 1
+            if remaining > 0:
+                self._outstanding[id(root)] = remaining
+            else:
+                self._outstanding.pop(id(root), None)
+
+            if (
+                healthy
+                and self._conn is root
+                and len(self._cursor_pool) < settings.metadata_cursor_pool_size
+            ):
+                self._cursor_pool.append(cursor)
+                return
 
-            # Connect and create schema
-            conn = duckdb.connect(str(db_path))
             try:
+                cursor.close()
+            except Exception:
+                pass
+
+            # Finish a close() that was deferred while this cursor was in use
+            if remaining <= 0 and self._retired.pop(id(root), None) is not None:
+                try:
+                    root.close()
+                except Exception:
+                    pass
+
+    def initialize(self) -> None:
+        """Initialize the metadata database and create schema."""
+        db_path = self._db_path
+        # Ensure parent directory exists
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._write_lock:
+            with self.connection() as conn:
                 # Run migrations BEFORE creating schema
                 # This allows us to migrate existing tables before CREATE TABLE IF NOT EXISTS
                 self._migrate_api_keys_schema(conn)
 
                 # Create/update schema
                 conn.execute(METADATA_SCHEMA)
+                # Columns added after the table was introduced
+                conn.execute(
+                    "ALTER TABLE idempotency_keys ADD COLUMN IF NOT EXISTS response_headers TEXT"
+                )
                 conn.commit()
                 logger.info("metadata_db_schema_created", path=str(db_path))
-            finally:
-                conn.close()
 
     def _migrate_api_keys_schema(self, conn: duckdb.DuckDBPyConnection) -> None:
         """
@@ -566,18 +1856,50 @@ class MetadataDB:
         """
         Get a connection to the metadata database.
 
+        Yields a pooled cursor on the long-lived connection (or a fresh
+        connection when settings.metadata_persistent_connection is off).
+        Use write_connection() for statements that modify data.
+
         Usage:
             with metadata_db.connection() as conn:
                 conn.execute("SELECT * FROM projects")
         """
         metrics.METADATA_CONNECTIONS_ACTIVE.inc()
-        conn = duckdb.connect(str(self._db_path))
         try:
-            yield conn
+            if not settings.metadata_persistent_connection:
+                conn = duckdb.connect(str(self._db_path))
+                metrics.METADATA_CONNECTION_OPENS.inc()
+                try:
+                    yield conn
+                finally:
+                    conn.close()
+                return
+
+            root, cursor = self._checkout_cursor()
+            healthy = False
+            try:
+                yield cursor
+                healthy = True
+            finally:
+                self._checkin_cursor(cursor, root, healthy)
         finally:
-            conn.close()
             metrics.METADATA_CONNECTIONS_ACTIVE.dec()
 
+    @contextmanager
+    def write_connection(self) -> Generator[duckdb.DuckDBPyConnection, None, None]:
+        """
+        Get a connection on the metadata write lane.
+
+        Writers are serialized by a process-wide lock so that concurrent
+        requests do not race into DuckDB write-write transaction conflicts.
+        Reentrant: a writer may call other write helpers while holding it.
+        """
+        wait_start = time.perf_counter()
+        with self._write_lock:
+            metrics.METADATA_WRITE_WAIT_TIME.observe(time.perf_counter() - wait_start)
+            with self.connection() as conn:
+                yield conn
+
     def execute(self, query: str, params: list | None = None) -> list[tuple]:
         """Execute a read query and return results."""
         start_time = time.time()
@@ -602,7 +1924,7 @@ class MetadataDB:
         """Execute a write query (INSERT, UPDATE, DELETE)."""
         start_time = time.time()
         try:
-            with self.connection() as conn:
+            with self.write_connection() as conn:
                 if params:
                     conn.execute(query, params)
                 else:
@@ -634,7 +1956,7 @@ class MetadataDB:
         db_path = f"project_{project_id}"
         now = datetime.now(timezone.utc)
 
-        with self.connection() as conn:
+        with self.write_connection() as conn:
             conn.execute(
                 """
                 INSERT INTO projects (id, name, db_path, created_at, updated_at, settings)
@@ -764,7 +2086,7 @@ class MetadataDB:
         """
         counts: dict[str, int] = {}
 
-        with self.connection() as conn:
+        with self.write_connection() as conn:
             # 1. Delete pgwire_sessions for workspaces in this project
             result = conn.execute(
                 """
@@ -828,6 +2150,19 @@ class MetadataDB:
                 [project_id],
             )
             counts["files"] = result.rowcount
+            conn.execute(
+                "DELETE FROM file_etags WHERE starts_with(path, ?)",
+                [f"project_{project_id}/"],
+            )
+            conn.execute(
+                """
+                DELETE FROM upload_chunks WHERE upload_key IN (
+                    SELECT upload_key FROM upload_sessions WHERE project_id = ?
+                )
+                """,
+                [project_id],
+            )
+            conn.execute("DELETE FROM upload_sessions WHERE project_id = ?", [project_id])
 
             # 8. Delete branches
             result = conn.execute(
@@ -842,6 +2177,8 @@ class MetadataDB:
                 [project_id],
             )
             counts["api_keys"] = result.rowcount
+        api_key_cache.invalidate_project(project_id)
+        object_index.invalidate(settings.files_dir / f"project_{project_id}")
 
         logger.info(
             "cascade_delete_project_metadata",
@@ -883,47 +2220,11 @@ class MetadataDB:
     # ========================================
 
     def count_projects(self) -> int:
-        """Count total number of projects (excluding deleted)."""
-        result = self.execute_one(
-            "SELECT COUNT(*) FROM projects WHERE status != 'deleted'"
-        )
-        return result[0] if result else 0
-
-    def count_buckets(self) -> int:
-        """
-        Count total number of buckets across all projects.
-
-        ADR-009: Counts directories in all project directories.
-        """
-        from src.config import settings
-
-        total = 0
-        duckdb_dir = settings.duckdb_dir
-        if duckdb_dir.exists():
-            for project_dir in duckdb_dir.iterdir():
-                if project_dir.is_dir() and project_dir.name.startswith("project_"):
-                    for item in project_dir.iterdir():
-                        if item.is_dir() and not item.name.startswith("_"):
-                            total += 1
-        return total
-
-    def count_tables(self) -> int:
-        """
-        Count total number of tables across all projects.
-
-        ADR-009: Counts .duckdb files in all bucket directories.
-        """
-        from src.config import settings
-
-        total = 0
-        duckdb_dir = settings.duckdb_dir
-        if duckdb_dir.exists():
-            for project_dir in duckdb_dir.iterdir():
-                if project_dir.is_dir() and project_dir.name.startswith("project_"):
-                    for bucket_dir in project_dir.iterdir():
-                        if bucket_dir.is_dir() and not bucket_dir.name.startswith("_"):
-                            total += len(list(bucket_dir.glob("*.duckdb")))
-        return total
+        """Count total number of projects (excluding deleted)."""
+        result = self.execute_one(
+            "SELECT COUNT(*) FROM projects WHERE status != 'deleted'"
+        )
+        return result[0] if result else 0
 
     def count_idempotency_keys(self) -> int:
         """Count current (non-expired) idempotency keys."""
@@ -1168,7 +2469,7 @@ class MetadataDB:
         """
         now = datetime.now(timezone.utc)
 
-        with self.connection() as conn:
+        with self.write_connection() as conn:
             conn.execute(
                 """
                 INSERT INTO api_keys (id, project_id, branch_id, key_hash, key_prefix,
@@ -1357,6 +2658,7 @@ class MetadataDB:
             "UPDATE api_keys SET revoked_at = ? WHERE id = ?",
             [now, key_id],
         )
+        api_key_cache.invalidate_key(key_id)
 
         logger.info(
             "api_key_revoked",
@@ -1381,6 +2683,34 @@ class MetadataDB:
 
         logger.debug("api_key_last_used_updated", key_id=key_id)
 
+    def update_api_keys_last_used(self, last_used: dict[str, datetime]) -> None:
+        """
+        Set last_used_at for many API keys in one transaction.
+
+        Args:
+            last_used: Mapping of API key ID to last use timestamp
+        """
+        start_time = time.time()
+        try:
+            with self.write_connection() as conn:
+                conn.execute("BEGIN TRANSACTION")
+                try:
+                    conn.executemany(
+                        "UPDATE api_keys SET last_used_at = ? WHERE id = ?",
+                        [[used_at, key_id] for key_id, used_at in last_used.items()],
+                    )
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+        finally:
+            metrics.METADATA_QUERIES_TOTAL.labels(operation="write").inc()
+            metrics.METADATA_QUERY_DURATION.labels(operation="write").observe(
+                time.time() - start_time
+            )
+
+        logger.debug("api_keys_last_used_flushed", count=len(last_used))
+
     def delete_api_key(self, key_id: str) -> bool:
         """
         Delete an API key.
@@ -1392,6 +2722,7 @@ class MetadataDB:
             True if key was deleted
         """
         self.execute_write("DELETE FROM api_keys WHERE id = ?", [key_id])
+        api_key_cache.invalidate_key(key_id)
 
         logger.info("api_key_deleted", key_id=key_id)
         return True
@@ -1418,6 +2749,7 @@ class MetadataDB:
             "DELETE FROM api_keys WHERE project_id = ?",
             [project_id],
         )
+        api_key_cache.invalidate_project(project_id)
 
         logger.info(
             "project_api_keys_deleted",
@@ -1451,6 +2783,178 @@ class MetadataDB:
         )
         return result[0] if result else 0
 
+    # ========================================
+    # Table stats operations
+    # ========================================
+
+    def get_table_stats(self, table_path: str) -> dict[str, Any] | None:
+        """
+        Get persisted stats for a table file.
+
+        Args:
+            table_path: Table file path relative to duckdb_dir
+
+        Returns:
+            Stats dict or None if not recorded
+        """
+        import json
+
+        result = self.execute_one(
+            """
+            SELECT table_path, row_count, size_bytes, columns, primary_key,
+                   file_signature, updated_at
+            FROM table_stats
+            WHERE table_path = ?
+            """,
+            [table_path],
+        )
+
+        if not result:
+            return None
+
+        return {
+            "table_path": result[0],
+            "row_count": result[1],
+            "size_bytes": result[2],
+            "columns": json.loads(result[3]) if result[3] else [],
+            "primary_key": json.loads(result[4]) if result[4] else [],
+            "file_signature": result[5],
+            "updated_at": result[6].isoformat() if result[6] else None,
+        }
+
+    def upsert_table_stats(
+        self,
+        table_path: str,
+        row_count: int,
+        size_bytes: int,
+        columns: list[dict[str, Any]],
+        primary_key: list[str],
+        file_signature: str,
+    ) -> None:
+        """Insert or replace persisted stats for a table file."""
+        import json
+
+        self.execute_write(
+            """
+            INSERT INTO table_stats
+            (table_path, row_count, size_bytes, columns, primary_key, file_signature, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (table_path) DO UPDATE SET
+                row_count = EXCLUDED.row_count,
+                size_bytes = EXCLUDED.size_bytes,
+                columns = EXCLUDED.columns,
+                primary_key = EXCLUDED.primary_key,
+                file_signature = EXCLUDED.file_signature,
+                updated_at = EXCLUDED.updated_at
+            """,
+            [
+                table_path,
+                row_count,
+                size_bytes,
+                json.dumps(columns),
+                json.dumps(primary_key),
+                file_signature,
+                datetime.now(timezone.utc),
+            ],
+        )
+
+    def delete_table_stats(self, table_path: str) -> None:
+        """Delete persisted stats (and cached profiles) for a table file."""
+        self.execute_write("DELETE FROM table_stats WHERE table_path = ?", [table_path])
+        self.execute_write("DELETE FROM table_profiles WHERE table_path = ?", [table_path])
+
+    def delete_table_stats_under(self, path_prefix: str) -> None:
+        """Delete persisted stats (and cached profiles) for all table files under a directory prefix."""
+        prefix = path_prefix.rstrip("/") + "/"
+        self.execute_write(
+            "DELETE FROM table_stats WHERE starts_with(table_path, ?)", [prefix]
+        )
+        self.execute_write(
+            "DELETE FROM table_profiles WHERE starts_with(table_path, ?)", [prefix]
+        )
+
+    def summarize_table_stats_under(self, path_prefix: str) -> tuple[int, int]:
+        """Return (table count, total size_bytes) of persisted stats under a directory prefix."""
+        result = self.execute_one(
+            """
+            SELECT COUNT(*), COALESCE(SUM(size_bytes), 0)
+            FROM table_stats
+            WHERE starts_with(table_path, ?)
+            """,
+            [path_prefix.rstrip("/") + "/"],
+        )
+        return (result[0], result[1]) if result else (0, 0)
+
+    def list_table_stats_signatures(self) -> dict[str, str]:
+        """Return {table_path: file_signature} for all persisted stats (reconciler)."""
+        rows = self.execute("SELECT table_path, file_signature FROM table_stats")
+        return {row[0]: row[1] for row in rows}
+
+    def get_cached_table_profile(
+        self, table_path: str, mode: str, sample_size: int
+    ) -> dict[str, Any] | None:
+        """
+        Get a stored table profile.
+
+        Args:
+            table_path: Table file path relative to duckdb_dir
+            mode: Profile mode
+            sample_size: Requested sample rows (0 = whole table)
+
+        Returns:
+            Dict with file_signature, profile and created_at, or None
+        """
+        import json
+
+        result = self.execute_one(
+            """
+            SELECT file_signature, profile, created_at
+            FROM table_profiles
+            WHERE table_path = ? AND mode = ? AND sample_size = ?
+            """,
+            [table_path, mode, sample_size],
+        )
+
+        if not result:
+            return None
+
+        return {
+            "file_signature": result[0],
+            "profile": json.loads(result[1]),
+            "created_at": result[2].isoformat() if result[2] else None,
+        }
+
+    def save_table_profile(
+        self,
+        table_path: str,
+        mode: str,
+        sample_size: int,
+        file_signature: str,
+        profile: dict[str, Any],
+    ) -> None:
+        """Insert or replace the stored profile for a table file and mode."""
+        import json
+
+        self.execute_write(
+            """
+            INSERT INTO table_profiles
+            (table_path, mode, sample_size, file_signature, profile, created_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (table_path, mode, sample_size) DO UPDATE SET
+                file_signature = EXCLUDED.file_signature,
+                profile = EXCLUDED.profile,
+                created_at = EXCLUDED.created_at
+            """,
+            [
+                table_path,
+                mode,
+                sample_size,
+                file_signature,
+                json.dumps(profile, default=str),
+                datetime.now(timezone.utc),
+            ],
+        )
+
     # ========================================
     # Idempotency key operations
     # ========================================
@@ -1465,10 +2969,12 @@ class MetadataDB:
         Returns:
             Dict with key info including cached response, or None if not found/expired
         """
+        import json
+
         result = self.execute_one(
             """
             SELECT key, method, endpoint, request_hash, response_status, response_body,
-                   created_at, expires_at
+                   created_at, expires_at, response_headers
             FROM idempotency_keys
             WHERE key = ? AND expires_at > now()
             """,
@@ -1485,6 +2991,7 @@ class MetadataDB:
                 "response_body": result[5],
                 "created_at": result[6].isoformat() if result[6] else None,
                 "expires_at": result[7].isoformat() if result[7] else None,
+                "response_headers": json.loads(result[8]) if result[8] else None,
             }
 
         return None
@@ -1496,8 +3003,9 @@ class MetadataDB:
         endpoint: str,
         request_hash: str | None,
         response_status: int,
-        response_body: str,
+        response_body: str | None,
         ttl_seconds: int = 600,
+        response_headers: dict[str, str] | None = None,
     ) -> None:
         """
         Store an idempotency key with its response.
@@ -1508,9 +3016,11 @@ class MetadataDB:
             endpoint: The request endpoint path
             request_hash: SHA-256 hash of request body (for validation)
             response_status: HTTP status code of the response
-            response_body: JSON string of the response body
+            response_body: Response body text, None if it was too large to keep
             ttl_seconds: Time to live in seconds (default 10 minutes)
+            response_headers: Response headers to replay (e.g. content-type)
         """
+        import json
         from datetime import timedelta
 
         now = datetime.now(timezone.utc)
@@ -1519,14 +3029,19 @@ class MetadataDB:
         self.execute_write(
             """
             INSERT INTO idempotency_keys
-            (key, method, endpoint, request_hash, response_status, response_body, created_at, expires_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            (key, method, endpoint, request_hash, response_status, response_body, created_at,
+             expires_at, response_headers)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
             ON CONFLICT (key) DO UPDATE SET
                 response_status = EXCLUDED.response_status,
                 response_body = EXCLUDED.response_body,
-                expires_at = EXCLUDED.expires_at
+                expires_at = EXCLUDED.expires_at,
+                response_headers = EXCLUDED.response_headers
             """,
-            [key, method, endpoint, request_hash, response_status, response_body, now, expires_at],
+            [
+                key, method, endpoint, request_hash, response_status, response_body, now,
+                expires_at, json.dumps(response_headers) if response_headers is not None else None,
+            ],
         )
 
         logger.debug(
@@ -1574,6 +3089,7 @@ class MetadataDB:
         is_staged: bool = True,
         expires_at: datetime | None = None,
         tags: dict | None = None,
+        checksum_md5: str | None = None,
     ) -> dict[str, Any]:
         """
         Create a file record in metadata database.
@@ -1589,6 +3105,7 @@ class MetadataDB:
             is_staged: True if file is in staging (not yet registered)
             expires_at: When staging file expires
             tags: Optional tags/metadata
+            checksum_md5: MD5 hash of file content (S3 ETag)
 
         Returns:
             Created file record dict
@@ -1597,18 +3114,18 @@ class MetadataDB:
 
         now = datetime.now(timezone.utc)
 
-        with self.connection() as conn:
+        with self.write_connection() as conn:
             conn.execute(
                 """
                 INSERT INTO files (
                     id, project_id, name, path, size_bytes, content_type,
-                    checksum_sha256, is_staged, created_at, expires_at, tags
+                    checksum_md5, checksum_sha256, is_staged, created_at, expires_at, tags
                 )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 [
                     file_id, project_id, name, path, size_bytes, content_type,
-                    checksum_sha256, is_staged, now, expires_at,
+                    checksum_md5, checksum_sha256, is_staged, now, expires_at,
                     json.dumps(tags) if tags else None
                 ],
             )
@@ -1645,6 +3162,46 @@ class MetadataDB:
         )
         return self._row_to_file_dict(result) if result else None
 
+    def get_files_by_project_ids(
+        self, project_id: str, file_ids: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Get several files of a project in one query.
+
+        Returns:
+            Dict of file ID -> file record; IDs not found in the project are missing
+        """
+        if not file_ids:
+            return {}
+        placeholders = ", ".join("?" for _ in file_ids)
+        results = self.execute(
+            f"SELECT * FROM files WHERE project_id = ? AND id IN ({placeholders})",
+            [project_id, *file_ids],
+        )
+        files = [self._row_to_file_dict(row) for row in results]
+        return {f["id"]: f for f in files}
+
+    def list_files_matching(self, project_id: str, pattern: str) -> list[dict[str, Any]]:
+        """
+        List files of a project whose name matches a glob pattern.
+
+        Args:
+            project_id: Project ID
+            pattern: Glob pattern (*, ?, [...]) matched against the file name
+
+        Returns:
+            List of file record dicts ordered by name
+        """
+        results = self.execute(
+            """
+            SELECT * FROM files
+            WHERE project_id = ? AND name GLOB ?
+            ORDER BY name, created_at
+            """,
+            [project_id, pattern],
+        )
+        return [self._row_to_file_dict(row) for row in results]
+
     def list_files(
         self,
         project_id: str,
@@ -1757,82 +3314,365 @@ class MetadataDB:
         logger.info("file_deleted", file_id=file_id)
         return True
 
-    def delete_project_files(self, project_id: str) -> int:
-        """Delete all file records for a project."""
-        count_result = self.execute_one(
-            "SELECT COUNT(*) FROM files WHERE project_id = ?",
-            [project_id]
+    def delete_project_files(self, project_id: str) -> int:
+        """Delete all file records for a project."""
+        count_result = self.execute_one(
+            "SELECT COUNT(*) FROM files WHERE project_id = ?",
+            [project_id]
+        )
+        count = count_result[0] if count_result else 0
+
+        self.execute_write(
+            "DELETE FROM files WHERE project_id = ?",
+            [project_id]
+        )
+
+        logger.info("project_files_deleted", project_id=project_id, count=count)
+        return count
+
+    def cleanup_expired_files(self) -> list[dict[str, Any]]:
+        """
+        Find and return expired staging files for cleanup.
+
+        Returns:
+            List of expired file records (caller should delete actual files)
+        """
+        results = self.execute(
+            """
+            SELECT * FROM files
+            WHERE is_staged = true AND expires_at <= now()
+            """
+        )
+
+        expired_files = [self._row_to_file_dict(row) for row in results]
+
+        if expired_files:
+            # Delete records
+            self.execute_write(
+                "DELETE FROM files WHERE is_staged = true AND expires_at <= now()"
+            )
+            logger.info("expired_files_cleaned", count=len(expired_files))
+
+        return expired_files
+
+    def _row_to_file_dict(self, row: tuple | None) -> dict[str, Any] | None:
+        """
+        Convert database row to file dictionary.
+
+        Schema: id(0), project_id(1), name(2), path(3), size_bytes(4),
+                content_type(5), checksum_md5(6), checksum_sha256(7),
+                is_staged(8), created_at(9), expires_at(10), tags(11)
+        """
+        import json
+
+        if row is None:
+            return None
+
+        # Parse tags JSON if it's a string
+        tags = row[11] if len(row) > 11 else None
+        if isinstance(tags, str):
+            try:
+                tags = json.loads(tags)
+            except (json.JSONDecodeError, TypeError):
+                tags = None
+
+        return {
+            "id": row[0],
+            "project_id": row[1],
+            "name": row[2],
+            "path": row[3],
+            "size_bytes": row[4],
+            "content_type": row[5],
+            "checksum_md5": row[6],
+            "checksum_sha256": row[7],
+            "is_staged": row[8],
+            "created_at": row[9].isoformat() if row[9] else None,
+            "expires_at": row[10].isoformat() if row[10] else None,
+            "tags": tags,
+        }
+
+    # ========================================
+    # Upload session operations (Files API)
+    # ========================================
+
+    def create_upload_session(
+        self,
+        upload_key: str,
+        project_id: str,
+        filename: str,
+        staging_path: str,
+        expires_at: datetime,
+        content_type: str | None = None,
+        expected_size: int | None = None,
+        tags: dict | None = None,
+    ) -> dict[str, Any]:
+        """
+        Create an upload session (stage 1 of the files API upload).
+
+        Args:
+            upload_key: Unique upload key
+            project_id: Project the upload belongs to
+            filename: Original filename
+            staging_path: Staging file path relative to files_dir
+            expires_at: When the session and its staging file expire
+            content_type: MIME type
+            expected_size: Declared file size (optional)
+            tags: Optional tags/metadata
+
+        Returns:
+            Created session dict
+        """
+        import json
+
+        self.execute_write(
+            """
+            INSERT INTO upload_sessions (
+                upload_key, project_id, filename, content_type, expected_size, tags,
+                staging_path, created_at, expires_at
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                upload_key, project_id, filename, content_type, expected_size,
+                json.dumps(tags) if tags else None, staging_path,
+                datetime.now(timezone.utc), expires_at,
+            ],
+        )
+        return self.get_upload_session(upload_key)
+
+    def get_upload_session(self, upload_key: str) -> dict[str, Any] | None:
+        """Get an upload session by key (expired sessions included)."""
+        import json
+
+        row = self.execute_one(
+            """
+            SELECT upload_key, project_id, filename, content_type, expected_size, tags,
+                   staging_path, size_bytes, checksum_sha256, checksum_md5,
+                   created_at, expires_at, uploaded_at
+            FROM upload_sessions WHERE upload_key = ?
+            """,
+            [upload_key],
+        )
+        if row is None:
+            return None
+
+        tags = row[5]
+        if isinstance(tags, str):
+            tags = json.loads(tags)
+
+        return {
+            "upload_key": row[0],
+            "project_id": row[1],
+            "filename": row[2],
+            "content_type": row[3],
+            "expected_size": row[4],
+            "tags": tags,
+            "staging_path": row[6],
+            "size_bytes": row[7],
+            "checksum_sha256": row[8],
+            "checksum_md5": row[9],
+            "created_at": row[10].isoformat() if row[10] else None,
+            "expires_at": row[11].isoformat() if row[11] else None,
+            "uploaded_at": row[12].isoformat() if row[12] else None,
+        }
+
+    def list_upload_chunks(self, upload_key: str) -> list[dict[str, Any]]:
+        """List the chunks received for an upload session, ordered by offset."""
+        rows = self.execute(
+            """
+            SELECT chunk_offset, size_bytes, checksum_sha256
+            FROM upload_chunks WHERE upload_key = ?
+            ORDER BY chunk_offset
+            """,
+            [upload_key],
+        )
+        return [
+            {"offset": row[0], "size_bytes": row[1], "checksum_sha256": row[2]}
+            for row in rows
+        ]
+
+    def get_overlapping_upload_chunk(
+        self, upload_key: str, offset: int, size_bytes: int
+    ) -> dict[str, Any] | None:
+        """
+        Find a stored chunk at another offset that overlaps [offset, offset + size_bytes).
+
+        Re-sending a chunk at the same offset replaces it (retries); any
+        other overlap would corrupt data already written.
+        """
+        row = self.execute_one(
+            """
+            SELECT chunk_offset, size_bytes FROM upload_chunks
+            WHERE upload_key = ? AND chunk_offset != ?
+              AND chunk_offset < ? AND chunk_offset + size_bytes > ?
+            LIMIT 1
+            """,
+            [upload_key, offset, offset + size_bytes, offset],
         )
-        count = count_result[0] if count_result else 0
+        if row is None:
+            return None
+        return {"offset": row[0], "size_bytes": row[1]}
 
+    def store_upload_chunk(
+        self, upload_key: str, offset: int, size_bytes: int, checksum_sha256: str
+    ) -> None:
+        """Record a chunk written into the staging file (replaces a retried chunk)."""
         self.execute_write(
-            "DELETE FROM files WHERE project_id = ?",
-            [project_id]
+            """
+            INSERT INTO upload_chunks (upload_key, chunk_offset, size_bytes, checksum_sha256, uploaded_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (upload_key, chunk_offset) DO UPDATE SET
+                size_bytes = EXCLUDED.size_bytes,
+                checksum_sha256 = EXCLUDED.checksum_sha256,
+                uploaded_at = EXCLUDED.uploaded_at
+            """,
+            [upload_key, offset, size_bytes, checksum_sha256, datetime.now(timezone.utc)],
         )
 
-        logger.info("project_files_deleted", project_id=project_id, count=count)
-        return count
+    def delete_upload_chunk(self, upload_key: str, offset: int) -> None:
+        """Forget a chunk before its bytes are overwritten by a re-send."""
+        self.execute_write(
+            "DELETE FROM upload_chunks WHERE upload_key = ? AND chunk_offset = ?",
+            [upload_key, offset],
+        )
 
-    def cleanup_expired_files(self) -> list[dict[str, Any]]:
+    def complete_upload_session(
+        self,
+        upload_key: str,
+        size_bytes: int,
+        checksum_sha256: str,
+        checksum_md5: str,
+    ) -> None:
+        """Mark an upload session's content as complete."""
+        with self.write_connection() as conn:
+            conn.execute(
+                """
+                UPDATE upload_sessions
+                SET size_bytes = ?, checksum_sha256 = ?, checksum_md5 = ?, uploaded_at = ?
+                WHERE upload_key = ?
+                """,
+                [size_bytes, checksum_sha256, checksum_md5, datetime.now(timezone.utc), upload_key],
+            )
+            # Chunk bookkeeping is no longer needed once the file is whole
+            conn.execute("DELETE FROM upload_chunks WHERE upload_key = ?", [upload_key])
+            conn.commit()
+
+    def delete_upload_session(self, upload_key: str) -> None:
+        """Delete an upload session and its chunk records."""
+        with self.write_connection() as conn:
+            conn.execute("DELETE FROM upload_chunks WHERE upload_key = ?", [upload_key])
+            conn.execute("DELETE FROM upload_sessions WHERE upload_key = ?", [upload_key])
+            conn.commit()
+
+    def cleanup_expired_upload_sessions(self) -> list[dict[str, Any]]:
         """
-        Find and return expired staging files for cleanup.
+        Delete expired upload sessions.
 
         Returns:
-            List of expired file records (caller should delete actual files)
+            List of {upload_key, project_id, staging_path} of deleted sessions
+            (caller should delete the staging files)
         """
-        results = self.execute(
-            """
-            SELECT * FROM files
-            WHERE is_staged = true AND expires_at <= now()
-            """
+        rows = self.execute(
+            "SELECT upload_key, project_id, staging_path FROM upload_sessions WHERE expires_at <= now()"
         )
+        expired = [
+            {"upload_key": row[0], "project_id": row[1], "staging_path": row[2]}
+            for row in rows
+        ]
 
-        expired_files = [self._row_to_file_dict(row) for row in results]
+        if expired:
+            keys = [session["upload_key"] for session in expired]
+            placeholders = ", ".join("?" for _ in keys)
+            with self.write_connection() as conn:
+                conn.execute(f"DELETE FROM upload_chunks WHERE upload_key IN ({placeholders})", keys)
+                conn.execute(f"DELETE FROM upload_sessions WHERE upload_key IN ({placeholders})", keys)
+                conn.commit()
+            logger.info("expired_upload_sessions_cleaned", count=len(expired))
 
-        if expired_files:
-            # Delete records
-            self.execute_write(
-                "DELETE FROM files WHERE is_staged = true AND expires_at <= now()"
-            )
-            logger.info("expired_files_cleaned", count=len(expired_files))
+        return expired
 
-        return expired_files
+    # ========================================
+    # File ETag operations (S3-compatible API)
+    # ========================================
 
-    def _row_to_file_dict(self, row: tuple | None) -> dict[str, Any] | None:
+    @staticmethod
+    def _file_etag_signature(file_path: Path) -> str | None:
+        """Return "mtime_ns:size" of a file, or None if it doesn't exist."""
+        try:
+            st = file_path.stat()
+        except FileNotFoundError:
+            return None
+        return f"{st.st_mtime_ns}:{st.st_size}"
+
+    def store_file_etag(self, file_path: Path, etag: str) -> None:
         """
-        Convert database row to file dictionary.
+        Remember the ETag of a file just written under files_dir.
 
-        Schema: id(0), project_id(1), name(2), path(3), size_bytes(4),
-                content_type(5), checksum_md5(6), checksum_sha256(7),
-                is_staged(8), created_at(9), expires_at(10), tags(11)
+        Args:
+            file_path: Absolute path of the file (under settings.files_dir)
+            etag: Hex digest of the file content
         """
-        import json
+        signature = self._file_etag_signature(file_path)
+        if signature is None:
+            return
 
-        if row is None:
-            return None
+        self.execute_write(
+            """
+            INSERT INTO file_etags (path, etag, file_signature, updated_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT (path) DO UPDATE SET
+                etag = EXCLUDED.etag,
+                file_signature = EXCLUDED.file_signature,
+                updated_at = EXCLUDED.updated_at
+            """,
+            [
+                str(file_path.relative_to(settings.files_dir)),
+                etag,
+                signature,
+                datetime.now(timezone.utc),
+            ],
+        )
 
-        # Parse tags JSON if it's a string
-        tags = row[11] if len(row) > 11 else None
-        if isinstance(tags, str):
-            try:
-                tags = json.loads(tags)
-            except (json.JSONDecodeError, TypeError):
-                tags = None
+    def get_file_etag(self, file_path: Path) -> str | None:
+        """
+        Get the cached ETag of a file under files_dir.
 
-        return {
-            "id": row[0],
-            "project_id": row[1],
-            "name": row[2],
-            "path": row[3],
-            "size_bytes": row[4],
-            "content_type": row[5],
-            "checksum_md5": row[6],
-            "checksum_sha256": row[7],
-            "is_staged": row[8],
-            "created_at": row[9].isoformat() if row[9] else None,
-            "expires_at": row[10].isoformat() if row[10] else None,
-            "tags": tags,
-        }
+        Returns:
+            The ETag, or None if unknown or the file changed since it was
+            computed.
+        """
+        result = self.execute_one(
+            "SELECT etag, file_signature FROM file_etags WHERE path = ?",
+            [str(file_path.relative_to(settings.files_dir))],
+        )
+        if result and result[1] == self._file_etag_signature(file_path):
+            return result[0]
+        return None
+
+    def get_file_etags(self, file_paths: list[Path]) -> dict[Path, tuple[str, str]]:
+        """
+        Get cached ETags of several files under files_dir (one listing page).
+
+        Returns:
+            {file_path: (etag, file_signature)} for files with a cached ETag;
+            callers compare the signature with the file they list.
+        """
+        if not file_paths:
+            return {}
+        by_relpath = {str(p.relative_to(settings.files_dir)): p for p in file_paths}
+        placeholders = ", ".join("?" for _ in by_relpath)
+        rows = self.execute(
+            f"SELECT path, etag, file_signature FROM file_etags WHERE path IN ({placeholders})",
+            list(by_relpath),
+        )
+        return {by_relpath[row[0]]: (row[1], row[2]) for row in rows}
+
+    def delete_file_etag(self, file_path: Path) -> None:
+        """Forget the ETag of a deleted file."""
+        self.execute_write(
+            "DELETE FROM file_etags WHERE path = ?",
+            [str(file_path.relative_to(settings.files_dir))],
+        )
 
     # ========================================
     # Snapshot settings operations (ADR-004)
@@ -1909,7 +3749,7 @@ class MetadataDB:
         now = datetime.now(timezone.utc)
         settings_id = str(uuid.uuid4())
 
-        with self.connection() as conn:
+        with self.write_connection() as conn:
             conn.execute(
                 """
                 INSERT INTO snapshot_settings (id, entity_type, entity_id, project_id, config, created_at, updated_at)
@@ -2032,7 +3872,7 @@ class MetadataDB:
 
         now = datetime.now(timezone.utc)
 
-        with self.connection() as conn:
+        with self.write_connection() as conn:
             conn.execute(
                 """
                 INSERT INTO snapshots (
@@ -2167,6 +4007,13 @@ class MetadataDB:
         )
         return result[0] if result else 0
 
+    def update_snapshot_size(self, snapshot_id: str, size_bytes: int) -> None:
+        """Set the on-disk size of a snapshot once its background export finishes."""
+        self.execute_write(
+            "UPDATE snapshots SET size_bytes = ? WHERE id = ?",
+            [size_bytes, snapshot_id],
+        )
+
     def delete_snapshot(self, snapshot_id: str) -> bool:
         """Delete a snapshot record (caller should delete files)."""
         self.execute_write("DELETE FROM snapshots WHERE id = ?", [snapshot_id])
@@ -2266,7 +4113,7 @@ class MetadataDB:
         """Create a new dev branch record."""
         now = datetime.now(timezone.utc)
 
-        with self.connection() as conn:
+        with self.write_connection() as conn:
             conn.execute(
                 """
                 INSERT INTO branches (id, project_id, name, created_at, created_by, description)
@@ -2466,7 +4313,7 @@ class MetadataDB:
         size_limit_bytes: int = 10737418240,
     ) -> dict[str, Any]:
         """Create a new workspace."""
-        with self.connection() as conn:
+        with self.write_connection() as conn:
             conn.execute(
                 """
                 INSERT INTO workspaces (id, project_id, branch_id, name, db_path, expires_at, size_limit_bytes, status)
@@ -2530,7 +4377,7 @@ class MetadataDB:
 
     def update_workspace_status(self, workspace_id: str, status: str) -> bool:
         """Update workspace status."""
-        with self.connection() as conn:
+        with self.write_connection() as conn:
             conn.execute(
                 "UPDATE workspaces SET status = ? WHERE id = ?",
                 [status, workspace_id],
@@ -2542,7 +4389,7 @@ class MetadataDB:
 
     def delete_workspace(self, workspace_id: str) -> bool:
         """Delete workspace and its credentials and sessions."""
-        with self.connection() as conn:
+        with self.write_connection() as conn:
             # Delete pgwire sessions first (foreign key)
             conn.execute(
                 "DELETE FROM pgwire_sessions WHERE workspace_id = ?",
@@ -2588,7 +4435,7 @@ class MetadataDB:
         self, workspace_id: str, username: str, password_hash: str
     ) -> dict[str, Any]:
         """Create credentials for workspace."""
-        with self.connection() as conn:
+        with self.write_connection() as conn:
             conn.execute(
                 """
                 INSERT INTO workspace_credentials (workspace_id, username, password_hash)
@@ -2640,7 +4487,7 @@ class MetadataDB:
         self, workspace_id: str, password_hash: str
     ) -> bool:
         """Update workspace password."""
-        with self.connection() as conn:
+        with self.write_connection() as conn:
             conn.execute(
                 "UPDATE workspace_credentials SET password_hash = ? WHERE workspace_id = ?",
                 [password_hash, workspace_id],
@@ -2656,7 +4503,7 @@ class MetadataDB:
         client_ip: str | None = None,
     ) -> dict[str, Any]:
         """Create a new PG Wire session."""
-        with self.connection() as conn:
+        with self.write_connection() as conn:
             conn.execute(
                 """
                 INSERT INTO pgwire_sessions (session_id, workspace_id, client_ip, status)
@@ -2698,7 +4545,7 @@ class MetadataDB:
         self, session_id: str, increment_queries: bool = True
     ) -> bool:
         """Update last activity time and optionally increment query count."""
-        with self.connection() as conn:
+        with self.write_connection() as conn:
             if increment_queries:
                 conn.execute(
                     """
@@ -2719,7 +4566,7 @@ class MetadataDB:
         self, session_id: str, status: str = "disconnected"
     ) -> bool:
         """Close a PG Wire session."""
-        with self.connection() as conn:
+        with self.write_connection() as conn:
             conn.execute(
                 "UPDATE pgwire_sessions SET status = ? WHERE session_id = ?",
                 [status, session_id],
@@ -2771,7 +4618,7 @@ class MetadataDB:
 
     def cleanup_stale_pgwire_sessions(self, idle_timeout_seconds: int = 3600) -> int:
         """Mark sessions as timeout if idle for too long. Returns count."""
-        with self.connection() as conn:
+        with self.write_connection() as conn:
             # DuckDB doesn't support parameterized INTERVAL, format directly
             # idle_timeout_seconds is an int so this is safe
             result = conn.execute(
@@ -2787,7 +4634,7 @@ class MetadataDB:
 
     def delete_pgwire_sessions_for_workspace(self, workspace_id: str) -> int:
         """Delete all sessions for a workspace (called on workspace delete)."""
-        with self.connection() as conn:
+        with self.write_connection() as conn:
             result = conn.execute(
                 "DELETE FROM pgwire_sessions WHERE workspace_id = ? RETURNING session_id",
                 [workspace_id],
@@ -2903,7 +4750,11 @@ class ProjectDBManager:
                         lock_key = f"{project_id}_branch_{branch_id}/{bucket_dir.name}/{table_name}"
                         table_lock_manager._locks.pop(lock_key, None)
 
+            bucket_count = self._count_bucket_dirs(branch_dir)
             shutil.rmtree(branch_dir)
+            storage_usage.adjust(buckets=-bucket_count)
+            table_catalog_cache.invalidate_dir(branch_dir)
+            self.forget_table_stats(branch_dir)
             logger.info(
                 "branch_dir_deleted",
                 project_id=project_id,
@@ -2934,7 +4785,10 @@ class ProjectDBManager:
         Copy a table from main to branch (Copy-on-Write operation).
 
         ADR-007: Called before first write to a table in a branch.
-        Copies the entire .duckdb file from main project to branch.
+        The .duckdb file is cloned with clone_file(): a reflink where the
+        filesystem supports it (no data is copied until either side
+        writes), otherwise an in-kernel or plain copy. Strategy selection
+        is controlled by settings.branch_cow_strategy.
 
         Returns the path to the copied table in branch.
         """
@@ -2948,12 +4802,29 @@ class ProjectDBManager:
 
         # Target: branch table
         branch_bucket_dir = self.get_branch_bucket_dir(project_id, branch_id, bucket_name)
-        branch_bucket_dir.mkdir(parents=True, exist_ok=True)
+        self._make_bucket_dir(branch_bucket_dir)
 
         target_path = self.get_branch_table_path(project_id, branch_id, bucket_name, table_name)
 
-        # Copy the file
-        shutil.copy2(source_path, target_path)
+        # Clone the file
+        start_time = time.perf_counter()
+        try:
+            strategy = clone_file(
+                source_path, target_path, strategy=settings.branch_cow_strategy
+            )
+        except BaseException:
+            # Never leave a partial file behind: it would be read as the branch copy
+            target_path.unlink(missing_ok=True)
+            raise
+        duration = time.perf_counter() - start_time
+        table_catalog_cache.invalidate(target_path)
+
+        size_bytes = target_path.stat().st_size
+        metrics.BRANCH_COW_OPERATIONS.labels(project_id=project_id, branch_id=branch_id).inc()
+        metrics.BRANCH_COW_DURATION.labels(strategy=strategy).observe(duration)
+        metrics.BRANCH_COW_SIZE_BYTES.labels(
+            project_id=project_id, branch_id=branch_id, strategy=strategy
+        ).inc(size_bytes)
 
         logger.info(
             "table_copied_to_branch",
@@ -2963,7 +4834,9 @@ class ProjectDBManager:
             table_name=table_name,
             source_path=str(source_path),
             target_path=str(target_path),
-            size_bytes=target_path.stat().st_size,
+            size_bytes=size_bytes,
+            strategy=strategy,
+            duration_seconds=duration,
         )
 
         return target_path
@@ -2984,6 +4857,8 @@ class ProjectDBManager:
 
         if table_path.exists():
             table_path.unlink()
+            table_catalog_cache.invalidate(table_path)
+            self.forget_table_stats(table_path)
             logger.info(
                 "table_deleted_from_branch",
                 project_id=project_id,
@@ -3306,7 +5181,7 @@ class ProjectDBManager:
         # Dev branch: create in branch directory
         # Ensure branch bucket directory exists
         branch_bucket_dir = self.get_branch_bucket_dir(project_id, branch_id, bucket_name)
-        branch_bucket_dir.mkdir(parents=True, exist_ok=True)
+        self._make_bucket_dir(branch_bucket_dir)
 
         # Get table file path in branch
         table_path = self.get_branch_table_path(
@@ -3336,6 +5211,9 @@ class ProjectDBManager:
         # Create the table file
         with duckdb.connect(str(table_path)) as conn:
             conn.execute(create_sql)
+            stats = self.collect_table_stats(conn, row_count=0)
+        table_catalog_cache.invalidate(table_path)
+        self.record_table_stats(table_path, stats)
 
         logger.info(
             "table_created_in_branch",
@@ -3432,52 +5310,11 @@ class ProjectDBManager:
             Table info dict or None if error
         """
         try:
-            table_name = table_path.stem
-
-            with duckdb.connect(str(table_path), read_only=True) as conn:
-                # Get columns
-                columns_result = conn.execute(
-                    f"DESCRIBE {TABLE_DATA_NAME}"
-                ).fetchall()
-                columns = [
-                    {
-                        "name": row[0],
-                        "type": row[1],
-                        "nullable": row[2] == "YES",
-                        "default": row[4],
-                    }
-                    for row in columns_result
-                ]
-
-                # Get primary key
-                primary_key = []
-                try:
-                    pk_result = conn.execute(
-                        f"""
-                        SELECT constraint_column_names
-                        FROM duckdb_constraints()
-                        WHERE schema_name = 'main' AND table_name = '{TABLE_DATA_NAME}'
-                          AND constraint_type = 'PRIMARY KEY'
-                        """
-                    ).fetchone()
-                    if pk_result and pk_result[0]:
-                        primary_key = list(pk_result[0])
-                except Exception:
-                    pass
-
-                # Get row count
-                row_count_result = conn.execute(
-                    f"SELECT COUNT(*) FROM {TABLE_DATA_NAME}"
-                ).fetchone()
-                row_count = row_count_result[0] if row_count_result else 0
-
-            return {
-                "name": table_name,
-                "bucket": bucket_name,
-                "columns": columns,
-                "primary_key": primary_key,
-                "row_count": row_count,
-            }
+            return table_catalog_cache.get_or_load(
+                table_path,
+                "branch_info",
+                lambda: self._read_branch_table_info(table_path, bucket_name),
+            )
 
         except Exception as e:
             logger.error(
@@ -3488,6 +5325,77 @@ class ProjectDBManager:
             )
             return None
 
+    def _read_branch_table_info(
+        self,
+        table_path: Path,
+        bucket_name: str,
+    ) -> dict[str, Any]:
+        """Read table info from a .duckdb file (uncached helper for _get_table_info_from_path)."""
+        table_name = table_path.stem
+
+        stats = self.get_persisted_table_stats(table_path)
+        if stats is not None:
+            return {
+                "name": table_name,
+                "bucket": bucket_name,
+                "columns": [
+                    {
+                        "name": col["name"],
+                        "type": col["type"],
+                        "nullable": col["nullable"],
+                        "default": col["default"],
+                    }
+                    for col in stats["columns"]
+                ],
+                "primary_key": stats["primary_key"],
+                "row_count": stats["row_count"],
+            }
+
+        with duckdb.connect(str(table_path), read_only=True) as conn:
+            # Get columns
+            columns_result = conn.execute(
+                f"DESCRIBE {TABLE_DATA_NAME}"
+            ).fetchall()
+            columns = [
+                {
+                    "name": row[0],
+                    "type": row[1],
+                    "nullable": row[2] == "YES",
+                    "default": row[4],
+                }
+                for row in columns_result
+            ]
+
+            # Get primary key
+            primary_key = []
+            try:
+                pk_result = conn.execute(
+                    f"""
+                    SELECT constraint_column_names
+                    FROM duckdb_constraints()
+                    WHERE schema_name = 'main' AND table_name = '{TABLE_DATA_NAME}'
+                      AND constraint_type = 'PRIMARY KEY'
+                    """
+                ).fetchone()
+                if pk_result and pk_result[0]:
+                    primary_key = list(pk_result[0])
+            except Exception:
+                pass
+
+            # Get row count
+            row_count_result = conn.execute(
+                f"SELECT COUNT(*) FROM {TABLE_DATA_NAME}"
+            ).fetchone()
+            row_count = row_count_result[0] if row_count_result else 0
+
+        return {
+            "name": table_name,
+            "bucket": bucket_name,
+            "columns": columns,
+            "primary_key": primary_key,
+            "row_count": row_count,
+        }
+
     @contextmanager
     def branch_table_connection(
         self,
@@ -3580,6 +5488,7 @@ class ProjectDBManager:
                     yield conn
                 finally:
                     conn.close()
+                    table_catalog_cache.invalidate(branch_table_path)
             finally:
                 lock.release()
                 TABLE_LOCKS_ACTIVE.dec()
@@ -3671,6 +5580,9 @@ class ProjectDBManager:
         # because those may return empty after ATTACH/DETACH operations (DuckDB quirk)
         conn = duckdb.connect(str(workspace_path))
         try:
+            # Views created with mode=view read from ATTACHed source tables
+            self.attach_workspace_sources(conn, project_id, branch_id)
+
             # Get all objects using SHOW TABLES (includes both tables and views)
             results = conn.execute("SHOW TABLES").fetchall()
 
@@ -3735,6 +5647,7 @@ class ProjectDBManager:
                 else:
                     conn.execute(f'DROP TABLE IF EXISTS "{name}"')
 
+            self._forget_workspace_sources(conn)
             return True
         finally:
             conn.close()
@@ -3771,6 +5684,7 @@ class ProjectDBManager:
             else:
                 conn.execute(f'DROP TABLE "{object_name}"')
 
+            self._forget_workspace_sources(conn, object_name)
             return True
         finally:
             conn.close()
@@ -3785,55 +5699,150 @@ class ProjectDBManager:
         columns: list[str] | None = None,
         where_clause: str | None = None,
         branch_id: str | None = None,
+        mode: str = "clone",
     ) -> dict[str, Any]:
-        """Load data from a project table into the workspace."""
-        workspace_path = self.get_workspace_path(project_id, workspace_id, branch_id)
+        """
+        Load data from a project table into the workspace.
 
-        # Get source table path
-        if branch_id:
-            source_path = self.get_branch_table_path(project_id, branch_id, source_bucket, source_table)
-            if not source_path.exists():
-                # Fall back to main branch table
-                source_path = self.get_table_path(project_id, source_bucket, source_table)
-        else:
-            source_path = self.get_table_path(project_id, source_bucket, source_table)
+        Modes:
+        - clone: write the selected columns/rows into a workspace table
+        - view: create a view over the source table; nothing is copied.
+          The view reads "{bucket}_{table}".main.data, which
+          attach_workspace_sources() ATTACHes (READ_ONLY) whenever the
+          workspace is opened.
+
+        Returns:
+            Dict with rows (taken from the CTAS result, or from persisted
+            table stats for an unfiltered view) and size_bytes
+        """
+        if mode not in WORKSPACE_LOAD_MODES:
+            raise ValueError(f"Unknown workspace load mode: {mode}")
+
+        workspace_path = self.get_workspace_path(project_id, workspace_id, branch_id)
+        source_path = self._get_workspace_source_path(
+            project_id, source_bucket, source_table, branch_id
+        )
 
         if not source_path.exists():
             raise FileNotFoundError(f"Source table not found: {source_bucket}.{source_table}")
 
+        alias = f"{source_bucket}_{source_table}"
+        col_list = ", ".join(f'"{c}"' for c in columns) if columns else "*"
+        where = f"WHERE {where_clause}" if where_clause else ""
+        select = f'SELECT {col_list} FROM "{alias}".main.data {where}'
+
         conn = duckdb.connect(str(workspace_path))
         try:
-            # Attach source table
-            conn.execute(f"ATTACH '{source_path}' AS source_db (READ_ONLY)")
+            conn.execute(f"ATTACH '{source_path}' AS \"{alias}\" (READ_ONLY)")
 
-            # Build column list
-            col_list = ", ".join(f'"{c}"' for c in columns) if columns else "*"
-
-            # Build WHERE clause
-            where = f"WHERE {where_clause}" if where_clause else ""
+            # Replacing a table with a view (or vice versa) needs an explicit DROP
+            existing = conn.execute(
+                "SELECT type FROM sqlite_master WHERE name = ?", [dest_table]
+            ).fetchone()
+            object_type = "view" if mode == "view" else "table"
+            if existing and existing[0] != object_type:
+                conn.execute(f'DROP {existing[0].upper()} "{dest_table}"')
 
-            # Copy data
-            conn.execute(f"""
-                CREATE OR REPLACE TABLE "{dest_table}" AS
-                SELECT {col_list} FROM source_db.main.data {where}
-            """)
+            conn.execute(_WORKSPACE_SOURCES_DDL)
+            conn.execute("DELETE FROM _workspace_sources WHERE name = ?", [dest_table])
 
-            # Get stats
-            row_count = conn.execute(f'SELECT COUNT(*) FROM "{dest_table}"').fetchone()[0]
+            if mode == "view":
+                conn.execute(f'CREATE OR REPLACE VIEW "{dest_table}" AS {select}')
+                conn.execute(
+                    "INSERT INTO _workspace_sources VALUES (?, ?, ?)",
+                    [dest_table, source_bucket, source_table],
+                )
+                stats = None if where_clause else self.get_persisted_table_stats(source_path)
+                if stats is not None:
+                    row_count = stats["row_count"]
+                else:
+                    row_count = conn.execute(f'SELECT COUNT(*) FROM "{dest_table}"').fetchone()[0]
+            else:
+                # CREATE TABLE AS reports the number of rows written
+                row_count = conn.execute(
+                    f'CREATE OR REPLACE TABLE "{dest_table}" AS {select}'
+                ).fetchone()[0]
 
-            conn.execute("DETACH source_db")
+            conn.execute(f'DETACH "{alias}"')
+        finally:
             conn.close()
 
-            # Get file size
-            size_bytes = workspace_path.stat().st_size
+        return {
+            "rows": row_count,
+            "size_bytes": workspace_path.stat().st_size,
+        }
+
+    def _get_workspace_source_path(
+        self, project_id: str, bucket: str, table: str, branch_id: str | None = None
+    ) -> Path:
+        """Source table file for a workspace: branch copy if any, else main."""
+        if branch_id:
+            source_path = self.get_branch_table_path(project_id, branch_id, bucket, table)
+            if source_path.exists():
+                return source_path
+        return self.get_table_path(project_id, bucket, table)
 
-            return {
-                "rows": row_count,
-                "size_bytes": size_bytes,
-            }
-        except Exception as e:
-            conn.close()
-            raise e
+    def attach_workspace_sources(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        project_id: str,
+        branch_id: str | None = None,
+    ) -> list[str]:
+        """
+        ATTACH (READ_ONLY) the project tables read by workspace views.
+
+        DuckDB does not store ATTACHes in the database file, so every
+        connection that reads views created with mode=view must call this
+        first. Sources that are missing or can't be attached are skipped
+        (their views fail to read). Returns the attached aliases.
+        """
+        try:
+            sources = conn.execute(
+                "SELECT DISTINCT source_bucket, source_table FROM _workspace_sources"
+            ).fetchall()
+        except duckdb.CatalogException:
+            # Workspace has never had a view loaded
+            return []
+
+        aliases = []
+        for bucket, table in sources:
+            source_path = self._get_workspace_source_path(project_id, bucket, table, branch_id)
+            if not source_path.exists():
+                logger.warning(
+                    "workspace_source_missing",
+                    project_id=project_id,
+                    source=f"{bucket}.{table}",
+                )
+                continue
+
+            alias = f"{bucket}_{table}"
+            try:
+                conn.execute(f"ATTACH '{source_path}' AS \"{alias}\" (READ_ONLY)")
+            except duckdb.Error as e:
+                # e.g. file handle conflict while the table is being written
+                logger.warning(
+                    "workspace_source_attach_failed",
+                    project_id=project_id,
+                    source=f"{bucket}.{table}",
+                    error=str(e),
+                )
+                continue
+            aliases.append(alias)
+
+        return aliases
+
+    @staticmethod
+    def _forget_workspace_sources(
+        conn: duckdb.DuckDBPyConnection, name: str | None = None
+    ) -> None:
+        """Drop view source records for one object (or all objects)."""
+        try:
+            if name is None:
+                conn.execute("DELETE FROM _workspace_sources")
+            else:
+                conn.execute("DELETE FROM _workspace_sources WHERE name = ?", [name])
+        except duckdb.CatalogException:
+            pass
 
     # ========================================
     # Project operations (ADR-009)
@@ -3872,7 +5881,11 @@ class ProjectDBManager:
             # Clean up all locks for this project
             table_lock_manager.clear_project_locks(project_id)
 
+            bucket_count = self._count_bucket_dirs(project_dir)
             shutil.rmtree(project_dir)
+            storage_usage.adjust(buckets=-bucket_count)
+            table_catalog_cache.invalidate_dir(project_dir)
+            self.forget_table_stats(project_dir)
             logger.info(
                 "project_dir_deleted", project_id=project_id, path=str(project_dir)
             )
@@ -3938,6 +5951,7 @@ class ProjectDBManager:
                     yield conn
                 finally:
                     conn.close()
+                    table_catalog_cache.invalidate(table_path)
         else:
             # Read operations don't need lock
             conn = duckdb.connect(str(table_path), read_only=True)
@@ -4009,6 +6023,21 @@ class ProjectDBManager:
     # Bucket operations (ADR-009: directories)
     # ========================================
 
+    def _make_bucket_dir(self, bucket_dir: Path) -> None:
+        """Create a bucket directory if missing, counting it in the storage gauges."""
+        try:
+            bucket_dir.mkdir(parents=True)
+        except FileExistsError:
+            return
+        storage_usage.adjust(buckets=1)
+
+    @staticmethod
+    def _count_bucket_dirs(dir_path: Path) -> int:
+        """Number of bucket directories in a project or branch directory."""
+        return sum(
+            1 for item in dir_path.iterdir() if item.is_dir() and not item.name.startswith("_")
+        )
+
     def create_bucket(
         self, project_id: str, bucket_name: str, description: str | None = None
     ) -> dict[str, Any]:
@@ -4022,7 +6051,7 @@ class ProjectDBManager:
         bucket_dir = self.get_bucket_dir(project_id, bucket_name)
 
         # Create bucket directory
-        bucket_dir.mkdir(parents=True, exist_ok=True)
+        self._make_bucket_dir(bucket_dir)
 
         logger.info(
             "bucket_created",
@@ -4074,6 +6103,9 @@ class ProjectDBManager:
 
         # Delete bucket directory and all contents
         shutil.rmtree(bucket_dir)
+        storage_usage.adjust(buckets=-1)
+        table_catalog_cache.invalidate_dir(bucket_dir)
+        self.forget_table_stats(bucket_dir)
 
         logger.info(
             "bucket_deleted",
@@ -4234,7 +6266,7 @@ class ProjectDBManager:
 
         # Create target bucket directory
         target_bucket_dir = self.get_bucket_dir(target_project_id, target_bucket_name)
-        target_bucket_dir.mkdir(parents=True, exist_ok=True)
+        self._make_bucket_dir(target_bucket_dir)
 
         # Note: With ADR-009, linked buckets work through metadata routing
         # The actual query resolution happens at runtime using ATTACH
@@ -4345,7 +6377,7 @@ class ProjectDBManager:
         """
         # Ensure bucket directory exists
         bucket_dir = self.get_bucket_dir(project_id, bucket_name)
-        bucket_dir.mkdir(parents=True, exist_ok=True)
+        self._make_bucket_dir(bucket_dir)
 
         # Get table file path
         table_path = self.get_table_path(project_id, bucket_name, table_name)
@@ -4376,8 +6408,11 @@ class ProjectDBManager:
             conn.execute(f"SET memory_limit = '{settings.duckdb_memory_limit}'")
             conn.execute(create_sql)
             conn.commit()
+            stats = self.collect_table_stats(conn, row_count=0)
         finally:
             conn.close()
+            table_catalog_cache.invalidate(table_path)
+        self.record_table_stats(table_path, stats)
 
         logger.info(
             "table_created",
@@ -4415,6 +6450,8 @@ class ProjectDBManager:
 
         if table_path.exists():
             table_path.unlink()
+            table_catalog_cache.invalidate(table_path)
+            self.forget_table_stats(table_path)
             # Clean up lock for deleted table
             table_lock_manager.remove_lock(project_id, bucket_name, table_name)
             logger.info(
@@ -4434,6 +6471,228 @@ class ProjectDBManager:
 
         return True
 
+    # ========================================
+    # Persisted table stats
+    # ========================================
+
+    def _stats_key(self, table_path: Path) -> str:
+        """Key for table_stats: table file path relative to duckdb_dir."""
+        try:
+            return str(table_path.relative_to(self._duckdb_dir))
+        except ValueError:
+            return str(table_path)
+
+    @staticmethod
+    def _stats_signature(table_path: Path) -> str | None:
+        """
+        Signature stored with persisted stats.
+
+        None when the file is missing or has a pending WAL (a writer is
+        active or didn't checkpoint) - stats can't be trusted then.
+        """
+        signature = TableCatalogCache.file_signature(table_path)
+        if signature is None or signature[3] is not None:
+            return None
+        inode, mtime_ns, size, _ = signature
+        return f"{inode}:{mtime_ns}:{size}"
+
+    def collect_table_stats(
+        self, conn: duckdb.DuckDBPyConnection, row_count: int | None = None
+    ) -> dict[str, Any]:
+        """
+        Collect stats from an open table connection.
+
+        Write paths call this before closing their connection and pass the
+        row count they already know, then hand the result to
+        record_table_stats() once the file is closed.
+
+        Args:
+            conn: Connection to the table's .duckdb file
+            row_count: Known row count (skips COUNT(*) when given)
+
+        Returns:
+            Dict with columns, primary_key and row_count
+        """
+        columns_result = conn.execute(
+            f"""
+            SELECT column_name, data_type, is_nullable, ordinal_position, column_default
+            FROM information_schema.columns
+            WHERE table_schema = 'main' AND table_name = '{TABLE_DATA_NAME}'
+            ORDER BY ordinal_position
+            """
+        ).fetchall()
+        columns = [
+            {
+                "name": row[0],
+                "type": row[1],
+                "nullable": row[2] == "YES",
+                "ordinal_position": row[3],
+                "default": row[4],
+            }
+            for row in columns_result
+        ]
+
+        primary_key = []
+        pk_result = conn.execute(
+            f"""
+            SELECT constraint_column_names
+            FROM duckdb_constraints()
+            WHERE schema_name = 'main' AND table_name = '{TABLE_DATA_NAME}'
+              AND constraint_type = 'PRIMARY KEY'
+            """
+        ).fetchone()
+        if pk_result and pk_result[0]:
+            primary_key = list(pk_result[0])
+
+        if row_count is None:
+            row_count = conn.execute(
+                f"SELECT COUNT(*) FROM main.{TABLE_DATA_NAME}"
+            ).fetchone()[0]
+
+        return {"columns": columns, "primary_key": primary_key, "row_count": row_count}
+
+    def record_table_stats(
+        self, table_path: Path, stats: dict[str, Any] | None = None
+    ) -> None:
+        """
+        Persist table stats after a write (connection must already be closed).
+
+        Never raises - a failure here only means the next read falls back
+        to opening the table file.
+
+        Args:
+            table_path: Path to the table's .duckdb file
+            stats: Result of collect_table_stats(); read from the file if None
+        """
+        try:
+            if stats is None:
+                with duckdb.connect(str(table_path), read_only=True) as conn:
+                    stats = self.collect_table_stats(conn)
+
+            signature = self._stats_signature(table_path)
+            if signature is None:
+                return
+
+            key = self._stats_key(table_path)
+            previous = metadata_db.get_table_stats(key)
+            size_bytes = table_path.stat().st_size
+            metadata_db.upsert_table_stats(
+                key,
+                row_count=stats["row_count"],
+                size_bytes=size_bytes,
+                columns=stats["columns"],
+                primary_key=stats["primary_key"],
+                file_signature=signature,
+            )
+            if previous is not None:
+                storage_usage.adjust(table_bytes=size_bytes - previous["size_bytes"])
+            else:
+                # A table already counted by the last rescan is not new
+                scanned_bytes = storage_usage.claim_unrecorded(key)
+                if scanned_bytes is not None:
+                    storage_usage.adjust(table_bytes=size_bytes - scanned_bytes)
+                else:
+                    storage_usage.adjust(tables=1, table_bytes=size_bytes)
+        except Exception as e:
+            logger.warning(
+                "table_stats_record_failed", table_path=str(table_path), error=str(e)
+            )
+
+    def forget_table_stats(self, path: Path) -> None:
+        """Drop persisted stats for a deleted table file or directory."""
+        try:
+            key = self._stats_key(path)
+            if path.suffix == ".duckdb":
+                previous = metadata_db.get_table_stats(key)
+                metadata_db.delete_table_stats(key)
+                if previous is not None:
+                    storage_usage.adjust(tables=-1, table_bytes=-previous["size_bytes"])
+                else:
+                    scanned_bytes = storage_usage.claim_unrecorded(key)
+                    if scanned_bytes is not None:
+                        storage_usage.adjust(tables=-1, table_bytes=-scanned_bytes)
+            else:
+                tables, size_bytes = metadata_db.summarize_table_stats_under(key)
+                metadata_db.delete_table_stats_under(key)
+                scanned_tables, scanned_bytes = storage_usage.claim_unrecorded_under(key)
+                storage_usage.adjust(
+                    tables=-(tables + scanned_tables),
+                    table_bytes=-(size_bytes + scanned_bytes),
+                )
+        except Exception as e:
+            logger.warning("table_stats_delete_failed", path=str(path), error=str(e))
+
+    def get_persisted_table_stats(self, table_path: Path) -> dict[str, Any] | None:
+        """
+        Return persisted stats if they still describe the file on disk.
+
+        Returns:
+            Stats dict (columns, primary_key, row_count, size_bytes) or None
+            when missing or stale
+        """
+        try:
+            stats = metadata_db.get_table_stats(self._stats_key(table_path))
+        except Exception:
+            # Metadata DB not available (e.g. not initialized yet)
+            return None
+
+        if stats is None:
+            metrics.TABLE_STATS_LOOKUPS.labels(result="missing").inc()
+            return None
+
+        if stats["file_signature"] != self._stats_signature(table_path):
+            metrics.TABLE_STATS_LOOKUPS.labels(result="stale").inc()
+            return None
+
+        metrics.TABLE_STATS_LOOKUPS.labels(result="fresh").inc()
+        return stats
+
+    def reconcile_table_stats(self) -> dict[str, int]:
+        """
+        Repair drift between persisted stats and table files on disk.
+
+        Rewrites stats for files changed outside the instrumented write paths
+        (or never recorded) and removes stats for files that no longer exist.
+        Workspace files (_workspaces/) are not tables and are skipped.
+
+        Returns:
+            Dict with counts: checked, repaired, removed
+        """
+        stored = metadata_db.list_table_stats_signatures()
+        seen: set[str] = set()
+        checked = repaired = removed = 0
+
+        if self._duckdb_dir.exists():
+            for table_path in self._duckdb_dir.glob("*/*/*.duckdb"):
+                if table_path.parent.name.startswith("_"):
+                    continue
+                checked += 1
+                key = self._stats_key(table_path)
+                seen.add(key)
+
+                signature = self._stats_signature(table_path)
+                if signature is None or stored.get(key) == signature:
+                    continue
+
+                self.record_table_stats(table_path)
+                repaired += 1
+
+        for key in stored.keys() - seen:
+            metadata_db.delete_table_stats(key)
+            removed += 1
+
+        metrics.TABLE_STATS_RECONCILED.labels(action="repaired").inc(repaired)
+        metrics.TABLE_STATS_RECONCILED.labels(action="removed").inc(removed)
+        if repaired or removed:
+            logger.info(
+                "table_stats_reconciled",
+                checked=checked,
+                repaired=repaired,
+                removed=removed,
+            )
+
+        return {"checked": checked, "repaired": repaired, "removed": removed}
+
     def get_table(
         self,
         project_id: str,
@@ -4458,6 +6717,44 @@ class ProjectDBManager:
         if not table_path.exists():
             return None
 
+        return table_catalog_cache.get_or_load(
+            table_path,
+            "object_info",
+            lambda: self._read_table_info(table_path, bucket_name, table_name),
+        )
+
+    def _read_table_info(
+        self,
+        table_path: Path,
+        bucket_name: str,
+        table_name: str,
+    ) -> dict[str, Any] | None:
+        """
+        Read ObjectInfo for a table directly from its .duckdb file.
+
+        Uncached - use get_table() which goes through table_catalog_cache.
+        Served from persisted table stats when they match the file.
+        """
+        stats = self.get_persisted_table_stats(table_path)
+        if stats is not None:
+            return {
+                "name": table_name,
+                "bucket": bucket_name,
+                "columns": [
+                    {
+                        "name": col["name"],
+                        "type": col["type"],
+                        "nullable": col["nullable"],
+                        "ordinal_position": col["ordinal_position"],
+                    }
+                    for col in stats["columns"]
+                ],
+                "row_count": stats["row_count"],
+                "size_bytes": stats["size_bytes"],
+                "primary_key": stats["primary_key"],
+                "created_at": None,
+            }
+
         conn = duckdb.connect(str(table_path), read_only=True)
         try:
             # Check if data table exists (ADR-009: table is main.{TABLE_DATA_NAME})
@@ -4610,6 +6907,9 @@ class ProjectDBManager:
                 f"Table not found: {project_id}/{bucket_name}/{table_name}"
             )
 
+        # Row count from persisted stats when they match the file
+        stats = self.get_persisted_table_stats(table_path)
+
         conn = duckdb.connect(str(table_path), read_only=True)
         try:
             # Get column information
@@ -4633,10 +6933,13 @@ class ProjectDBManager:
             ]
 
             # Get total row count
-            total_count_result = conn.execute(
-                f"SELECT COUNT(*) FROM main.{TABLE_DATA_NAME}"
-            ).fetchone()
-            total_row_count = total_count_result[0] if total_count_result else 0
+            if stats is not None:
+                total_row_count = stats["row_count"]
+            else:
+                total_count_result = conn.execute(
+                    f"SELECT COUNT(*) FROM main.{TABLE_DATA_NAME}"
+                ).fetchone()
+                total_row_count = total_count_result[0] if total_count_result else 0
 
             # Get preview rows
             preview_result = conn.execute(
@@ -4671,6 +6974,97 @@ class ProjectDBManager:
         finally:
             conn.close()
 
+    def open_table_arrow_stream(
+        self,
+        project_id: str,
+        bucket_name: str,
+        table_name: str,
+        columns: list[str] | None = None,
+        where_filter: str | None = None,
+        limit: int | None = None,
+        batch_size: int = 65536,
+    ) -> Iterator[bytes]:
+        """
+        Open a table for reading as an Arrow IPC stream (ADR-011).
+
+        The query runs through DuckDB's record batch reader, so rows are
+        never materialized as Python objects and memory stays bounded by
+        batch_size. Errors (missing table, unknown column, invalid filter)
+        are raised here, before any bytes are produced.
+
+        Args:
+            project_id: The project ID
+            bucket_name: The bucket name (directory)
+            table_name: The table name
+            columns: Columns to read (None = all columns)
+            where_filter: SQL WHERE clause without the WHERE keyword
+            limit: Maximum number of rows
+            batch_size: Rows per record batch
+
+        Returns:
+            Iterator of IPC stream chunks (schema first, then one per batch).
+            The table connection is closed when the iterator is exhausted
+            or closed.
+        """
+        table_path = self.get_table_path(project_id, bucket_name, table_name)
+
+        if not table_path.exists():
+            raise FileNotFoundError(
+                f"Table not found: {project_id}/{bucket_name}/{table_name}"
+            )
+
+        conn = duckdb.connect(str(table_path), read_only=True)
+        try:
+            if columns:
+                table_columns = {
+                    row[0]
+                    for row in conn.execute(
+                        f"""
+                        SELECT column_name FROM information_schema.columns
+                        WHERE table_schema = 'main' AND table_name = '{TABLE_DATA_NAME}'
+                        """
+                    ).fetchall()
+                }
+                unknown = [c for c in columns if c not in table_columns]
+                if unknown:
+                    raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+                columns_sql = ", ".join(f'"{c}"' for c in columns)
+            else:
+                columns_sql = "*"
+
+            query = f"SELECT {columns_sql} FROM main.{TABLE_DATA_NAME}"
+            if where_filter:
+                query += f" WHERE {where_filter}"
+            if limit is not None:
+                query += f" LIMIT {int(limit)}"
+
+            reader = conn.execute(query).fetch_record_batch(batch_size)
+        except Exception:
+            conn.close()
+            raise
+
+        return self._iter_arrow_ipc(conn, reader)
+
+    @staticmethod
+    def _iter_arrow_ipc(
+        conn: duckdb.DuckDBPyConnection, reader: Any
+    ) -> Generator[bytes, None, None]:
+        """Encode a record batch reader as one Arrow IPC stream, chunk by chunk."""
+        import pyarrow as pa
+
+        sink = _ArrowChunkSink()
+        try:
+            with pa.ipc.new_stream(pa.PythonFile(sink, mode="w"), reader.schema) as writer:
+                for batch in reader:
+                    writer.write_batch(batch)
+                    yield sink.drain()
+            # Schema (for empty results) and end-of-stream marker
+            remaining = sink.drain()
+            if remaining:
+                yield remaining
+        finally:
+            conn.close()
+
 
     # ========================================
     # Table schema operations (ADR-009: per-table files)
@@ -4723,8 +7117,11 @@ class ProjectDBManager:
             try:
                 conn.execute(alter_sql)
                 conn.commit()
+                stats = self.collect_table_stats(conn)
             finally:
                 conn.close()
+                table_catalog_cache.invalidate(table_path)
+            self.record_table_stats(table_path, stats)
 
         logger.info(
             "column_added",
@@ -4771,8 +7168,11 @@ class ProjectDBManager:
             try:
                 conn.execute(alter_sql)
                 conn.commit()
+                stats = self.collect_table_stats(conn)
             finally:
                 conn.close()
+                table_catalog_cache.invalidate(table_path)
+            self.record_table_stats(table_path, stats)
 
         logger.info(
             "column_dropped",
@@ -4865,8 +7265,11 @@ class ProjectDBManager:
                 for sql in alter_statements:
                     conn.execute(sql)
                 conn.commit()
+                stats = self.collect_table_stats(conn)
             finally:
                 conn.close()
+                table_catalog_cache.invalidate(table_path)
+            self.record_table_stats(table_path, stats)
 
         logger.info(
             "column_altered",
@@ -4960,8 +7363,12 @@ class ProjectDBManager:
                 conn.execute("DROP TABLE main._temp_data")
                 conn.commit()
 
+                stats = self.collect_table_stats(conn)
+
             finally:
                 conn.close()
+                table_catalog_cache.invalidate(table_path)
+            self.record_table_stats(table_path, stats)
 
         logger.info(
             "primary_key_added",
@@ -5046,8 +7453,12 @@ class ProjectDBManager:
                 conn.execute("DROP TABLE main._temp_data")
                 conn.commit()
 
+                stats = self.collect_table_stats(conn)
+
             finally:
                 conn.close()
+                table_catalog_cache.invalidate(table_path)
+            self.record_table_stats(table_path, stats)
 
         logger.info(
             "primary_key_dropped",
@@ -5112,8 +7523,12 @@ class ProjectDBManager:
 
                 deleted_rows = count_before - count_after
 
+                stats = self.collect_table_stats(conn, row_count=count_after)
+
             finally:
                 conn.close()
+                table_catalog_cache.invalidate(table_path)
+            self.record_table_stats(table_path, stats)
 
         logger.info(
             "table_rows_deleted",
@@ -5135,15 +7550,23 @@ class ProjectDBManager:
         bucket_name: str,
         table_name: str,
         mode: str = "basic",
+        sample_size: int | None = None,
+        refresh: bool = False,
     ) -> dict[str, Any]:
         """
         Get statistical profile of a table with advanced analytics.
 
+        Computed profiles are stored per table file signature, so repeated
+        requests are answered from the metadata DB until the table changes.
+
         Args:
             project_id: The project ID
             bucket_name: The bucket name
             table_name: The table name
             mode: Profile mode - "basic", "full", "distribution", "quality"
+            sample_size: Profile a uniform sample of this many rows instead of
+                the whole table (None = whole table)
+            refresh: Recompute even if a stored profile is still current
 
         Returns:
             Dict with table info and per-column statistics
@@ -5155,12 +7578,73 @@ class ProjectDBManager:
                 f"Table not found: {project_id}/{bucket_name}/{table_name}"
             )
 
+        key = self._stats_key(table_path)
+        signature = self._stats_signature(table_path)
+
+        if not refresh and signature is not None:
+            try:
+                cached = metadata_db.get_cached_table_profile(key, mode, sample_size or 0)
+            except Exception:
+                # Metadata DB not available (e.g. not initialized yet)
+                cached = None
+            if cached is not None and cached["file_signature"] == signature:
+                metrics.TABLE_PROFILE_LOOKUPS.labels(result="hit").inc()
+                return {**cached["profile"], "cached": True}
+        metrics.TABLE_PROFILE_LOOKUPS.labels(result="miss").inc()
+
+        profiled_at = datetime.now(timezone.utc)
+        result = self._compute_table_profile(
+            table_path, bucket_name, table_name, mode, sample_size
+        )
+        result["profiled_at"] = profiled_at.isoformat()
+
+        if signature is not None:
+            try:
+                metadata_db.save_table_profile(
+                    key, mode, sample_size or 0, signature, result
+                )
+            except Exception as e:
+                logger.warning(
+                    "table_profile_save_failed", table_path=str(table_path), error=str(e)
+                )
+
+        return {**result, "cached": False}
+
+    def _compute_table_profile(
+        self,
+        table_path: Path,
+        bucket_name: str,
+        table_name: str,
+        mode: str,
+        sample_size: int | None,
+    ) -> dict[str, Any]:
+        """Profile a table file (see get_table_profile)."""
+        stats = self.get_persisted_table_stats(table_path)
+
         conn = duckdb.connect(str(table_path), read_only=True)
         try:
             # Get row count
-            row_count = conn.execute(
-                f"SELECT COUNT(*) FROM main.{TABLE_DATA_NAME}"
-            ).fetchone()[0]
+            if stats is not None:
+                row_count = stats["row_count"]
+            else:
+                row_count = conn.execute(
+                    f"SELECT COUNT(*) FROM main.{TABLE_DATA_NAME}"
+                ).fetchone()[0]
+
+            # Large tables: profile a uniform reservoir sample, materialized
+            # once in a temp table so every scan sees the same rows
+            source = f"main.{TABLE_DATA_NAME}"
+            profiled_rows = row_count
+            if sample_size is not None and row_count > sample_size:
+                conn.execute(
+                    f"""
+                    CREATE TEMP TABLE profile_sample AS
+                    SELECT * FROM main.{TABLE_DATA_NAME}
+                    USING SAMPLE reservoir({int(sample_size)} ROWS) REPEATABLE (42)
+                    """
+                )
+                source = "temp.profile_sample"
+                profiled_rows = sample_size
 
             # Get column info from information_schema
             columns_info = conn.execute(
@@ -5183,21 +7667,23 @@ class ProjectDBManager:
             # String types for pattern analysis
             string_types = {"VARCHAR", "TEXT", "STRING", "CHAR"}
 
-            statistics = []
             quality_issues = []
             quality_score = 100.0
 
+            columns = []
             for col_name, col_type in columns_info:
                 col_type_upper = col_type.upper() if col_type else ""
-                is_numeric = any(col_type_upper.startswith(nt) for nt in numeric_types)
-                is_string = any(col_type_upper.startswith(st) for st in string_types)
+                columns.append((
+                    col_name,
+                    col_type,
+                    any(col_type_upper.startswith(nt) for nt in numeric_types),
+                    any(col_type_upper.startswith(st) for st in string_types),
+                ))
 
-                # Build advanced stats query for this column
-                stat = self._get_column_stats(
-                    conn, col_name, col_type, is_numeric, is_string, row_count, mode
-                )
-                statistics.append(stat)
+            # All columns are profiled together in a few wide scans
+            statistics = self._get_column_stats(conn, columns, mode, source)
 
+            for (col_name, _, is_numeric, is_string), stat in zip(columns, statistics):
                 # Collect quality issues
                 if stat.get("null_percentage", 0) > 50:
                     quality_issues.append({
@@ -5217,7 +7703,7 @@ class ProjectDBManager:
                     })
 
                 if is_numeric and stat.get("outlier_count", 0) > 0:
-                    outlier_pct = (stat["outlier_count"] / row_count * 100) if row_count > 0 else 0
+                    outlier_pct = (stat["outlier_count"] / profiled_rows * 100) if profiled_rows > 0 else 0
                     if outlier_pct > 5:
                         quality_issues.append({
                             "column": col_name,
@@ -5236,8 +7722,12 @@ class ProjectDBManager:
                         "message": f"Highly {skew_dir}-skewed distribution (skewness={stat['skewness']:.2f})",
                     })
 
-                # Suggest primary key candidates
-                if stat.get("cardinality_class") == "unique" and stat.get("null_percentage", 0) == 0:
+                # Suggest primary key candidates (a unique sample proves nothing)
+                if (
+                    stat.get("cardinality_class") == "unique"
+                    and stat.get("null_percentage", 0) == 0
+                    and profiled_rows == row_count
+                ):
                     quality_issues.append({
                         "column": col_name,
                         "type": "pk_candidate",
@@ -5264,7 +7754,17 @@ class ProjectDBManager:
                 "statistics": statistics,
                 "quality_score": round(quality_score, 1),
                 "quality_issues": quality_issues,
+                "sampled": profiled_rows < row_count,
+                "profiled_rows": profiled_rows,
             }
+            if profiled_rows < row_count:
+                # 95% margin of error for percentages estimated from the sample
+                # (worst case p=0.5, with finite population correction)
+                result["margin_of_error"] = round(
+                    1.96 * math.sqrt(0.25 / profiled_rows)
+                    * math.sqrt((row_count - profiled_rows) / (row_count - 1)) * 100,
+                    2,
+                )
 
             # Add correlations for full/quality mode
             if mode in ("full", "quality") and row_count > 0:
@@ -5272,8 +7772,14 @@ class ProjectDBManager:
                     s["column_name"] for s in statistics
                     if any(s["column_type"].upper().startswith(nt) for nt in numeric_types)
                 ]
+                max_columns = settings.profile_max_correlation_columns
+                if max_columns > 0:
+                    numeric_cols = numeric_cols[:max_columns]
                 if len(numeric_cols) >= 2:
-                    result["correlations"] = self._get_correlations(conn, numeric_cols[:10])
+                    matrix = self._get_correlation_matrix(conn, numeric_cols, source)
+                    if matrix is not None:
+                        result["correlation_matrix"] = matrix
+                        result["correlations"] = self._get_correlations(matrix)
 
             return result
 
@@ -5283,216 +7789,267 @@ class ProjectDBManager:
     def _get_column_stats(
         self,
         conn: Any,
-        col_name: str,
-        col_type: str,
-        is_numeric: bool,
-        is_string: bool,
-        row_count: int,
+        columns: list[tuple[str, str, bool, bool]],
         mode: str,
-    ) -> dict[str, Any]:
-        """Get comprehensive statistics for a single column."""
-        quoted_col = f'"{col_name}"'
-
-        # Base stats query
-        base_query = f"""
-        SELECT
-            COUNT(*) as total_count,
-            COUNT({quoted_col}) as non_null_count,
-            COUNT(DISTINCT {quoted_col}) as unique_count,
-            MIN({quoted_col}) as min_val,
-            MAX({quoted_col}) as max_val
-        FROM main.{TABLE_DATA_NAME}
-        """
-        base_result = conn.execute(base_query).fetchone()
-
-        total_count = base_result[0]
-        non_null_count = base_result[1]
-        unique_count = base_result[2]
-        min_val = base_result[3]
-        max_val = base_result[4]
-
-        null_percentage = ((total_count - non_null_count) / total_count * 100) if total_count > 0 else 0
-        cardinality_ratio = (unique_count / non_null_count) if non_null_count > 0 else 0
-
-        # Classify cardinality
-        if unique_count == non_null_count and non_null_count > 0:
-            cardinality_class = "unique"
-        elif unique_count == 1:
-            cardinality_class = "constant"
-        elif cardinality_ratio > 0.9:
-            cardinality_class = "high"
-        elif cardinality_ratio > 0.5:
-            cardinality_class = "medium"
-        elif cardinality_ratio > 0.01:
-            cardinality_class = "low"
-        else:
-            cardinality_class = "very_low"
-
-        stat = {
-            "column_name": col_name,
-            "column_type": col_type,
-            "min": self._serialize_value(min_val),
-            "max": self._serialize_value(max_val),
-            "approx_unique": unique_count,
-            "cardinality_ratio": round(cardinality_ratio, 4),
-            "cardinality_class": cardinality_class,
-            "count": non_null_count,
-            "null_percentage": round(null_percentage, 2),
-        }
+        source: str = f"main.{TABLE_DATA_NAME}",
+    ) -> list[dict[str, Any]]:
+        """
+        Get comprehensive statistics for all columns.
 
-        # Numeric-specific stats
-        if is_numeric and non_null_count > 0:
-            numeric_query = f"""
-            SELECT
-                AVG({quoted_col}) as avg_val,
-                STDDEV({quoted_col}) as std_val,
-                SKEWNESS({quoted_col}) as skewness,
-                KURTOSIS({quoted_col}) as kurtosis,
-                QUANTILE_CONT({quoted_col}, [0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99]) as percentiles
-            FROM main.{TABLE_DATA_NAME}
-            WHERE {quoted_col} IS NOT NULL
-            """
-            try:
-                num_result = conn.execute(numeric_query).fetchone()
-                stat["avg"] = round(num_result[0], 4) if num_result[0] is not None else None
-                stat["std"] = round(num_result[1], 4) if num_result[1] is not None else None
-                stat["skewness"] = round(num_result[2], 4) if num_result[2] is not None else None
-                stat["kurtosis"] = round(num_result[3], 4) if num_result[3] is not None else None
-
-                percentiles = num_result[4] if num_result[4] else []
-                if len(percentiles) == 7:
-                    stat["q01"] = self._serialize_value(percentiles[0])
-                    stat["q05"] = self._serialize_value(percentiles[1])
-                    stat["q25"] = self._serialize_value(percentiles[2])
-                    stat["q50"] = self._serialize_value(percentiles[3])
-                    stat["q75"] = self._serialize_value(percentiles[4])
-                    stat["q95"] = self._serialize_value(percentiles[5])
-                    stat["q99"] = self._serialize_value(percentiles[6])
-
-                    # Calculate IQR outliers
-                    q25 = percentiles[2]
-                    q75 = percentiles[4]
-                    if q25 is not None and q75 is not None:
-                        iqr = q75 - q25
-                        lower_bound = q25 - 1.5 * iqr
-                        upper_bound = q75 + 1.5 * iqr
-                        outlier_query = f"""
-                        SELECT COUNT(*) FROM main.{TABLE_DATA_NAME}
-                        WHERE {quoted_col} < {lower_bound} OR {quoted_col} > {upper_bound}
-                        """
-                        outlier_count = conn.execute(outlier_query).fetchone()[0]
-                        stat["outlier_count"] = outlier_count
-                        stat["outlier_lower_bound"] = round(lower_bound, 4)
-                        stat["outlier_upper_bound"] = round(upper_bound, 4)
-            except Exception:
-                # Skip advanced numeric stats if query fails
-                pass
+        Instead of a handful of queries per column, the table is scanned by
+        at most four wide aggregates shared by all columns: base stats,
+        numeric/string distributions, outliers plus regex patterns, and (basic
+        mode only) an exact distinct count for columns that look unique.
 
-            # Histogram for distribution mode
-            if mode in ("full", "distribution") and non_null_count > 0:
-                try:
-                    hist_query = f"""
-                    SELECT HISTOGRAM({quoted_col})
-                    FROM main.{TABLE_DATA_NAME}
-                    WHERE {quoted_col} IS NOT NULL
-                    """
-                    hist_result = conn.execute(hist_query).fetchone()
-                    if hist_result and hist_result[0]:
-                        stat["histogram"] = hist_result[0]
-                except Exception:
-                    pass
-        else:
-            # Non-numeric columns don't have these stats
-            stat["avg"] = None
-            stat["std"] = None
-            stat["skewness"] = None
-            stat["kurtosis"] = None
-
-        # String-specific stats
-        if is_string and non_null_count > 0:
-            string_query = f"""
-            SELECT
-                AVG(LENGTH({quoted_col})) as avg_length,
-                MIN(LENGTH({quoted_col})) as min_length,
-                MAX(LENGTH({quoted_col})) as max_length,
-                COUNT(*) FILTER (WHERE {quoted_col} = '') as empty_count,
-                COUNT(*) FILTER (WHERE TRIM({quoted_col}) = '' AND {quoted_col} != '') as whitespace_only_count
-            FROM main.{TABLE_DATA_NAME}
-            WHERE {quoted_col} IS NOT NULL
-            """
+        Args:
+            conn: Read-only connection to the table file
+            columns: (name, type, is_numeric, is_string) per column
+            mode: Profile mode - "basic", "full", "distribution", "quality"
+            source: Relation to profile (the table or its sample)
+
+        Returns:
+            List of per-column statistics, in column order
+        """
+        quoted = [self._quote_identifier(col[0]) for col in columns]
+
+        # Base stats; basic mode estimates distinct counts with HyperLogLog
+        distinct_fn = "APPROX_COUNT_DISTINCT({})" if mode == "basic" else "COUNT(DISTINCT {})"
+        base_exprs = {"total_count": "COUNT(*)"}
+        for i, col in enumerate(quoted):
+            base_exprs[f"non_null_{i}"] = f"COUNT({col})"
+            base_exprs[f"unique_{i}"] = distinct_fn.format(col)
+            base_exprs[f"min_{i}"] = f"MIN({col})"
+            base_exprs[f"max_{i}"] = f"MAX({col})"
+        base = self._profile_aggregate(conn, base_exprs, source)
+        total_count = base["total_count"]
+
+        unique_counts = [
+            min(base[f"unique_{i}"], base[f"non_null_{i}"]) for i in range(len(columns))
+        ]
+        if mode == "basic":
+            # The estimate can't tell "unique" from "almost unique", which
+            # decides the PK candidate hint, so confirm those columns exactly
+            candidates = [
+                i for i in range(len(columns))
+                if base[f"non_null_{i}"] > 0 and unique_counts[i] / base[f"non_null_{i}"] > 0.9
+            ]
+            if candidates:
+                exact = self._profile_aggregate(
+                    conn, {i: f"COUNT(DISTINCT {quoted[i]})" for i in candidates}, source
+                )
+                for i in candidates:
+                    unique_counts[i] = exact[i]
+
+        statistics = []
+        for i, (col_name, col_type, is_numeric, is_string) in enumerate(columns):
+            non_null_count = base[f"non_null_{i}"]
+            unique_count = unique_counts[i]
+
+            null_percentage = ((total_count - non_null_count) / total_count * 100) if total_count > 0 else 0
+            cardinality_ratio = (unique_count / non_null_count) if non_null_count > 0 else 0
+
+            # Classify cardinality
+            if unique_count == non_null_count and non_null_count > 0:
+                cardinality_class = "unique"
+            elif unique_count == 1:
+                cardinality_class = "constant"
+            elif cardinality_ratio > 0.9:
+                cardinality_class = "high"
+            elif cardinality_ratio > 0.5:
+                cardinality_class = "medium"
+            elif cardinality_ratio > 0.01:
+                cardinality_class = "low"
+            else:
+                cardinality_class = "very_low"
+
+            stat = {
+                "column_name": col_name,
+                "column_type": col_type,
+                "min": self._serialize_value(base[f"min_{i}"]),
+                "max": self._serialize_value(base[f"max_{i}"]),
+                "approx_unique": unique_count,
+                "cardinality_ratio": round(cardinality_ratio, 4),
+                "cardinality_class": cardinality_class,
+                "count": non_null_count,
+                "null_percentage": round(null_percentage, 2),
+            }
+            if not is_numeric or non_null_count == 0:
+                # Non-numeric columns don't have these stats
+                stat["avg"] = None
+                stat["std"] = None
+                stat["skewness"] = None
+                stat["kurtosis"] = None
+            statistics.append(stat)
+
+        numeric = [i for i, col in enumerate(columns) if col[2] and base[f"non_null_{i}"] > 0]
+        strings = [i for i, col in enumerate(columns) if col[3] and base[f"non_null_{i}"] > 0]
+
+        # Distribution stats for numeric and string columns (aggregates skip NULLs)
+        dist_exprs = {}
+        for i in numeric:
+            col = quoted[i]
+            dist_exprs[f"avg_{i}"] = f"AVG({col})"
+            dist_exprs[f"std_{i}"] = f"STDDEV({col})"
+            dist_exprs[f"skewness_{i}"] = f"SKEWNESS({col})"
+            dist_exprs[f"kurtosis_{i}"] = f"KURTOSIS({col})"
+            dist_exprs[f"percentiles_{i}"] = (
+                f"QUANTILE_CONT({col}, [0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99])"
+            )
+            if mode in ("full", "distribution"):
+                dist_exprs[f"histogram_{i}"] = f"HISTOGRAM({col})"
+        for i in strings:
+            col = quoted[i]
+            dist_exprs[f"avg_length_{i}"] = f"AVG(LENGTH({col}))"
+            dist_exprs[f"min_length_{i}"] = f"MIN(LENGTH({col}))"
+            dist_exprs[f"max_length_{i}"] = f"MAX(LENGTH({col}))"
+            dist_exprs[f"empty_{i}"] = f"COUNT(*) FILTER (WHERE {col} = '')"
+            dist_exprs[f"whitespace_{i}"] = (
+                f"COUNT(*) FILTER (WHERE TRIM({col}) = '' AND {col} != '')"
+            )
+
+        dist = {}
+        if dist_exprs:
             try:
-                str_result = conn.execute(string_query).fetchone()
-                stat["avg_length"] = round(str_result[0], 1) if str_result[0] else None
-                stat["min_length"] = str_result[1]
-                stat["max_length"] = str_result[2]
-                stat["empty_count"] = str_result[3]
-                stat["whitespace_only_count"] = str_result[4]
+                dist = self._profile_aggregate(conn, dist_exprs, source)
             except Exception:
+                # Skip advanced stats if the query fails
                 pass
 
+        # Outlier counts and regex pattern checks share one more scan
+        scan_exprs = {}
+        for i in numeric:
+            stat = statistics[i]
+            if f"avg_{i}" not in dist:
+                continue
+            # Moments are NaN when undefined (e.g. constant column)
+            for key in ("avg", "std", "skewness", "kurtosis"):
+                value = dist[f"{key}_{i}"]
+                stat[key] = round(value, 4) if value is not None and not math.isnan(value) else None
+            if dist.get(f"histogram_{i}"):
+                stat["histogram"] = {
+                    self._serialize_value(k): v for k, v in dist[f"histogram_{i}"].items()
+                }
+
+            percentiles = dist[f"percentiles_{i}"] or []
+            if len(percentiles) == 7:
+                for key, value in zip(("q01", "q05", "q25", "q50", "q75", "q95", "q99"), percentiles):
+                    stat[key] = self._serialize_value(value)
+
+                # IQR outlier bounds
+                q25 = percentiles[2]
+                q75 = percentiles[4]
+                if q25 is not None and q75 is not None:
+                    iqr = q75 - q25
+                    lower_bound = q25 - 1.5 * iqr
+                    upper_bound = q75 + 1.5 * iqr
+                    stat["outlier_lower_bound"] = round(lower_bound, 4)
+                    stat["outlier_upper_bound"] = round(upper_bound, 4)
+                    scan_exprs[("outliers", i)] = (
+                        f"COUNT(*) FILTER (WHERE {quoted[i]} < {lower_bound} "
+                        f"OR {quoted[i]} > {upper_bound})"
+                    )
+
+        for i in strings:
+            stat = statistics[i]
+            if f"avg_length_{i}" in dist:
+                stat["avg_length"] = round(dist[f"avg_length_{i}"], 1) if dist[f"avg_length_{i}"] else None
+                stat["min_length"] = dist[f"min_length_{i}"]
+                stat["max_length"] = dist[f"max_length_{i}"]
+                stat["empty_count"] = dist[f"empty_{i}"]
+                stat["whitespace_only_count"] = dist[f"whitespace_{i}"]
+
             # Pattern detection for full mode
-            if mode in ("full", "quality") and non_null_count > 0:
-                stat["detected_patterns"] = self._detect_patterns(conn, col_name, non_null_count)
-
-        return stat
-
-    def _detect_patterns(self, conn: Any, col_name: str, non_null_count: int) -> list[dict]:
-        """Detect common patterns in string column."""
-        quoted_col = f'"{col_name}"'
-        patterns = []
-
-        pattern_checks = [
-            ("email", r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"),
-            ("uuid", r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[1-5][0-9a-fA-F]{3}-[89abAB][0-9a-fA-F]{3}-[0-9a-fA-F]{12}$"),
-            ("url", r"^https?://"),
-            ("phone", r"^\+?[0-9\s\-\(\)]{10,20}$"),
-            ("ipv4", r"^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$"),
-            ("date_iso", r"^\d{4}-\d{2}-\d{2}$"),
-            ("datetime_iso", r"^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}"),
-        ]
+            if mode in ("full", "quality"):
+                for pattern_name, regex in PROFILE_PATTERNS:
+                    scan_exprs[(pattern_name, i)] = (
+                        f"COUNT(*) FILTER (WHERE regexp_full_match({quoted[i]}, '{regex}'))"
+                    )
 
-        for pattern_name, regex in pattern_checks:
+        scan = {}
+        if scan_exprs:
             try:
-                query = f"""
-                SELECT COUNT(*) FROM main.{TABLE_DATA_NAME}
-                WHERE {quoted_col} IS NOT NULL
-                AND regexp_full_match({quoted_col}, '{regex}')
-                """
-                match_count = conn.execute(query).fetchone()[0]
-                if match_count > 0:
-                    match_pct = (match_count / non_null_count * 100) if non_null_count > 0 else 0
-                    patterns.append({
-                        "pattern": pattern_name,
-                        "match_count": match_count,
-                        "match_percentage": round(match_pct, 1),
-                    })
+                scan = self._profile_aggregate(conn, scan_exprs, source)
             except Exception:
                 pass
 
-        return patterns
+        for (kind, i), count in scan.items():
+            stat = statistics[i]
+            if kind == "outliers":
+                stat["outlier_count"] = count
+            elif count > 0:
+                non_null_count = stat["count"]
+                match_pct = (count / non_null_count * 100) if non_null_count > 0 else 0
+                stat.setdefault("detected_patterns", []).append({
+                    "pattern": kind,
+                    "match_count": count,
+                    "match_percentage": round(match_pct, 1),
+                })
+        if mode in ("full", "quality"):
+            for i in strings:
+                statistics[i].setdefault("detected_patterns", [])
+
+        return statistics
 
-    def _get_correlations(self, conn: Any, numeric_cols: list[str]) -> list[dict]:
-        """Calculate correlations between numeric columns."""
-        correlations = []
+    def _profile_aggregate(self, conn: Any, exprs: dict[Any, str], source: str) -> dict[Any, Any]:
+        """Evaluate many aggregate expressions in one scan of the source."""
+        row = conn.execute(f"SELECT {', '.join(exprs.values())} FROM {source}").fetchone()
+        return dict(zip(exprs.keys(), row))
 
-        for i, col1 in enumerate(numeric_cols):
-            for col2 in numeric_cols[i + 1:]:
-                try:
-                    query = f"""
-                    SELECT CORR("{col1}", "{col2}")
-                    FROM main.{TABLE_DATA_NAME}
-                    WHERE "{col1}" IS NOT NULL AND "{col2}" IS NOT NULL
-                    """
-                    corr_val = conn.execute(query).fetchone()[0]
-                    if corr_val is not None and abs(corr_val) > 0.3:
-                        correlations.append({
-                            "column1": col1,
-                            "column2": col2,
-                            "correlation": round(corr_val, 4),
-                            "strength": "strong" if abs(corr_val) > 0.7 else "moderate",
-                        })
-                except Exception:
-                    pass
+    @staticmethod
+    def _quote_identifier(name: str) -> str:
+        """Quote a column name for use in SQL."""
+        return '"' + name.replace('"', '""') + '"'
+
+    def _get_correlation_matrix(
+        self, conn: Any, numeric_cols: list[str], source: str = f"main.{TABLE_DATA_NAME}"
+    ) -> dict[str, Any] | None:
+        """
+        Compute the Pearson correlation matrix of numeric columns in one scan.
+
+        CORR skips rows where either value is NULL, so every pair uses its
+        pairwise-complete rows. Undefined correlations (e.g. a constant
+        column) are None.
+
+        Returns:
+            Dict with columns and a symmetric values matrix, or None if the
+            query fails
+        """
+        quoted = [f"{self._quote_identifier(col)}::DOUBLE" for col in numeric_cols]
+        pairs = [
+            (i, j) for i in range(len(numeric_cols)) for j in range(i + 1, len(numeric_cols))
+        ]
+        try:
+            corr = self._profile_aggregate(
+                conn, {(i, j): f"CORR({quoted[i]}, {quoted[j]})" for i, j in pairs}, source
+            )
+        except Exception:
+            return None
+
+        values: list[list[float | None]] = [
+            [1.0 if i == j else None for j in range(len(numeric_cols))]
+            for i in range(len(numeric_cols))
+        ]
+        for (i, j), value in corr.items():
+            if value is not None and not math.isnan(value):
+                values[i][j] = values[j][i] = round(value, 4)
+
+        return {"columns": numeric_cols, "values": values}
+
+    def _get_correlations(self, matrix: dict[str, Any]) -> list[dict]:
+        """List significant correlations (|r| > 0.3) from a correlation matrix."""
+        correlations = []
+        columns = matrix["columns"]
+
+        for i, col1 in enumerate(columns):
+            for j in range(i + 1, len(columns)):
+                corr_val = matrix["values"][i][j]
+                if corr_val is not None and abs(corr_val) > 0.3:
+                    correlations.append({
+                        "column1": col1,
+                        "column2": columns[j],
+                        "correlation": corr_val,
+                        "strength": "strong" if abs(corr_val) > 0.7 else "moderate",
+                    })
 
         # Sort by absolute correlation value
         correlations.sort(key=lambda x: abs(x["correlation"]), reverse=True)
@@ -28,9 +28,9 @@ import structlog
 from fastapi import Depends, HTTPException, Path, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
-from src.auth import get_key_prefix, verify_key_hash
+from src.auth import get_key_prefix, hash_key, verify_key_hash
 from src.config import settings
-from src.database import metadata_db
+from src.database import api_key_cache, metadata_db
 
 logger = structlog.get_logger(__name__)
 
@@ -143,22 +143,28 @@ def verify_admin_key(api_key: str) -> bool:
     return api_key == settings.admin_api_key
 
 
-def verify_project_key(api_key: str, project_id: str) -> dict[str, Any] | None:
+def lookup_api_key(api_key: str) -> dict[str, Any] | None:
     """
-    Verify if the API key is valid for the given project.
+    Find and verify the stored record of a project/branch API key.
+
+    Verified records are served from the in-process api_key_cache (keyed by
+    the key's hash) so the hot auth path does not query metadata.duckdb on
+    every request.
 
     Args:
         api_key: The API key to verify
-        project_id: The project ID to check access for
 
     Returns:
-        The key record dict if valid for this project, None otherwise.
-        Key record includes: id, project_id, branch_id, scope, key_hash, etc.
+        The key record dict if the key exists, is active and its hash
+        matches, None otherwise.
     """
-    # Get the key prefix for database lookup
-    key_prefix = get_key_prefix(api_key)
+    key_hash = hash_key(api_key)
+    key_record = api_key_cache.get(key_hash)
+    if key_record:
+        return key_record
 
     # Look up key by prefix (already filters revoked/expired keys)
+    key_prefix = get_key_prefix(api_key)
     key_record = metadata_db.get_api_key_by_prefix(key_prefix)
 
     if not key_record:
@@ -170,6 +176,27 @@ def verify_project_key(api_key: str, project_id: str) -> dict[str, Any] | None:
         logger.warning("auth_key_hash_mismatch", key_prefix=key_prefix)
         return None
 
+    api_key_cache.put(key_hash, key_record)
+    return key_record
+
+
+def verify_project_key(api_key: str, project_id: str) -> dict[str, Any] | None:
+    """
+    Verify if the API key is valid for the given project.
+
+    Args:
+        api_key: The API key to verify
+        project_id: The project ID to check access for
+
+    Returns:
+        The key record dict if valid for this project, None otherwise.
+        Key record includes: id, project_id, branch_id, scope, key_hash, etc.
+    """
+    key_prefix = get_key_prefix(api_key)
+    key_record = lookup_api_key(api_key)
+    if not key_record:
+        return None
+
     # Check project ID matches
     if key_record["project_id"] != project_id:
         logger.warning(
@@ -180,12 +207,8 @@ def verify_project_key(api_key: str, project_id: str) -> dict[str, Any] | None:
         )
         return None
 
-    # Update last_used_at timestamp
-    try:
-        metadata_db.update_api_key_last_used(key_record["id"])
-    except Exception as e:
-        # Don't fail auth if we can't update timestamp
-        logger.warning("auth_update_last_used_failed", error=str(e))
+    # last_used_at is written in batches by the background flusher
+    api_key_cache.record_use(key_record["id"])
 
     logger.debug(
         "auth_project_key_verified",
@@ -300,19 +323,9 @@ def verify_branch_key(api_key: str, project_id: str, branch_id: str) -> dict[str
         - branch_admin: Has access only to the specific branch_id
         - branch_read: Has read-only access to the specific branch_id
     """
-    # Get the key prefix for database lookup
     key_prefix = get_key_prefix(api_key)
-
-    # Look up key by prefix (already filters revoked/expired keys)
-    key_record = metadata_db.get_api_key_by_prefix(key_prefix)
-
+    key_record = lookup_api_key(api_key)
     if not key_record:
-        logger.debug("auth_key_not_found", key_prefix=key_prefix)
-        return None
-
-    # Verify the key hash
-    if not verify_key_hash(api_key, key_record["key_hash"]):
-        logger.warning("auth_key_hash_mismatch", key_prefix=key_prefix)
         return None
 
     # Check project ID matches
@@ -355,12 +368,8 @@ def verify_branch_key(api_key: str, project_id: str, branch_id: str) -> dict[str
         )
         return None
 
-    # Update last_used_at timestamp
-    try:
-        metadata_db.update_api_key_last_used(key_record["id"])
-    except Exception as e:
-        # Don't fail auth if we can't update timestamp
-        logger.warning("auth_update_last_used_failed", error=str(e))
+    # last_used_at is written in batches by the background flusher
+    api_key_cache.record_use(key_record["id"])
 
     logger.debug(
         "auth_branch_key_verified",
@@ -466,9 +475,9 @@ async def require_driver_auth(
 
     # Check if it's a valid project key (any project)
     key_prefix = get_key_prefix(api_key)
-    key_record = metadata_db.get_api_key_by_prefix(key_prefix)
+    key_record = lookup_api_key(api_key)
 
-    if key_record and verify_key_hash(api_key, key_record["key_hash"]):
+    if key_record:
         logger.info(
             "auth_driver_project_key",
             key_prefix=key_prefix,
@@ -491,10 +500,8 @@ def get_project_id_from_driver_key(api_key: str) -> str | None:
     if verify_admin_key(api_key):
         return None  # Admin key has access to all projects
 
-    key_prefix = get_key_prefix(api_key)
-    key_record = metadata_db.get_api_key_by_prefix(key_prefix)
-
-    if key_record and verify_key_hash(api_key, key_record["key_hash"]):
+    key_record = lookup_api_key(api_key)
+    if key_record:
         return key_record["project_id"]
 
     return None
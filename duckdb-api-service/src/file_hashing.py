@@ -0,0 +1,36 @@
+"""Content hashes of files on disk.
+
+Shared by the files API, the S3-compatible API and the export paths (REST
+and gRPC). The MD5 of a file is its S3 ETag, so every write path must hash
+files the same way.
+"""
+
+import hashlib
+from pathlib import Path
+
+# Read size for hashing; large enough to keep Python overhead per chunk low
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(file_path: Path, *algorithms: str) -> tuple[str, ...]:
+    """
+    Hash a file with one or more algorithms in a single read pass.
+
+    Args:
+        file_path: File to hash
+        algorithms: hashlib algorithm names, e.g. "sha256", "md5"
+
+    Returns:
+        Hex digests in the order of algorithms
+    """
+    hashes = [hashlib.new(name) for name in algorithms]
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            for file_hash in hashes:
+                file_hash.update(chunk)
+    return tuple(file_hash.hexdigest() for file_hash in hashes)
+
+
+def file_md5(file_path: Path) -> str:
+    """MD5 hex digest of a file (its S3 ETag)."""
+    return hash_file(file_path, "md5")[0]
@@ -0,0 +1,171 @@
+"""File download responses with conditional and byte-range request support.
+
+Used by the files API and the S3-compatible API so remote readers (DuckDB
+httpfs, boto3, browsers) can:
+- read only the byte ranges they need (Parquet footer, single row groups)
+  via Range: bytes=... (single range -> 206, several -> multipart/byteranges)
+- revalidate cached copies with If-None-Match / If-Modified-Since (304)
+- guard reads with If-Match / If-Unmodified-Since (412)
+- resume with If-Range (range served only while the object is unchanged)
+"""
+
+import os
+from email.utils import parsedate_to_datetime
+from secrets import token_hex
+from typing import Mapping
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.types import Receive, Scope, Send
+
+# Headers repeated on 304 responses (RFC 9110 section 15.4.5)
+_NOT_MODIFIED_HEADERS = ("etag", "last-modified", "cache-control", "content-location", "expires", "vary")
+
+
+def _parse_etags(header: str) -> list[str]:
+    """Split an If-Match/If-None-Match header into entity tags."""
+    return [tag.strip() for tag in header.split(",") if tag.strip()]
+
+
+def _opaque_tag(etag: str) -> str:
+    """Strip the weak indicator for weak comparison."""
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def _parse_http_date(value: str) -> float | None:
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def evaluate_preconditions(headers: Headers, etag: str, last_modified: float) -> int | None:
+    """
+    Evaluate conditional request headers for a GET/HEAD of a file.
+
+    Follows the precedence of RFC 9110 section 13.2.2.
+
+    Args:
+        headers: Request headers
+        etag: Current entity tag of the file (quoted)
+        last_modified: File modification time (Unix timestamp)
+
+    Returns:
+        412 or 304 when the request should not be served, None otherwise
+    """
+    # HTTP dates have one-second resolution
+    modified = int(last_modified)
+
+    if_match = headers.get("if-match")
+    if if_match is not None:
+        tags = _parse_etags(if_match)
+        # Strong comparison: weak tags never match
+        if "*" not in tags and etag not in tags:
+            return 412
+    else:
+        if_unmodified_since = headers.get("if-unmodified-since")
+        if if_unmodified_since is not None:
+            since = _parse_http_date(if_unmodified_since)
+            if since is not None and modified > since:
+                return 412
+
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [_opaque_tag(tag) for tag in _parse_etags(if_none_match)]
+        if "*" in tags or _opaque_tag(etag) in tags:
+            return 304
+    else:
+        if_modified_since = headers.get("if-modified-since")
+        if if_modified_since is not None:
+            since = _parse_http_date(if_modified_since)
+            if since is not None and modified <= since:
+                return 304
+
+    return None
+
+
+class ConditionalFileResponse(FileResponse):
+    """
+    FileResponse that honours conditional requests and byte ranges.
+
+    Starlette's FileResponse already serves Range/If-Range; this adds
+    If-Match / If-None-Match / If-Modified-Since / If-Unmodified-Since and
+    sends multi-range responses as a proper multipart/byteranges body.
+    The file's stat is taken once up front so all validators agree.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        etag: str | None = None,
+        headers: Mapping[str, str] | None = None,
+        media_type: str | None = None,
+        filename: str | None = None,
+        stat_result: os.stat_result | None = None,
+    ) -> None:
+        headers = dict(headers or {})
+        if etag is not None:
+            headers["etag"] = f'"{etag}"'
+        super().__init__(
+            path,
+            headers=headers,
+            media_type=media_type,
+            filename=filename,
+            stat_result=stat_result or os.stat(path),
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        status_code = evaluate_preconditions(
+            Headers(scope=scope), self.headers["etag"], self.stat_result.st_mtime
+        )
+        if status_code == 304:
+            headers = {
+                name: self.headers[name] for name in _NOT_MODIFIED_HEADERS if name in self.headers
+            }
+            return await Response(status_code=304, headers=headers)(scope, receive, send)
+        if status_code == 412:
+            return await Response(status_code=412)(scope, receive, send)
+
+        await super().__call__(scope, receive, send)
+
+    async def _handle_multiple_ranges(
+        self,
+        send: Send,
+        ranges: list[tuple[int, int]],
+        file_size: int,
+        send_header_only: bool,
+    ) -> None:
+        boundary = token_hex(13)
+        content_type = self.headers["content-type"]
+        part_headers = [
+            (
+                f"--{boundary}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Range: bytes {start}-{end - 1}/{file_size}\r\n\r\n"
+            ).encode("latin-1")
+            for start, end in ranges
+        ]
+        closing = f"--{boundary}--\r\n".encode("latin-1")
+
+        self.headers["content-type"] = f"multipart/byteranges; boundary={boundary}"
+        self.headers["content-length"] = str(
+            sum(len(header) + (end - start) + 2 for header, (start, end) in zip(part_headers, ranges))
+            + len(closing)
+        )
+        await send({"type": "http.response.start", "status": 206, "headers": self.raw_headers})
+        if send_header_only:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        async with await anyio.open_file(self.path, mode="rb") as file:
+            for header, (start, end) in zip(part_headers, ranges):
+                await send({"type": "http.response.body", "body": header, "more_body": True})
+                await file.seek(start)
+                while start < end:
+                    chunk = await file.read(min(self.chunk_size, end - start))
+                    if not chunk:
+                        break
+                    start += len(chunk)
+                    await send({"type": "http.response.body", "body": chunk, "more_body": True})
+                await send({"type": "http.response.body", "body": b"\r\n", "more_body": True})
+        await send({"type": "http.response.body", "body": closing, "more_body": False})
@@ -12,7 +12,15 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "generated")
 
 from proto import table_pb2, info_pb2, common_pb2
 from src.grpc.handlers.base import BaseCommandHandler
-from src.database import ProjectDBManager, TABLE_DATA_NAME, table_lock_manager
+from src.config import settings
+from src.database import (
+    ProjectDBManager,
+    TABLE_DATA_NAME,
+    metadata_db,
+    object_index,
+    table_write_queue,
+)
+from src.file_hashing import file_md5
 
 
 class TableImportFromFileHandler(BaseCommandHandler):
@@ -25,6 +33,10 @@ class TableImportFromFileHandler(BaseCommandHandler):
     3. Imports data using COPY FROM or INSERT INTO
     4. Handles full/incremental load modes
 
+    CSV sourceType SLICED_FILE (path points to a manifest listing the
+    slices) and DIRECTORY (all files under the path) load every slice in
+    one parallel read_csv([...]) scan and one commit.
+
     Supports S3, ABS (Azure), GCS, and HTTP (pre-signed URL) file providers.
     """
 
@@ -107,15 +119,17 @@ class TableImportFromFileHandler(BaseCommandHandler):
             effective_project_id, bucket_name, table_name
         )
 
-        # Execute import with table lock
-        with table_lock_manager.acquire(project_id, bucket_name, table_name):
-            result = self._execute_import(
-                table_path=table_path,
-                file_url=file_url,
-                s3_creds=s3_creds,
-                csv_opts=csv_opts,
-                is_incremental=is_incremental,
-            )
+        # Execute import through the table's write queue
+        result = self._execute_import(
+            project_id=effective_project_id,
+            bucket_name=bucket_name,
+            table_name=table_name,
+            table_path=table_path,
+            file_url=file_url,
+            s3_creds=s3_creds,
+            csv_opts=csv_opts,
+            is_incremental=is_incremental,
+        )
 
         duration = time.time() - start_time
 
@@ -132,8 +146,8 @@ class TableImportFromFileHandler(BaseCommandHandler):
         timer.duration = f"{duration:.3f}s"
 
         self.log_info(
-            f"Imported {result['imported_rows']} rows into {table_name} "
-            f"(incremental={is_incremental})"
+            f"Imported {result['imported_rows']} rows from {result['file_count']} file(s) "
+            f"into {table_name} (incremental={is_incremental})"
         )
 
         return response
@@ -238,21 +252,62 @@ class TableImportFromFileHandler(BaseCommandHandler):
                 "enclosure": csv_type_opts.enclosure or '"',
                 "escaped_by": csv_type_opts.escapedBy or '"',
                 "columns": list(csv_type_opts.columnsNames) if csv_type_opts.columnsNames else None,
+                "source_type": csv_type_opts.sourceType,
             }
 
         return csv_opts
 
+    @staticmethod
+    def _resolve_sources(
+        conn: duckdb.DuckDBPyConnection, file_url: str, source_type: int
+    ) -> list[str]:
+        """
+        Expand the command's file path into the list of files to read.
+
+        SLICED_FILE: file_url is a manifest ({"entries": [{"url": ...}]}).
+        DIRECTORY: every file under file_url (DuckDB glob).
+        """
+        source_types = table_pb2.TableImportFromFileCommand.CsvTypeOptions.SourceType
+        if source_type == source_types.DIRECTORY:
+            return [f"{file_url.rstrip('/')}/*"]
+        if source_type != source_types.SLICED_FILE:
+            return [file_url]
+
+        from src.config import settings
+
+        rows = conn.execute(
+            "SELECT entry.url FROM (SELECT unnest(entries) AS entry FROM read_json(?))",
+            [file_url],
+        ).fetchall()
+        sources = []
+        for (url,) in rows:
+            # Slices in our own project buckets are read from disk (see _build_file_url)
+            if url.startswith("s3://project_"):
+                url = str(settings.files_dir / url.removeprefix("s3://"))
+            sources.append(url)
+        if not sources:
+            raise ValueError(f"Manifest {file_url} lists no files")
+        return sources
+
     def _execute_import(
         self,
+        project_id: str,
+        bucket_name: str,
+        table_name: str,
         table_path: Path,
         file_url: str,
         s3_creds: dict,
         csv_opts: dict,
         is_incremental: bool,
     ) -> dict:
-        """Execute the actual import operation."""
-        conn = duckdb.connect(str(table_path))
-        try:
+        """
+        Execute the actual import operation.
+
+        Runs through table_write_queue, so concurrent incremental imports
+        into the same table share one transaction.
+        """
+
+        def import_job(conn: duckdb.DuckDBPyConnection) -> dict:
             # Check if file is from remote source (S3, HTTP, etc.)
             is_remote = file_url.startswith(('s3://', 'http://', 'https://', 'azure://', 'gcs://'))
 
@@ -277,10 +332,10 @@ class TableImportFromFileHandler(BaseCommandHandler):
             """).fetchall()
             columns = [row[0] for row in columns_result]
 
-            # Get row count before import
-            rows_before = conn.execute(
-                f"SELECT COUNT(*) FROM main.{TABLE_DATA_NAME}"
-            ).fetchone()[0]
+            sources = self._resolve_sources(conn, file_url, csv_opts.get("source_type", 0))
+            sources_sql = "[" + ", ".join(
+                "'" + source.replace("'", "''") + "'" for source in sources
+            ) + "]"
 
             # If not incremental, truncate table first
             if not is_incremental:
@@ -308,41 +363,43 @@ class TableImportFromFileHandler(BaseCommandHandler):
             copy_sql = f"""
                 INSERT INTO main.{TABLE_DATA_NAME} ({columns_sql}, _timestamp)
                 SELECT {columns_sql}, CURRENT_TIMESTAMP
-                FROM read_csv('{file_url}', {', '.join(csv_read_opts)})
+                FROM read_csv({sources_sql}, {', '.join(csv_read_opts)})
             """
 
             try:
-                conn.execute(copy_sql)
+                imported_rows = conn.execute(copy_sql).fetchone()[0]
             except Exception as e:
                 self.log_error(f"Import failed: {e}")
                 raise ValueError(f"Failed to import file: {e}")
 
-            # Get final counts
-            rows_after = conn.execute(
-                f"SELECT COUNT(*) FROM main.{TABLE_DATA_NAME}"
-            ).fetchone()[0]
-
-            conn.commit()
-
-            # Calculate imported rows
-            imported_rows = rows_after - (0 if not is_incremental else rows_before)
-
-            # Close connection BEFORE reading file size
-            # DuckDB uses WAL and doesn't flush all data until close
-            conn.close()
-
-            # Get file size after close (now includes all flushed WAL data)
-            size_bytes = table_path.stat().st_size
+            # Full loads start from an empty table; only appends need a count
+            rows_after = imported_rows
+            if is_incremental:
+                rows_after = conn.execute(
+                    f"SELECT COUNT(*) FROM main.{TABLE_DATA_NAME}"
+                ).fetchone()[0]
 
             return {
                 "imported_rows": imported_rows,
                 "total_rows": rows_after,
-                "size_bytes": size_bytes,
                 "columns": columns,
+                "file_count": len(sources),
             }
-        except Exception:
-            conn.close()
-            raise
+
+        result = table_write_queue.run(
+            project_id,
+            bucket_name,
+            table_name,
+            table_path,
+            import_job,
+            batch_key="incremental_import" if is_incremental else None,
+            row_count=lambda result: result["total_rows"],
+        )
+
+        # Queue closes the connection after commit, so the file size
+        # includes all flushed WAL data
+        result["size_bytes"] = table_path.stat().st_size
+        return result
 
 
 class TableExportToFileHandler(BaseCommandHandler):
@@ -430,6 +487,7 @@ class TableExportToFileHandler(BaseCommandHandler):
             is_compressed=is_compressed,
             file_format=cmd.fileFormat,
         )
+        self._register_local_export(file_url)
 
         # Build response with TableInfo
         response = table_pb2.TableExportToFileResponse()
@@ -543,6 +601,22 @@ class TableExportToFileHandler(BaseCommandHandler):
 
         return creds
 
+    @staticmethod
+    def _register_local_export(file_url: str) -> None:
+        """
+        Make an export written into a project bucket visible to the S3 API.
+
+        Exports to project_N buckets are written straight to files_dir (see
+        _build_file_url), so record them in the ListObjectsV2 index and
+        store their ETag like the other write paths do.
+        """
+        export_path = Path(file_url)
+        if not export_path.is_relative_to(settings.files_dir) or not export_path.is_file():
+            return
+
+        metadata_db.store_file_etag(export_path, file_md5(export_path))
+        object_index.add(export_path)
+
     def _execute_export(
         self,
         table_path: Path,
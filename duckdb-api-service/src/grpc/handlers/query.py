@@ -2,19 +2,54 @@
 
 Phase 12g: ExecuteQueryCommand handler
 Executes SQL queries on a project database.
+
+Results are read from DuckDB in bounded record batches rather than with
+fetchall(), and are capped by settings.query_result_max_rows /
+query_result_max_bytes. The unary Execute() path assembles the batches
+into one ExecuteQueryResponse; ExecuteQueryStream() emits one message per
+batch, optionally as Arrow IPC bytes (see ARROW_RESULT_FEATURE).
 """
 
 import sys
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterable, Iterator, Optional
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "generated"))
 
+from google.protobuf import wrappers_pb2
+
 from proto import executeQuery_pb2, common_pb2
 from src.grpc.handlers.base import BaseCommandHandler
 from src.database import MetadataDB, ProjectDBManager
 
+# DriverRequest.features entry asking ExecuteQueryStream for Arrow IPC output.
+# Data messages are then google.protobuf.BytesValue chunks which, concatenated,
+# form a single Arrow IPC stream (application/vnd.apache.arrow.stream).
+ARROW_RESULT_FEATURE = "query-result-arrow-ipc"
+
+
+class _ResultBudget:
+    """Running row/byte totals checked against the configured result caps."""
+
+    def __init__(self, max_rows: int, max_bytes: int):
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.rows = 0
+        self.bytes = 0
+
+    def consume(self, rows: int, nbytes: int) -> None:
+        self.rows += rows
+        self.bytes += nbytes
+        if self.max_rows and self.rows > self.max_rows:
+            raise ValueError(
+                f"Query result exceeds the maximum of {self.max_rows} rows"
+            )
+        if self.max_bytes and self.bytes > self.max_bytes:
+            raise ValueError(
+                f"Query result exceeds the maximum of {self.max_bytes} bytes"
+            )
+
 
 class ExecuteQueryHandler(BaseCommandHandler):
     """
@@ -41,30 +76,7 @@ class ExecuteQueryHandler(BaseCommandHandler):
         credentials: Optional[dict],
         runtime_options: common_pb2.RuntimeOptions
     ) -> executeQuery_pb2.ExecuteQueryResponse:
-        cmd = executeQuery_pb2.ExecuteQueryCommand()
-        command.Unpack(cmd)
-
-        query = cmd.query
-        timeout = cmd.timeout or 300  # Default 5 minutes
-        path_restriction = list(cmd.pathRestriction)
-
-        if not query:
-            raise ValueError("query is required")
-
-        # Extract project_id from credentials or path
-        project_id = None
-        if credentials and "project_id" in credentials:
-            project_id = credentials["project_id"]
-        elif path_restriction:
-            project_id = path_restriction[0]
-
-        if not project_id:
-            raise ValueError("project_id must be provided via credentials or pathRestriction")
-
-        # Verify project exists
-        project = self.metadata_db.get_project(project_id)
-        if not project:
-            raise KeyError(f"Project {project_id} not found")
+        query, project_id, path_restriction = self._parse_command(command, credentials)
 
         self.log_info(f"Executing query on project {project_id}")
 
@@ -92,15 +104,103 @@ class ExecuteQueryHandler(BaseCommandHandler):
             response.message = str(e)
             return response
 
-    def _execute_project_query(
+    def stream(
+        self,
+        command,
+        credentials: Optional[dict],
+        runtime_options: common_pb2.RuntimeOptions,
+        features: Iterable[str] = ()
+    ) -> Iterator[Any]:
+        """
+        Execute the query and yield the result batch by batch.
+
+        Yields one ExecuteQueryResponse per record batch (rows only, columns
+        repeated on every chunk), or BytesValue Arrow IPC chunks when
+        ARROW_RESULT_FEATURE is requested, followed by a final
+        ExecuteQueryResponse carrying the status and total row count.
+
+        Raises:
+            ValueError: Invalid command or result over the configured caps
+            KeyError: Project not found
+        """
+        query, project_id, path_restriction = self._parse_command(command, credentials)
+        arrow = ARROW_RESULT_FEATURE in features
+
+        self.log_info(f"Streaming query on project {project_id}")
+
+        start_time = time.time()
+        conn, result = self._open_query(project_id, query, path_restriction)
+        budget = self._new_budget()
+
+        try:
+            if not result.description:
+                yield self._summary_response("Query executed successfully")
+                return
+
+            columns = [col[0] for col in result.description]
+            if arrow:
+                import pyarrow as pa
+
+                reader = result.fetch_record_batch(self._batch_rows())
+                batches = self._budgeted_arrow_batches(reader, budget)
+                for chunk in ProjectDBManager._iter_arrow_ipc(
+                    conn, pa.RecordBatchReader.from_batches(reader.schema, batches)
+                ):
+                    yield wrappers_pb2.BytesValue(value=chunk)
+            else:
+                for rows in self._iter_row_batches(result, columns, budget):
+                    chunk = executeQuery_pb2.ExecuteQueryResponse()
+                    chunk.status = executeQuery_pb2.ExecuteQueryResponse.Status.Success
+                    chunk.data.columns.extend(columns)
+                    chunk.data.rows.extend(rows)
+                    yield chunk
+        finally:
+            conn.close()
+
+        duration_ms = int((time.time() - start_time) * 1000)
+        self.log_info(f"Query streamed {budget.rows} rows in {duration_ms}ms")
+        yield self._summary_response(f"Query returned {budget.rows} rows")
+
+    def _parse_command(
+        self,
+        command,
+        credentials: Optional[dict]
+    ) -> tuple[str, str, list]:
+        """Unpack and validate the command, returning (query, project_id, path_restriction)."""
+        cmd = executeQuery_pb2.ExecuteQueryCommand()
+        command.Unpack(cmd)
+
+        query = cmd.query
+        path_restriction = list(cmd.pathRestriction)
+
+        if not query:
+            raise ValueError("query is required")
+
+        # Extract project_id from credentials or path
+        project_id = None
+        if credentials and "project_id" in credentials:
+            project_id = credentials["project_id"]
+        elif path_restriction:
+            project_id = path_restriction[0]
+
+        if not project_id:
+            raise ValueError("project_id must be provided via credentials or pathRestriction")
+
+        # Verify project exists
+        project = self.metadata_db.get_project(project_id)
+        if not project:
+            raise KeyError(f"Project {project_id} not found")
+
+        return query, project_id, path_restriction
+
+    def _open_query(
         self,
         project_id: str,
         query: str,
         path_restriction: list
-    ) -> executeQuery_pb2.ExecuteQueryResponse:
-        """Execute SQL query on project database."""
+    ):
+        """Run the query on a fresh in-memory connection; caller closes the connection."""
         import duckdb
-        from src.config import settings
 
         # For simple queries, we can use an in-memory connection
         # and ATTACH the relevant tables
@@ -113,10 +213,10 @@ class ExecuteQueryHandler(BaseCommandHandler):
 
             # If path restriction includes bucket/table, attach those
             if len(path_restriction) >= 2:
-                bucket_name = path_restriction[1] if len(path_restriction) > 1 else None
+                bucket_name = path_restriction[1]
                 if bucket_name:
                     # Attach all tables in the bucket
-                    bucket_path = settings.duckdb_path / project_id / bucket_name
+                    bucket_path = self.project_manager.get_bucket_dir(project_id, bucket_name)
                     if bucket_path.exists():
                         for table_file in bucket_path.glob("*.duckdb"):
                             table_name = table_file.stem
@@ -125,37 +225,92 @@ class ExecuteQueryHandler(BaseCommandHandler):
                                 f"ATTACH '{table_file}' AS {alias} (READ_ONLY)"
                             )
 
-            # Execute the query
-            result = conn.execute(query)
+            return conn, conn.execute(query)
+        except Exception:
+            conn.close()
+            raise
+
+    def _execute_project_query(
+        self,
+        project_id: str,
+        query: str,
+        path_restriction: list
+    ) -> executeQuery_pb2.ExecuteQueryResponse:
+        """Execute SQL query on project database."""
+        conn, result = self._open_query(project_id, query, path_restriction)
 
+        try:
             # Check if this is a SELECT query (returns results)
             description = result.description
             if description:
                 # It's a SELECT query
                 columns = [col[0] for col in description]
-                rows = result.fetchall()
+                budget = self._new_budget()
 
                 response = executeQuery_pb2.ExecuteQueryResponse()
                 response.status = executeQuery_pb2.ExecuteQueryResponse.Status.Success
 
                 # Build data response
                 response.data.columns.extend(columns)
-                for row in rows:
-                    row_msg = executeQuery_pb2.ExecuteQueryResponse.Data.Row()
-                    for i, col in enumerate(columns):
-                        # Convert value to string for proto
-                        value = row[i]
-                        row_msg.fields[col] = str(value) if value is not None else ""
-                    response.data.rows.append(row_msg)
-
-                response.message = f"Query returned {len(rows)} rows"
+                for rows in self._iter_row_batches(result, columns, budget):
+                    response.data.rows.extend(rows)
+
+                response.message = f"Query returned {budget.rows} rows"
                 return response
             else:
                 # Non-SELECT query (CREATE, INSERT, etc.)
-                response = executeQuery_pb2.ExecuteQueryResponse()
-                response.status = executeQuery_pb2.ExecuteQueryResponse.Status.Success
-                response.message = "Query executed successfully"
-                return response
+                return self._summary_response("Query executed successfully")
 
         finally:
             conn.close()
+
+    def _iter_row_batches(
+        self,
+        result,
+        columns: list[str],
+        budget: _ResultBudget
+    ) -> Iterator[list]:
+        """Yield proto rows one record batch at a time, enforcing the result caps."""
+        reader = result.fetch_record_batch(self._batch_rows())
+        for batch in reader:
+            rows = []
+            nbytes = 0
+            # Convert column-wise: one to_pylist() per column instead of per cell
+            values = [column.to_pylist() for column in batch.columns]
+            for row in zip(*values):
+                row_msg = executeQuery_pb2.ExecuteQueryResponse.Data.Row()
+                for col, value in zip(columns, row):
+                    # Convert value to string for proto
+                    row_msg.fields[col] = str(value) if value is not None else ""
+                nbytes += row_msg.ByteSize()
+                rows.append(row_msg)
+            budget.consume(len(rows), nbytes)
+            yield rows
+
+    @staticmethod
+    def _budgeted_arrow_batches(reader, budget: _ResultBudget) -> Iterator[Any]:
+        """Pass record batches through, enforcing the result caps."""
+        for batch in reader:
+            budget.consume(batch.num_rows, batch.nbytes)
+            yield batch
+
+    @staticmethod
+    def _summary_response(message: str) -> executeQuery_pb2.ExecuteQueryResponse:
+        response = executeQuery_pb2.ExecuteQueryResponse()
+        response.status = executeQuery_pb2.ExecuteQueryResponse.Status.Success
+        response.message = message
+        return response
+
+    @staticmethod
+    def _batch_rows() -> int:
+        from src.config import settings
+
+        return settings.query_result_batch_rows
+
+    @staticmethod
+    def _new_budget() -> _ResultBudget:
+        from src.config import settings
+
+        return _ResultBudget(
+            settings.query_result_max_rows, settings.query_result_max_bytes
+        )
@@ -11,7 +11,7 @@ import grpc
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "generated"))
 
-from proto import service_pb2_grpc
+from proto import common_pb2, service_pb2_grpc
 from src.grpc.servicer import StorageDriverServicer
 from src.database import MetadataDB, ProjectDBManager
 from src import metrics
@@ -51,6 +51,27 @@ class MetricsInterceptor(grpc.ServerInterceptor):
         return handler
 
 
+def add_streaming_handlers(servicer: StorageDriverServicer, server: grpc.Server) -> None:
+    """
+    Register server-streaming RPCs not present in the generated stubs.
+
+    ExecuteQueryStream is declared in proto/service.proto; it is registered
+    here as a generic handler on the same service so it works with the
+    checked-in service_pb2_grpc module.
+    """
+    handler = grpc.method_handlers_generic_handler(
+        "keboola.storageDriver.service.StorageDriverService",
+        {
+            "ExecuteQueryStream": grpc.unary_stream_rpc_method_handler(
+                servicer.ExecuteQueryStream,
+                request_deserializer=common_pb2.DriverRequest.FromString,
+                response_serializer=common_pb2.DriverResponse.SerializeToString,
+            ),
+        },
+    )
+    server.add_generic_rpc_handlers((handler,))
+
+
 def create_server(
     metadata_db: MetadataDB,
     project_manager: ProjectDBManager,
@@ -79,6 +100,7 @@ def create_server(
 
     servicer = StorageDriverServicer(metadata_db, project_manager)
     service_pb2_grpc.add_StorageDriverServiceServicer_to_server(servicer, server)
+    add_streaming_handlers(servicer, server)
 
     address = f"{host}:{port}"
     server.add_insecure_port(address)
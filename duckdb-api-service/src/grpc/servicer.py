@@ -2,7 +2,7 @@
 
 import logging
 import time
-from typing import Optional
+from typing import Iterator, Optional
 
 import grpc
 
@@ -341,6 +341,93 @@ class StorageDriverServicer(service_pb2_grpc.StorageDriverServiceServicer):
             if error_type:
                 metrics.GRPC_ERRORS_TOTAL.labels(command=command_type, error_type=error_type).inc()
 
+    def ExecuteQueryStream(
+        self,
+        request: common_pb2.DriverRequest,
+        context: grpc.ServicerContext
+    ) -> Iterator[common_pb2.DriverResponse]:
+        """
+        Execute an ExecuteQueryCommand and stream the result.
+
+        Server-streaming counterpart of Execute() for large query results.
+        Each DriverResponse packs one record batch (ExecuteQueryResponse
+        rows, or BytesValue Arrow IPC chunks when the request lists the
+        ARROW_RESULT_FEATURE feature); the last one packs the final
+        ExecuteQueryResponse status and carries the log messages.
+        Errors end the stream with an error DriverResponse and a status code.
+        """
+        start_time = time.time()
+        command_type = "unknown"
+        status = "success"
+        error_type = None
+        handler = None
+
+        try:
+            command_type = get_type_name(request.command)
+            logger.info("Received streaming command: %s", command_type)
+
+            if command_type != "ExecuteQueryCommand":
+                error_msg = f"Unsupported streaming command: {command_type}"
+                logger.error(error_msg)
+                context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+                context.set_details(error_msg)
+                status = "error"
+                error_type = "unimplemented"
+                yield self._error_response(error_msg)
+                return
+
+            handler, _ = self._handlers[command_type]
+
+            credentials = None
+            if request.credentials and request.credentials.ByteSize() > 0:
+                from src.grpc.handlers.base import BaseCommandHandler
+                credentials = BaseCommandHandler.extract_credentials(request.credentials)
+
+            # One message of lookahead so log messages go on the last response
+            pending = None
+            for message in handler.stream(
+                request.command,
+                credentials,
+                request.runtimeOptions,
+                features=list(request.features)
+            ):
+                if pending is not None:
+                    yield self._wrap_response(pending, [])
+                pending = message
+            if pending is not None:
+                yield self._wrap_response(pending, handler.get_log_messages())
+
+        except ValueError as e:
+            logger.error("Invalid parameters: %s", e)
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(str(e))
+            status = "error"
+            error_type = "invalid_argument"
+            yield self._error_response(str(e), handler.get_log_messages() if handler else None)
+
+        except KeyError as e:
+            logger.error("Resource not found: %s", e)
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            context.set_details(str(e))
+            status = "error"
+            error_type = "not_found"
+            yield self._error_response(str(e), handler.get_log_messages() if handler else None)
+
+        except Exception as e:
+            logger.exception("Internal error in streaming %s", command_type)
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(str(e))
+            status = "error"
+            error_type = "internal"
+            yield self._error_response(str(e), handler.get_log_messages() if handler else None)
+
+        finally:
+            duration = time.time() - start_time
+            metrics.GRPC_REQUESTS_TOTAL.labels(command=command_type, status=status).inc()
+            metrics.GRPC_REQUEST_DURATION.labels(command=command_type).observe(duration)
+            if error_type:
+                metrics.GRPC_ERRORS_TOTAL.labels(command=command_type, error_type=error_type).inc()
+
     def _wrap_response(
         self,
         command_response: Optional[object],
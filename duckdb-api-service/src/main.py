@@ -12,7 +12,13 @@ import uuid
 
 from src.config import settings
 from src.routers import api_keys, backend, branches, buckets, bucket_sharing, driver, files, projects, s3_compat, tables, table_schema, table_import, metrics, pgwire_auth, snapshot_settings, snapshots, workspaces
-from src.database import metadata_db
+from src.database import (
+    api_key_cache,
+    duckdb_executor,
+    metadata_db,
+    project_db_manager,
+    storage_usage,
+)
 from src.middleware.idempotency import IdempotencyMiddleware
 from src.middleware.metrics import MetricsMiddleware, normalize_path
 from src.metrics import ERROR_COUNT
@@ -82,6 +88,115 @@ async def cleanup_pgwire_sessions_task():
             logger.error("pgwire_session_cleanup_failed", error=str(e))
 
 
+async def cleanup_multipart_uploads_task():
+    """Background task to remove abandoned S3 multipart uploads and temp files."""
+    logger = structlog.get_logger()
+    # Run cleanup every hour
+    cleanup_interval = 3600
+    # First run at startup re-syncs the active uploads gauge from disk
+    delay = 0
+
+    while True:
+        try:
+            await asyncio.sleep(delay)
+            delay = cleanup_interval
+            count = await asyncio.to_thread(
+                s3_compat.cleanup_stale_multipart_uploads,
+                settings.s3_multipart_upload_max_age_hours * 3600,
+            )
+            if count > 0:
+                logger.info("s3_multipart_cleanup_completed", removed_count=count)
+        except asyncio.CancelledError:
+            logger.info("s3_multipart_cleanup_task_cancelled")
+            break
+        except Exception as e:
+            logger.error("s3_multipart_cleanup_failed", error=str(e))
+
+
+async def cleanup_upload_sessions_task():
+    """Background task to remove expired Files API upload sessions and staging files."""
+    logger = structlog.get_logger()
+    # Run cleanup every hour
+    cleanup_interval = 3600
+
+    while True:
+        try:
+            await asyncio.sleep(cleanup_interval)
+            count = await asyncio.to_thread(files.cleanup_expired_upload_sessions)
+            if count > 0:
+                logger.info("upload_session_cleanup_completed", removed_count=count)
+        except asyncio.CancelledError:
+            logger.info("upload_session_cleanup_task_cancelled")
+            break
+        except Exception as e:
+            logger.error("upload_session_cleanup_failed", error=str(e))
+
+
+async def reconcile_table_stats_task():
+    """Background task to repair drift in persisted table stats.
+
+    Write paths keep table_stats up to date; this catches files changed by
+    other means (manual copies, crashed writers) and removes stats for
+    deleted tables.
+    """
+    logger = structlog.get_logger()
+
+    while True:
+        try:
+            await asyncio.sleep(settings.table_stats_reconcile_interval_seconds)
+            result = await asyncio.to_thread(project_db_manager.reconcile_table_stats)
+            if result["repaired"] or result["removed"]:
+                logger.info("table_stats_reconcile_completed", **result)
+        except asyncio.CancelledError:
+            logger.info("table_stats_reconcile_task_cancelled")
+            break
+        except Exception as e:
+            logger.error("table_stats_reconcile_failed", error=str(e))
+
+
+async def rescan_storage_metrics_task():
+    """Background task to reset the storage gauges from a filesystem scan.
+
+    Write paths keep bucket/table counts and storage sizes current; this
+    runs once at startup and then periodically to correct drift (S3 API
+    writes, upload staging, files changed outside the service).
+    """
+    logger = structlog.get_logger()
+
+    while True:
+        try:
+            result = await asyncio.to_thread(storage_usage.rescan)
+            logger.info("storage_metrics_rescan_completed", **result)
+            await asyncio.sleep(settings.storage_metrics_rescan_interval_seconds)
+        except asyncio.CancelledError:
+            logger.info("storage_metrics_rescan_task_cancelled")
+            break
+        except Exception as e:
+            logger.error("storage_metrics_rescan_failed", error=str(e))
+            await asyncio.sleep(settings.storage_metrics_rescan_interval_seconds)
+
+
+async def flush_api_key_last_used_task():
+    """Background task to write collected API key last_used_at timestamps.
+
+    Auth only records key use in memory (api_key_cache); this writes the
+    timestamps in one batch per interval instead of one commit per request.
+    """
+    logger = structlog.get_logger()
+
+    while True:
+        try:
+            await asyncio.sleep(settings.api_key_last_used_flush_interval_seconds)
+            count = await asyncio.to_thread(api_key_cache.flush_last_used, metadata_db)
+            if count:
+                logger.debug("api_key_last_used_flushed", count=count)
+        except asyncio.CancelledError:
+            logger.info("api_key_last_used_flush_task_cancelled")
+            break
+        except Exception as e:
+            logger.error("api_key_last_used_flush_failed", error=str(e))
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
@@ -104,13 +219,34 @@ async def lifespan(app: FastAPI):
     # Start background cleanup tasks
     idempotency_cleanup_task = asyncio.create_task(cleanup_idempotency_keys_task())
     pgwire_cleanup_task = asyncio.create_task(cleanup_pgwire_sessions_task())
-    logger.info("background_tasks_started", tasks=["idempotency_cleanup", "pgwire_session_cleanup"])
+    table_stats_task = asyncio.create_task(reconcile_table_stats_task())
+    storage_metrics_task = asyncio.create_task(rescan_storage_metrics_task())
+    api_key_flush_task = asyncio.create_task(flush_api_key_last_used_task())
+    multipart_cleanup_task = asyncio.create_task(cleanup_multipart_uploads_task())
+    upload_session_cleanup_task = asyncio.create_task(cleanup_upload_sessions_task())
+    logger.info(
+        "background_tasks_started",
+        tasks=[
+            "idempotency_cleanup",
+            "pgwire_session_cleanup",
+            "table_stats_reconcile",
+            "storage_metrics_rescan",
+            "api_key_last_used_flush",
+            "s3_multipart_cleanup",
+            "upload_session_cleanup",
+        ],
+    )
 
     yield
 
     # Cancel cleanup tasks on shutdown
     idempotency_cleanup_task.cancel()
     pgwire_cleanup_task.cancel()
+    table_stats_task.cancel()
+    storage_metrics_task.cancel()
+    api_key_flush_task.cancel()
+    multipart_cleanup_task.cancel()
+    upload_session_cleanup_task.cancel()
     try:
         await idempotency_cleanup_task
     except asyncio.CancelledError:
@@ -119,6 +255,38 @@ async def lifespan(app: FastAPI):
         await pgwire_cleanup_task
     except asyncio.CancelledError:
         pass
+    try:
+        await table_stats_task
+    except asyncio.CancelledError:
+        pass
+    try:
+        await storage_metrics_task
+    except asyncio.CancelledError:
+        pass
+    try:
+        await api_key_flush_task
+    except asyncio.CancelledError:
+        pass
+    try:
+        await multipart_cleanup_task
+    except asyncio.CancelledError:
+        pass
+    try:
+        await upload_session_cleanup_task
+    except asyncio.CancelledError:
+        pass
+
+    # Stop DuckDB executor lanes (waits for running operations)
+    duckdb_executor.shutdown()
+
+    # Write last_used_at collected since the last flush
+    try:
+        api_key_cache.flush_last_used(metadata_db)
+    except Exception as e:
+        logger.error("api_key_last_used_flush_failed", error=str(e))
+
+    # Release the long-lived metadata connection
+    metadata_db.close()
 
     logger.info("application_shutdown")
 
@@ -147,13 +147,85 @@ IDEMPOTENCY_CACHE_SIZE = Gauge(
     "Current number of entries in idempotency cache"
 )
 
+IDEMPOTENCY_IN_FLIGHT_WAITS = Counter(
+    "duckdb_idempotency_in_flight_waits_total",
+    "Requests that waited for an in-flight request with the same idempotency key",
+    ["result"]  # replayed, executed, timeout
+)
+
+IDEMPOTENCY_BODIES_OMITTED = Counter(
+    "duckdb_idempotency_bodies_omitted_total",
+    "Idempotent responses stored without body (over the capture size cap)"
+)
+
 IDEMPOTENCY_CACHE_CONFLICTS = Counter(
     "duckdb_idempotency_conflicts_total",
     "Total number of idempotency key conflicts"
 )
 
 # =============================================================================
-# Write Queue Metrics (prepared for future use)
+# Table Catalog Metrics (in-process cache + persisted stats)
+# =============================================================================
+
+TABLE_CATALOG_CACHE_HITS = Counter(
+    "duckdb_table_catalog_cache_hits_total",
+    "Table metadata lookups served from the in-process catalog cache"
+)
+
+TABLE_CATALOG_CACHE_MISSES = Counter(
+    "duckdb_table_catalog_cache_misses_total",
+    "Table metadata lookups that had to open the table file"
+)
+
+TABLE_CATALOG_CACHE_SIZE = Gauge(
+    "duckdb_table_catalog_cache_size",
+    "Current number of entries in the table catalog cache"
+)
+
+# =============================================================================
+# API Key Cache Metrics (auth hot path)
+# =============================================================================
+
+API_KEY_CACHE_HITS = Counter(
+    "duckdb_api_key_cache_hits_total",
+    "API key verifications served from the in-process key cache"
+)
+
+API_KEY_CACHE_MISSES = Counter(
+    "duckdb_api_key_cache_misses_total",
+    "API key verifications that had to query the metadata database"
+)
+
+API_KEY_CACHE_SIZE = Gauge(
+    "duckdb_api_key_cache_size",
+    "Current number of entries in the API key cache"
+)
+
+API_KEY_LAST_USED_FLUSHED = Counter(
+    "duckdb_api_key_last_used_flushed_total",
+    "API keys whose last_used_at was written by the batched flusher"
+)
+
+TABLE_STATS_LOOKUPS = Counter(
+    "duckdb_table_stats_lookups_total",
+    "Persisted table stats lookups",
+    ["result"]  # fresh, stale, missing
+)
+
+TABLE_PROFILE_LOOKUPS = Counter(
+    "duckdb_table_profile_lookups_total",
+    "Table profile requests answered from a stored profile or computed",
+    ["result"]  # hit, miss
+)
+
+TABLE_STATS_RECONCILED = Counter(
+    "duckdb_table_stats_reconciled_total",
+    "Persisted table stats repaired or removed by the reconciler",
+    ["action"]  # repaired, removed
+)
+
+# =============================================================================
+# Write Queue Metrics (per-table write queue, ADR-005)
 # =============================================================================
 
 WRITE_QUEUE_DEPTH = Gauge(
@@ -169,6 +241,35 @@ WRITE_QUEUE_WAIT_TIME = Histogram(
     buckets=[0.01, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0]
 )
 
+WRITE_QUEUE_BATCH_SIZE = Histogram(
+    "duckdb_write_queue_batch_size",
+    "Number of queued writes committed together in one transaction",
+    buckets=[1, 2, 4, 8, 16, 32, 64]
+)
+
+# =============================================================================
+# DuckDB Executor Metrics (thread pools for blocking work from async routes)
+# =============================================================================
+
+DUCKDB_EXECUTOR_QUEUE_DEPTH = Gauge(
+    "duckdb_executor_queue_depth",
+    "Number of DuckDB operations waiting for an executor thread",
+    ["lane"]  # data, metadata, snapshot
+)
+
+DUCKDB_EXECUTOR_ACTIVE = Gauge(
+    "duckdb_executor_active",
+    "Number of DuckDB operations currently running in the executor",
+    ["lane"]
+)
+
+DUCKDB_EXECUTOR_WAIT_TIME = Histogram(
+    "duckdb_executor_wait_seconds",
+    "Time DuckDB operations spent queued before an executor thread picked them up",
+    ["lane"],
+    buckets=[0.001, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0]
+)
+
 # =============================================================================
 # Table Lock Metrics
 # =============================================================================
@@ -230,6 +331,12 @@ PGWIRE_AUTH_DURATION = Histogram(
     buckets=[0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0]
 )
 
+PGWIRE_TABLE_ATTACHES = Counter(
+    "pgwire_table_attaches_total",
+    "PG Wire on-demand table ATTACH/DETACH operations",
+    ["result"]  # attached, evicted, failed
+)
+
 # =============================================================================
 # Branch Metrics (ADR-007: CoW branching)
 # =============================================================================
@@ -248,13 +355,14 @@ BRANCH_COW_OPERATIONS = Counter(
 BRANCH_COW_DURATION = Histogram(
     "duckdb_branch_cow_duration_seconds",
     "Duration of Copy-on-Write operations",
+    ["strategy"],  # reflink, copy_range, copy
     buckets=[0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0]
 )
 
 BRANCH_COW_SIZE_BYTES = Counter(
     "duckdb_branch_cow_bytes_total",
-    "Total bytes copied in CoW operations",
-    ["project_id", "branch_id"]
+    "Total bytes copied in CoW operations (logical table size; reflinks share blocks)",
+    ["project_id", "branch_id", "strategy"]
 )
 
 BRANCH_TABLES_TOTAL = Gauge(
@@ -284,6 +392,23 @@ METADATA_CONNECTIONS_ACTIVE = Gauge(
     "Active connections to metadata.duckdb"
 )
 
+METADATA_CONNECTION_OPENS = Counter(
+    "duckdb_metadata_connection_opens_total",
+    "Number of times metadata.duckdb was opened"
+)
+
+METADATA_CURSOR_CHECKOUTS = Counter(
+    "duckdb_metadata_cursor_checkouts_total",
+    "Metadata cursor checkouts from the pool",
+    ["result"]  # reused, created
+)
+
+METADATA_WRITE_WAIT_TIME = Histogram(
+    "duckdb_metadata_write_wait_seconds",
+    "Time spent waiting for the metadata write lane",
+    buckets=[0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5]
+)
+
 # =============================================================================
 # gRPC Metrics (Phase 13b)
 # =============================================================================
@@ -385,6 +510,22 @@ S3_BYTES_OUT_TOTAL = Counter(
     "Total bytes sent via S3 API"
 )
 
+S3_ETAG_LOOKUPS = Counter(
+    "duckdb_s3_etag_lookups_total",
+    "Object ETag lookups",
+    ["result"]  # cached, computed (file hashed because no valid cached ETag)
+)
+
+S3_OBJECT_INDEX_KEYS = Gauge(
+    "duckdb_s3_object_index_keys",
+    "Object keys held in the in-memory ListObjectsV2 index"
+)
+
+S3_OBJECT_INDEX_BUILDS = Counter(
+    "duckdb_s3_object_index_builds_total",
+    "Project directory walks that (re)built the ListObjectsV2 index"
+)
+
 S3_MULTIPART_UPLOADS_ACTIVE = Gauge(
     "duckdb_s3_multipart_uploads_active",
     "Active multipart uploads"
@@ -423,6 +564,19 @@ SNAPSHOT_CREATE_DURATION = Histogram(
     buckets=[0.01, 0.1, 0.5, 1.0, 5.0, 30.0]
 )
 
+SNAPSHOT_EXPORT_DURATION = Histogram(
+    "duckdb_snapshot_export_duration_seconds",
+    "Time to write snapshot data to Parquet",
+    ["mode"],  # full, incremental
+    buckets=[0.01, 0.1, 0.5, 1.0, 5.0, 30.0, 120.0, 600.0]
+)
+
+SNAPSHOT_PARTS_TOTAL = Counter(
+    "duckdb_snapshot_parts_total",
+    "Incremental snapshot parts by outcome",
+    ["result"]  # written, reused
+)
+
 SNAPSHOT_RESTORE_DURATION = Histogram(
     "duckdb_snapshot_restore_duration_seconds",
     "Snapshot restore duration in seconds",
@@ -449,6 +603,12 @@ FILES_UPLOADS_TOTAL = Counter(
     ["status"]  # success, error
 )
 
+FILES_UPLOAD_CHUNKS_TOTAL = Counter(
+    "duckdb_files_upload_chunks_total",
+    "Chunks received by resumable Files API uploads",
+    ["status"]  # success, bad_checksum, error
+)
+
 FILES_DOWNLOADS_TOTAL = Counter(
     "duckdb_files_downloads_total",
     "Total file downloads",
@@ -5,20 +5,38 @@ return the same response without re-executing the operation.
 
 TTL: 10 minutes (600 seconds)
 Scope: POST, PUT, DELETE requests only
+
+Storage is two-tier: recent keys live in an in-process LRU in front of the
+metadata idempotency_keys table, so replays and first-time keys seen by this
+process don't need a metadata read. Responses are captured while they stream
+to the client; bodies above settings.idempotency_max_response_bytes are not
+stored (replay returns the status and headers only). A retry that arrives
+while the first request with the same key is still running waits for its
+result instead of executing the operation a second time. In-flight tracking
+is per process.
 """
 
+import asyncio
 import hashlib
-import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator
+
 import structlog
 from fastapi import Request, Response
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 
-from src.database import metadata_db
+from src.config import settings
+from src.database import duckdb_executor, metadata_db
 from src.metrics import (
+    IDEMPOTENCY_BODIES_OMITTED,
     IDEMPOTENCY_CACHE_HITS,
     IDEMPOTENCY_CACHE_MISSES,
     IDEMPOTENCY_CACHE_CONFLICTS,
+    IDEMPOTENCY_IN_FLIGHT_WAITS,
 )
 
 logger = structlog.get_logger()
@@ -32,12 +50,173 @@ IDEMPOTENCY_TTL_SECONDS = 600
 # Header name
 IDEMPOTENCY_HEADER = "X-Idempotency-Key"
 
+# Set on replays whose original body was too large to store
+BODY_OMITTED_HEADER = "X-Idempotency-Body-Omitted"
+
+# Response headers recomputed on replay rather than stored
+_UNSTORED_HEADERS = {"content-length", "transfer-encoding"}
+
 
 def compute_request_hash(body: bytes) -> str:
     """Compute SHA-256 hash of request body."""
     return hashlib.sha256(body).hexdigest()
 
 
+class IdempotencyStore:
+    """
+    Two-tier store of idempotent responses with in-flight key tracking.
+
+    The in-process tier is an LRU of recent records (same dict shape as
+    MetadataDB.get_idempotency_key) bounded by
+    settings.idempotency_cache_max_entries; misses fall through to the
+    metadata table. All methods are called from the event loop; metadata
+    reads and writes run on the "metadata" executor lane.
+    """
+
+    def __init__(self, max_entries: int | None = None):
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._in_flight: dict[str, tuple[float, asyncio.Event]] = {}
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    @property
+    def max_entries(self) -> int:
+        if self._max_entries is not None:
+            return self._max_entries
+        return settings.idempotency_cache_max_entries
+
+    def peek(self, key: str) -> dict[str, Any] | None:
+        """Return the record from the in-process tier only."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+        return None
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """Return the stored record for a key, or None if unknown/expired."""
+        record = self.peek(key)
+        if record:
+            return record
+
+        record = await duckdb_executor.run("metadata", metadata_db.get_idempotency_key, key)
+        if record:
+            expires_at = datetime.fromisoformat(record["expires_at"])
+            self._remember(key, record, (expires_at - datetime.now(timezone.utc)).total_seconds())
+        return record
+
+    async def put(self, record: dict[str, Any], ttl_seconds: int) -> None:
+        """Store a record in both tiers; a metadata write failure is only logged."""
+        self._remember(record["key"], record, ttl_seconds)
+        try:
+            await duckdb_executor.run(
+                "metadata",
+                metadata_db.store_idempotency_key,
+                key=record["key"],
+                method=record["method"],
+                endpoint=record["endpoint"],
+                request_hash=record["request_hash"],
+                response_status=record["response_status"],
+                response_body=record["response_body"],
+                ttl_seconds=ttl_seconds,
+                response_headers=record["response_headers"],
+            )
+        except Exception as e:
+            # Don't fail the request if caching fails
+            logger.error(
+                "idempotency_store_failed",
+                key=record["key"][:20] + "...",
+                error=str(e),
+            )
+
+    def _remember(self, key: str, record: dict[str, Any], ttl_seconds: float) -> None:
+        if ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, record)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def claim(self, key: str) -> bool:
+        """
+        Mark a key as in flight. Returns False if another request holds it.
+
+        A claim older than settings.idempotency_in_flight_wait_seconds is
+        taken over (its response was never streamed, so never released).
+        """
+        held = self._in_flight.get(key)
+        if held is not None:
+            if time.monotonic() - held[0] < settings.idempotency_in_flight_wait_seconds:
+                return False
+            logger.warning("idempotency_stale_in_flight_key", key=key[:20] + "...")
+            held[1].set()
+        self._in_flight[key] = (time.monotonic(), asyncio.Event())
+        return True
+
+    def release(self, key: str) -> None:
+        """Clear the in-flight mark and wake up waiting retries."""
+        held = self._in_flight.pop(key, None)
+        if held is not None:
+            held[1].set()
+
+    async def wait(self, key: str, timeout: float) -> bool:
+        """Wait for an in-flight key to be released. Returns False on timeout."""
+        held = self._in_flight.get(key)
+        if held is None:
+            return True
+        event = held[1]
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Global singleton instance
+idempotency_store = IdempotencyStore()
+
+
+def _conflict_response(message: str) -> JSONResponse:
+    IDEMPOTENCY_CACHE_CONFLICTS.inc()
+    return JSONResponse(
+        status_code=409,
+        content={"error": "idempotency_conflict", "message": message},
+    )
+
+
+def _replay_response(cached: dict[str, Any], idempotency_key: str) -> Response:
+    """Rebuild the original response from a stored record."""
+    headers = dict(cached["response_headers"] or {})
+    headers[IDEMPOTENCY_HEADER] = idempotency_key
+    headers["X-Idempotency-Replay"] = "true"
+
+    body = cached["response_body"]
+    if body is None:
+        headers[BODY_OMITTED_HEADER] = "true"
+
+    # Records stored before headers were kept only ever held JSON bodies
+    media_type = None if cached["response_headers"] else "application/json"
+
+    return Response(
+        content=(body or "").encode("utf-8"),
+        status_code=cached["response_status"],
+        headers=headers,
+        media_type=media_type,
+    )
+
+
 class IdempotencyMiddleware(BaseHTTPMiddleware):
     """
     Middleware that implements idempotent request handling.
@@ -45,7 +224,8 @@ class IdempotencyMiddleware(BaseHTTPMiddleware):
     When a request includes an X-Idempotency-Key header:
     1. Check if we've seen this key before (and it hasn't expired)
     2. If yes, return the cached response
-    3. If no, execute the request and cache the response
+    3. If the key is in flight, wait for that request and replay its result
+    4. If no, execute the request and cache the response
 
     This prevents duplicate operations from network retries.
     """
@@ -72,73 +252,48 @@ class IdempotencyMiddleware(BaseHTTPMiddleware):
         body = await request.body()
         request_hash = compute_request_hash(body) if body else None
 
-        # Check if we have a cached response for this key
-        cached = metadata_db.get_idempotency_key(idempotency_key)
-
-        if cached:
-            # Validate that this is the same request (optional safety check)
-            if cached["method"] != method:
-                logger.warning(
-                    "idempotency_method_mismatch",
-                    key=idempotency_key[:20] + "...",
-                    cached_method=cached["method"],
-                    request_method=method,
-                )
-                IDEMPOTENCY_CACHE_CONFLICTS.inc()
-                return JSONResponse(
-                    status_code=409,
-                    content={
-                        "error": "idempotency_conflict",
-                        "message": f"Idempotency key was used with {cached['method']}, not {method}",
-                    },
+        waited = False
+        while True:
+            # Check if we have a cached response for this key
+            cached = await idempotency_store.get(idempotency_key)
+            if cached:
+                if waited:
+                    IDEMPOTENCY_IN_FLIGHT_WAITS.labels(result="replayed").inc()
+                return self._cached_response(
+                    cached, idempotency_key, method, endpoint, request_hash
                 )
 
-            if cached["endpoint"] != endpoint:
-                logger.warning(
-                    "idempotency_endpoint_mismatch",
-                    key=idempotency_key[:20] + "...",
-                    cached_endpoint=cached["endpoint"],
-                    request_endpoint=endpoint,
-                )
-                IDEMPOTENCY_CACHE_CONFLICTS.inc()
-                return JSONResponse(
-                    status_code=409,
-                    content={
-                        "error": "idempotency_conflict",
-                        "message": f"Idempotency key was used with different endpoint",
-                    },
-                )
+            if idempotency_store.claim(idempotency_key):
+                # The previous holder may have finished while we were reading
+                # the metadata table
+                cached = idempotency_store.peek(idempotency_key)
+                if cached:
+                    idempotency_store.release(idempotency_key)
+                    continue
+                if waited:
+                    # First request failed without storing a response
+                    IDEMPOTENCY_IN_FLIGHT_WAITS.labels(result="executed").inc()
+                break
 
-            # Optional: validate request body hash
-            if request_hash and cached["request_hash"] and cached["request_hash"] != request_hash:
-                logger.warning(
-                    "idempotency_body_mismatch",
-                    key=idempotency_key[:20] + "...",
-                )
-                IDEMPOTENCY_CACHE_CONFLICTS.inc()
+            logger.info(
+                "idempotency_waiting_for_in_flight",
+                key=idempotency_key[:20] + "...",
+                endpoint=endpoint,
+            )
+            waited = True
+            if not await idempotency_store.wait(
+                idempotency_key, settings.idempotency_in_flight_wait_seconds
+            ):
+                IDEMPOTENCY_IN_FLIGHT_WAITS.labels(result="timeout").inc()
                 return JSONResponse(
                     status_code=409,
                     content={
-                        "error": "idempotency_conflict",
-                        "message": "Idempotency key was used with different request body",
+                        "error": "idempotency_in_progress",
+                        "message": "A request with this idempotency key is still in progress",
                     },
+                    headers={"Retry-After": "1"},
                 )
 
-            # Return cached response
-            logger.info(
-                "idempotency_cache_hit",
-                key=idempotency_key[:20] + "...",
-                endpoint=endpoint,
-                method=method,
-            )
-            IDEMPOTENCY_CACHE_HITS.inc()
-
-            return JSONResponse(
-                status_code=cached["response_status"],
-                content=json.loads(cached["response_body"]) if cached["response_body"] else None,
-                headers={IDEMPOTENCY_HEADER: idempotency_key, "X-Idempotency-Replay": "true"},
-            )
-
         # No cached response - execute the request
         # Record cache miss
         IDEMPOTENCY_CACHE_MISSES.inc()
@@ -152,44 +307,127 @@ class IdempotencyMiddleware(BaseHTTPMiddleware):
         request._receive = receive
 
         # Execute the request
-        response = await call_next(request)
-
-        # Read the response body to cache it
-        response_body = b""
-        async for chunk in response.body_iterator:
-            response_body += chunk
-
-        # Store in cache
         try:
-            metadata_db.store_idempotency_key(
-                key=idempotency_key,
-                method=method,
-                endpoint=endpoint,
-                request_hash=request_hash,
-                response_status=response.status_code,
-                response_body=response_body.decode("utf-8"),
-                ttl_seconds=IDEMPOTENCY_TTL_SECONDS,
+            response = await call_next(request)
+        except BaseException:
+            idempotency_store.release(idempotency_key)
+            raise
+
+        # Capture the body while it streams to the client
+        response.body_iterator = self._capture(
+            response.body_iterator,
+            {
+                "key": idempotency_key,
+                "method": method,
+                "endpoint": endpoint,
+                "request_hash": request_hash,
+                "response_status": response.status_code,
+                "response_headers": {
+                    name: value
+                    for name, value in response.headers.items()
+                    if name not in _UNSTORED_HEADERS
+                },
+            },
+        )
+        return response
+
+    @staticmethod
+    def _cached_response(
+        cached: dict[str, Any],
+        idempotency_key: str,
+        method: str,
+        endpoint: str,
+        request_hash: str | None,
+    ) -> Response:
+        """Validate a stored record against the request and replay it."""
+        # Validate that this is the same request (optional safety check)
+        if cached["method"] != method:
+            logger.warning(
+                "idempotency_method_mismatch",
+                key=idempotency_key[:20] + "...",
+                cached_method=cached["method"],
+                request_method=method,
+            )
+            return _conflict_response(
+                f"Idempotency key was used with {cached['method']}, not {method}"
             )
 
-            logger.info(
-                "idempotency_key_stored",
+        if cached["endpoint"] != endpoint:
+            logger.warning(
+                "idempotency_endpoint_mismatch",
                 key=idempotency_key[:20] + "...",
-                endpoint=endpoint,
-                method=method,
-                status=response.status_code,
+                cached_endpoint=cached["endpoint"],
+                request_endpoint=endpoint,
             )
-        except Exception as e:
-            # Don't fail the request if caching fails
-            logger.error(
-                "idempotency_store_failed",
+            return _conflict_response("Idempotency key was used with different endpoint")
+
+        # Optional: validate request body hash
+        if request_hash and cached["request_hash"] and cached["request_hash"] != request_hash:
+            logger.warning(
+                "idempotency_body_mismatch",
                 key=idempotency_key[:20] + "...",
-                error=str(e),
             )
-
-        # Return the response with idempotency header
-        return Response(
-            content=response_body,
-            status_code=response.status_code,
-            headers=dict(response.headers),
-            media_type=response.media_type,
+            return _conflict_response("Idempotency key was used with different request body")
+
+        # Return cached response
+        logger.info(
+            "idempotency_cache_hit",
+            key=idempotency_key[:20] + "...",
+            endpoint=endpoint,
+            method=method,
         )
+        IDEMPOTENCY_CACHE_HITS.inc()
+
+        return _replay_response(cached, idempotency_key)
+
+    @staticmethod
+    async def _capture(
+        body_iterator: AsyncIterator[bytes], record: dict[str, Any]
+    ) -> AsyncIterator[bytes]:
+        """
+        Pass response chunks through and store the response once sent.
+
+        At most settings.idempotency_max_response_bytes are buffered; larger
+        bodies are stored as None. Nothing is stored if the client
+        disconnects mid-stream. The key is released either way.
+        """
+        max_bytes = settings.idempotency_max_response_bytes
+        chunks: list[bytes] | None = []
+        size = 0
+        completed = False
+        try:
+            async for chunk in body_iterator:
+                if chunks is not None:
+                    size += len(chunk)
+                    if size > max_bytes:
+                        chunks = None
+                    else:
+                        chunks.append(chunk)
+                yield chunk
+            completed = True
+        finally:
+            try:
+                if completed:
+                    response_body = None
+                    if chunks is not None:
+                        try:
+                            response_body = b"".join(chunks).decode("utf-8")
+                        except UnicodeDecodeError:
+                            pass
+                    if response_body is None:
+                        IDEMPOTENCY_BODIES_OMITTED.inc()
+
+                    await idempotency_store.put(
+                        {**record, "response_body": response_body},
+                        IDEMPOTENCY_TTL_SECONDS,
+                    )
+                    logger.info(
+                        "idempotency_key_stored",
+                        key=record["key"][:20] + "...",
+                        endpoint=record["endpoint"],
+                        method=record["method"],
+                        status=record["response_status"],
+                        body_stored=response_body is not None,
+                    )
+            finally:
+                idempotency_store.release(record["key"])
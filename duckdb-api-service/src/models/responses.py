@@ -369,6 +369,15 @@ class ColumnCorrelation(BaseModel):
     strength: str = Field(description="Correlation strength: strong (>0.7), moderate (0.4-0.7)")
 
 
+class CorrelationMatrix(BaseModel):
+    """Pearson correlation matrix of numeric columns."""
+
+    columns: list[str] = Field(description="Column names, in matrix order")
+    values: list[list[float | None]] = Field(
+        description="Symmetric matrix of correlations; null where undefined (e.g. constant column)"
+    )
+
+
 class TableProfileResponse(BaseModel):
     """Response for advanced table profiling."""
 
@@ -393,6 +402,21 @@ class TableProfileResponse(BaseModel):
         default=None,
         description="Significant correlations between numeric columns"
     )
+    correlation_matrix: CorrelationMatrix | None = Field(
+        default=None,
+        description="Full correlation matrix of numeric columns (full/quality mode)"
+    )
+    # Sampling
+    sampled: bool = Field(default=False, description="Statistics were computed on a row sample")
+    profiled_rows: int | None = Field(default=None, description="Rows the statistics were computed on")
+    margin_of_error: float | None = Field(
+        default=None,
+        description="95% margin of error of sampled percentages, in percentage points",
+    )
+
+    # Caching
+    cached: bool = Field(default=False, description="Returned from a stored profile of the unchanged table")
+    profiled_at: str | None = Field(default=None, description="When the profile was computed (ISO 8601)")
 
 
 # ============================================
@@ -469,6 +493,30 @@ class FileUploadResponse(BaseModel):
     checksum_sha256: str = Field(description="SHA256 checksum of uploaded file")
 
 
+class FileChunkResponse(BaseModel):
+    """A chunk received for a resumable upload."""
+
+    offset: int = Field(description="Byte offset of the chunk in the file")
+    size_bytes: int = Field(description="Chunk size in bytes")
+    checksum_sha256: str = Field(description="SHA256 checksum of the chunk")
+
+
+class FileUploadStatusResponse(BaseModel):
+    """State of an upload session (used to resume an interrupted upload)."""
+
+    upload_key: str = Field(description="Upload key")
+    filename: str = Field(description="Original filename")
+    expected_size: int | None = Field(
+        default=None, description="File size declared at prepare"
+    )
+    uploaded_bytes: int = Field(description="Bytes received so far")
+    complete: bool = Field(description="Whether the whole file was received by a single upload")
+    expires_at: str = Field(description="When the upload session expires (ISO timestamp)")
+    chunks: list[FileChunkResponse] = Field(
+        default_factory=list, description="Chunks received so far, ordered by offset"
+    )
+
+
 # ============================================
 # Import/Export API models
 # ============================================
@@ -502,9 +550,22 @@ class ImportOptions(BaseModel):
 
 
 class ImportFromFileRequest(BaseModel):
-    """Request to import data from a file into a table."""
+    """Request to import data from one or more files into a table.
+
+    Exactly one of file_id, file_ids or file_pattern selects the files.
+    Several files (e.g. CSV slices) are loaded in one scan and one commit.
+    """
 
-    file_id: str = Field(description="ID of file to import (from Files API)")
+    file_id: str | None = Field(
+        default=None, description="ID of file to import (from Files API)"
+    )
+    file_ids: list[str] | None = Field(
+        default=None, description="IDs of several files to import together (e.g. sliced CSV)"
+    )
+    file_pattern: str | None = Field(
+        default=None,
+        description="Glob over file names in the project (e.g. 'orders_*.csv'); imports all matches",
+    )
     format: str = Field(
         default="csv",
         description="File format: 'csv' or 'parquet'"
@@ -515,6 +576,24 @@ class ImportFromFileRequest(BaseModel):
     import_options: ImportOptions = Field(
         default_factory=ImportOptions, description="Import behavior options"
     )
+    report_file_rows: bool = Field(
+        default=False,
+        description=(
+            "Report rows per file for multi-file CSV imports (costs a second, "
+            "count-only scan of the files; Parquet counts are always reported)"
+        ),
+    )
+
+
+class ImportedFileResponse(BaseModel):
+    """Rows read from one file of an import."""
+
+    file_id: str = Field(description="File ID")
+    name: str = Field(description="File name")
+    rows: int | None = Field(
+        default=None,
+        description="Rows read from the file (None unless reported, see report_file_rows)",
+    )
 
 
 class ImportResponse(BaseModel):
@@ -523,6 +602,9 @@ class ImportResponse(BaseModel):
     imported_rows: int = Field(description="Number of rows imported")
     table_rows_after: int = Field(description="Total rows in table after import")
     table_size_bytes: int = Field(description="Table size after import")
+    files: list[ImportedFileResponse] = Field(
+        default_factory=list, description="Per-file row counts, in load order"
+    )
     warnings: list[str] = Field(default_factory=list, description="Any warnings during import")
 
 
@@ -595,6 +677,27 @@ class SnapshotRetentionConfig(BaseModel):
     )
 
 
+class SnapshotStorageConfig(BaseModel):
+    """Configuration for how snapshot data is written."""
+
+    model_config = {"extra": "forbid"}
+
+    compression: str | None = Field(
+        default=None,
+        description="Parquet compression (uncompressed, snappy, gzip, zstd, lz4, brotli)",
+    )
+    row_group_size: int | None = Field(
+        default=None, description="Rows per Parquet row group"
+    )
+    incremental: bool | None = Field(
+        default=None,
+        description="Only write row ranges that changed since the table's previous snapshot",
+    )
+    part_rows: int | None = Field(
+        default=None, description="Row range size used by incremental snapshots"
+    )
+
+
 class SnapshotConfigRequest(BaseModel):
     """Request to update snapshot configuration."""
 
@@ -604,6 +707,9 @@ class SnapshotConfigRequest(BaseModel):
     retention: SnapshotRetentionConfig | None = Field(
         default=None, description="Retention period settings"
     )
+    storage: SnapshotStorageConfig | None = Field(
+        default=None, description="Parquet storage settings"
+    )
     enabled: bool | None = Field(
         default=None, description="Master switch to enable/disable snapshots"
     )
@@ -838,7 +944,9 @@ class WorkspaceListResponse(BaseModel):
 class WorkspaceLoadRequest(BaseModel):
     """Request to load data into workspace."""
 
-    tables: list[dict] = Field(..., description="Tables to load with source, destination, columns, where")
+    tables: list[dict] = Field(
+        ..., description="Tables to load with source, destination, columns, where, mode (clone|view)"
+    )
 
 
 class WorkspaceLoadTableResult(BaseModel):
@@ -846,6 +954,7 @@ class WorkspaceLoadTableResult(BaseModel):
 
     source: str = Field(..., description="Source table")
     destination: str = Field(..., description="Destination table name")
+    mode: str = Field(default="clone", description="Load mode: clone (table) or view")
     rows: int = Field(default=0, description="Rows loaded")
     size_bytes: int = Field(default=0, description="Size in bytes")
 
@@ -3,7 +3,8 @@
 This module provides a PG Wire server that:
 1. Authenticates using workspace credentials from metadata_db
 2. Opens workspace-specific DuckDB files
-3. ATTACHes all project tables as READ_ONLY
+3. ATTACHes project tables READ_ONLY on demand (only those a query references),
+   plus the sources of workspace views for the whole session
 4. Tracks sessions for monitoring
 5. Collects Prometheus metrics for observability
 
@@ -17,6 +18,7 @@ Or programmatically:
 
 import argparse
 import hashlib
+import re
 import signal
 import socket
 import ssl
@@ -24,6 +26,7 @@ import socketserver
 import struct
 import threading
 import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Optional
@@ -50,10 +53,15 @@ from src.metrics import (
     PGWIRE_QUERY_DURATION,
     PGWIRE_SESSIONS_TOTAL,
     PGWIRE_AUTH_DURATION,
+    PGWIRE_TABLE_ATTACHES,
 )
 
 logger = structlog.get_logger()
 
+# Identifiers in a query: "quoted" or bare. Used to find referenced
+# {bucket}_{table} aliases - false positives only cost an extra ATTACH.
+_IDENTIFIER_RE = re.compile(r'"((?:[^"]|"")+)"|([A-Za-z_][A-Za-z0-9_$]*)')
+
 
 class QueryTimeoutError(Exception):
     """Raised when a query exceeds the configured timeout."""
@@ -67,7 +75,7 @@ class WorkspaceSession(DuckDBSession):
 
     Adds:
     - Session tracking in metadata_db
-    - Automatic ATTACH of project tables
+    - On-demand ATTACH of project tables referenced by queries
     - Resource limit enforcement
     - Query timeout enforcement
     - Prometheus metrics collection
@@ -92,7 +100,12 @@ class WorkspaceSession(DuckDBSession):
         self.session_id = session_id
         self.client_ip = client_ip
         self.query_timeout = query_timeout
-        self._attached_tables = []
+        # lower(alias) -> (alias, table file); built at login without opening files
+        self._table_index: Dict[str, tuple[str, Path]] = {}
+        # lower(alias) -> alias, in LRU order (most recently used last)
+        self._attached_tables: OrderedDict[str, str] = OrderedDict()
+        # lower(alias) -> alias of workspace view sources; attached for the whole session
+        self._pinned_tables: Dict[str, str] = {}
         self._query_count = 0
         self._log = logger.bind(
             session_id=session_id,
@@ -104,66 +117,134 @@ class WorkspaceSession(DuckDBSession):
         PGWIRE_CONNECTIONS_ACTIVE.labels(workspace_id=workspace_id).inc()
         PGWIRE_SESSIONS_TOTAL.inc()
 
-    def attach_project_tables(self) -> int:
-        """ATTACH all project tables as READ_ONLY. Returns count."""
-        attached = 0
-        buckets = project_db_manager.list_buckets(self.project_id)
+    def index_project_tables(self) -> int:
+        """
+        Build the alias -> table file index for this session. Returns count.
+
+        Only scans bucket directories - table files are not opened. Tables
+        are ATTACHed later by attach_referenced_tables() when a query uses them.
+        """
+        project_dir = project_db_manager.get_project_dir(self.project_id)
+        if not project_dir.exists():
+            return 0
 
-        for bucket in buckets:
-            bucket_name = bucket["name"]
-            tables = project_db_manager.list_tables(self.project_id, bucket_name)
+        for bucket_dir in sorted(project_dir.iterdir()):
+            # Skip hidden/special directories (_workspaces, ...)
+            if bucket_dir.name.startswith(("_", ".")) or not bucket_dir.is_dir():
+                continue
 
-            for table in tables:
-                table_name = table["name"]
+            bucket_name = bucket_dir.name
+            for table_path in sorted(bucket_dir.glob("*.duckdb")):
+                table_name = table_path.stem
 
-                # Get path to table file
+                # Branch copy wins over main (CoW)
                 if self.branch_id:
                     branch_path = project_db_manager.get_branch_table_path(
                         self.project_id, self.branch_id, bucket_name, table_name
                     )
                     if branch_path.exists():
                         table_path = branch_path
-                    else:
-                        table_path = project_db_manager.get_table_path(
-                            self.project_id, bucket_name, table_name
-                        )
-                else:
-                    table_path = project_db_manager.get_table_path(
-                        self.project_id, bucket_name, table_name
-                    )
-
-                if not table_path.exists():
-                    self._log.warning("table_file_not_found", table_path=str(table_path))
-                    continue
 
-                # Create unique alias for attached database
                 alias = f"{bucket_name}_{table_name}"
+                self._table_index[alias.lower()] = (alias, table_path)
 
-                try:
-                    self._conn.execute(
-                        f"ATTACH '{table_path}' AS \"{alias}\" (READ_ONLY)"
-                    )
-                    self._attached_tables.append(alias)
-                    attached += 1
-                    self._log.debug("table_attached", alias=alias, path=str(table_path))
-                except Exception as e:
-                    self._log.error("table_attach_failed", alias=alias, error=str(e))
+        return len(self._table_index)
+
+    def attach_workspace_sources(self) -> int:
+        """
+        ATTACH the source tables of workspace views (mode=view loads).
+
+        Views reference their source by alias, which does not appear in the
+        queries that read them, so these are attached up front and never
+        evicted. Returns number of attached tables.
+        """
+        try:
+            aliases = project_db_manager.attach_workspace_sources(
+                self._conn, self.project_id, self.branch_id
+            )
+        except Exception as e:
+            PGWIRE_TABLE_ATTACHES.labels(result="failed").inc()
+            self._log.error("workspace_sources_attach_failed", error=str(e))
+            return 0
+
+        for alias in aliases:
+            self._pinned_tables[alias.lower()] = alias
+            PGWIRE_TABLE_ATTACHES.labels(result="attached").inc()
+        return len(aliases)
 
+    def attach_referenced_tables(self, query: str) -> int:
+        """
+        ATTACH (READ_ONLY) the project tables referenced by a query.
+
+        Attached tables are kept in a per-session LRU capped at
+        pgwire_max_attached_tables; least recently used ones not needed by
+        this query are DETACHed. Returns number of newly attached tables.
+        """
+        referenced = []
+        for quoted, bare in _IDENTIFIER_RE.findall(query):
+            key = (quoted.replace('""', '"') if quoted else bare).lower()
+            if key in self._table_index and key not in referenced:
+                referenced.append(key)
+
+        attached = 0
+        for key in referenced:
+            if key in self._pinned_tables:
+                continue
+            if key in self._attached_tables:
+                self._attached_tables.move_to_end(key)
+                continue
+
+            alias, table_path = self._table_index[key]
+            if not table_path.exists():
+                self._log.warning("table_file_not_found", table_path=str(table_path))
+                continue
+
+            try:
+                self._conn.execute(f"ATTACH '{table_path}' AS \"{alias}\" (READ_ONLY)")
+                self._attached_tables[key] = alias
+                attached += 1
+                PGWIRE_TABLE_ATTACHES.labels(result="attached").inc()
+                self._log.debug("table_attached", alias=alias, path=str(table_path))
+            except Exception as e:
+                PGWIRE_TABLE_ATTACHES.labels(result="failed").inc()
+                self._log.error("table_attach_failed", alias=alias, error=str(e))
+
+        self._evict_attached_tables(keep=set(referenced))
         return attached
 
-    def execute(self, query: str):
-        """Execute query with timeout enforcement and metrics."""
+    def _evict_attached_tables(self, keep: set[str]) -> None:
+        """DETACH least recently used tables above the per-session cap."""
+        limit = settings.pgwire_max_attached_tables
+        for key in list(self._attached_tables):
+            if len(self._attached_tables) <= limit:
+                break
+            if key in keep:
+                continue
+
+            alias = self._attached_tables.pop(key)
+            try:
+                self._conn.execute(f'DETACH "{alias}"')
+                PGWIRE_TABLE_ATTACHES.labels(result="evicted").inc()
+                self._log.debug("table_detached", alias=alias)
+            except Exception as e:
+                self._log.warning("table_detach_failed", alias=alias, error=str(e))
+
+    def execute_sql(self, sql: str, params=None):
+        """Execute query with on-demand ATTACH, timeout enforcement and metrics."""
         start_time = time.time()
         self._query_count += 1
 
-        self._log.info("query_started", query_preview=query[:100] if len(query) > 100 else query)
+        self._log.info("query_started", query_preview=sql[:100] if len(sql) > 100 else sql)
+
+        # DuckDB has no statement timeout setting; interrupt the cursor instead
+        timer = threading.Timer(self.query_timeout, self._cursor.interrupt)
+        timer.daemon = True
+        timer.start()
 
         try:
-            # Set DuckDB query timeout
-            timeout_ms = self.query_timeout * 1000
-            self._conn.execute(f"SET statement_timeout = {timeout_ms}")
+            self.attach_referenced_tables(sql)
 
-            result = super().execute(query)
+            result = super().execute_sql(sql, params)
 
             duration = time.time() - start_time
             PGWIRE_QUERIES_TOTAL.labels(
@@ -202,6 +283,9 @@ class WorkspaceSession(DuckDBSession):
             PGWIRE_QUERY_DURATION.labels(workspace_id=self.workspace_id).observe(duration)
             raise
 
+        finally:
+            timer.cancel()
+
     def close(self):
         """Close session and cleanup."""
         self._log.info("session_closing", query_count=self._query_count)
@@ -217,7 +301,7 @@ class WorkspaceSession(DuckDBSession):
             self._log.error("session_close_failed", error=str(e))
 
         # Detach all attached databases
-        for alias in self._attached_tables:
+        for alias in [*self._attached_tables.values(), *self._pinned_tables.values()]:
             try:
                 self._conn.execute(f'DETACH "{alias}"')
             except Exception:
@@ -294,9 +378,15 @@ class WorkspaceConnection(Connection):
             query_timeout=settings.pgwire_query_timeout_seconds,
         )
 
-        # Attach project tables
-        attached = session.attach_project_tables()
-        log.info("session_created", attached_tables=attached, client_ip=client_ip)
+        # Index project tables (ATTACHed lazily on first reference)
+        available = session.index_project_tables()
+        view_sources = session.attach_workspace_sources()
+        log.info(
+            "session_created",
+            available_tables=available,
+            view_sources=view_sources,
+            client_ip=client_ip,
+        )
 
         # Register session in metadata
         try:
@@ -368,7 +458,7 @@ class WorkspacePGHandler(BuenaVistaHandler):
     1. Look up workspace by username in metadata_db
     2. Verify password (SHA256 hash comparison)
     3. Create workspace-specific DuckDB session
-    4. ATTACH project tables
+    4. Index project tables (ATTACHed on demand per query)
     """
 
     def send_auth_request(self, ctx: BVContext):
@@ -17,9 +17,6 @@ from src.database import metadata_db, project_db_manager
 from src.dependencies import require_project_access
 from src.metrics import (
     BRANCHES_TOTAL,
-    BRANCH_COW_OPERATIONS,
-    BRANCH_COW_DURATION,
-    BRANCH_COW_SIZE_BYTES,
     BRANCH_TABLES_TOTAL,
 )
 from src.models.responses import (
@@ -434,10 +431,7 @@ def ensure_table_in_branch(
     # Record in metadata
     metadata_db.mark_table_copied_to_branch(branch_id, bucket_name, table_name)
 
-    # Update metrics
-    BRANCH_COW_OPERATIONS.labels(project_id=project_id, branch_id=branch_id).inc()
-    BRANCH_COW_DURATION.observe(cow_duration)
-    BRANCH_COW_SIZE_BYTES.labels(project_id=project_id, branch_id=branch_id).inc(size_bytes)
+    # Update metrics (CoW counters are recorded by copy_table_to_branch)
     BRANCH_TABLES_TOTAL.set(_count_total_branch_tables())
 
     logger.info(
@@ -7,14 +7,18 @@ to communicate without needing gRPC PHP extension.
 The endpoint mirrors the gRPC StorageDriverService.Execute() RPC method.
 """
 
+import itertools
 import logging
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
+
+import grpc
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from src.dependencies import require_driver_auth, get_project_id_from_driver_key, verify_admin_key
 
-from google.protobuf import json_format
+from google.protobuf import json_format, wrappers_pb2
 from google.protobuf.any_pb2 import Any as AnyProto
 
 import sys
@@ -22,7 +26,8 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "generated"))
 
 from proto import common_pb2, backend_pb2, project_pb2, bucket_pb2, table_pb2, info_pb2, credentials_pb2, workspace_pb2, executeQuery_pb2
-from src.database import metadata_db, project_db_manager
+from src.database import ARROW_STREAM_MEDIA_TYPE, duckdb_executor, metadata_db, project_db_manager
+from src.grpc.handlers.query import ARROW_RESULT_FEATURE
 from src.grpc.servicer import StorageDriverServicer
 
 
@@ -335,6 +340,63 @@ def _unpack_response(type_name: str, any_proto: AnyProto):
     return message
 
 
+def _authorize_command(request: DriverExecuteRequest, api_key: str) -> str:
+    """Check the API key may run the request's command; returns the command type name."""
+    # Get command type for authorization check
+    command_type = request.command.get("type", request.command.get("@type", ""))
+    type_name = command_type.split(".")[-1]
+
+    # Commands that require admin key (not project key)
+    admin_only_commands = {
+        "InitBackendCommand",
+        "RemoveBackendCommand",
+        "CreateProjectCommand",
+        "DropProjectCommand",
+    }
+
+    # Check authorization based on command type
+    if type_name in admin_only_commands:
+        # Admin-only commands require admin key
+        if not verify_admin_key(api_key):
+            raise HTTPException(
+                status_code=403,
+                detail=f"Command {type_name} requires admin API key"
+            )
+    else:
+        # Project commands - verify project_id matches the API key
+        request_project_id = request.credentials.get("project_id") if request.credentials else None
+        key_project_id = get_project_id_from_driver_key(api_key)
+
+        if key_project_id is not None:
+            # Using project key - must match the project_id in credentials
+            if request_project_id != key_project_id:
+                logger.warning(
+                    "auth_project_mismatch_in_driver",
+                    key_project=key_project_id,
+                    request_project=request_project_id,
+                )
+                raise HTTPException(
+                    status_code=403,
+                    detail=f"API key is for project {key_project_id}, but request is for project {request_project_id}"
+                )
+        # else: using admin key - allowed for any project
+
+    return type_name
+
+
+def _raise_for_grpc_status(context: MockGrpcContext) -> None:
+    """Map a gRPC status code set by the servicer to an HTTPException."""
+    if context.get_code() is not None:
+        if context.get_code() == grpc.StatusCode.UNIMPLEMENTED:
+            raise HTTPException(status_code=501, detail=context.get_details())
+        elif context.get_code() == grpc.StatusCode.INVALID_ARGUMENT:
+            raise HTTPException(status_code=400, detail=context.get_details())
+        elif context.get_code() == grpc.StatusCode.NOT_FOUND:
+            raise HTTPException(status_code=404, detail=context.get_details())
+        else:
+            raise HTTPException(status_code=500, detail=context.get_details())
+
+
 @router.post("/execute", response_model=DriverExecuteResponse)
 async def execute_driver_command(
     request: DriverExecuteRequest,
@@ -377,44 +439,7 @@ async def execute_driver_command(
     More commands will be added as handlers are implemented.
     """
     try:
-        # Get command type for authorization check
-        command_type = request.command.get("type", request.command.get("@type", ""))
-        type_name = command_type.split(".")[-1]
-
-        # Commands that require admin key (not project key)
-        admin_only_commands = {
-            "InitBackendCommand",
-            "RemoveBackendCommand",
-            "CreateProjectCommand",
-            "DropProjectCommand",
-        }
-
-        # Check authorization based on command type
-        if type_name in admin_only_commands:
-            # Admin-only commands require admin key
-            if not verify_admin_key(api_key):
-                raise HTTPException(
-                    status_code=403,
-                    detail=f"Command {type_name} requires admin API key"
-                )
-        else:
-            # Project commands - verify project_id matches the API key
-            request_project_id = request.credentials.get("project_id") if request.credentials else None
-            key_project_id = get_project_id_from_driver_key(api_key)
-
-            if key_project_id is not None:
-                # Using project key - must match the project_id in credentials
-                if request_project_id != key_project_id:
-                    logger.warning(
-                        "auth_project_mismatch_in_driver",
-                        key_project=key_project_id,
-                        request_project=request_project_id,
-                    )
-                    raise HTTPException(
-                        status_code=403,
-                        detail=f"API key is for project {key_project_id}, but request is for project {request_project_id}"
-                    )
-            # else: using admin key - allowed for any project
+        _authorize_command(request, api_key)
 
         # Convert JSON to protobuf
         driver_request = json_to_driver_request(request)
@@ -426,16 +451,7 @@ async def execute_driver_command(
         response = servicer.Execute(driver_request, context)
 
         # Check for gRPC errors
-        if context.get_code() is not None:
-            import grpc
-            if context.get_code() == grpc.StatusCode.UNIMPLEMENTED:
-                raise HTTPException(status_code=501, detail=context.get_details())
-            elif context.get_code() == grpc.StatusCode.INVALID_ARGUMENT:
-                raise HTTPException(status_code=400, detail=context.get_details())
-            elif context.get_code() == grpc.StatusCode.NOT_FOUND:
-                raise HTTPException(status_code=404, detail=context.get_details())
-            else:
-                raise HTTPException(status_code=500, detail=context.get_details())
+        _raise_for_grpc_status(context)
 
         # Convert response to JSON
         return driver_response_to_json(response)
@@ -449,6 +465,98 @@ async def execute_driver_command(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+@router.post(
+    "/execute/stream",
+    responses={
+        200: {"content": {NDJSON_MEDIA_TYPE: {}, ARROW_STREAM_MEDIA_TYPE: {}}},
+    },
+)
+async def execute_driver_command_stream(
+    request: DriverExecuteRequest,
+    api_key: str = Depends(require_driver_auth),
+) -> StreamingResponse:
+    """Execute an ExecuteQueryCommand and stream the result in batches.
+
+    HTTP bridge for the gRPC ExecuteQueryStream RPC. The response is
+    newline-delimited JSON, one DriverExecuteResponse per result batch;
+    the last line holds the final status and log messages.
+
+    With `"features": ["query-result-arrow-ipc"]` the response is a
+    single Arrow IPC stream (`application/vnd.apache.arrow.stream`)
+    instead.
+
+    Errors raised before the first batch (bad command, unknown project,
+    invalid SQL) return the usual HTTP error codes. Errors after that
+    end the NDJSON stream with an error line, or abort the Arrow stream.
+    """
+    type_name = _authorize_command(request, api_key)
+    if type_name != "ExecuteQueryCommand":
+        raise HTTPException(
+            status_code=400,
+            detail=f"Command {type_name} does not support streaming"
+        )
+
+    try:
+        driver_request = json_to_driver_request(request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    context = MockGrpcContext()
+    responses = get_servicer().ExecuteQueryStream(driver_request, context)
+
+    # Pull the first message eagerly so setup errors map to HTTP status codes
+    first = await duckdb_executor.run("data", next, responses, None)
+    _raise_for_grpc_status(context)
+
+    if ARROW_RESULT_FEATURE in driver_request.features:
+        return StreamingResponse(
+            _arrow_chunks(first, responses, context),
+            media_type=ARROW_STREAM_MEDIA_TYPE,
+        )
+
+    return StreamingResponse(
+        _ndjson_lines(first, responses),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
+
+
+def _ndjson_lines(
+    first: Optional[common_pb2.DriverResponse],
+    responses: Iterator[common_pb2.DriverResponse],
+) -> Iterator[bytes]:
+    """Render streamed DriverResponses as NDJSON lines."""
+    try:
+        if first is not None:
+            yield driver_response_to_json(first).model_dump_json().encode() + b"\n"
+        for response in responses:
+            yield driver_response_to_json(response).model_dump_json().encode() + b"\n"
+    finally:
+        responses.close()
+
+
+def _arrow_chunks(
+    first: Optional[common_pb2.DriverResponse],
+    responses: Iterator[common_pb2.DriverResponse],
+    context: MockGrpcContext,
+) -> Iterator[bytes]:
+    """Concatenate the BytesValue payloads of streamed DriverResponses."""
+    try:
+        pending = [first] if first is not None else []
+        for response in itertools.chain(pending, responses):
+            if context.get_code() is not None:
+                # Aborting leaves the client with a truncated IPC stream
+                raise RuntimeError(f"Query stream failed: {context.get_details()}")
+            if response.commandResponse.Is(wrappers_pb2.BytesValue.DESCRIPTOR):
+                payload = wrappers_pb2.BytesValue()
+                response.commandResponse.Unpack(payload)
+                yield payload.value
+    finally:
+        responses.close()
+
+
 @router.get("/commands")
 async def list_supported_commands() -> dict:
     """List all supported driver commands.
@@ -775,7 +883,7 @@ async def list_supported_commands() -> dict:
             # Query command (Phase 12g)
             {
                 "type": "ExecuteQueryCommand",
-                "description": "Execute a SQL query on project database",
+                "description": "Execute a SQL query on project database (also streamable via /execute/stream)",
                 "example": {
                     "type": "ExecuteQueryCommand",
                     "query": "SELECT * FROM my_table LIMIT 10",
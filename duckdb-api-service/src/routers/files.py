@@ -2,13 +2,14 @@
 
 This module implements a 3-stage file upload workflow:
 1. PREPARE: Get upload key and URL
-2. UPLOAD: Upload file to staging area
+2. UPLOAD: Upload file to staging area (one request, or resumable chunks)
 3. REGISTER: Finalize file and move from staging to permanent storage
 
 Files can then be used for import operations or downloaded for export.
 """
 
 import hashlib
+import os
 import shutil
 import time
 import uuid
@@ -17,21 +18,25 @@ from pathlib import Path
 from typing import Any
 
 import structlog
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi import APIRouter, Depends, File, Header, HTTPException, Query, Request, UploadFile, status
 from fastapi.responses import FileResponse
 
 from src.config import settings
-from src.database import metadata_db
+from src.database import duckdb_executor, metadata_db, object_index, storage_usage
 from src.dependencies import require_project_access
+from src.file_hashing import hash_file
+from src.file_responses import ConditionalFileResponse
 from src import metrics
 from src.models.responses import (
     ErrorResponse,
+    FileChunkResponse,
     FileListResponse,
     FilePrepareRequest,
     FilePrepareResponse,
     FileRegisterRequest,
     FileResponse as FileInfoResponse,
     FileUploadResponse,
+    FileUploadStatusResponse,
 )
 
 logger = structlog.get_logger()
@@ -67,13 +72,30 @@ def _get_permanent_dir(project_id: str) -> Path:
     return _get_project_files_dir(project_id) / now.strftime("%Y/%m/%d")
 
 
-def _compute_sha256(file_path: Path) -> str:
-    """Compute SHA256 hash of a file."""
-    sha256_hash = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256_hash.update(chunk)
-    return sha256_hash.hexdigest()
+def _chunk_coverage(
+    chunks: list[dict[str, Any]], expected_size: int | None
+) -> tuple[int, list[tuple[int, int]]]:
+    """
+    Find the byte ranges of a chunked upload that are still missing.
+
+    Args:
+        chunks: Received chunks ordered by offset
+        expected_size: Size declared at prepare; otherwise the end of the last chunk
+
+    Returns:
+        (file size, [(start, end), ...] missing byte ranges)
+    """
+    missing = []
+    position = 0
+    for chunk in chunks:
+        if chunk["offset"] > position:
+            missing.append((position, chunk["offset"]))
+        position = max(position, chunk["offset"] + chunk["size_bytes"])
+
+    size_bytes = expected_size if expected_size is not None else position
+    if position < size_bytes:
+        missing.append((position, size_bytes))
+    return size_bytes, missing
 
 
 def _validate_project_exists(project_id: str) -> dict[str, Any]:
@@ -91,8 +113,68 @@ def _validate_project_exists(project_id: str) -> dict[str, Any]:
     return project
 
 
-# In-memory upload session storage (for MVP - could use Redis in production)
-_upload_sessions: dict[str, dict[str, Any]] = {}
+def _get_upload_session(project_id: str, upload_key: str) -> dict[str, Any]:
+    """Load an upload session and check it belongs to the project and hasn't expired."""
+    session = metadata_db.get_upload_session(upload_key)
+    if not session:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "error": "upload_session_not_found",
+                "message": "Upload session not found or expired",
+                "details": {"upload_key": upload_key},
+            },
+        )
+
+    # Validate session belongs to project
+    if session["project_id"] != project_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={
+                "error": "upload_session_mismatch",
+                "message": "Upload session does not belong to this project",
+                "details": {"upload_key": upload_key, "project_id": project_id},
+            },
+        )
+
+    # Check if session expired
+    if datetime.now(timezone.utc) > datetime.fromisoformat(session["expires_at"]):
+        _discard_upload_session(session)
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail={
+                "error": "upload_session_expired",
+                "message": "Upload session has expired",
+                "details": {"upload_key": upload_key},
+            },
+        )
+
+    return session
+
+
+def _discard_upload_session(session: dict[str, Any]) -> None:
+    """Delete an upload session together with its staging file."""
+    staging_path = settings.files_dir / session["staging_path"]
+    staging_path.unlink(missing_ok=True)
+    object_index.discard(staging_path)
+    metadata_db.delete_upload_session(session["upload_key"])
+
+
+def cleanup_expired_upload_sessions() -> int:
+    """
+    Remove expired upload sessions and their staging files.
+
+    Called periodically from the application lifespan.
+
+    Returns:
+        Number of removed sessions
+    """
+    expired = metadata_db.cleanup_expired_upload_sessions()
+    for session in expired:
+        staging_path = settings.files_dir / session["staging_path"]
+        staging_path.unlink(missing_ok=True)
+        object_index.discard(staging_path)
+    return len(expired)
 
 
 @router.post(
@@ -116,10 +198,12 @@ async def prepare_upload(
 
     This is stage 1 of the 3-stage upload workflow:
     1. PREPARE (this endpoint) - get upload credentials
-    2. UPLOAD - upload file to staging
+    2. UPLOAD - upload file to staging, in one request or as chunks
     3. REGISTER - finalize and move to permanent storage
 
-    The upload session expires after 24 hours if not completed.
+    The session is stored in the metadata DB, so an interrupted chunked
+    upload can be resumed (also after a restart). It expires after 24 hours
+    if not completed.
     """
     request_id = _get_request_id()
 
@@ -152,16 +236,20 @@ async def prepare_upload(
     upload_key = str(uuid.uuid4())
     expires_at = datetime.now(timezone.utc) + timedelta(hours=STAGING_TTL_HOURS)
 
+    # Staging file with upload_key in the name; chunks are written into it in place
+    staging_path = _get_staging_dir(project_id) / f"{upload_key}_{request.filename}"
+
     # Store upload session
-    _upload_sessions[upload_key] = {
-        "project_id": project_id,
-        "filename": request.filename,
-        "content_type": request.content_type,
-        "expected_size": request.size_bytes,
-        "tags": request.tags,
-        "created_at": datetime.now(timezone.utc),
-        "expires_at": expires_at,
-    }
+    metadata_db.create_upload_session(
+        upload_key=upload_key,
+        project_id=project_id,
+        filename=request.filename,
+        staging_path=str(staging_path.relative_to(settings.files_dir)),
+        expires_at=expires_at,
+        content_type=request.content_type,
+        expected_size=request.size_bytes,
+        tags=request.tags,
+    )
 
     # Build upload URL
     upload_url = f"/projects/{project_id}/files/upload/{upload_key}"
@@ -205,6 +293,9 @@ async def upload_file(
     This is stage 2 of the 3-stage upload workflow.
     The file is saved to staging and a checksum is computed.
     Call the register endpoint to finalize the upload.
+
+    Large files should use the chunk endpoint instead, which can be
+    resumed and parallelized.
     """
     start_time = time.time()
     request_id = _get_request_id()
@@ -218,57 +309,22 @@ async def upload_file(
     )
 
     # Validate upload session
-    session = _upload_sessions.get(upload_key)
-    if not session:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={
-                "error": "upload_session_not_found",
-                "message": "Upload session not found or expired",
-                "details": {"upload_key": upload_key},
-            },
-        )
+    session = _get_upload_session(project_id, upload_key)
 
-    # Validate session belongs to project
-    if session["project_id"] != project_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail={
-                "error": "upload_session_mismatch",
-                "message": "Upload session does not belong to this project",
-                "details": {"upload_key": upload_key, "project_id": project_id},
-            },
-        )
-
-    # Check if session expired
-    if datetime.now(timezone.utc) > session["expires_at"]:
-        del _upload_sessions[upload_key]
-        raise HTTPException(
-            status_code=status.HTTP_410_GONE,
-            detail={
-                "error": "upload_session_expired",
-                "message": "Upload session has expired",
-                "details": {"upload_key": upload_key},
-            },
-        )
-
-    # Create staging directory
-    staging_dir = _get_staging_dir(project_id)
-    staging_dir.mkdir(parents=True, exist_ok=True)
-
-    # Save file to staging with upload_key as filename
-    staging_filename = f"{upload_key}_{session['filename']}"
-    staging_path = staging_dir / staging_filename
+    staging_path = settings.files_dir / session["staging_path"]
+    staging_path.parent.mkdir(parents=True, exist_ok=True)
 
     try:
         # Stream file to disk
         size_bytes = 0
         sha256_hash = hashlib.sha256()
+        md5_hash = hashlib.md5()
 
         with open(staging_path, "wb") as f:
             while chunk := await file.read(8192):
                 size_bytes += len(chunk)
                 sha256_hash.update(chunk)
+                md5_hash.update(chunk)
                 f.write(chunk)
 
                 # Check size limit
@@ -286,10 +342,13 @@ async def upload_file(
         checksum_sha256 = sha256_hash.hexdigest()
 
         # Update session with actual file info
-        session["staging_path"] = str(staging_path)
-        session["size_bytes"] = size_bytes
-        session["checksum_sha256"] = checksum_sha256
-        session["uploaded_at"] = datetime.now(timezone.utc)
+        metadata_db.complete_upload_session(
+            upload_key,
+            size_bytes=size_bytes,
+            checksum_sha256=checksum_sha256,
+            checksum_md5=md5_hash.hexdigest(),
+        )
+        object_index.add(staging_path)
 
         duration_ms = int((time.time() - start_time) * 1000)
 
@@ -309,7 +368,7 @@ async def upload_file(
 
         return FileUploadResponse(
             upload_key=upload_key,
-            staging_path=f"staging/{staging_filename}",
+            staging_path=str(staging_path.relative_to(_get_project_files_dir(project_id))),
             size_bytes=size_bytes,
             checksum_sha256=checksum_sha256,
         )
@@ -337,6 +396,204 @@ async def upload_file(
         )
 
 
+@router.put(
+    "/projects/{project_id}/files/upload/{upload_key}/chunks/{offset}",
+    response_model=FileChunkResponse,
+    status_code=status.HTTP_200_OK,
+    responses={
+        400: {"model": ErrorResponse},
+        404: {"model": ErrorResponse},
+        409: {"model": ErrorResponse},
+        410: {"model": ErrorResponse},
+        411: {"model": ErrorResponse},
+        413: {"model": ErrorResponse},
+    },
+    summary="Upload file chunk",
+    description=(
+        "Write one chunk of a resumable upload at a byte offset. The request body "
+        "is the raw chunk; chunks may be sent in any order and in parallel, and a "
+        "chunk re-sent at the same offset replaces the previous attempt."
+    ),
+    dependencies=[Depends(require_project_access)],
+)
+async def upload_chunk(
+    project_id: str,
+    upload_key: str,
+    offset: int,
+    request: Request,
+    x_checksum_sha256: str | None = Header(
+        default=None, description="Hex SHA256 of the chunk; verified before the chunk is accepted"
+    ),
+) -> FileChunkResponse:
+    """
+    Upload one chunk into the session's staging file (stage 2, resumable).
+
+    The chunk is written at its offset directly into the staging file, so
+    register only has to verify that the chunks cover the whole file. The
+    chunk is recorded only after its checksum matched; a failed or
+    interrupted chunk is simply sent again. A re-sent chunk is un-recorded
+    before its range is overwritten, so a failed re-send leaves the range
+    missing instead of marked complete over bad bytes.
+    """
+    start_time = time.time()
+    request_id = _get_request_id()
+
+    session = _get_upload_session(project_id, upload_key)
+
+    if session["uploaded_at"] is not None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={
+                "error": "upload_already_complete",
+                "message": "The file was already uploaded in one request",
+                "details": {"upload_key": upload_key},
+            },
+        )
+
+    # The chunk's extent must be known before anything is written
+    content_length = request.headers.get("content-length")
+    if content_length is None:
+        raise HTTPException(
+            status_code=status.HTTP_411_LENGTH_REQUIRED,
+            detail={
+                "error": "content_length_required",
+                "message": "Chunk uploads require a Content-Length header",
+                "details": {"upload_key": upload_key},
+            },
+        )
+    size_bytes = int(content_length)
+    end = offset + size_bytes
+
+    if offset < 0 or size_bytes == 0 or (
+        session["expected_size"] is not None and end > session["expected_size"]
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error": "chunk_out_of_range",
+                "message": "Chunk is empty or lies outside the declared file size",
+                "details": {
+                    "offset": offset,
+                    "size_bytes": size_bytes,
+                    "expected_size": session["expected_size"],
+                },
+            },
+        )
+    if end > MAX_FILE_SIZE_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail={
+                "error": "file_too_large",
+                "message": f"File exceeds maximum size of {MAX_FILE_SIZE_BYTES} bytes",
+                "details": {"max_size_bytes": MAX_FILE_SIZE_BYTES},
+            },
+        )
+
+    overlapping = metadata_db.get_overlapping_upload_chunk(upload_key, offset, size_bytes)
+    if overlapping:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={
+                "error": "chunk_overlap",
+                "message": "Chunk overlaps a chunk already uploaded at another offset",
+                "details": {"offset": offset, "size_bytes": size_bytes, "existing": overlapping},
+            },
+        )
+
+    staging_path = settings.files_dir / session["staging_path"]
+    staging_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # The range is about to be overwritten; it is complete again only on success
+    metadata_db.delete_upload_chunk(upload_key, offset)
+
+    # Write in place at the offset (no per-chunk files to concatenate later)
+    sha256_hash = hashlib.sha256()
+    received = 0
+    fd = os.open(staging_path, os.O_WRONLY | os.O_CREAT, 0o644)
+    try:
+        async for data in request.stream():
+            if received + len(data) > size_bytes:
+                break
+            os.pwrite(fd, data, offset + received)
+            sha256_hash.update(data)
+            received += len(data)
+    finally:
+        os.close(fd)
+
+    checksum_sha256 = sha256_hash.hexdigest()
+    if received != size_bytes:
+        metrics.FILES_UPLOAD_CHUNKS_TOTAL.labels(status="error").inc()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error": "incomplete_chunk",
+                "message": "Chunk body does not match Content-Length",
+                "details": {"expected_bytes": size_bytes, "received_bytes": received},
+            },
+        )
+    if x_checksum_sha256 is not None and x_checksum_sha256.lower() != checksum_sha256:
+        metrics.FILES_UPLOAD_CHUNKS_TOTAL.labels(status="bad_checksum").inc()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error": "bad_checksum",
+                "message": "Chunk SHA256 does not match X-Checksum-Sha256",
+                "details": {"offset": offset, "checksum_sha256": checksum_sha256},
+            },
+        )
+
+    metadata_db.store_upload_chunk(upload_key, offset, size_bytes, checksum_sha256)
+    object_index.add(staging_path)
+
+    logger.info(
+        "upload_chunk_complete",
+        project_id=project_id,
+        upload_key=upload_key,
+        offset=offset,
+        size_bytes=size_bytes,
+        duration_ms=int((time.time() - start_time) * 1000),
+        request_id=request_id,
+    )
+
+    metrics.FILES_UPLOAD_CHUNKS_TOTAL.labels(status="success").inc()
+    metrics.FILES_UPLOAD_BYTES_TOTAL.inc(size_bytes)
+
+    return FileChunkResponse(offset=offset, size_bytes=size_bytes, checksum_sha256=checksum_sha256)
+
+
+@router.get(
+    "/projects/{project_id}/files/upload/{upload_key}",
+    response_model=FileUploadStatusResponse,
+    responses={
+        404: {"model": ErrorResponse},
+        410: {"model": ErrorResponse},
+    },
+    summary="Get upload status",
+    description="Show the chunks received so far, to resume an interrupted upload.",
+    dependencies=[Depends(require_project_access)],
+)
+async def get_upload_status(
+    project_id: str,
+    upload_key: str,
+) -> FileUploadStatusResponse:
+    """Get the state of an upload session."""
+    session = _get_upload_session(project_id, upload_key)
+    chunks = metadata_db.list_upload_chunks(upload_key)
+    complete = session["uploaded_at"] is not None
+
+    return FileUploadStatusResponse(
+        upload_key=upload_key,
+        filename=session["filename"],
+        expected_size=session["expected_size"],
+        uploaded_bytes=(
+            session["size_bytes"] if complete else sum(c["size_bytes"] for c in chunks)
+        ),
+        complete=complete,
+        expires_at=session["expires_at"],
+        chunks=[FileChunkResponse(**chunk) for chunk in chunks],
+    )
+
+
 @router.post(
     "/projects/{project_id}/files",
     response_model=FileInfoResponse,
@@ -358,7 +615,9 @@ async def register_file(
     Register an uploaded file (stage 3 of upload workflow).
 
     This moves the file from staging to permanent storage and
-    creates a database record for it.
+    creates a database record for it. For chunked uploads the chunks must
+    cover the whole file; they were written in place, so the staging file
+    is only hashed and renamed, never copied.
     """
     start_time = time.time()
     request_id = _get_request_id()
@@ -371,31 +630,39 @@ async def register_file(
     )
 
     # Validate upload session
-    session = _upload_sessions.get(request.upload_key)
-    if not session:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={
-                "error": "upload_session_not_found",
-                "message": "Upload session not found or expired",
-                "details": {"upload_key": request.upload_key},
-            },
-        )
+    session = _get_upload_session(project_id, request.upload_key)
+    staging_path = settings.files_dir / session["staging_path"]
+
+    chunks = None
+    if session["uploaded_at"] is None:
+        # Check if file was actually uploaded
+        chunks = metadata_db.list_upload_chunks(request.upload_key)
+        if not chunks:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "error": "file_not_uploaded",
+                    "message": "File has not been uploaded yet",
+                    "details": {"upload_key": request.upload_key},
+                },
+            )
 
-    # Check if file was actually uploaded
-    if "staging_path" not in session:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "error": "file_not_uploaded",
-                "message": "File has not been uploaded yet",
-                "details": {"upload_key": request.upload_key},
-            },
-        )
+        size_bytes, missing = _chunk_coverage(chunks, session["expected_size"])
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "error": "upload_incomplete",
+                    "message": "Some byte ranges of the file have not been uploaded",
+                    "details": {
+                        "upload_key": request.upload_key,
+                        "missing_ranges": [list(r) for r in missing[:100]],
+                    },
+                },
+            )
 
-    staging_path = Path(session["staging_path"])
     if not staging_path.exists():
-        del _upload_sessions[request.upload_key]
+        _discard_upload_session(session)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={
@@ -405,6 +672,25 @@ async def register_file(
             },
         )
 
+    if chunks is not None:
+        # Drop bytes past the end left by rejected chunks, then hash in one read
+        os.truncate(staging_path, size_bytes)
+        checksum_sha256, checksum_md5 = await duckdb_executor.run(
+            "data", hash_file, staging_path, "sha256", "md5"
+        )
+        metadata_db.complete_upload_session(
+            request.upload_key,
+            size_bytes=size_bytes,
+            checksum_sha256=checksum_sha256,
+            checksum_md5=checksum_md5,
+        )
+        session = {
+            **session,
+            "size_bytes": size_bytes,
+            "checksum_sha256": checksum_sha256,
+            "checksum_md5": checksum_md5,
+        }
+
     # Determine final filename and path
     final_name = request.name or session["filename"]
     permanent_dir = _get_permanent_dir(project_id)
@@ -439,10 +725,17 @@ async def register_file(
             is_staged=False,
             expires_at=None,  # Permanent file - no expiration
             tags=tags if tags else None,
+            checksum_md5=session["checksum_md5"],
         )
 
+        # The file is also an S3 object; cache its ETag for HEAD/GET
+        metadata_db.store_file_etag(permanent_path, session["checksum_md5"])
+        object_index.discard(staging_path)
+        object_index.add(permanent_path)
+        storage_usage.adjust(file_bytes=session["size_bytes"])
+
         # Clean up session
-        del _upload_sessions[request.upload_key]
+        metadata_db.delete_upload_session(request.upload_key)
 
         duration_ms = int((time.time() - start_time) * 1000)
 
@@ -669,8 +962,11 @@ async def download_file(
     metrics.FILES_DOWNLOADS_TOTAL.labels(status="success").inc()
     metrics.FILES_DOWNLOAD_BYTES_TOTAL.inc(file_record["size_bytes"])
 
-    return FileResponse(
-        path=str(file_path),
+    # Range, If-Range and conditional headers are answered by the response;
+    # records without a stored checksum fall back to an mtime/size ETag
+    return ConditionalFileResponse(
+        path=file_path,
+        etag=file_record.get("checksum_md5"),
         filename=file_record["name"],
         media_type=file_record.get("content_type") or "application/octet-stream",
     )
@@ -719,10 +1015,14 @@ async def delete_file(
     # Delete physical file
     file_path = settings.files_dir / file_record["path"]
     if file_path.exists():
+        size_bytes = file_path.stat().st_size
         file_path.unlink()
+        storage_usage.adjust(file_bytes=-size_bytes)
 
     # Delete database record
     metadata_db.delete_file(file_id)
+    metadata_db.delete_file_etag(file_path)
+    object_index.discard(file_path)
 
     duration_ms = int((time.time() - start_time) * 1000)
 
@@ -4,9 +4,6 @@ Exposes /metrics endpoint for Prometheus scraping.
 Also provides storage metrics collection.
 """
 
-import os
-from pathlib import Path
-
 import duckdb
 import structlog
 from fastapi import APIRouter
@@ -17,8 +14,6 @@ from src.config import settings
 from src.database import metadata_db
 from src.metrics import (
     PROJECTS_TOTAL,
-    BUCKETS_TOTAL,
-    TABLES_TOTAL,
     STORAGE_SIZE_BYTES,
     IDEMPOTENCY_CACHE_SIZE,
     TABLE_LOCKS_ACTIVE,
@@ -30,52 +25,25 @@ logger = structlog.get_logger()
 router = APIRouter(tags=["metrics"])
 
 
-def get_directory_size(path: Path) -> int:
-    """Calculate total size of all files in a directory recursively."""
-    total = 0
-    if path.exists():
-        for item in path.rglob("*"):
-            if item.is_file():
-                try:
-                    total += item.stat().st_size
-                except OSError:
-                    pass
-    return total
-
-
 def collect_storage_metrics() -> None:
-    """Collect current storage metrics from database and filesystem."""
+    """
+    Collect metrics that are cheap to read at scrape time.
+
+    Bucket/table counts and storage sizes are not collected here: write
+    paths keep those gauges current (see storage_usage) and a background
+    task rescans the filesystem periodically, so a scrape does no file I/O
+    beyond one stat() of the metadata DB.
+    """
     try:
         # Count projects
         project_count = metadata_db.count_projects()
         PROJECTS_TOTAL.set(project_count)
 
-        # Count buckets
-        bucket_count = metadata_db.count_buckets()
-        BUCKETS_TOTAL.set(bucket_count)
-
-        # Count tables
-        table_count = metadata_db.count_tables()
-        TABLES_TOTAL.set(table_count)
-
         # Metadata DB size
         metadata_path = settings.metadata_db_path
         if metadata_path.exists():
             STORAGE_SIZE_BYTES.labels(type="metadata").set(metadata_path.stat().st_size)
 
-        # Tables storage size
-        duckdb_path = settings.duckdb_dir
-        STORAGE_SIZE_BYTES.labels(type="tables").set(get_directory_size(duckdb_path))
-
-        # Staging storage size
-        staging_path = settings.duckdb_dir / "_staging"
-        STORAGE_SIZE_BYTES.labels(type="staging").set(get_directory_size(staging_path))
-
-        # Files storage size (if exists)
-        files_path = settings.files_dir
-        if files_path.exists():
-            STORAGE_SIZE_BYTES.labels(type="files").set(get_directory_size(files_path))
-
         # Idempotency cache size
         cache_size = metadata_db.count_idempotency_keys()
         IDEMPOTENCY_CACHE_SIZE.set(cache_size)
@@ -13,8 +13,17 @@ Supported operations:
 - DeleteObject (DELETE /{bucket}/{key})
 - HeadObject (HEAD /{bucket}/{key})
 - ListObjectsV2 (GET /{bucket}?list-type=2)
+- CreateMultipartUpload (POST /{bucket}/{key}?uploads)
+- UploadPart (PUT /{bucket}/{key}?partNumber={n}&uploadId={id})
+- CompleteMultipartUpload (POST /{bucket}/{key}?uploadId={id})
+- AbortMultipartUpload (DELETE /{bucket}/{key}?uploadId={id})
 - Presign (POST /{bucket}/presign) - Generate pre-signed URLs
 
+Uploads are streamed to a temp file (MD5 computed on the fly) and moved
+into place, so object size is not bounded by worker memory. Multipart
+parts are kept under files_dir/.s3-uploads until completion, then
+concatenated in the kernel (copy_file_range) where supported.
+
 Authentication (in order of precedence):
 1. AWS Signature V4 - Authorization: AWS4-HMAC-SHA256 ...
 2. Pre-signed URL with signature query parameter
@@ -23,10 +32,14 @@ Authentication (in order of precedence):
 """
 
 import base64
+import binascii
 import hashlib
 import hmac
+import os
 import re
+import json
 import secrets
+import shutil
 import time
 import urllib.parse
 from datetime import datetime, timedelta, timezone
@@ -42,8 +55,10 @@ from pydantic import BaseModel, Field
 
 from src import metrics
 from src.config import settings
-from src.database import metadata_db
+from src.database import duckdb_executor, metadata_db, object_index
 from src.dependencies import require_s3_bucket_access, get_api_key_flexible, verify_admin_key, verify_project_key
+from src.file_hashing import file_md5
+from src.file_responses import ConditionalFileResponse
 
 logger = structlog.get_logger()
 
@@ -75,18 +90,22 @@ def _extract_project_id(bucket: str) -> str:
     return bucket
 
 
-def _compute_md5(content: bytes) -> str:
-    """Compute MD5 hash of content (for ETag)."""
-    return hashlib.md5(content).hexdigest()
+def _get_object_etag(file_path: Path) -> str:
+    """Return the object's ETag, hashing the file only if no valid one is cached.
 
+    ETags are stored when objects are written (PutObject, file register,
+    exports) and validated by mtime/size, so HEAD and GET don't read the
+    file. Files written by other means are hashed once and cached.
+    """
+    etag = metadata_db.get_file_etag(file_path)
+    if etag is not None:
+        metrics.S3_ETAG_LOOKUPS.labels(result="cached").inc()
+        return etag
 
-def _compute_file_md5(file_path: Path) -> str:
-    """Compute MD5 hash of a file."""
-    md5_hash = hashlib.md5()
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            md5_hash.update(chunk)
-    return md5_hash.hexdigest()
+    etag = file_md5(file_path)
+    metadata_db.store_file_etag(file_path, etag)
+    metrics.S3_ETAG_LOOKUPS.labels(result="computed").inc()
+    return etag
 
 
 def _format_s3_timestamp(dt: datetime) -> str:
@@ -94,12 +113,6 @@ def _format_s3_timestamp(dt: datetime) -> str:
     return dt.strftime("%Y-%m-%dT%H:%M:%S.000Z")
 
 
-def _format_http_date(timestamp: float) -> str:
-    """Format timestamp as HTTP-date (RFC 7231)."""
-    dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
-    return dt.strftime("%a, %d %b %Y %H:%M:%S GMT")
-
-
 def _build_list_objects_xml(
     bucket: str,
     objects: list[dict[str, Any]],
@@ -109,14 +122,20 @@ def _build_list_objects_xml(
     next_continuation_token: str | None = None,
     max_keys: int = 1000,
     common_prefixes: list[str] | None = None,
+    start_after: str | None = None,
+    delimiter: str = "",
 ) -> str:
     """Build S3 ListObjectsV2 XML response."""
     root = ET.Element("ListBucketResult")
 
     ET.SubElement(root, "Name").text = bucket
     ET.SubElement(root, "Prefix").text = prefix
+    if delimiter:
+        ET.SubElement(root, "Delimiter").text = delimiter
+    if start_after:
+        ET.SubElement(root, "StartAfter").text = start_after
     ET.SubElement(root, "MaxKeys").text = str(max_keys)
-    ET.SubElement(root, "KeyCount").text = str(len(objects))
+    ET.SubElement(root, "KeyCount").text = str(len(objects) + len(common_prefixes or []))
     ET.SubElement(root, "IsTruncated").text = str(is_truncated).lower()
 
     if continuation_token:
@@ -140,6 +159,94 @@ def _build_list_objects_xml(
     return ET.tostring(root, encoding="unicode", xml_declaration=True)
 
 
+def _encode_continuation_token(after: str, is_common_prefix: bool) -> str:
+    """Encode the last key (or common prefix) of a page as an opaque token."""
+    marker = ("P" if is_common_prefix else "K") + after
+    return base64.urlsafe_b64encode(marker.encode("utf-8")).decode("ascii")
+
+
+def _decode_continuation_token(token: str) -> tuple[str, bool]:
+    """Decode a continuation token into (after, is_common_prefix).
+
+    Raises:
+        ValueError: If the token was not produced by _encode_continuation_token
+    """
+    try:
+        marker = base64.urlsafe_b64decode(token.encode("ascii")).decode("utf-8")
+    except (UnicodeError, binascii.Error) as e:
+        raise ValueError("invalid continuation token") from e
+    if not marker or marker[0] not in "PK":
+        raise ValueError("invalid continuation token")
+    return marker[1:], marker[0] == "P"
+
+
+def _list_objects_page(
+    project_dir: Path,
+    prefix: str,
+    delimiter: str,
+    after: str,
+    after_common_prefix: bool,
+    max_keys: int,
+) -> tuple[list[dict[str, Any]], list[str], tuple[str, bool] | None]:
+    """Build one ListObjectsV2 page from the object index.
+
+    Only the keys on the page are stat'ed and their ETags looked up.
+
+    Returns:
+        (objects, common_prefixes, (after, is_common_prefix) to resume from
+        or None when the listing is complete)
+    """
+    if not project_dir.is_dir():
+        return [], [], None
+
+    entries, is_truncated = object_index.list_page(
+        project_dir,
+        prefix=prefix,
+        delimiter=delimiter,
+        after=after,
+        after_common_prefix=after_common_prefix,
+        max_keys=max_keys,
+    )
+
+    cached_etags = metadata_db.get_file_etags(
+        [project_dir / key for is_prefix, key in entries if not is_prefix]
+    )
+    objects: list[dict[str, Any]] = []
+    common_prefixes: list[str] = []
+
+    for is_prefix, key in entries:
+        if is_prefix:
+            common_prefixes.append(key)
+            continue
+
+        file_path = project_dir / key
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            # Removed without going through the API
+            object_index.discard(file_path)
+            continue
+
+        cached = cached_etags.get(file_path)
+        if cached and cached[1] == f"{stat.st_mtime_ns}:{stat.st_size}":
+            metrics.S3_ETAG_LOOKUPS.labels(result="cached").inc()
+            etag = cached[0]
+        else:
+            etag = _get_object_etag(file_path)
+
+        objects.append({
+            "Key": key,
+            "Size": stat.st_size,
+            "LastModified": datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
+            "ETag": etag,
+        })
+
+    next_after = None
+    if is_truncated and entries:
+        next_after = (entries[-1][1], entries[-1][0])
+    return objects, common_prefixes, next_after
+
+
 def _build_error_xml(code: str, message: str, resource: str = "", request_id: str = "") -> str:
     """Build S3 error XML response."""
     root = ET.Element("Error")
@@ -613,6 +720,210 @@ async def _check_presign_or_auth(
     )
 
 
+# ============================================================================
+# Streaming Uploads and Multipart Upload Support
+# ============================================================================
+
+# Upload state lives outside the project directories so it never shows up in
+# ListObjectsV2: files_dir/.s3-uploads/tmp (PutObject/UploadPart bodies being
+# received) and files_dir/.s3-uploads/multipart/project_{id}/{upload_id}
+S3_UPLOADS_DIR = ".s3-uploads"
+
+# Part files are named {part_number:05d}-{md5}; upload.json holds the key
+_UPLOAD_ID_RE = re.compile(r"^[0-9a-f]{32}$")
+_PART_FILE_RE = re.compile(r"^(\d{5})-([0-9a-f]{32})$")
+MAX_PART_NUMBER = 10000
+
+
+def _uploads_root() -> Path:
+    return settings.files_dir / S3_UPLOADS_DIR
+
+
+def _new_temp_path() -> Path:
+    """Return a fresh temp file path on the same filesystem as the objects."""
+    tmp_dir = _uploads_root() / "tmp"
+    tmp_dir.mkdir(parents=True, exist_ok=True)
+    return tmp_dir / f"{secrets.token_hex(16)}.tmp"
+
+
+def _get_multipart_dir(project_id: str, upload_id: str) -> Path | None:
+    """Directory of a multipart upload, or None for a malformed upload ID."""
+    if not _UPLOAD_ID_RE.match(upload_id):
+        return None
+    return _uploads_root() / "multipart" / f"project_{project_id}" / upload_id
+
+
+def _load_multipart_upload(project_id: str, upload_id: str, key: str) -> Path | None:
+    """Return the upload directory if the upload exists and is for this key."""
+    upload_dir = _get_multipart_dir(project_id, upload_id)
+    if upload_dir is None:
+        return None
+    try:
+        info = json.loads((upload_dir / "upload.json").read_text())
+    except (FileNotFoundError, ValueError):
+        return None
+    return upload_dir if info.get("key") == key else None
+
+
+def _list_uploaded_parts(upload_dir: Path) -> dict[int, tuple[Path, str]]:
+    """Return {part_number: (part_path, md5)} for the parts of an upload."""
+    parts = {}
+    for part_path in upload_dir.iterdir():
+        match = _PART_FILE_RE.match(part_path.name)
+        if match:
+            parts[int(match.group(1))] = (part_path, match.group(2))
+    return parts
+
+
+async def _stream_body_to_file(request: Request, target: Path) -> tuple[int, Any]:
+    """Write the request body to target chunk by chunk, hashing as it goes.
+
+    Returns:
+        Tuple of (size_bytes, md5 hash object). target is removed on error.
+    """
+    md5_hash = hashlib.md5()
+    size_bytes = 0
+    try:
+        with open(target, "wb") as f:
+            async for chunk in request.stream():
+                if chunk:
+                    md5_hash.update(chunk)
+                    f.write(chunk)
+                    size_bytes += len(chunk)
+    except BaseException:
+        target.unlink(missing_ok=True)
+        raise
+    return size_bytes, md5_hash
+
+
+def _content_md5_matches(request: Request, md5_hash: Any) -> bool:
+    """Check the optional Content-MD5 header against the received body."""
+    content_md5_header = request.headers.get("Content-MD5")
+    if not content_md5_header:
+        return True
+    return base64.b64encode(md5_hash.digest()).decode() == content_md5_header
+
+
+def _concat_files(sources: list[Path], target: Path) -> None:
+    """Concatenate files into target (blocking).
+
+    Uses copy_file_range so the data stays in the kernel (and is reflinked
+    on XFS/Btrfs); falls back to a buffered copy where unsupported.
+    """
+    with open(target, "wb") as dst:
+        for source in sources:
+            with open(source, "rb") as src:
+                remaining = os.fstat(src.fileno()).st_size
+                if hasattr(os, "copy_file_range"):
+                    dst.flush()
+                    try:
+                        while remaining > 0:
+                            copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                            if copied == 0:
+                                break
+                            remaining -= copied
+                    except OSError:
+                        pass
+                if remaining > 0:
+                    # copy_file_range advanced both file offsets; copy the rest
+                    shutil.copyfileobj(src, dst, 8 * 1024 * 1024)
+
+
+def _multipart_etag(part_md5s: list[str]) -> str:
+    """S3 multipart ETag: MD5 of the concatenated part digests, plus part count."""
+    digest = hashlib.md5(b"".join(bytes.fromhex(md5) for md5 in part_md5s)).hexdigest()
+    return f"{digest}-{len(part_md5s)}"
+
+
+def _build_initiate_multipart_xml(bucket: str, key: str, upload_id: str) -> str:
+    """Build S3 InitiateMultipartUploadResult XML response."""
+    root = ET.Element("InitiateMultipartUploadResult")
+    ET.SubElement(root, "Bucket").text = bucket
+    ET.SubElement(root, "Key").text = key
+    ET.SubElement(root, "UploadId").text = upload_id
+    return ET.tostring(root, encoding="unicode", xml_declaration=True)
+
+
+def _build_complete_multipart_xml(bucket: str, key: str, etag: str) -> str:
+    """Build S3 CompleteMultipartUploadResult XML response."""
+    root = ET.Element("CompleteMultipartUploadResult")
+    ET.SubElement(root, "Location").text = f"/s3/{bucket}/{key}"
+    ET.SubElement(root, "Bucket").text = bucket
+    ET.SubElement(root, "Key").text = key
+    ET.SubElement(root, "ETag").text = f'"{etag}"'
+    return ET.tostring(root, encoding="unicode", xml_declaration=True)
+
+
+def _parse_complete_multipart_xml(body: bytes) -> list[tuple[int, str]] | None:
+    """Parse CompleteMultipartUpload XML into [(part_number, etag)], None if malformed."""
+    try:
+        root = ET.fromstring(body)
+    except ET.ParseError:
+        return None
+
+    parts = []
+    for elem in root:
+        if not elem.tag.endswith("Part"):
+            continue
+        number = etag = None
+        for child in elem:
+            if child.tag.endswith("PartNumber"):
+                number = child.text
+            elif child.tag.endswith("ETag"):
+                etag = child.text
+        if not number or not etag or not number.strip().isdigit():
+            return None
+        parts.append((int(number), etag.strip().strip('"')))
+    return parts
+
+
+def _s3_error(code: str, message: str, bucket: str, key: str, status_code: int) -> Response:
+    return Response(
+        content=_build_error_xml(code, message, f"/{bucket}/{key}", _get_request_id() or ""),
+        status_code=status_code,
+        media_type="application/xml",
+    )
+
+
+def cleanup_stale_multipart_uploads(max_age_seconds: int) -> int:
+    """
+    Remove multipart uploads and temp files older than max_age_seconds.
+
+    Called periodically from the application lifespan; clients that never
+    complete or abort an upload would otherwise leak disk space.
+
+    Returns:
+        Number of removed multipart uploads
+    """
+    root = _uploads_root()
+    cutoff = time.time() - max_age_seconds
+    removed = 0
+
+    remaining = 0
+    for upload_dir in root.glob("multipart/*/*"):
+        try:
+            if upload_dir.stat().st_mtime < cutoff:
+                shutil.rmtree(upload_dir, ignore_errors=True)
+                removed += 1
+            else:
+                remaining += 1
+        except FileNotFoundError:
+            continue
+
+    # Uploads started before a restart were never counted, so re-sync the
+    # gauge from disk rather than decrementing it
+    metrics.S3_MULTIPART_UPLOADS_ACTIVE.set(remaining)
+
+    for temp_path in root.glob("tmp/*.tmp"):
+        try:
+            if temp_path.stat().st_mtime < cutoff:
+                temp_path.unlink()
+        except FileNotFoundError:
+            continue
+
+    return removed
+
+
 # ============================================================================
 # S3 API Endpoints
 # ============================================================================
@@ -682,23 +993,16 @@ async def get_object(
             media_type="application/xml",
         )
 
-    # Compute ETag
-    etag = _compute_file_md5(file_path)
+    # Cached ETag (hashes the file only if it changed outside our write paths)
+    etag = await duckdb_executor.run("metadata", _get_object_etag, file_path)
     stat = file_path.stat()
 
     # Record metrics
     metrics.S3_OPERATIONS_TOTAL.labels(operation="GetObject", status="success").inc()
     metrics.S3_BYTES_OUT_TOTAL.inc(stat.st_size)
 
-    return FileResponse(
-        path=str(file_path),
-        headers={
-            "ETag": f'"{etag}"',
-            "Content-Length": str(stat.st_size),
-            "Last-Modified": _format_http_date(stat.st_mtime),
-            "Accept-Ranges": "bytes",
-        },
-    )
+    # Range, If-Range and conditional headers are answered by the response
+    return ConditionalFileResponse(path=file_path, etag=etag, stat_result=stat)
 
 
 @router.put(
@@ -717,7 +1021,7 @@ async def put_object(
     key: str,
     request: Request,
 ) -> Response:
-    """S3 PutObject - Upload a file.
+    """S3 PutObject - Upload a file (UploadPart when uploadId is given).
 
     Supports both header-based auth and pre-signed URLs.
     """
@@ -739,36 +1043,36 @@ async def put_object(
     # Validate project exists
     _validate_project_exists(project_id)
 
+    upload_id = request.query_params.get("uploadId")
+    if upload_id is not None:
+        return await _upload_part(request, bucket, key, project_id, upload_id, start_time)
+
     # Build file path
     file_path = _get_project_files_dir(project_id) / key
 
-    # Create parent directories
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-
-    # Read request body
-    content = await request.body()
+    # Stream the body to a temp file, hashing as it goes (constant memory)
+    temp_path = _new_temp_path()
+    size_bytes, md5_hash = await _stream_body_to_file(request, temp_path)
 
     # Verify Content-MD5 if provided
-    content_md5_header = request.headers.get("Content-MD5")
-    if content_md5_header:
-        actual_md5_b64 = base64.b64encode(hashlib.md5(content).digest()).decode()
-        if actual_md5_b64 != content_md5_header:
-            return Response(
-                content=_build_error_xml(
-                    "BadDigest",
-                    "The Content-MD5 you specified did not match what we received.",
-                    f"/{bucket}/{key}",
-                    request_id or "",
-                ),
-                status_code=400,
-                media_type="application/xml",
-            )
+    if not _content_md5_matches(request, md5_hash):
+        temp_path.unlink(missing_ok=True)
+        return _s3_error(
+            "BadDigest",
+            "The Content-MD5 you specified did not match what we received.",
+            bucket,
+            key,
+            400,
+        )
 
-    # Write file
-    file_path.write_bytes(content)
+    # Move into place (atomic; readers never see a partial object)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    os.replace(temp_path, file_path)
 
-    # Compute ETag
-    etag = _compute_md5(content)
+    # Keep the ETag for HEAD/GET
+    etag = md5_hash.hexdigest()
+    metadata_db.store_file_etag(file_path, etag)
+    object_index.add(file_path)
 
     duration_ms = int((time.time() - start_time) * 1000)
 
@@ -777,7 +1081,7 @@ async def put_object(
         bucket=bucket,
         key=key,
         project_id=project_id,
-        size_bytes=len(content),
+        size_bytes=size_bytes,
         duration_ms=duration_ms,
         request_id=request_id,
     )
@@ -785,7 +1089,7 @@ async def put_object(
     # Record metrics
     metrics.S3_OPERATIONS_TOTAL.labels(operation="PutObject", status="success").inc()
     metrics.S3_OPERATION_DURATION.labels(operation="PutObject").observe(time.time() - start_time)
-    metrics.S3_BYTES_IN_TOTAL.inc(len(content))
+    metrics.S3_BYTES_IN_TOTAL.inc(size_bytes)
 
     return Response(
         status_code=200,
@@ -808,7 +1112,7 @@ async def delete_object(
     key: str,
     request: Request,
 ) -> Response:
-    """S3 DeleteObject - Delete a file.
+    """S3 DeleteObject - Delete a file (AbortMultipartUpload when uploadId is given).
 
     Supports both header-based auth and pre-signed URLs.
     Note: S3 returns 204 even if the key doesn't exist.
@@ -830,12 +1134,18 @@ async def delete_object(
     # Validate project exists
     _validate_project_exists(project_id)
 
+    upload_id = request.query_params.get("uploadId")
+    if upload_id is not None:
+        return _abort_multipart_upload(bucket, key, project_id, upload_id)
+
     # Build file path
     file_path = _get_project_files_dir(project_id) / key
 
     # Delete file if exists (S3 is idempotent - returns 204 even if not found)
     if file_path.exists() and file_path.is_file():
         file_path.unlink()
+        metadata_db.delete_file_etag(file_path)
+        object_index.discard(file_path)
 
         # Try to remove empty parent directories
         try:
@@ -899,22 +1209,19 @@ async def head_object(
     if not file_path.exists() or not file_path.is_file():
         return Response(status_code=404)
 
-    # Compute ETag and get stats
-    etag = _compute_file_md5(file_path)
+    # Cached ETag and stats (no read of the file content)
+    etag = await duckdb_executor.run("metadata", _get_object_etag, file_path)
     stat = file_path.stat()
 
     # Record metrics
     metrics.S3_OPERATIONS_TOTAL.labels(operation="HeadObject", status="success").inc()
 
-    return Response(
-        status_code=200,
-        headers={
-            "ETag": f'"{etag}"',
-            "Content-Length": str(stat.st_size),
-            "Content-Type": "application/octet-stream",
-            "Last-Modified": _format_http_date(stat.st_mtime),
-            "Accept-Ranges": "bytes",
-        },
+    # Sends headers only for HEAD; honours Range and conditional headers like GET
+    return ConditionalFileResponse(
+        path=file_path,
+        etag=etag,
+        media_type="application/octet-stream",
+        stat_result=stat,
     )
 
 
@@ -955,80 +1262,45 @@ async def list_objects_v2(
     # Validate project exists
     _validate_project_exists(project_id)
 
-    # Get project files directory
-    project_dir = _get_project_files_dir(project_id)
-
-    if not project_dir.exists():
-        # Empty bucket - return empty list
-        xml_content = _build_list_objects_xml(
-            bucket=bucket,
-            objects=[],
-            prefix=prefix,
-            is_truncated=False,
-            max_keys=max_keys,
-        )
-        return Response(content=xml_content, media_type="application/xml")
-
-    # Collect all files
-    objects: list[dict[str, Any]] = []
-    common_prefixes: set[str] = set()
-
-    for file_path in project_dir.rglob("*"):
-        if not file_path.is_file():
-            continue
-
-        # Get relative key
-        key = str(file_path.relative_to(project_dir))
-
-        # Filter by prefix
-        if prefix and not key.startswith(prefix):
-            continue
-
-        # Handle start_after
-        if start_after and key <= start_after:
-            continue
-
-        # Handle delimiter (for virtual directories)
-        if delimiter:
-            # Find the part after prefix
-            suffix = key[len(prefix):]
-            if delimiter in suffix:
-                # This is a "directory" - add to common prefixes
-                common_prefix = prefix + suffix.split(delimiter)[0] + delimiter
-                common_prefixes.add(common_prefix)
-                continue
-
-        # Get file stats
-        stat = file_path.stat()
-
-        objects.append({
-            "Key": key,
-            "Size": stat.st_size,
-            "LastModified": datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
-            "ETag": _compute_file_md5(file_path),
-        })
-
-    # Sort by key
-    objects.sort(key=lambda x: x["Key"])
+    after = start_after or ""
+    after_common_prefix = False
+    if continuation_token:
+        try:
+            after, after_common_prefix = _decode_continuation_token(continuation_token)
+        except ValueError:
+            return _s3_error(
+                "InvalidArgument",
+                "The continuation token provided is incorrect.",
+                bucket,
+                "",
+                400,
+            )
 
-    # Handle pagination
-    is_truncated = len(objects) > max_keys
-    if is_truncated:
-        objects = objects[:max_keys]
-        next_continuation_token = objects[-1]["Key"] if objects else None
-    else:
-        next_continuation_token = None
+    objects, common_prefixes, next_after = await duckdb_executor.run(
+        "metadata",
+        _list_objects_page,
+        _get_project_files_dir(project_id),
+        prefix,
+        delimiter,
+        after,
+        after_common_prefix,
+        max_keys,
+    )
 
     # Build XML response
     xml_content = _build_list_objects_xml(
         bucket=bucket,
         objects=objects,
         prefix=prefix,
-        is_truncated=is_truncated,
+        is_truncated=next_after is not None,
         continuation_token=continuation_token,
-        next_continuation_token=next_continuation_token,
+        next_continuation_token=(
+            _encode_continuation_token(*next_after) if next_after is not None else None
+        ),
         max_keys=max_keys,
-        common_prefixes=sorted(common_prefixes) if common_prefixes else None,
+        common_prefixes=common_prefixes or None,
+        start_after=start_after,
+        delimiter=delimiter,
     )
 
     # Record metrics
@@ -1136,3 +1408,255 @@ async def create_presigned_url(
         expires_at=expires_at_dt.isoformat(),
         method=request_body.method.value,
     )
+
+
+# ============================================================================
+# Multipart Upload Endpoints
+# ============================================================================
+
+
+@router.post(
+    "/{bucket}/{key:path}",
+    summary="CreateMultipartUpload / CompleteMultipartUpload",
+    description=(
+        "POST ?uploads starts a multipart upload; POST ?uploadId={id} with the "
+        "part list completes it. Supports pre-signed URLs."
+    ),
+    responses={
+        200: {"description": "Upload started or completed (XML)"},
+        400: {"description": "InvalidPart / InvalidPartOrder / MalformedXML"},
+        401: {"description": "Unauthorized - Missing authentication"},
+        403: {"description": "Forbidden - Invalid signature or access denied"},
+        404: {"description": "NoSuchUpload - Upload not found"},
+    },
+)
+async def post_object(
+    bucket: str,
+    key: str,
+    request: Request,
+) -> Response:
+    """S3 POST on an object: multipart upload create/complete."""
+    # Check auth (pre-signed URL or header)
+    await _check_presign_or_auth(request, bucket, key, "POST")
+
+    project_id = _extract_project_id(bucket)
+
+    # Validate project exists
+    _validate_project_exists(project_id)
+
+    if "uploads" in request.query_params:
+        return _create_multipart_upload(bucket, key, project_id)
+
+    upload_id = request.query_params.get("uploadId")
+    if upload_id is not None:
+        return await _complete_multipart_upload(request, bucket, key, project_id, upload_id)
+
+    return _s3_error(
+        "NotImplemented",
+        "POST on an object requires ?uploads or ?uploadId.",
+        bucket,
+        key,
+        501,
+    )
+
+
+def _create_multipart_upload(bucket: str, key: str, project_id: str) -> Response:
+    """S3 CreateMultipartUpload - Start an upload and return its ID."""
+    upload_id = secrets.token_hex(16)
+    upload_dir = _get_multipart_dir(project_id, upload_id)
+    upload_dir.mkdir(parents=True)
+    (upload_dir / "upload.json").write_text(
+        json.dumps({
+            "bucket": bucket,
+            "key": key,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        })
+    )
+
+    logger.info(
+        "s3_multipart_upload_created",
+        bucket=bucket,
+        key=key,
+        upload_id=upload_id,
+        request_id=_get_request_id(),
+    )
+
+    metrics.S3_OPERATIONS_TOTAL.labels(operation="CreateMultipartUpload", status="success").inc()
+    metrics.S3_MULTIPART_UPLOADS_ACTIVE.inc()
+
+    return Response(
+        content=_build_initiate_multipart_xml(bucket, key, upload_id),
+        media_type="application/xml",
+    )
+
+
+async def _upload_part(
+    request: Request,
+    bucket: str,
+    key: str,
+    project_id: str,
+    upload_id: str,
+    start_time: float,
+) -> Response:
+    """S3 UploadPart - Stream one part to disk; its MD5 is the part ETag."""
+    upload_dir = _load_multipart_upload(project_id, upload_id, key)
+    if upload_dir is None:
+        return _s3_error("NoSuchUpload", "The specified upload does not exist.", bucket, key, 404)
+
+    part_number_param = request.query_params.get("partNumber", "")
+    if not part_number_param.isdigit() or not 1 <= int(part_number_param) <= MAX_PART_NUMBER:
+        return _s3_error(
+            "InvalidArgument",
+            f"Part number must be an integer between 1 and {MAX_PART_NUMBER}.",
+            bucket,
+            key,
+            400,
+        )
+    part_number = int(part_number_param)
+
+    temp_path = _new_temp_path()
+    size_bytes, md5_hash = await _stream_body_to_file(request, temp_path)
+
+    if not _content_md5_matches(request, md5_hash):
+        temp_path.unlink(missing_ok=True)
+        return _s3_error(
+            "BadDigest",
+            "The Content-MD5 you specified did not match what we received.",
+            bucket,
+            key,
+            400,
+        )
+
+    # Re-uploading a part number replaces the previous part
+    etag = md5_hash.hexdigest()
+    for old_part in upload_dir.glob(f"{part_number:05d}-*"):
+        old_part.unlink(missing_ok=True)
+    os.replace(temp_path, upload_dir / f"{part_number:05d}-{etag}")
+
+    logger.debug(
+        "s3_upload_part_complete",
+        bucket=bucket,
+        key=key,
+        upload_id=upload_id,
+        part_number=part_number,
+        size_bytes=size_bytes,
+    )
+
+    metrics.S3_OPERATIONS_TOTAL.labels(operation="UploadPart", status="success").inc()
+    metrics.S3_OPERATION_DURATION.labels(operation="UploadPart").observe(time.time() - start_time)
+    metrics.S3_BYTES_IN_TOTAL.inc(size_bytes)
+
+    return Response(status_code=200, headers={"ETag": f'"{etag}"'})
+
+
+async def _complete_multipart_upload(
+    request: Request,
+    bucket: str,
+    key: str,
+    project_id: str,
+    upload_id: str,
+) -> Response:
+    """S3 CompleteMultipartUpload - Concatenate the listed parts into the object."""
+    start_time = time.time()
+    request_id = _get_request_id()
+
+    upload_dir = _load_multipart_upload(project_id, upload_id, key)
+    if upload_dir is None:
+        return _s3_error("NoSuchUpload", "The specified upload does not exist.", bucket, key, 404)
+
+    requested = _parse_complete_multipart_xml(await request.body())
+    if not requested:
+        return _s3_error(
+            "MalformedXML",
+            "The XML you provided was not well-formed or did not list any parts.",
+            bucket,
+            key,
+            400,
+        )
+
+    numbers = [number for number, _ in requested]
+    if numbers != sorted(set(numbers)):
+        return _s3_error(
+            "InvalidPartOrder",
+            "The list of parts was not in ascending order.",
+            bucket,
+            key,
+            400,
+        )
+
+    uploaded = _list_uploaded_parts(upload_dir)
+    sources: list[Path] = []
+    part_md5s: list[str] = []
+    for number, etag in requested:
+        part = uploaded.get(number)
+        if part is None or part[1] != etag:
+            return _s3_error(
+                "InvalidPart",
+                f"Part {number} was not uploaded or its ETag does not match.",
+                bucket,
+                key,
+                400,
+            )
+        sources.append(part[0])
+        part_md5s.append(part[1])
+
+    # Concatenate off the event loop, then move into place atomically
+    file_path = _get_project_files_dir(project_id) / key
+    temp_path = _new_temp_path()
+    try:
+        await duckdb_executor.run("data", _concat_files, sources, temp_path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+    etag = _multipart_etag(part_md5s)
+    metadata_db.store_file_etag(file_path, etag)
+    object_index.add(file_path)
+    shutil.rmtree(upload_dir, ignore_errors=True)
+
+    size_bytes = file_path.stat().st_size
+    logger.info(
+        "s3_multipart_upload_complete",
+        bucket=bucket,
+        key=key,
+        upload_id=upload_id,
+        parts=len(sources),
+        size_bytes=size_bytes,
+        duration_ms=int((time.time() - start_time) * 1000),
+        request_id=request_id,
+    )
+
+    metrics.S3_OPERATIONS_TOTAL.labels(operation="CompleteMultipartUpload", status="success").inc()
+    metrics.S3_OPERATION_DURATION.labels(operation="CompleteMultipartUpload").observe(
+        time.time() - start_time
+    )
+    metrics.S3_MULTIPART_UPLOADS_ACTIVE.dec()
+
+    return Response(
+        content=_build_complete_multipart_xml(bucket, key, etag),
+        media_type="application/xml",
+    )
+
+
+def _abort_multipart_upload(bucket: str, key: str, project_id: str, upload_id: str) -> Response:
+    """S3 AbortMultipartUpload - Discard an upload and its parts."""
+    upload_dir = _load_multipart_upload(project_id, upload_id, key)
+    if upload_dir is None:
+        return _s3_error("NoSuchUpload", "The specified upload does not exist.", bucket, key, 404)
+
+    shutil.rmtree(upload_dir, ignore_errors=True)
+
+    logger.info(
+        "s3_multipart_upload_aborted",
+        bucket=bucket,
+        key=key,
+        upload_id=upload_id,
+        request_id=_get_request_id(),
+    )
+
+    metrics.S3_OPERATIONS_TOTAL.labels(operation="AbortMultipartUpload", status="success").inc()
+    metrics.S3_MULTIPART_UPLOADS_ACTIVE.dec()
+
+    return Response(status_code=204)
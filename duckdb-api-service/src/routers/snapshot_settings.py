@@ -97,6 +97,11 @@ def _request_to_config_dict(request: SnapshotConfigRequest) -> dict:
         if retention:
             config["retention"] = retention
 
+    if request.storage is not None:
+        storage = request.storage.model_dump(exclude_none=True)
+        if storage:
+            config["storage"] = storage
+
     if request.enabled is not None:
         config["enabled"] = request.enabled
 
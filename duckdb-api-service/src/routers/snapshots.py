@@ -3,9 +3,13 @@
 Uses branch-first URL pattern per ADR-012, but snapshots only work on default branch for MVP.
 """
 
+import asyncio
 import json
+import os
 import shutil
+import threading
 import time
+from concurrent.futures import Future
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
@@ -16,7 +20,14 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from src import metrics
 from src.branch_utils import require_default_branch, resolve_branch, validate_project_and_bucket
 from src.config import settings
-from src.database import metadata_db, project_db_manager
+from src.database import (
+    clone_file,
+    duckdb_executor,
+    metadata_db,
+    project_db_manager,
+    table_catalog_cache,
+    table_lock_manager,
+)
 from src.dependencies import require_project_access
 from src.models.responses import (
     ErrorResponse,
@@ -28,11 +39,22 @@ from src.models.responses import (
     SnapshotRestoreResponse,
     SnapshotSchemaColumn,
 )
-from src.snapshot_config import get_retention_days, resolve_snapshot_config
+from src.snapshot_config import get_retention_days, get_storage_config, resolve_snapshot_config
 
 logger = structlog.get_logger()
 router = APIRouter(prefix="", tags=["snapshots"])
 
+# Snapshot directory layout: full snapshots are one data.parquet, incremental
+# ones a parts/ directory. Auto-snapshots first clone the table file to
+# staging.duckdb and export it in the background.
+SNAPSHOT_DATA_FILE = "data.parquet"
+SNAPSHOT_PARTS_DIR = "parts"
+SNAPSHOT_STAGING_FILE = "staging.duckdb"
+
+# Background exports still running, by snapshot ID
+_pending_exports: dict[str, Future] = {}
+_pending_exports_lock = threading.Lock()
+
 
 def _validate_table_exists(
     project_id: str, branch_id: str | None, bucket_name: str, table_name: str
@@ -96,6 +118,330 @@ def _get_table_schema(project_id: str, bucket_name: str, table_name: str) -> dic
         conn.close()
 
 
+def _quote_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _parquet_copy_options(storage: dict) -> str:
+    """COPY options for snapshot Parquet files from the storage config."""
+    compression = storage.get("compression", "zstd").upper()
+    row_group_size = int(storage.get("row_group_size", 122880))
+    return f"FORMAT PARQUET, COMPRESSION {compression}, ROW_GROUP_SIZE {row_group_size}"
+
+
+def _snapshot_data_source(snapshot_dir: Path) -> str | None:
+    """Parquet path (or glob over parts) holding a snapshot's data, if written."""
+    data_path = snapshot_dir / SNAPSHOT_DATA_FILE
+    if data_path.exists():
+        return str(data_path)
+    parts_dir = snapshot_dir / SNAPSHOT_PARTS_DIR
+    if parts_dir.is_dir() and any(parts_dir.glob("*.parquet")):
+        return str(parts_dir / "*.parquet")
+    return None
+
+
+def _part_fingerprints(
+    conn: duckdb.DuckDBPyConnection, columns: list[dict], part_rows: int
+) -> list[dict]:
+    """
+    Row count and content fingerprint of each rowid range of main.data.
+
+    The fingerprint is the sum of row hashes, so it does not depend on
+    scan order and duplicate rows don't cancel out.
+    """
+    hash_args = ", ".join(_quote_identifier(col["name"]) for col in columns)
+    rows = conn.execute(f"""
+        SELECT rowid // {part_rows} AS part,
+               count(*) AS rows,
+               sum(hash({hash_args}))::VARCHAR AS fingerprint
+        FROM main.data
+        GROUP BY part
+        ORDER BY part
+    """).fetchall()
+    return [
+        {"index": row[0], "rows": row[1], "fingerprint": row[2]}
+        for row in rows
+    ]
+
+
+def _find_incremental_base(
+    project_id: str,
+    bucket_name: str,
+    table_name: str,
+    schema_json: dict,
+) -> dict | None:
+    """
+    Find the latest finished part-based snapshot of a table to build on.
+
+    Returns None when there is none or its schema differs from the table's
+    current schema (parts can only be reused for an identical schema).
+    """
+    candidates = metadata_db.list_snapshots(
+        project_id=project_id, bucket_name=bucket_name, table_name=table_name, limit=10
+    )
+    for record in candidates:
+        snapshot_dir = settings.snapshots_dir / record["parquet_path"]
+        if (snapshot_dir / SNAPSHOT_STAGING_FILE).exists():
+            continue  # Export still pending
+        try:
+            with open(snapshot_dir / "metadata.json") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if not manifest.get("parts"):
+            continue
+        if manifest.get("schema", {}).get("columns") != schema_json.get("columns"):
+            return None
+        return {
+            "snapshot_id": record["id"],
+            "snapshot_dir": snapshot_dir,
+            "parts": {part["index"]: part for part in manifest["parts"]},
+        }
+    return None
+
+
+def _link_or_clone(source: Path, target: Path) -> None:
+    """Hardlink a reused part file; fall back to a (reflink) copy."""
+    try:
+        os.link(source, target)
+    except OSError:
+        clone_file(source, target)
+
+
+def _export_table_to_parquet(
+    table_path: Path,
+    snapshot_dir: Path,
+    storage: dict,
+    columns: list[dict],
+    base: dict | None = None,
+) -> dict:
+    """
+    Write a table file's data into a snapshot directory (blocking).
+
+    Full snapshots are a single data.parquet. Incremental snapshots
+    (storage["incremental"]) are split into rowid-range parts; parts whose
+    row count and fingerprint match the base snapshot are hardlinked from
+    it instead of being rewritten, so each snapshot directory stays
+    self-contained and can be deleted independently.
+
+    Returns:
+        Dict with row_count, size_bytes, parts (None for full snapshots)
+        and parts_reused
+    """
+    options = _parquet_copy_options(storage)
+
+    conn = duckdb.connect(str(table_path), read_only=True)
+    try:
+        conn.execute(f"SET threads = {settings.snapshot_duckdb_threads}")
+
+        fingerprints = []
+        if storage.get("incremental"):
+            part_rows = int(storage.get("part_rows", 1000000))
+            fingerprints = _part_fingerprints(conn, columns, part_rows)
+
+        if not fingerprints:
+            # Full snapshot (also used for empty tables: keeps the schema)
+            data_path = snapshot_dir / SNAPSHOT_DATA_FILE
+            # COPY returns the number of rows written
+            row_count = conn.execute(
+                f"COPY main.data TO '{data_path}' ({options})"
+            ).fetchone()[0]
+            return {
+                "row_count": row_count,
+                "size_bytes": data_path.stat().st_size,
+                "parts": None,
+                "parts_reused": 0,
+            }
+
+        parts_dir = snapshot_dir / SNAPSHOT_PARTS_DIR
+        parts_dir.mkdir(parents=True, exist_ok=True)
+        base_parts = base["parts"] if base else {}
+
+        parts = []
+        reused = 0
+        size_bytes = 0
+        for part in fingerprints:
+            part_path = parts_dir / f"part_{part['index']:06d}.parquet"
+            base_part = base_parts.get(part["index"])
+            base_file = (
+                base["snapshot_dir"] / SNAPSHOT_PARTS_DIR / part_path.name
+                if base_part else None
+            )
+
+            if (
+                base_part
+                and base_part["rows"] == part["rows"]
+                and base_part["fingerprint"] == part["fingerprint"]
+                and base_file.exists()
+            ):
+                _link_or_clone(base_file, part_path)
+                part["reused_from"] = base_part.get("reused_from") or base["snapshot_id"]
+                reused += 1
+                metrics.SNAPSHOT_PARTS_TOTAL.labels(result="reused").inc()
+            else:
+                start = part["index"] * part_rows
+                conn.execute(f"""
+                    COPY (
+                        SELECT * FROM main.data
+                        WHERE rowid >= {start} AND rowid < {start + part_rows}
+                    ) TO '{part_path}' ({options})
+                """)
+                part["reused_from"] = None
+                metrics.SNAPSHOT_PARTS_TOTAL.labels(result="written").inc()
+
+            size_bytes += part_path.stat().st_size
+            parts.append(part)
+
+        return {
+            "row_count": sum(part["rows"] for part in parts),
+            "size_bytes": size_bytes,
+            "parts": parts,
+            "parts_reused": reused,
+        }
+    finally:
+        conn.close()
+
+
+def _count_table_rows(table_path: Path) -> int:
+    conn = duckdb.connect(str(table_path), read_only=True)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM main.data").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def _stage_table(
+    project_id: str, bucket_name: str, table_name: str, staging_path: Path
+) -> None:
+    """Clone a table file into a snapshot directory under the table lock (blocking)."""
+    table_path = project_db_manager.get_table_path(project_id, bucket_name, table_name)
+    with table_lock_manager.acquire(project_id, bucket_name, table_name):
+        clone_file(table_path, staging_path)
+
+
+def _write_snapshot_metadata(snapshot_dir: Path, metadata: dict) -> None:
+    with open(snapshot_dir / "metadata.json", "w") as f:
+        json.dump(metadata, f, indent=2)
+
+
+def _finish_staged_snapshot(
+    snapshot_id: str,
+    snapshot_dir: Path,
+    metadata: dict,
+    base: dict | None,
+) -> None:
+    """
+    Export a staged table copy to Parquet and drop the copy (blocking).
+
+    Runs on the "snapshot" executor lane after an auto-snapshot returned.
+    """
+    start_time = time.time()
+    staging_path = snapshot_dir / SNAPSHOT_STAGING_FILE
+    try:
+        result = _export_table_to_parquet(
+            staging_path,
+            snapshot_dir,
+            metadata["storage"],
+            metadata["schema"]["columns"],
+            base,
+        )
+        metadata.update(
+            size_bytes=result["size_bytes"],
+            parts=result["parts"],
+            base_snapshot_id=base["snapshot_id"] if base and result["parts"] else None,
+        )
+        _write_snapshot_metadata(snapshot_dir, metadata)
+        metadata_db.update_snapshot_size(snapshot_id, result["size_bytes"])
+        staging_path.unlink(missing_ok=True)
+
+        duration = time.time() - start_time
+        mode = "incremental" if result["parts"] is not None else "full"
+        metrics.SNAPSHOT_EXPORT_DURATION.labels(mode=mode).observe(duration)
+        logger.info(
+            "snapshot_export_finished",
+            snapshot_id=snapshot_id,
+            mode=mode,
+            size_bytes=result["size_bytes"],
+            parts_reused=result["parts_reused"],
+            duration_seconds=duration,
+        )
+    except Exception as e:
+        # The staged copy stays in place; restore can still finish the export
+        logger.error("snapshot_export_failed", snapshot_id=snapshot_id, error=str(e))
+        raise
+    finally:
+        with _pending_exports_lock:
+            _pending_exports.pop(snapshot_id, None)
+
+
+async def _wait_for_snapshot_export(snapshot: dict) -> None:
+    """
+    Make sure a snapshot's Parquet data is written before it is read or deleted.
+
+    Waits for a background export still running in this process; finishes
+    an export left behind by a restart (staged copy but no Parquet).
+    """
+    snapshot_id = snapshot["id"]
+    with _pending_exports_lock:
+        future = _pending_exports.get(snapshot_id)
+    if future is not None:
+        try:
+            await asyncio.wrap_future(future)
+        except Exception:
+            pass  # Logged by _finish_staged_snapshot; handled below
+        else:
+            return
+
+    snapshot_dir = settings.snapshots_dir / snapshot["parquet_path"]
+    if (snapshot_dir / SNAPSHOT_STAGING_FILE).exists():
+        with open(snapshot_dir / "metadata.json") as f:
+            metadata = json.load(f)
+        # No base: parts are written from scratch rather than trusting old state
+        await duckdb_executor.run(
+            "snapshot", _finish_staged_snapshot, snapshot_id, snapshot_dir, metadata, None
+        )
+
+
+def _restore_table_from_parquet(
+    table_path: Path, parquet_source: str, primary_key: list[str], snapshot_id: str
+) -> int:
+    """Replace a table file's data with snapshot Parquet data (blocking). Returns row count.
+
+    parquet_source is a single file or a glob over the parts of an
+    incremental snapshot.
+    """
+    conn = duckdb.connect(str(table_path))
+    try:
+        # Create table from Parquet
+        conn.execute(f"""
+            CREATE OR REPLACE TABLE main.data AS
+            SELECT * FROM read_parquet('{parquet_source}')
+        """)
+
+        # Add primary key if exists in schema
+        if primary_key:
+            pk_cols = ", ".join(primary_key)
+            try:
+                conn.execute(f"ALTER TABLE main.data ADD PRIMARY KEY ({pk_cols})")
+            except Exception as e:
+                logger.warning(
+                    "restore_pk_failed",
+                    snapshot_id=snapshot_id,
+                    primary_key=primary_key,
+                    error=str(e),
+                )
+
+        # Get restored row count
+        row_count = conn.execute("SELECT COUNT(*) FROM main.data").fetchone()[0]
+        table_stats = project_db_manager.collect_table_stats(conn, row_count=row_count)
+    finally:
+        conn.close()
+        table_catalog_cache.invalidate(table_path)
+    project_db_manager.record_table_stats(table_path, table_stats)
+
+    return row_count
+
+
 def _snapshot_record_to_response(record: dict) -> SnapshotResponse:
     """Convert snapshot database record to API response."""
     return SnapshotResponse(
@@ -152,12 +498,19 @@ async def create_snapshot_internal(
     snapshot_type: str = "manual",
     description: str | None = None,
     created_by: str | None = None,
+    background: bool = False,
 ) -> dict:
     """
     Internal function to create a snapshot.
 
     Used by both the API endpoint and auto-snapshot triggers.
 
+    With background=True (auto-snapshots before destructive operations)
+    the table file is only cloned into the snapshot directory - a reflink
+    where the filesystem supports it - and the snapshot is registered
+    right away; the Parquet export then runs on the throttled "snapshot"
+    executor lane. size_bytes is updated when the export finishes.
+
     Returns:
         Snapshot record dict
     """
@@ -178,6 +531,7 @@ async def create_snapshot_internal(
                 },
             },
         )
+    storage = get_storage_config(project_id, bucket_name, table_name)
 
     # Generate snapshot ID with milliseconds for uniqueness
     now = datetime.now(timezone.utc)
@@ -185,39 +539,31 @@ async def create_snapshot_internal(
     snapshot_id = f"snap_{table_name}_{timestamp}"
 
     # Get table schema
-    schema_json = _get_table_schema(project_id, bucket_name, table_name)
+    schema_json = await duckdb_executor.run(
+        "metadata", _get_table_schema, project_id, bucket_name, table_name
+    )
+
+    # Previous snapshot whose unchanged parts can be reused
+    base = None
+    if storage.get("incremental"):
+        base = await duckdb_executor.run(
+            "metadata", _find_incremental_base, project_id, bucket_name, table_name, schema_json
+        )
 
     # Create snapshot directory
     snapshot_dir = settings.snapshots_dir / project_id / snapshot_id
     snapshot_dir.mkdir(parents=True, exist_ok=True)
-    parquet_path = snapshot_dir / "data.parquet"
 
     # Get table path
     table_path = project_db_manager.get_table_path(project_id, bucket_name, table_name)
 
-    # Export to Parquet
-    conn = duckdb.connect(str(table_path), read_only=True)
-    try:
-        conn.execute(f"""
-            COPY main.data TO '{parquet_path}'
-            (FORMAT PARQUET, COMPRESSION ZSTD)
-        """)
-
-        # Get row count
-        row_count = conn.execute("SELECT COUNT(*) FROM main.data").fetchone()[0]
-    finally:
-        conn.close()
-
-    # Get file size
-    size_bytes = parquet_path.stat().st_size
-
     # Calculate expiration based on retention config
     retention_days = get_retention_days(
         project_id, bucket_name, table_name, snapshot_type
     )
     expires_at = datetime.now(timezone.utc) + timedelta(days=retention_days)
 
-    # Save metadata JSON (redundant copy for recovery)
+    # Metadata JSON (redundant copy for recovery, and the part manifest)
     metadata = {
         "snapshot_id": snapshot_id,
         "project_id": project_id,
@@ -228,13 +574,42 @@ async def create_snapshot_internal(
         "created_by": created_by,
         "expires_at": expires_at.isoformat(),
         "description": description,
-        "row_count": row_count,
-        "size_bytes": size_bytes,
         "schema": schema_json,
+        "storage": storage,
     }
 
-    with open(snapshot_dir / "metadata.json", "w") as f:
-        json.dump(metadata, f, indent=2)
+    if background:
+        staging_path = snapshot_dir / SNAPSHOT_STAGING_FILE
+        await duckdb_executor.run(
+            "data", _stage_table, project_id, bucket_name, table_name, staging_path
+        )
+        stats = project_db_manager.get_persisted_table_stats(table_path)
+        if stats is not None:
+            row_count = stats["row_count"]
+        else:
+            row_count = await duckdb_executor.run("metadata", _count_table_rows, staging_path)
+        size_bytes = staging_path.stat().st_size
+    else:
+        # Export to Parquet on the throttled snapshot lane
+        result = await duckdb_executor.run(
+            "snapshot",
+            _export_table_to_parquet,
+            table_path,
+            snapshot_dir,
+            storage,
+            schema_json["columns"],
+            base,
+        )
+        row_count = result["row_count"]
+        size_bytes = result["size_bytes"]
+        metadata["parts"] = result["parts"]
+        metadata["base_snapshot_id"] = (
+            base["snapshot_id"] if base and result["parts"] else None
+        )
+
+    metadata["row_count"] = row_count
+    metadata["size_bytes"] = size_bytes
+    _write_snapshot_metadata(snapshot_dir, metadata)
 
     # Register in metadata database
     snapshot_record = metadata_db.create_snapshot(
@@ -252,6 +627,12 @@ async def create_snapshot_internal(
         description=description,
     )
 
+    if background:
+        with _pending_exports_lock:
+            _pending_exports[snapshot_id] = duckdb_executor.submit(
+                "snapshot", _finish_staged_snapshot, snapshot_id, snapshot_dir, metadata, base
+            )
+
     logger.info(
         "snapshot_created",
         snapshot_id=snapshot_id,
@@ -261,10 +642,14 @@ async def create_snapshot_internal(
         snapshot_type=snapshot_type,
         row_count=row_count,
         size_bytes=size_bytes,
+        background=background,
     )
 
     duration = time.time() - start_time
     metrics.SNAPSHOT_CREATE_DURATION.observe(duration)
+    if not background:
+        mode = "incremental" if metadata["parts"] is not None else "full"
+        metrics.SNAPSHOT_EXPORT_DURATION.labels(mode=mode).observe(duration)
 
     trigger = "manual" if snapshot_type == "manual" else snapshot_type.replace("auto_", "")
     metrics.SNAPSHOTS_CREATED_TOTAL.labels(type=snapshot_type, trigger=trigger).inc()
@@ -426,6 +811,12 @@ async def delete_snapshot(project_id: str, branch_id: str, snapshot_id: str) ->
             },
         )
 
+    # Don't remove the directory under a running background export
+    with _pending_exports_lock:
+        pending = _pending_exports.get(snapshot_id)
+    if pending is not None:
+        await asyncio.wait([asyncio.wrap_future(pending)])
+
     # Delete files
     snapshot_dir = settings.snapshots_dir / resolved_project_id / snapshot_id
     if snapshot_dir.exists():
@@ -507,14 +898,16 @@ async def restore_snapshot(
                 },
             )
 
-    # Get parquet file path
-    parquet_path = settings.snapshots_dir / snapshot["parquet_path"] / "data.parquet"
-    if not parquet_path.exists():
+    # Get parquet data (waiting for a background export if one is running)
+    snapshot_dir = settings.snapshots_dir / snapshot["parquet_path"]
+    await _wait_for_snapshot_export(snapshot)
+    parquet_source = _snapshot_data_source(snapshot_dir)
+    if parquet_source is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={
                 "error": "snapshot_file_not_found",
-                "message": f"Snapshot file not found at {parquet_path}",
+                "message": f"Snapshot data not found in {snapshot_dir}",
                 "details": {"snapshot_id": snapshot_id},
             },
         )
@@ -523,34 +916,16 @@ async def restore_snapshot(
     table_path = project_db_manager.get_table_path(resolved_project_id, target_bucket, target_table)
     table_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Restore from Parquet
-    conn = duckdb.connect(str(table_path))
-    try:
-        # Create table from Parquet
-        conn.execute(f"""
-            CREATE OR REPLACE TABLE main.data AS
-            SELECT * FROM read_parquet('{parquet_path}')
-        """)
-
-        # Add primary key if exists in schema
-        schema_json = snapshot.get("schema_json", {})
-        primary_key = schema_json.get("primary_key", [])
-        if primary_key:
-            pk_cols = ", ".join(primary_key)
-            try:
-                conn.execute(f"ALTER TABLE main.data ADD PRIMARY KEY ({pk_cols})")
-            except Exception as e:
-                logger.warning(
-                    "restore_pk_failed",
-                    snapshot_id=snapshot_id,
-                    primary_key=primary_key,
-                    error=str(e),
-                )
-
-        # Get restored row count
-        row_count = conn.execute("SELECT COUNT(*) FROM main.data").fetchone()[0]
-    finally:
-        conn.close()
+    # Restore from Parquet (off the event loop)
+    schema_json = snapshot.get("schema_json", {})
+    row_count = await duckdb_executor.run(
+        "data",
+        _restore_table_from_parquet,
+        table_path,
+        parquet_source,
+        schema_json.get("primary_key", []),
+        snapshot_id,
+    )
 
     # Note: Table is automatically "registered" by creating the DuckDB file
     # No separate metadata registry needed per ADR-009
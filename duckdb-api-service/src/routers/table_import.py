@@ -4,14 +4,18 @@ Branch-First API (ADR-012):
 - All endpoints use /projects/{project_id}/branches/{branch_id}/buckets/{bucket_name}/tables/{table_name}/...
 - Import/Export operations require default branch (MVP limitation)
 
-Import Pipeline (3-stage):
-1. STAGING: Load file into staging table using COPY FROM
-2. TRANSFORM: Deduplicate and merge into target table
-3. CLEANUP: Drop staging table and return statistics
+Import Pipeline:
+- Plain loads (no primary key, or a dedup mode that needs no merge) COPY the
+  file straight into the target table in one pass
+- Upserts use the 3-stage pipeline:
+  1. STAGING: Load file into staging table using COPY FROM
+  2. TRANSFORM: Deduplicate and merge into target table
+  3. CLEANUP: Drop staging table and return statistics
 
 Export:
 - Export table data to CSV or Parquet file
 - Support filtering, column selection, and compression
+- Stream table data as Arrow IPC (no staging file, ADR-011)
 """
 
 import time
@@ -22,7 +26,8 @@ from typing import Any
 
 import duckdb
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 
 from src import metrics
 from src.branch_utils import (
@@ -32,16 +37,22 @@ from src.branch_utils import (
 )
 from src.config import settings
 from src.database import (
+    ARROW_STREAM_MEDIA_TYPE,
     TABLE_DATA_NAME,
+    duckdb_executor,
     metadata_db,
+    object_index,
     project_db_manager,
-    table_lock_manager,
+    storage_usage,
+    table_write_queue,
 )
 from src.dependencies import require_project_access
+from src.file_hashing import file_md5
 from src.models.responses import (
     ErrorResponse,
     ExportRequest,
     ExportResponse,
+    ImportedFileResponse,
     ImportFromFileRequest,
     ImportResponse,
 )
@@ -97,46 +108,102 @@ def _validate_table_exists(
     return table
 
 
-def _get_file_path(project_id: str, file_id: str) -> Path:
+def _resolve_import_files(
+    project_id: str, request: ImportFromFileRequest
+) -> list[tuple[dict[str, Any], Path]]:
     """
-    Get the physical path for a file.
+    Resolve the files selected by an import request.
 
-    Validates file exists and belongs to project.
+    Validates that exactly one of file_id / file_ids / file_pattern is set
+    and that every file exists and belongs to the project.
+
+    Returns:
+        List of (file record, physical path) in load order
 
     Raises:
-        HTTPException if file not found
+        HTTPException if the selection is invalid or a file is not found
     """
-    file_record = metadata_db.get_file_by_project(project_id, file_id)
-    if not file_record:
+    selectors = [request.file_id, request.file_ids, request.file_pattern]
+    if sum(selector is not None for selector in selectors) != 1 or request.file_ids == []:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={
-                "error": "file_not_found",
-                "message": f"File {file_id} not found in project {project_id}",
-                "details": {"project_id": project_id, "file_id": file_id},
-            },
-        )
-
-    file_path = settings.files_dir / file_record["path"]
-    if not file_path.exists():
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
+            status_code=status.HTTP_400_BAD_REQUEST,
             detail={
-                "error": "file_content_not_found",
-                "message": "File content not found on disk",
-                "details": {"file_id": file_id},
+                "error": "invalid_file_selection",
+                "message": "Specify exactly one of file_id, file_ids or file_pattern",
+                "details": {},
             },
         )
 
-    return file_path
+    if request.file_pattern is not None:
+        records = metadata_db.list_files_matching(project_id, request.file_pattern)
+        if not records:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={
+                    "error": "file_not_found",
+                    "message": f"No files match {request.file_pattern} in project {project_id}",
+                    "details": {"project_id": project_id, "file_pattern": request.file_pattern},
+                },
+            )
+    else:
+        # Duplicate IDs would load the same file twice
+        file_ids = list(dict.fromkeys(request.file_ids or [request.file_id]))
+        found = metadata_db.get_files_by_project_ids(project_id, file_ids)
+        missing = [file_id for file_id in file_ids if file_id not in found]
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={
+                    "error": "file_not_found",
+                    "message": f"File {missing[0]} not found in project {project_id}",
+                    "details": {"project_id": project_id, "file_id": missing[0], "missing": missing},
+                },
+            )
+        records = [found[file_id] for file_id in file_ids]
+
+    files = []
+    for record in records:
+        file_path = settings.files_dir / record["path"]
+        if not file_path.exists():
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={
+                    "error": "file_content_not_found",
+                    "message": "File content not found on disk",
+                    "details": {"file_id": record["id"]},
+                },
+            )
+        files.append((record, file_path))
+
+    return files
+
+
+def _validate_where_filter(where_filter: str | None) -> None:
+    """Reject WHERE clauses with statement separators, comments or DML/DDL keywords."""
+    if not where_filter:
+        return
+
+    dangerous_patterns = [";", "--", "/*", "*/", "drop ", "truncate ", "alter ", "delete ", "insert ", "update "]
+    where_lower = where_filter.lower()
+    for pattern in dangerous_patterns:
+        if pattern in where_lower:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "error": "invalid_where_clause",
+                    "message": f"Invalid WHERE clause: contains '{pattern}'",
+                    "details": {"where_filter": where_filter},
+                },
+            )
 
 
 def _build_copy_from_sql(
     file_path: Path,
     format: str,
     csv_options: dict | None = None,
+    target: str = "staging",
 ) -> str:
-    """Build DuckDB COPY FROM SQL statement."""
+    """Build DuckDB COPY FROM SQL statement loading into target."""
     options = []
 
     if format == "csv":
@@ -161,67 +228,278 @@ def _build_copy_from_sql(
         raise ValueError(f"Unsupported format: {format}")
 
     options_str = ", ".join(options)
-    return f"COPY staging FROM '{file_path}' ({options_str})"
+    return f"COPY {target} FROM '{file_path}' ({options_str})"
+
+
+def _sql_literal(value: Any) -> str:
+    """Quote a value as a SQL string literal."""
+    return "'" + str(value).replace("'", "''") + "'"
 
 
-def _build_dedup_sql(
-    target_columns: list[str],
-    primary_key: list[str] | None,
-    dedup_mode: str,
-) -> list[str]:
+def _build_read_files_sql(
+    file_paths: list[Path],
+    format: str,
+    columns: list[dict[str, Any]],
+    csv_options: dict | None = None,
+    filename: bool = False,
+) -> str:
+    """
+    Build a read_csv/read_parquet call scanning several files at once.
+
+    DuckDB reads the files in parallel. CSV columns are bound by position to
+    the table's names and types, like COPY FROM does for a single file.
     """
-    Build SQL statements for deduplication and merge.
+    files_sql = "[" + ", ".join(_sql_literal(path) for path in file_paths) + "]"
+
+    if format == "parquet":
+        options = []
+    elif format == "csv":
+        column_types = ", ".join(
+            f"{_sql_literal(col['name'])}: {_sql_literal(col['type'])}" for col in columns
+        )
+        options = [f"columns = {{{column_types}}}"]
+        if csv_options:
+            if csv_options.get("delimiter"):
+                options.append(f"delim = {_sql_literal(csv_options['delimiter'])}")
+            if csv_options.get("quote"):
+                options.append(f"quote = {_sql_literal(csv_options['quote'])}")
+            if csv_options.get("escape"):
+                options.append(f"escape = {_sql_literal(csv_options['escape'])}")
+            if csv_options.get("header") is not None:
+                options.append(f"header = {'true' if csv_options['header'] else 'false'}")
+            if csv_options.get("null_string"):
+                options.append(f"nullstr = {_sql_literal(csv_options['null_string'])}")
+        else:
+            options.append("header = true")
+    else:
+        raise ValueError(f"Unsupported format: {format}")
+
+    if filename:
+        options.append("filename = true")
+
+    function = "read_parquet" if format == "parquet" else "read_csv"
+    return f"{function}({', '.join([files_sql, *options])})"
+
+
+def _build_file_row_counts_sql(
+    file_paths: list[Path],
+    format: str,
+    columns: list[dict[str, Any]],
+    csv_options: dict | None = None,
+) -> str:
+    """
+    Build a query returning (file path, row count) for each file.
+
+    Parquet counts come from the file footers; CSV files need a count-only
+    scan (no values are converted, so it is much cheaper than the load).
+    """
+    if format == "parquet":
+        files_sql = "[" + ", ".join(_sql_literal(path) for path in file_paths) + "]"
+        return f"SELECT file_name, num_rows FROM parquet_file_metadata({files_sql})"
+
+    read_sql = _build_read_files_sql(file_paths, format, columns, csv_options, filename=True)
+    return f"SELECT filename, COUNT(*) FROM {read_sql} GROUP BY filename"
+
+
+def _needs_staging(primary_key: list[str] | None, dedup_mode: str) -> bool:
+    """
+    Whether an import has to go through the staging table.
+
+    Only upserts (update_duplicates on a table with a primary key) need to
+    merge staged rows into the target. Every other mode is a plain insert,
+    so the file is copied straight into the target table and the primary
+    key constraint (if any) rejects duplicates during the copy.
+    """
+    return bool(primary_key) and dedup_mode == "update_duplicates"
+
+
+def _build_upsert_sql(target_columns: list[str], primary_key: list[str]) -> str:
+    """
+    Build the SQL merging the staging table into the target on primary key.
 
     Args:
         target_columns: List of column names in target table
-        primary_key: Primary key columns (None if no PK)
-        dedup_mode: How to handle duplicates
+        primary_key: Primary key columns
 
     Returns:
-        List of SQL statements to execute
+        INSERT ... ON CONFLICT statement
     """
-    statements = []
-
-    if not primary_key:
-        # No primary key - simple INSERT (no dedup possible)
-        statements.append(
-            f"INSERT INTO main.{TABLE_DATA_NAME} SELECT * FROM staging"
-        )
-        return statements
-
-    # Build column lists
     pk_cols = ", ".join(primary_key)
     all_cols = ", ".join(target_columns)
     update_cols = [c for c in target_columns if c not in primary_key]
 
-    if dedup_mode == "fail_on_duplicates":
-        # Try insert, will fail if duplicates exist
-        statements.append(
-            f"INSERT INTO main.{TABLE_DATA_NAME} SELECT * FROM staging"
-        )
-    elif dedup_mode == "insert_duplicates":
-        # Insert all rows, including duplicates
-        statements.append(
-            f"INSERT INTO main.{TABLE_DATA_NAME} SELECT * FROM staging"
-        )
-    else:  # update_duplicates (default)
-        # Use INSERT ON CONFLICT for upsert
-        if update_cols:
-            update_set = ", ".join([f"{c} = EXCLUDED.{c}" for c in update_cols])
-            statements.append(
-                f"""INSERT INTO main.{TABLE_DATA_NAME} ({all_cols})
-                SELECT {all_cols} FROM staging
-                ON CONFLICT ({pk_cols}) DO UPDATE SET {update_set}"""
-            )
+    if update_cols:
+        update_set = ", ".join([f"{c} = EXCLUDED.{c}" for c in update_cols])
+        return f"""INSERT INTO main.{TABLE_DATA_NAME} ({all_cols})
+            SELECT {all_cols} FROM staging
+            ON CONFLICT ({pk_cols}) DO UPDATE SET {update_set}"""
+
+    # Only PK columns, nothing to update
+    return f"""INSERT INTO main.{TABLE_DATA_NAME} ({all_cols})
+        SELECT {all_cols} FROM staging
+        ON CONFLICT ({pk_cols}) DO NOTHING"""
+
+
+def _run_import(
+    project_id: str,
+    bucket_name: str,
+    table_name: str,
+    table_path: Path,
+    file_paths: list[Path],
+    table_info: dict[str, Any],
+    request: ImportFromFileRequest,
+    request_id: str | None,
+) -> tuple[int, int, list[int | None]]:
+    """
+    Run the import against the table file (blocking).
+
+    Runs on the "data" lane of duckdb_executor. The import itself goes
+    through table_write_queue - concurrent incremental imports into the
+    same table are committed together in one transaction.
+
+    A single file is loaded with COPY FROM; several files are read in one
+    parallel read_csv/read_parquet scan.
+
+    Row counts come from the DELETE/COPY/INSERT results; the table is only
+    counted after incremental loads (and before incremental upserts).
+    Per-file counts of several files are taken after the commit, outside
+    the write queue: Parquet from the footers, CSV only when
+    request.report_file_rows asks for the extra scan.
+
+    Returns:
+        Tuple of (imported_rows, rows_after, rows read from each file or None)
+    """
+    target_columns = [col["name"] for col in table_info["columns"]]
+    primary_key = table_info.get("primary_key", [])
+    incremental = request.import_options.incremental
+    dedup_mode = request.import_options.dedup_mode
+    use_staging = _needs_staging(primary_key, dedup_mode)
+    csv_opts = request.csv_options.model_dump() if request.csv_options else None
+
+    def load_files(conn: duckdb.DuckDBPyConnection, target: str) -> int:
+        """Load the file(s) into target, returning the number of rows loaded."""
+        if len(file_paths) == 1:
+            load_sql = _build_copy_from_sql(file_paths[0], request.format, csv_opts, target)
         else:
-            # Only PK columns, nothing to update
-            statements.append(
-                f"""INSERT INTO main.{TABLE_DATA_NAME} ({all_cols})
-                SELECT {all_cols} FROM staging
-                ON CONFLICT ({pk_cols}) DO NOTHING"""
+            read_sql = _build_read_files_sql(
+                file_paths, request.format, table_info["columns"], csv_opts
             )
+            load_sql = f"INSERT INTO {target} SELECT * FROM {read_sql}"
+        try:
+            return conn.execute(load_sql).fetchone()[0]
+        except duckdb.ConstraintException as e:
+            if dedup_mode == "fail_on_duplicates":
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail={
+                        "error": "duplicate_key",
+                        "message": f"Duplicate key violation: {str(e)}",
+                        "details": {"dedup_mode": dedup_mode},
+                    },
+                )
+            raise
+        except Exception as e:
+            error_msg = str(e)
+            logger.error(
+                "import_copy_failed",
+                error=error_msg,
+                request_id=request_id,
+            )
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "error": "import_failed",
+                    "message": f"Failed to load file: {error_msg}",
+                    "details": {
+                        "file_id": request.file_id,
+                        "file_count": len(file_paths),
+                        "format": request.format,
+                    },
+                },
+            )
+
+    def rows_per_file(loaded_rows: int) -> list[int | None]:
+        """Rows read from each file, in file_paths order."""
+        if len(file_paths) == 1:
+            return [loaded_rows]
+        if request.format != "parquet" and not request.report_file_rows:
+            return [None] * len(file_paths)
+        with duckdb.connect() as conn:
+            counts = dict(conn.execute(_build_file_row_counts_sql(
+                file_paths, request.format, table_info["columns"], csv_opts
+            )).fetchall())
+        return [counts.get(str(path), 0) for path in file_paths]
+
+    def import_job(conn: duckdb.DuckDBPyConnection) -> tuple[int, int, int]:
+        if not incremental:
+            # Full load - truncate table first
+            conn.execute(f"DELETE FROM main.{TABLE_DATA_NAME}")
+            logger.debug("import_table_truncated", request_id=request_id)
+
+        if not use_staging:
+            # Direct path: one COPY into the target, no second write
+            logger.debug("import_direct_copy", request_id=request_id)
+            loaded_rows = load_files(conn, f"main.{TABLE_DATA_NAME}")
+            if not incremental:
+                return loaded_rows, loaded_rows, loaded_rows
+            rows_after = conn.execute(
+                f"SELECT COUNT(*) FROM main.{TABLE_DATA_NAME}"
+            ).fetchone()[0]
+            return loaded_rows, rows_after, loaded_rows
+
+        # Stage 1: Create staging table and load data
+        logger.debug("import_stage_1_staging", request_id=request_id)
+
+        # Create staging table with same structure as target
+        column_defs = ", ".join([
+            f"{col['name']} {col['type']}"
+            for col in table_info["columns"]
+        ])
+        conn.execute(f"CREATE TEMPORARY TABLE staging ({column_defs})")
+        staging_rows = load_files(conn, "staging")
+        logger.debug(
+            "import_staging_complete",
+            staging_rows=staging_rows,
+            request_id=request_id,
+        )
 
-    return statements
+        # Stage 2: Transform - merge into target
+        logger.debug("import_stage_2_transform", request_id=request_id)
+
+        rows_before = 0
+        if incremental:
+            # Upserted rows are counted as imported only when new
+            rows_before = conn.execute(
+                f"SELECT COUNT(*) FROM main.{TABLE_DATA_NAME}"
+            ).fetchone()[0]
+        merged_rows = conn.execute(
+            _build_upsert_sql(target_columns, primary_key)
+        ).fetchone()[0]
+
+        # Stage 3: Cleanup and get stats
+        logger.debug("import_stage_3_cleanup", request_id=request_id)
+
+        conn.execute("DROP TABLE IF EXISTS staging")
+
+        if not incremental:
+            # Table was empty, so every merged row is a new row
+            return staging_rows, merged_rows, staging_rows
+        rows_after = conn.execute(
+            f"SELECT COUNT(*) FROM main.{TABLE_DATA_NAME}"
+        ).fetchone()[0]
+        return rows_after - rows_before, rows_after, staging_rows
+
+    # Full loads truncate the table, so only incremental imports are batched
+    imported_rows, rows_after, loaded_rows = table_write_queue.run(
+        project_id,
+        bucket_name,
+        table_name,
+        table_path,
+        import_job,
+        batch_key="incremental_import" if incremental else None,
+        row_count=lambda result: result[1],
+    )
+    return imported_rows, rows_after, rows_per_file(loaded_rows)
 
 
 @router.post(
@@ -234,7 +512,7 @@ def _build_dedup_sql(
         500: {"model": ErrorResponse},
     },
     summary="Import from file",
-    description="Import data from a file into a table using 3-stage pipeline. Requires default branch for MVP.",
+    description="Import data from one or more files into a table. Several files (file_ids or file_pattern) are loaded in one parallel scan and one commit. Plain loads are copied straight into the table; upserts go through a staging table. Requires default branch for MVP.",
     dependencies=[Depends(require_project_access)],
 )
 async def import_from_file(
@@ -247,13 +525,17 @@ async def import_from_file(
     """
     Import data from a file into a table.
 
-    This implements the 3-stage import pipeline:
+    Plain loads (no primary key, or dedup_mode other than
+    update_duplicates) COPY the file straight into the table. Upserts use
+    the 3-stage import pipeline:
     1. STAGING: Create staging table and load file data
     2. TRANSFORM: Deduplicate and merge into target
     3. CLEANUP: Drop staging table
 
     Supports:
     - CSV and Parquet formats
+    - One file (file_id) or several (file_ids, or file_pattern glob over
+      file names), e.g. sliced CSV - loaded in one scan, one commit
     - Full load (truncate + insert) or incremental (merge/upsert)
     - Deduplication based on primary key
 
@@ -276,6 +558,8 @@ async def import_from_file(
         bucket_name=bucket_name,
         table_name=table_name,
         file_id=request.file_id,
+        file_ids=request.file_ids,
+        file_pattern=request.file_pattern,
         format=request.format,
         incremental=request.import_options.incremental,
         dedup_mode=request.import_options.dedup_mode,
@@ -286,12 +570,20 @@ async def import_from_file(
     validate_project_and_bucket(resolved_project_id, resolved_branch_id, bucket_name)
 
     # Validate table exists
-    table_info = _validate_table_exists(
-        resolved_project_id, resolved_branch_id, bucket_name, table_name
+    table_info = await duckdb_executor.run(
+        "metadata",
+        _validate_table_exists,
+        resolved_project_id,
+        resolved_branch_id,
+        bucket_name,
+        table_name,
     )
 
-    # Get file path
-    file_path = _get_file_path(project_id, request.file_id)
+    # Resolve the file(s) to load
+    import_files = await duckdb_executor.run(
+        "metadata", _resolve_import_files, project_id, request
+    )
+    file_paths = [file_path for _, file_path in import_files]
 
     # Validate format
     if request.format not in ("csv", "parquet"):
@@ -307,108 +599,19 @@ async def import_from_file(
     # Get table path
     table_path = project_db_manager.get_table_path(project_id, bucket_name, table_name)
 
-    # Get column info from target table
-    target_columns = [col["name"] for col in table_info["columns"]]
-    primary_key = table_info.get("primary_key", [])
-
-    # Execute import with table lock
-    with table_lock_manager.acquire(project_id, bucket_name, table_name):
-        conn = duckdb.connect(str(table_path))
-        try:
-            # Get row count before
-            rows_before = conn.execute(
-                f"SELECT COUNT(*) FROM main.{TABLE_DATA_NAME}"
-            ).fetchone()[0]
-
-            # Stage 1: Create staging table and load data
-            logger.debug("import_stage_1_staging", request_id=request_id)
-
-            # Create staging table with same structure as target
-            column_defs = ", ".join([
-                f"{col['name']} {col['type']}"
-                for col in table_info["columns"]
-            ])
-            conn.execute(f"CREATE TEMPORARY TABLE staging ({column_defs})")
-
-            # Build and execute COPY FROM
-            csv_opts = request.csv_options.model_dump() if request.csv_options else None
-            copy_sql = _build_copy_from_sql(file_path, request.format, csv_opts)
-
-            try:
-                conn.execute(copy_sql)
-            except Exception as e:
-                error_msg = str(e)
-                logger.error(
-                    "import_copy_failed",
-                    error=error_msg,
-                    request_id=request_id,
-                )
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail={
-                        "error": "import_failed",
-                        "message": f"Failed to load file: {error_msg}",
-                        "details": {"file_id": request.file_id, "format": request.format},
-                    },
-                )
-
-            # Count rows in staging
-            staging_rows = conn.execute("SELECT COUNT(*) FROM staging").fetchone()[0]
-            logger.debug(
-                "import_staging_complete",
-                staging_rows=staging_rows,
-                request_id=request_id,
-            )
-
-            # Stage 2: Transform - truncate (if not incremental) and merge
-            logger.debug("import_stage_2_transform", request_id=request_id)
-
-            if not request.import_options.incremental:
-                # Full load - truncate table first
-                conn.execute(f"DELETE FROM main.{TABLE_DATA_NAME}")
-                logger.debug("import_table_truncated", request_id=request_id)
-
-            # Build and execute dedup/merge SQL
-            dedup_statements = _build_dedup_sql(
-                target_columns,
-                primary_key if primary_key else None,
-                request.import_options.dedup_mode,
-            )
-
-            try:
-                for sql in dedup_statements:
-                    conn.execute(sql)
-            except duckdb.ConstraintException as e:
-                if request.import_options.dedup_mode == "fail_on_duplicates":
-                    raise HTTPException(
-                        status_code=status.HTTP_409_CONFLICT,
-                        detail={
-                            "error": "duplicate_key",
-                            "message": f"Duplicate key violation: {str(e)}",
-                            "details": {"dedup_mode": request.import_options.dedup_mode},
-                        },
-                    )
-                raise
-
-            # Stage 3: Cleanup and get stats
-            logger.debug("import_stage_3_cleanup", request_id=request_id)
-
-            conn.execute("DROP TABLE IF EXISTS staging")
-            conn.commit()
-
-            # Get final stats
-            rows_after = conn.execute(
-                f"SELECT COUNT(*) FROM main.{TABLE_DATA_NAME}"
-            ).fetchone()[0]
-
-        finally:
-            conn.close()
-
-    # Calculate imported rows
-    if request.import_options.incremental:
-        imported_rows = rows_after - rows_before
-    else:
-        imported_rows = staging_rows  # Full load = staging count
+    # Execute import with table lock (off the event loop)
+    imported_rows, rows_after, file_rows = await duckdb_executor.run(
+        "data",
+        _run_import,
+        project_id,
+        bucket_name,
+        table_name,
+        table_path,
+        file_paths,
+        table_info,
+        request,
+        request_id,
+    )
 
     # Get table size after import
     table_size = table_path.stat().st_size
@@ -421,10 +624,8 @@ async def import_from_file(
         branch_id=branch_id,
         bucket_name=bucket_name,
         table_name=table_name,
-        file_id=request.file_id,
-        staging_rows=staging_rows,
+        file_count=len(import_files),
         imported_rows=imported_rows,
-        rows_before=rows_before,
         rows_after=rows_after,
         duration_ms=duration_ms,
         request_id=request_id,
@@ -439,7 +640,7 @@ async def import_from_file(
         resource_type="table",
         resource_id=f"{bucket_name}.{table_name}",
         details={
-            "file_id": request.file_id,
+            "file_ids": [record["id"] for record, _ in import_files],
             "format": request.format,
             "incremental": request.import_options.incremental,
             "imported_rows": imported_rows,
@@ -457,17 +658,72 @@ async def import_from_file(
     )
     metrics.IMPORT_ROWS_TOTAL.inc(imported_rows)
     metrics.IMPORT_BYTES_TOTAL.labels(format=request.format).inc(
-        file_path.stat().st_size
+        sum(record["size_bytes"] for record, _ in import_files)
     )
 
     return ImportResponse(
         imported_rows=imported_rows,
         table_rows_after=rows_after,
         table_size_bytes=table_size,
+        files=[
+            ImportedFileResponse(file_id=record["id"], name=record["name"], rows=rows)
+            for (record, _), rows in zip(import_files, file_rows)
+        ],
         warnings=warnings,
     )
 
 
+def _run_export(
+    table_path: Path,
+    columns_sql: str,
+    export_path: Path,
+    request: ExportRequest,
+) -> int:
+    """
+    Export table data to export_path with COPY TO (blocking).
+
+    Runs on the "data" lane of duckdb_executor.
+
+    Returns:
+        Number of exported rows
+    """
+    conn = duckdb.connect(str(table_path), read_only=True)
+    try:
+        # Build query
+        query = f"SELECT {columns_sql} FROM main.{TABLE_DATA_NAME}"
+        if request.where_filter:
+            query += f" WHERE {request.where_filter}"
+        if request.limit:
+            query += f" LIMIT {request.limit}"
+
+        # Count rows for export
+        count_query = f"SELECT COUNT(*) FROM ({query}) AS export_data"
+        rows_exported = conn.execute(count_query).fetchone()[0]
+
+        # Build COPY TO options
+        options = []
+        if request.format == "csv":
+            options.append("FORMAT CSV")
+            options.append("HEADER true")
+            if request.compression == "gzip":
+                options.append("COMPRESSION GZIP")
+        else:  # parquet
+            options.append("FORMAT PARQUET")
+            if request.compression:
+                options.append(f"COMPRESSION {request.compression.upper()}")
+
+        options_str = ", ".join(options)
+
+        # Execute COPY TO
+        copy_sql = f"COPY ({query}) TO '{export_path}' ({options_str})"
+        conn.execute(copy_sql)
+
+    finally:
+        conn.close()
+
+    return rows_exported
+
+
 @router.post(
     "/projects/{project_id}/branches/{branch_id}/buckets/{bucket_name}/tables/{table_name}/export",
     response_model=ExportResponse,
@@ -524,8 +780,13 @@ async def export_to_file(
     validate_project_and_bucket(resolved_project_id, resolved_branch_id, bucket_name)
 
     # Validate table exists
-    table_info = _validate_table_exists(
-        resolved_project_id, resolved_branch_id, bucket_name, table_name
+    table_info = await duckdb_executor.run(
+        "metadata",
+        _validate_table_exists,
+        resolved_project_id,
+        resolved_branch_id,
+        bucket_name,
+        table_name,
     )
 
     # Validate format
@@ -558,19 +819,7 @@ async def export_to_file(
         )
 
     # Validate WHERE clause if provided (basic SQL injection prevention)
-    if request.where_filter:
-        dangerous_patterns = [";", "--", "/*", "*/", "drop ", "truncate ", "alter ", "delete ", "insert ", "update "]
-        where_lower = request.where_filter.lower()
-        for pattern in dangerous_patterns:
-            if pattern in where_lower:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail={
-                        "error": "invalid_where_clause",
-                        "message": f"Invalid WHERE clause: contains '{pattern}'",
-                        "details": {"where_filter": request.where_filter},
-                    },
-                )
+    _validate_where_filter(request.where_filter)
 
     # Generate export file ID and path
     file_id = str(uuid.uuid4())
@@ -596,40 +845,13 @@ async def export_to_file(
     # Get table path
     table_path = project_db_manager.get_table_path(project_id, bucket_name, table_name)
 
-    # Execute export (read-only, no lock needed)
-    conn = duckdb.connect(str(table_path), read_only=True)
-    try:
-        # Build query
-        query = f"SELECT {columns_sql} FROM main.{TABLE_DATA_NAME}"
-        if request.where_filter:
-            query += f" WHERE {request.where_filter}"
-        if request.limit:
-            query += f" LIMIT {request.limit}"
-
-        # Count rows for export
-        count_query = f"SELECT COUNT(*) FROM ({query}) AS export_data"
-        rows_exported = conn.execute(count_query).fetchone()[0]
-
-        # Build COPY TO options
-        options = []
-        if request.format == "csv":
-            options.append("FORMAT CSV")
-            options.append("HEADER true")
-            if request.compression == "gzip":
-                options.append("COMPRESSION GZIP")
-        else:  # parquet
-            options.append("FORMAT PARQUET")
-            if request.compression:
-                options.append(f"COMPRESSION {request.compression.upper()}")
-
-        options_str = ", ".join(options)
-
-        # Execute COPY TO
-        copy_sql = f"COPY ({query}) TO '{export_path}' ({options_str})"
-        conn.execute(copy_sql)
+    # Execute export (read-only, no lock needed; off the event loop)
+    rows_exported = await duckdb_executor.run(
+        "data", _run_export, table_path, columns_sql, export_path, request
+    )
 
-    finally:
-        conn.close()
+    # Hash once now so S3 HEAD/GET of the export never read it
+    checksum_md5 = await duckdb_executor.run("data", file_md5, export_path)
 
     # Get file size
     file_size = export_path.stat().st_size
@@ -649,7 +871,11 @@ async def export_to_file(
         is_staged=False,
         expires_at=None,
         tags={"type": "export", "table": f"{bucket_name}.{table_name}"},
+        checksum_md5=checksum_md5,
     )
+    metadata_db.store_file_etag(export_path, checksum_md5)
+    object_index.add(export_path)
+    storage_usage.adjust(file_bytes=file_size)
 
     duration_ms = int((time.time() - start_time) * 1000)
 
@@ -697,3 +923,109 @@ async def export_to_file(
         rows_exported=rows_exported,
         file_size_bytes=file_size,
     )
+
+
+@router.get(
+    "/projects/{project_id}/branches/{branch_id}/buckets/{bucket_name}/tables/{table_name}/export/stream",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {ARROW_STREAM_MEDIA_TYPE: {}},
+            "description": "Arrow IPC stream of the selected rows",
+        },
+        400: {"model": ErrorResponse},
+        404: {"model": ErrorResponse},
+    },
+    summary="Stream table as Arrow",
+    description="Stream table rows as an Arrow IPC stream (ADR-011). No staging file is written. Requires default branch for MVP.",
+    dependencies=[Depends(require_project_access)],
+)
+async def export_arrow_stream(
+    project_id: str,
+    branch_id: str,
+    bucket_name: str,
+    table_name: str,
+    columns: list[str] | None = Query(
+        default=None, description="Columns to read (repeat the parameter; default all)"
+    ),
+    where_filter: str | None = Query(
+        default=None, description="SQL WHERE clause to filter rows (without 'WHERE' keyword)"
+    ),
+    limit: int | None = Query(default=None, ge=1, description="Maximum number of rows"),
+    batch_size: int = Query(
+        default=65536, ge=1, le=1_000_000, description="Rows per Arrow record batch"
+    ),
+) -> StreamingResponse:
+    """
+    Stream table data as Arrow IPC.
+
+    Rows go from DuckDB's record batch reader straight to the response -
+    no JSON serialization and no export file - so clients can pull
+    millions of rows with bounded server memory.
+
+    Note: MVP only supports default branch (branch_id = "default")
+    """
+    request_id = _get_request_id()
+
+    # Resolve branch context
+    resolved_project_id, resolved_branch_id = resolve_branch(project_id, branch_id)
+
+    # MVP: Import/Export only allowed on default branch
+    require_default_branch(resolved_branch_id, "export data")
+
+    logger.info(
+        "export_arrow_stream_start",
+        project_id=project_id,
+        branch_id=branch_id,
+        bucket_name=bucket_name,
+        table_name=table_name,
+        columns=columns,
+        limit=limit,
+        request_id=request_id,
+    )
+
+    # Validate project and bucket
+    validate_project_and_bucket(resolved_project_id, resolved_branch_id, bucket_name)
+
+    # Validate table exists
+    await duckdb_executor.run(
+        "metadata",
+        _validate_table_exists,
+        resolved_project_id,
+        resolved_branch_id,
+        bucket_name,
+        table_name,
+    )
+
+    _validate_where_filter(where_filter)
+
+    try:
+        stream = await duckdb_executor.run(
+            "data",
+            project_db_manager.open_table_arrow_stream,
+            project_id=project_id,
+            bucket_name=bucket_name,
+            table_name=table_name,
+            columns=columns,
+            where_filter=where_filter,
+            limit=limit,
+            batch_size=batch_size,
+        )
+    except (ValueError, duckdb.Error) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error": "invalid_stream_request",
+                "message": str(e),
+                "details": {"columns": columns, "where_filter": where_filter},
+            },
+        )
+
+    metrics.EXPORT_OPERATIONS_TOTAL.labels(format="arrow", status="success").inc()
+
+    # Starlette iterates the sync generator in its threadpool
+    return StreamingResponse(
+        stream,
+        media_type=ARROW_STREAM_MEDIA_TYPE,
+        headers={"Content-Disposition": f"attachment; filename={table_name}.arrow"},
+    )
@@ -22,7 +22,7 @@ from src.branch_utils import (
     validate_project_and_bucket,
     require_default_branch,
 )
-from src.database import metadata_db, project_db_manager
+from src.database import duckdb_executor, metadata_db, project_db_manager
 from src.dependencies import require_project_access
 from src.models.responses import (
     AddColumnRequest,
@@ -30,6 +30,7 @@ from src.models.responses import (
     ColumnCorrelation,
     ColumnInfo,
     ColumnStatistics,
+    CorrelationMatrix,
     DeleteRowsRequest,
     DeleteRowsResponse,
     DetectedPattern,
@@ -138,7 +139,9 @@ async def add_column(
     _validate_table_exists(resolved_project_id, bucket_name, table_name)
 
     # Check if column already exists
-    table_info = project_db_manager.get_table(
+    table_info = await duckdb_executor.run(
+        "metadata",
+        project_db_manager.get_table,
         resolved_project_id, bucket_name, table_name
     )
     existing_columns = {col["name"] for col in table_info["columns"]}
@@ -156,7 +159,9 @@ async def add_column(
         )
 
     try:
-        table_data = project_db_manager.add_column(
+        table_data = await duckdb_executor.run(
+            "data",
+            project_db_manager.add_column,
             project_id=resolved_project_id,
             bucket_name=bucket_name,
             table_name=table_name,
@@ -297,7 +302,9 @@ async def drop_column(
     _validate_table_exists(resolved_project_id, bucket_name, table_name)
 
     # Check if column exists
-    table_info = project_db_manager.get_table(
+    table_info = await duckdb_executor.run(
+        "metadata",
+        project_db_manager.get_table,
         resolved_project_id, bucket_name, table_name
     )
     existing_columns = {col["name"] for col in table_info["columns"]}
@@ -349,6 +356,7 @@ async def drop_column(
                 table_name=table_name,
                 snapshot_type="auto_predrop_column",
                 description=f"Auto-backup before DROP COLUMN {bucket_name}.{table_name}.{column_name}",
+                background=True,
             )
             logger.info(
                 "auto_snapshot_created_before_drop_column",
@@ -369,7 +377,9 @@ async def drop_column(
             )
 
     try:
-        table_data = project_db_manager.drop_column(
+        table_data = await duckdb_executor.run(
+            "data",
+            project_db_manager.drop_column,
             project_id=resolved_project_id,
             bucket_name=bucket_name,
             table_name=table_name,
@@ -508,7 +518,9 @@ async def alter_column(
     _validate_table_exists(resolved_project_id, bucket_name, table_name)
 
     # Check if column exists
-    table_info = project_db_manager.get_table(
+    table_info = await duckdb_executor.run(
+        "metadata",
+        project_db_manager.get_table,
         resolved_project_id, bucket_name, table_name
     )
     existing_columns = {col["name"] for col in table_info["columns"]}
@@ -554,7 +566,9 @@ async def alter_column(
             )
 
     try:
-        table_data = project_db_manager.alter_column(
+        table_data = await duckdb_executor.run(
+            "data",
+            project_db_manager.alter_column,
             project_id=resolved_project_id,
             bucket_name=bucket_name,
             table_name=table_name,
@@ -706,7 +720,9 @@ async def add_primary_key(
     _validate_table_exists(resolved_project_id, bucket_name, table_name)
 
     # Check if columns exist
-    table_info = project_db_manager.get_table(
+    table_info = await duckdb_executor.run(
+        "metadata",
+        project_db_manager.get_table,
         resolved_project_id, bucket_name, table_name
     )
     existing_columns = {col["name"] for col in table_info["columns"]}
@@ -736,7 +752,9 @@ async def add_primary_key(
         )
 
     try:
-        table_data = project_db_manager.add_primary_key(
+        table_data = await duckdb_executor.run(
+            "data",
+            project_db_manager.add_primary_key,
             project_id=resolved_project_id,
             bucket_name=bucket_name,
             table_name=table_name,
@@ -875,7 +893,9 @@ async def drop_primary_key(
     _validate_table_exists(resolved_project_id, bucket_name, table_name)
 
     # Check if table has a primary key
-    table_info = project_db_manager.get_table(
+    table_info = await duckdb_executor.run(
+        "metadata",
+        project_db_manager.get_table,
         resolved_project_id, bucket_name, table_name
     )
     if not table_info.get("primary_key"):
@@ -889,7 +909,9 @@ async def drop_primary_key(
         )
 
     try:
-        table_data = project_db_manager.drop_primary_key(
+        table_data = await duckdb_executor.run(
+            "data",
+            project_db_manager.drop_primary_key,
             project_id=resolved_project_id,
             bucket_name=bucket_name,
             table_name=table_name,
@@ -1063,6 +1085,7 @@ async def delete_rows(
                     table_name=table_name,
                     snapshot_type="auto_pretruncate",
                     description=f"Auto-backup before DELETE ALL ROWS from {bucket_name}.{table_name}",
+                    background=True,
                 )
                 logger.info(
                     "auto_snapshot_created_before_truncate",
@@ -1081,7 +1104,9 @@ async def delete_rows(
                 )
 
     try:
-        result = project_db_manager.delete_table_rows(
+        result = await duckdb_executor.run(
+            "data",
+            project_db_manager.delete_table_rows,
             project_id=resolved_project_id,
             bucket_name=bucket_name,
             table_name=table_name,
@@ -1192,6 +1217,15 @@ async def profile_table(
         default="basic",
         description="Profile mode: basic (default), full (all features), distribution (histograms), quality (correlations & patterns)",
     ),
+    sample_size: int | None = Query(
+        default=None,
+        ge=1,
+        description="Profile a uniform random sample of this many rows instead of the whole table",
+    ),
+    refresh: bool = Query(
+        default=False,
+        description="Recompute the profile even if a stored one is still current",
+    ),
 ) -> TableProfileResponse:
     """
     Get advanced statistical profile of a table.
@@ -1203,10 +1237,18 @@ async def profile_table(
     - `quality`: Focus on data quality with pattern detection and correlations
 
     **Statistics included:**
-    - Basic: min, max, count, null%, unique count, cardinality class
+    - Basic: min, max, count, null%, unique count (estimated in basic mode), cardinality class
     - Numeric: avg, std, skewness, kurtosis, percentiles (q01-q99), outlier detection
     - String: avg/min/max length, empty count, pattern detection (email, UUID, URL, etc.)
-    - Quality: quality score, issues/recommendations, column correlations
+    - Quality: quality score, issues/recommendations, correlation matrix and significant correlations
+
+    **Large tables:** with `sample_size` the statistics are computed on a
+    reservoir sample of that many rows; the response reports `profiled_rows`
+    and the 95% `margin_of_error` of sampled percentages.
+
+    Profiles are stored per table version (file signature), so repeating a
+    request returns the stored profile (`cached: true`) until the table
+    changes. Use `refresh=true` to recompute.
 
     This is a read-only operation and does not modify data.
     """
@@ -1223,6 +1265,7 @@ async def profile_table(
         bucket_name=bucket_name,
         table_name=table_name,
         mode=mode,
+        sample_size=sample_size,
         request_id=request_id,
     )
 
@@ -1233,11 +1276,15 @@ async def profile_table(
     _validate_table_exists(resolved_project_id, bucket_name, table_name)
 
     try:
-        profile_data = project_db_manager.get_table_profile(
+        profile_data = await duckdb_executor.run(
+            "data",
+            project_db_manager.get_table_profile,
             project_id=resolved_project_id,
             bucket_name=bucket_name,
             table_name=table_name,
             mode=mode,
+            sample_size=sample_size,
+            refresh=refresh,
         )
 
         duration_ms = int((time.time() - start_time) * 1000)
@@ -1254,6 +1301,8 @@ async def profile_table(
                 "column_count": profile_data["column_count"],
                 "mode": mode,
                 "quality_score": profile_data.get("quality_score"),
+                "sample_size": sample_size,
+                "cached": profile_data["cached"],
                 "branch_id": branch_id,
             },
             duration_ms=duration_ms,
@@ -1269,6 +1318,7 @@ async def profile_table(
             row_count=profile_data["row_count"],
             column_count=profile_data["column_count"],
             quality_score=profile_data.get("quality_score"),
+            cached=profile_data["cached"],
             duration_ms=duration_ms,
         )
 
@@ -1291,6 +1341,9 @@ async def profile_table(
         correlations = None
         if profile_data.get("correlations"):
             correlations = [ColumnCorrelation(**corr) for corr in profile_data["correlations"]]
+        correlation_matrix = None
+        if profile_data.get("correlation_matrix"):
+            correlation_matrix = CorrelationMatrix(**profile_data["correlation_matrix"])
 
         return TableProfileResponse(
             table_name=profile_data["table_name"],
@@ -1301,6 +1354,12 @@ async def profile_table(
             quality_score=profile_data.get("quality_score"),
             quality_issues=quality_issues,
             correlations=correlations,
+            correlation_matrix=correlation_matrix,
+            sampled=profile_data["sampled"],
+            profiled_rows=profile_data["profiled_rows"],
+            margin_of_error=profile_data.get("margin_of_error"),
+            cached=profile_data["cached"],
+            profiled_at=profile_data["profiled_at"],
         )
 
     except HTTPException:
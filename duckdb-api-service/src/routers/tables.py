@@ -21,7 +21,8 @@ from typing import Any, Literal
 
 import structlog
 import duckdb
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 
 from src.branch_utils import (
     get_table_source,
@@ -30,7 +31,14 @@ from src.branch_utils import (
     validate_project_and_bucket,
     validate_project_db_exists,
 )
-from src.database import metadata_db, project_db_manager, TABLE_DATA_NAME
+from src.database import (
+    ARROW_STREAM_MEDIA_TYPE,
+    TABLE_DATA_NAME,
+    duckdb_executor,
+    metadata_db,
+    project_db_manager,
+    table_catalog_cache,
+)
 from src.dependencies import require_project_access
 from src.models.responses import (
     ColumnInfo,
@@ -240,6 +248,7 @@ async def create_table(
                 }
             finally:
                 conn.close()
+                table_catalog_cache.invalidate(table_path)
 
             # Record in branch_tables metadata
             metadata_db.mark_table_copied_to_branch(
@@ -367,7 +376,9 @@ async def list_tables(
     try:
         if resolved_branch_id is None:
             # Default branch - list from main
-            tables_data = project_db_manager.list_tables(
+            tables_data = await duckdb_executor.run(
+                "metadata",
+                project_db_manager.list_tables,
                 resolved_project_id, bucket_name
             )
             tables = [
@@ -385,7 +396,9 @@ async def list_tables(
             ]
         else:
             # Dev branch - merge main + branch tables
-            main_tables = project_db_manager.list_tables(
+            main_tables = await duckdb_executor.run(
+                "metadata",
+                project_db_manager.list_tables,
                 resolved_project_id, bucket_name
             )
             branch_tables_meta = metadata_db.get_branch_tables(resolved_branch_id)
@@ -479,7 +492,9 @@ async def get_table(
     )
 
     # Get table data from effective location (follows links)
-    table_data = project_db_manager.get_table(
+    table_data = await duckdb_executor.run(
+        "metadata",
+        project_db_manager.get_table,
         effective_project_id, effective_bucket_name, table_name
     )
     if not table_data:
@@ -578,6 +593,7 @@ async def delete_table(
                         table_name=table_name,
                         snapshot_type="auto_predrop",
                         description=f"Auto-backup before DROP TABLE {bucket_name}.{table_name}",
+                        background=True,
                     )
                     logger.info(
                         "auto_snapshot_created_before_drop",
@@ -710,13 +726,18 @@ async def delete_table(
 @router.get(
     "/projects/{project_id}/branches/{branch_id}/buckets/{bucket_name}/tables/{table_name}/preview",
     response_model=TablePreviewResponse,
-    responses={404: {"model": ErrorResponse}},
+    responses={
+        200: {"content": {ARROW_STREAM_MEDIA_TYPE: {}}},
+        404: {"model": ErrorResponse},
+    },
     summary="Preview table",
     description="""
     Get a preview of table data (first N rows).
 
     - For default branch: previews from main
     - For dev branches: previews from branch if CoW'd, otherwise from main
+    - Send `Accept: application/vnd.apache.arrow.stream` to get the rows
+      as an Arrow IPC stream instead of JSON
     """,
     dependencies=[Depends(require_project_access)],
 )
@@ -731,6 +752,7 @@ async def preview_table(
         le=10000,
         description="Maximum number of rows to return (1-10000)",
     ),
+    accept: str | None = Header(default=None),
 ) -> TablePreviewResponse:
     """Get a preview of table data - branch-aware."""
     # Resolve branch
@@ -771,8 +793,22 @@ async def preview_table(
         )
 
     try:
+        if accept and ARROW_STREAM_MEDIA_TYPE in accept:
+            # Arrow IPC: record batches straight from DuckDB, no per-value conversion
+            stream = await duckdb_executor.run(
+                "data",
+                project_db_manager.open_table_arrow_stream,
+                project_id=effective_project_id,
+                bucket_name=effective_bucket_name,
+                table_name=table_name,
+                limit=limit,
+            )
+            return StreamingResponse(stream, media_type=ARROW_STREAM_MEDIA_TYPE)
+
         # Get preview data from effective location (follows links)
-        preview_data = project_db_manager.get_table_preview(
+        preview_data = await duckdb_executor.run(
+            "data",
+            project_db_manager.get_table_preview,
             project_id=effective_project_id,
             bucket_name=effective_bucket_name,
             table_name=table_name,
@@ -538,8 +538,11 @@ async def drop_workspace_object(
     description="""
     Load tables from project buckets into workspace.
 
-    This operation copies table data into the workspace DuckDB instance.
-    Changes in workspace don't affect source tables.
+    Each table spec accepts an optional "mode":
+    - clone (default): copy the selected columns/rows into a workspace table.
+      Changes in workspace don't affect source tables.
+    - view: create a read-only view over the source table without copying
+      any data. The view always reflects the current source table.
     """,
 )
 async def load_data(
@@ -560,6 +563,7 @@ async def load_data(
         destination = table_spec.get("destination")
         columns = table_spec.get("columns")
         where_clause = table_spec.get("where")
+        mode = table_spec.get("mode", "clone")
 
         # Parse source (format: bucket.table)
         parts = source.split(".")
@@ -600,12 +604,14 @@ async def load_data(
                 columns=columns,
                 where_clause=where_clause,
                 branch_id=workspace.get("branch_id"),
+                mode=mode,
             )
 
             results.append(
                 WorkspaceLoadTableResult(
                     source=source,
                     destination=dest_table,
+                    mode=mode,
                     rows=load_result["rows"],
                     size_bytes=load_result["size_bytes"],
                 )
@@ -618,6 +624,7 @@ async def load_data(
                 workspace_id=workspace_id,
                 source=source,
                 destination=dest_table,
+                mode=mode,
                 rows=load_result["rows"],
             )
 
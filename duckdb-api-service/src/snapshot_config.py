@@ -27,9 +27,18 @@ SYSTEM_DEFAULTS: dict[str, Any] = {
         "manual_days": 90,         # Manual snapshots: 90 days
         "auto_days": 7,            # Auto snapshots: 7 days
     },
+    "storage": {
+        "compression": "zstd",     # Parquet codec
+        "row_group_size": 122880,  # Rows per Parquet row group
+        "incremental": False,      # Reuse unchanged row ranges of the previous snapshot
+        "part_rows": 1000000,      # Row range size for incremental snapshots
+    },
     "enabled": True,               # Master switch
 }
 
+# Parquet codecs accepted by DuckDB's COPY ... (FORMAT PARQUET)
+PARQUET_COMPRESSIONS = {"uncompressed", "snappy", "gzip", "zstd", "lz4", "brotli"}
+
 
 def deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
     """
@@ -233,6 +242,21 @@ def get_retention_days(
         return retention.get("auto_days", 7)
 
 
+def get_storage_config(
+    project_id: str,
+    bucket_name: str | None = None,
+    table_name: str | None = None,
+) -> dict[str, Any]:
+    """
+    Get Parquet storage options for snapshots of a table.
+
+    Returns:
+        Dict with compression, row_group_size, incremental and part_rows
+    """
+    config, _ = resolve_snapshot_config(project_id, bucket_name, table_name)
+    return config.get("storage", SYSTEM_DEFAULTS["storage"])
+
+
 def validate_config(config: dict[str, Any]) -> list[str]:
     """
     Validate a snapshot configuration.
@@ -273,6 +297,29 @@ def validate_config(config: dict[str, Any]) -> list[str]:
                 if isinstance(value, int) and value > 3650:  # 10 years max
                     errors.append(f"Retention {key} cannot exceed 3650 days")
 
+    # Validate storage
+    if "storage" in config:
+        storage = config["storage"]
+        if not isinstance(storage, dict):
+            errors.append("storage must be an object")
+        else:
+            valid_storage = {"compression", "row_group_size", "incremental", "part_rows"}
+            for key, value in storage.items():
+                if key not in valid_storage:
+                    errors.append(f"Unknown storage key: {key}. Valid: {valid_storage}")
+            compression = storage.get("compression")
+            if compression is not None and compression not in PARQUET_COMPRESSIONS:
+                errors.append(
+                    f"Unknown compression: {compression}. Valid: {PARQUET_COMPRESSIONS}"
+                )
+            for key in ("row_group_size", "part_rows"):
+                value = storage.get(key)
+                if value is not None and (not isinstance(value, int) or value < 1024):
+                    errors.append(f"Storage {key} must be an integer >= 1024")
+            incremental = storage.get("incremental")
+            if incremental is not None and not isinstance(incremental, bool):
+                errors.append("Storage incremental must be a boolean")
+
     # Validate enabled
     if "enabled" in config:
         if not isinstance(config["enabled"], bool):
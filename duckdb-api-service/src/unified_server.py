@@ -28,6 +28,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "generated"))
 from proto import service_pb2_grpc
 from src.main import app
 from src.grpc.servicer import StorageDriverServicer
+from src.grpc.server import add_streaming_handlers
 from src.database import MetadataDB, ProjectDBManager
 from src.config import settings
 
@@ -65,6 +66,7 @@ class GRPCServerManager:
 
         servicer = StorageDriverServicer(self.metadata_db, self.project_manager)
         service_pb2_grpc.add_StorageDriverServiceServicer_to_server(servicer, self.server)
+        add_streaming_handlers(servicer, self.server)
 
         address = f"{self.host}:{self.port}"
         self.server.add_insecure_port(address)
@@ -0,0 +1,140 @@
+"""Tests for the in-process API key cache and batched last_used_at writes."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src import metrics
+from src.auth import get_key_prefix, hash_key
+from src.database import ApiKeyCache, api_key_cache, metadata_db
+
+
+def _counter_value(counter) -> float:
+    """Read current value of a prometheus counter."""
+    return counter._value.get()
+
+
+@pytest.fixture
+def project_key(client, initialized_backend, admin_headers) -> tuple[str, str]:
+    """Create a project and return (project_id, project admin API key)."""
+    api_key_cache.clear()
+    response = client.post(
+        "/projects",
+        json={"id": "key_cache_proj", "name": "Key Cache"},
+        headers=admin_headers,
+    )
+    assert response.status_code == 201
+
+    yield "key_cache_proj", response.json()["api_key"]
+
+    api_key_cache.clear()
+
+
+class TestApiKeyCache:
+    """Tests for ApiKeyCache and its use by the auth dependencies."""
+
+    def test_repeated_auth_served_from_cache(self, client, project_key, monkeypatch):
+        """Test that a second request does not look the key up in metadata DB."""
+        project_id, api_key = project_key
+        headers = {"Authorization": f"Bearer {api_key}"}
+        assert client.get(f"/projects/{project_id}", headers=headers).status_code == 200
+        hits_before = _counter_value(metrics.API_KEY_CACHE_HITS)
+
+        def fail_lookup(key_prefix):
+            raise AssertionError("key lookup should be served from cache")
+
+        monkeypatch.setattr(metadata_db, "get_api_key_by_prefix", fail_lookup)
+        response = client.get(f"/projects/{project_id}", headers=headers)
+
+        assert response.status_code == 200
+        assert _counter_value(metrics.API_KEY_CACHE_HITS) == hits_before + 1
+
+    def test_wrong_key_not_cached(self, client, project_key):
+        """Test that a key with a valid prefix but wrong secret is rejected."""
+        project_id, api_key = project_key
+        tampered = api_key[:-1] + ("0" if api_key[-1] != "0" else "1")
+
+        response = client.get(
+            f"/projects/{project_id}", headers={"Authorization": f"Bearer {tampered}"}
+        )
+
+        assert response.status_code == 403
+        assert api_key_cache.get(hash_key(tampered)) is None
+
+    def test_revoke_invalidates(self, client, project_key):
+        """Test that a key revoked by rotation stops working immediately."""
+        project_id, api_key = project_key
+        headers = {"Authorization": f"Bearer {api_key}"}
+        keys = client.get(f"/projects/{project_id}/api-keys", headers=headers).json()["api_keys"]
+        assert len(api_key_cache) == 1
+
+        response = client.post(
+            f"/projects/{project_id}/api-keys/{keys[0]['id']}/rotate", headers=headers
+        )
+        assert response.status_code == 201
+        new_headers = {"Authorization": f"Bearer {response.json()['api_key']}"}
+
+        assert client.get(f"/projects/{project_id}", headers=headers).status_code == 403
+        assert client.get(f"/projects/{project_id}", headers=new_headers).status_code == 200
+
+    def test_project_delete_invalidates(self, client, project_key, admin_headers):
+        """Test that deleting a project drops its cached keys."""
+        project_id, api_key = project_key
+        headers = {"Authorization": f"Bearer {api_key}"}
+        assert client.get(f"/projects/{project_id}", headers=headers).status_code == 200
+        assert len(api_key_cache) == 1
+
+        client.delete(f"/projects/{project_id}", headers=admin_headers)
+
+        assert len(api_key_cache) == 0
+
+    def test_last_used_written_on_flush(self, client, project_key):
+        """Test that auth defers last_used_at until flush_last_used()."""
+        project_id, api_key = project_key
+        headers = {"Authorization": f"Bearer {api_key}"}
+        key_prefix = get_key_prefix(api_key)
+
+        for _ in range(3):
+            assert client.get(f"/projects/{project_id}", headers=headers).status_code == 200
+
+        assert metadata_db.get_api_key_by_prefix(key_prefix)["last_used_at"] is None
+
+        assert api_key_cache.flush_last_used(metadata_db) == 1
+        assert metadata_db.get_api_key_by_prefix(key_prefix)["last_used_at"] is not None
+        assert api_key_cache.flush_last_used(metadata_db) == 0
+
+    def test_failed_flush_keeps_pending(self, monkeypatch):
+        """Test that timestamps survive a failed flush."""
+        cache = ApiKeyCache(ttl_seconds=30, max_entries=10)
+        cache.record_use("key-1")
+
+        def fail(last_used):
+            raise RuntimeError("database is locked")
+
+        monkeypatch.setattr(metadata_db, "update_api_keys_last_used", fail)
+        with pytest.raises(RuntimeError):
+            cache.flush_last_used(metadata_db)
+
+        written = {}
+        monkeypatch.setattr(metadata_db, "update_api_keys_last_used", written.update)
+        assert cache.flush_last_used(metadata_db) == 1
+        assert list(written) == ["key-1"]
+
+    def test_entry_does_not_outlive_key_expiry(self):
+        """Test that keys already past expires_at are not cached."""
+        cache = ApiKeyCache(ttl_seconds=30, max_entries=10)
+        expired = (datetime.now(timezone.utc) - timedelta(seconds=1)).isoformat()
+
+        cache.put("hash", {"id": "k", "project_id": "p", "expires_at": expired})
+
+        assert cache.get("hash") is None
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted at max_entries."""
+        cache = ApiKeyCache(ttl_seconds=30, max_entries=2)
+        for i in range(3):
+            cache.put(f"hash-{i}", {"id": f"k{i}", "project_id": "p"})
+
+        assert len(cache) == 2
+        assert cache.get("hash-0") is None
+        assert cache.get("hash-2")["id"] == "k2"
@@ -604,6 +604,51 @@ class TestBranchCopyOnWrite:
         assert main_count_before == main_count_after
 
 
+class TestCloneFile:
+    """Tests for clone_file (strategy used by branch CoW)."""
+
+    def test_auto_clones_content(self, tmp_path):
+        from src.database import (
+            COW_STRATEGY_COPY,
+            COW_STRATEGY_COPY_RANGE,
+            COW_STRATEGY_REFLINK,
+            clone_file,
+        )
+
+        source = tmp_path / "source.duckdb"
+        source.write_bytes(b"duckdb" * 100000)
+        target = tmp_path / "target.duckdb"
+
+        strategy = clone_file(source, target)
+
+        assert strategy in (COW_STRATEGY_REFLINK, COW_STRATEGY_COPY_RANGE, COW_STRATEGY_COPY)
+        assert target.read_bytes() == source.read_bytes()
+        assert target.stat().st_mtime == source.stat().st_mtime
+
+    def test_copy_strategy_forces_plain_copy(self, tmp_path):
+        from src.database import COW_STRATEGY_COPY, clone_file
+
+        source = tmp_path / "source.duckdb"
+        source.write_bytes(b"data")
+        target = tmp_path / "target.duckdb"
+
+        assert clone_file(source, target, strategy="copy") == COW_STRATEGY_COPY
+        assert target.read_bytes() == b"data"
+
+    def test_falls_back_when_reflink_unsupported(self, tmp_path, monkeypatch):
+        import src.database as database
+
+        monkeypatch.setattr(database, "_try_reflink", lambda source, target: False)
+        monkeypatch.setattr(database, "_try_copy_file_range", lambda source, target: False)
+
+        source = tmp_path / "source.duckdb"
+        source.write_bytes(b"data")
+        target = tmp_path / "target.duckdb"
+
+        assert database.clone_file(source, target) == database.COW_STRATEGY_COPY
+        assert target.read_bytes() == b"data"
+
+
 class TestEnsureTableInBranch:
     """Test the ensure_table_in_branch helper function."""
 
@@ -0,0 +1,102 @@
+"""Tests for DuckDBExecutor (bounded thread pools for blocking DuckDB work)."""
+
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from src import metrics
+from src.database import DuckDBExecutor
+
+
+def _queue_depth(lane: str) -> float:
+    return metrics.DUCKDB_EXECUTOR_QUEUE_DEPTH.labels(lane=lane)._value.get()
+
+
+class TestDuckDBExecutor:
+    """Unit tests for DuckDBExecutor."""
+
+    async def test_run_returns_result_off_event_loop(self):
+        """Test that work runs on a lane thread and returns its result."""
+        executor = DuckDBExecutor()
+        loop_thread = threading.current_thread()
+
+        try:
+            thread, value = await executor.run(
+                "data", lambda x, y=0: (threading.current_thread(), x + y), 1, y=2
+            )
+        finally:
+            executor.shutdown()
+
+        assert value == 3
+        assert thread is not loop_thread
+        assert thread.name.startswith("duckdb-data")
+
+    async def test_run_propagates_exceptions(self):
+        """Test that HTTPException raised in a worker reaches the caller."""
+        executor = DuckDBExecutor()
+
+        def fail():
+            raise HTTPException(status_code=404, detail="missing")
+
+        try:
+            with pytest.raises(HTTPException) as exc_info:
+                await executor.run("metadata", fail)
+        finally:
+            executor.shutdown()
+
+        assert exc_info.value.status_code == 404
+
+    async def test_unknown_lane_rejected(self):
+        """Test that an unknown lane name raises ValueError."""
+        executor = DuckDBExecutor()
+
+        with pytest.raises(ValueError):
+            await executor.run("bulk", lambda: None)
+
+    async def test_lane_is_bounded(self, monkeypatch):
+        """Test that a lane runs at most its configured number of operations."""
+        monkeypatch.setattr("src.config.settings.duckdb_data_executor_workers", 1)
+        executor = DuckDBExecutor()
+        release = threading.Event()
+        depth_before = _queue_depth("data")
+
+        try:
+            first = asyncio.create_task(executor.run("data", release.wait, 5))
+            second = asyncio.create_task(executor.run("data", lambda: "done"))
+            await asyncio.sleep(0.1)
+
+            # Second call is queued behind the first on the single worker
+            assert not second.done()
+            assert _queue_depth("data") == depth_before + 1
+
+            release.set()
+            assert await second == "done"
+            await first
+        finally:
+            release.set()
+            executor.shutdown()
+
+        assert _queue_depth("data") == depth_before
+
+    async def test_lanes_are_independent(self, monkeypatch):
+        """Test that a busy data lane does not block metadata calls."""
+        monkeypatch.setattr("src.config.settings.duckdb_data_executor_workers", 1)
+        executor = DuckDBExecutor()
+        release = threading.Event()
+
+        try:
+            busy = asyncio.create_task(executor.run("data", release.wait, 5))
+            await asyncio.sleep(0.05)
+
+            result = await asyncio.wait_for(
+                executor.run("metadata", lambda: "fast"), timeout=2
+            )
+
+            assert result == "fast"
+            assert not busy.done()
+        finally:
+            release.set()
+            await busy
+            executor.shutdown()
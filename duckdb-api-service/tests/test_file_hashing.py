@@ -0,0 +1,18 @@
+"""Tests for shared file hashing helpers."""
+
+import hashlib
+
+from src.file_hashing import HASH_CHUNK_SIZE, file_md5, hash_file
+
+
+def test_hash_file_matches_hashlib_across_chunks(tmp_path):
+    """Test that several digests from one pass match hashlib over the whole file."""
+    data = b"x" * (HASH_CHUNK_SIZE + 17)
+    path = tmp_path / "data.bin"
+    path.write_bytes(data)
+
+    assert hash_file(path, "sha256", "md5") == (
+        hashlib.sha256(data).hexdigest(),
+        hashlib.md5(data).hexdigest(),
+    )
+    assert file_md5(path) == hashlib.md5(data).hexdigest()
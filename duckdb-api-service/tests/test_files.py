@@ -1,11 +1,13 @@
 """Tests for Files API endpoints."""
 
+import hashlib
 import io
 import pytest
 from fastapi.testclient import TestClient
 
 from src.main import app
 from src.config import settings
+from src.database import metadata_db
 
 
 @pytest.fixture
@@ -230,6 +232,138 @@ class TestFileRegister:
         assert response.json()["detail"]["error"] == "file_not_uploaded"
 
 
+class TestChunkedUpload:
+    """Test resumable chunked uploads."""
+
+    CONTENT = b"".join(f"{i},row {i}\n".encode() for i in range(200))
+
+    @pytest.fixture
+    def upload(self, client, project_with_auth):
+        """Prepare an upload with a declared size and return (base url, upload_key, headers)."""
+        headers = {"Authorization": f"Bearer {project_with_auth['api_key']}"}
+        response = client.post(
+            f"/projects/{project_with_auth['project_id']}/files/prepare",
+            json={"filename": "chunked.csv", "size_bytes": len(self.CONTENT)},
+            headers=headers,
+        )
+        upload_key = response.json()["upload_key"]
+        return f"/projects/{project_with_auth['project_id']}/files", upload_key, headers
+
+    def _put_chunk(self, client, upload, offset: int, data: bytes, checksum: str | None = None):
+        base_url, upload_key, headers = upload
+        if checksum is not None:
+            headers = {**headers, "X-Checksum-Sha256": checksum}
+        return client.put(
+            f"{base_url}/upload/{upload_key}/chunks/{offset}", content=data, headers=headers
+        )
+
+    def test_chunks_out_of_order_then_register(self, client, upload):
+        """Test that chunks sent in any order assemble into the original file."""
+        base_url, upload_key, headers = upload
+        offsets = list(range(0, len(self.CONTENT), 1000))
+        for offset in reversed(offsets):
+            chunk = self.CONTENT[offset:offset + 1000]
+            response = self._put_chunk(
+                client, upload, offset, chunk, hashlib.sha256(chunk).hexdigest()
+            )
+            assert response.status_code == 200
+            assert response.json()["size_bytes"] == len(chunk)
+
+        response = client.post(base_url, json={"upload_key": upload_key}, headers=headers)
+        assert response.status_code == 201
+        data = response.json()
+        assert data["size_bytes"] == len(self.CONTENT)
+        assert data["checksum_sha256"] == hashlib.sha256(self.CONTENT).hexdigest()
+
+        download = client.get(f"{base_url}/{data['id']}/download", headers=headers)
+        assert download.content == self.CONTENT
+        assert download.headers["ETag"] == f'"{hashlib.md5(self.CONTENT).hexdigest()}"'
+
+    def test_status_lists_received_chunks(self, client, upload):
+        """Test that the upload status shows what to resume."""
+        base_url, upload_key, headers = upload
+        self._put_chunk(client, upload, 0, self.CONTENT[:500])
+        self._put_chunk(client, upload, 1000, self.CONTENT[1000:1500])
+
+        response = client.get(f"{base_url}/upload/{upload_key}", headers=headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["uploaded_bytes"] == 1000
+        assert data["complete"] is False
+        assert [(c["offset"], c["size_bytes"]) for c in data["chunks"]] == [(0, 500), (1000, 500)]
+
+    def test_register_incomplete_upload(self, client, upload):
+        """Test that register reports the byte ranges still missing."""
+        base_url, upload_key, headers = upload
+        self._put_chunk(client, upload, 0, self.CONTENT[:500])
+
+        response = client.post(base_url, json={"upload_key": upload_key}, headers=headers)
+
+        assert response.status_code == 400
+        detail = response.json()["detail"]
+        assert detail["error"] == "upload_incomplete"
+        assert detail["details"]["missing_ranges"] == [[500, len(self.CONTENT)]]
+
+    def test_retry_after_bad_checksum(self, client, upload):
+        """Test that a corrupted chunk is rejected and can be re-sent."""
+        base_url, upload_key, headers = upload
+        chunk = self.CONTENT[:1000]
+
+        response = self._put_chunk(client, upload, 0, b"x" * 1000, hashlib.sha256(chunk).hexdigest())
+        assert response.status_code == 400
+        assert response.json()["detail"]["error"] == "bad_checksum"
+        status = client.get(f"{base_url}/upload/{upload_key}", headers=headers).json()
+        assert status["chunks"] == []
+
+        response = self._put_chunk(client, upload, 0, chunk, hashlib.sha256(chunk).hexdigest())
+        assert response.status_code == 200
+
+    def test_failed_resend_invalidates_earlier_chunk(self, client, upload):
+        """Test that a failed re-send of a good chunk leaves its range missing."""
+        base_url, upload_key, headers = upload
+        chunk = self.CONTENT[:1000]
+        response = self._put_chunk(client, upload, 0, chunk, hashlib.sha256(chunk).hexdigest())
+        assert response.status_code == 200
+
+        response = self._put_chunk(client, upload, 0, b"x" * 1000, hashlib.sha256(chunk).hexdigest())
+        assert response.status_code == 400
+        assert response.json()["detail"]["error"] == "bad_checksum"
+
+        status = client.get(f"{base_url}/upload/{upload_key}", headers=headers).json()
+        assert status["chunks"] == []
+        rest = self.CONTENT[1000:]
+        self._put_chunk(client, upload, 1000, rest, hashlib.sha256(rest).hexdigest())
+        response = client.post(base_url, json={"upload_key": upload_key}, headers=headers)
+        assert response.status_code == 400
+        assert response.json()["detail"]["details"]["missing_ranges"] == [[0, 1000]]
+
+    def test_overlapping_chunk_rejected(self, client, upload):
+        """Test that a chunk overlapping one at another offset is refused."""
+        self._put_chunk(client, upload, 0, self.CONTENT[:1000])
+
+        response = self._put_chunk(client, upload, 500, self.CONTENT[500:1500])
+
+        assert response.status_code == 409
+        assert response.json()["detail"]["error"] == "chunk_overlap"
+
+    def test_chunk_beyond_declared_size(self, client, upload):
+        """Test that chunks past the size declared at prepare are refused."""
+        response = self._put_chunk(client, upload, len(self.CONTENT) - 10, b"x" * 20)
+
+        assert response.status_code == 400
+        assert response.json()["detail"]["error"] == "chunk_out_of_range"
+
+    def test_session_persisted_in_metadata_db(self, client, upload):
+        """Test that upload sessions live in the metadata DB, not process memory."""
+        _, upload_key, _ = upload
+
+        session = metadata_db.get_upload_session(upload_key)
+
+        assert session is not None
+        assert session["expected_size"] == len(self.CONTENT)
+
+
 class TestFileList:
     """Test file listing."""
 
@@ -360,6 +494,42 @@ class TestFileDownload:
         assert response.status_code == 200
         assert response.content == csv_content
 
+    def test_download_range_and_revalidate(self, client, project_with_auth):
+        """Test byte-range downloads and ETag revalidation."""
+        headers = {"Authorization": f"Bearer {project_with_auth['api_key']}"}
+        prepare_response = client.post(
+            f"/projects/{project_with_auth['project_id']}/files/prepare",
+            json={"filename": "range.csv"},
+            headers=headers,
+        )
+        upload_key = prepare_response.json()["upload_key"]
+
+        csv_content = b"id,name\n1,Alice\n2,Bob\n"
+        client.post(
+            f"/projects/{project_with_auth['project_id']}/files/upload/{upload_key}",
+            files={"file": ("range.csv", io.BytesIO(csv_content), "text/csv")},
+            headers=headers,
+        )
+        register_response = client.post(
+            f"/projects/{project_with_auth['project_id']}/files",
+            json={"upload_key": upload_key},
+            headers=headers,
+        )
+        file_id = register_response.json()["id"]
+        url = f"/projects/{project_with_auth['project_id']}/files/{file_id}/download"
+
+        response = client.get(url, headers={**headers, "Range": "bytes=8-"})
+        assert response.status_code == 206
+        assert response.headers["Content-Range"] == f"bytes 8-{len(csv_content) - 1}/{len(csv_content)}"
+        assert response.content == csv_content[8:]
+
+        # ETag is the content MD5 recorded at upload
+        etag = client.get(url, headers=headers).headers["ETag"]
+        assert etag == f'"{hashlib.md5(csv_content).hexdigest()}"'
+
+        response = client.get(url, headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 304
+
 
 class TestFileDelete:
     """Test file deletion."""
@@ -472,6 +472,49 @@ class TestTableImportFromFileHandler:
             handler.handle(any_cmd, None, common_pb2.RuntimeOptions())
 
 
+    def test_import_sliced_file_from_manifest(self, phase12c_bucket, project_db_manager, tmp_path):
+        """Slices listed in a manifest are loaded in one scan and one commit."""
+        import json
+        from src.grpc.handlers.import_export import TableImportFromFileHandler
+
+        project_id, bucket_name = phase12c_bucket
+        project_db_manager.create_table(
+            project_id=project_id,
+            bucket_name=bucket_name,
+            table_name="sliced",
+            columns=[
+                {"name": "id", "type": "INTEGER"},
+                {"name": "name", "type": "VARCHAR"},
+                {"name": "_timestamp", "type": "TIMESTAMP"},
+            ],
+        )
+        slices = []
+        for i, rows in enumerate(["1,a\n2,b\n", "3,c\n"]):
+            slice_path = tmp_path / f"part_{i}.csv"
+            slice_path.write_text("id,name\n" + rows)
+            slices.append({"url": str(slice_path)})
+        (tmp_path / "manifest.json").write_text(json.dumps({"entries": slices}))
+
+        cmd = table_pb2.TableImportFromFileCommand()
+        cmd.destination.path.extend([project_id, bucket_name])
+        cmd.destination.tableName = "sliced"
+        cmd.fileProvider = table_pb2.ImportExportShared.FileProvider.HTTP
+        cmd.filePath.root = str(tmp_path)
+        cmd.filePath.fileName = "manifest.json"
+        csv_options = table_pb2.TableImportFromFileCommand.CsvTypeOptions()
+        csv_options.sourceType = table_pb2.TableImportFromFileCommand.CsvTypeOptions.SourceType.SLICED_FILE
+        cmd.formatTypeOptions.Pack(csv_options)
+
+        any_cmd = common_pb2.DriverRequest().command
+        any_cmd.Pack(cmd)
+
+        handler = TableImportFromFileHandler(project_db_manager)
+        response = handler.handle(any_cmd, None, common_pb2.RuntimeOptions())
+
+        assert response.importedRowsCount == 3
+        assert response.tableRowsCount == 3
+
+
 class TestTableExportToFileHandler:
     """Basic tests for TableExportToFileHandler."""
 
@@ -503,6 +546,44 @@ class TestTableExportToFileHandler:
         with pytest.raises(KeyError, match="Table not found"):
             handler.handle(any_cmd, None, common_pb2.RuntimeOptions())
 
+    def test_export_to_project_bucket_is_listed(
+        self, phase12c_table_with_data, project_db_manager, temp_data_dir
+    ):
+        """Export into a project_N bucket shows up in the S3 object index."""
+        import hashlib
+
+        from src import database
+        from src.grpc.handlers.import_export import TableExportToFileHandler
+
+        project_id, bucket_name, table_name = phase12c_table_with_data
+        project_dir = temp_data_dir["files_dir"] / "project_1"
+        (project_dir / "exports").mkdir(parents=True)
+        # Build the project's index before the export
+        assert database.object_index.list_page(project_dir) == ([], False)
+
+        cmd = table_pb2.TableExportToFileCommand()
+        cmd.source.path.extend([project_id, bucket_name])
+        cmd.source.tableName = table_name
+        cmd.fileProvider = table_pb2.ImportExportShared.FileProvider.HTTP
+        cmd.filePath.root = "project_1"
+        cmd.filePath.path = "exports"
+        cmd.filePath.fileName = "export.csv"
+
+        any_cmd = common_pb2.DriverRequest().command
+        any_cmd.Pack(cmd)
+        TableExportToFileHandler(project_db_manager).handle(
+            any_cmd, None, common_pb2.RuntimeOptions()
+        )
+
+        export_path = project_dir / "exports" / "export.csv"
+        assert database.object_index.list_page(project_dir) == (
+            [(False, "exports/export.csv")],
+            False,
+        )
+        assert database.metadata_db.get_file_etag(export_path) == hashlib.md5(
+            export_path.read_bytes()
+        ).hexdigest()
+
 
 # ============================================
 # Integration Tests via Servicer
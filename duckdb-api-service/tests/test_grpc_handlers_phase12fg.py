@@ -411,3 +411,122 @@ class TestExecuteQueryHandler:
         query_response = executeQuery_pb2.ExecuteQueryResponse()
         response.commandResponse.Unpack(query_response)
         assert query_response.status == executeQuery_pb2.ExecuteQueryResponse.Status.Error
+
+    def test_execute_query_max_rows_guard(self, servicer, metadata_db, monkeypatch):
+        """Results over query_result_max_rows return an error response."""
+        monkeypatch.setattr("src.config.settings.query_result_max_rows", 5)
+        metadata_db.create_project("proj", "Project")
+
+        request = _query_request("SELECT * FROM range(10)")
+        context = MockContext()
+        response = servicer.Execute(request, context)
+
+        query_response = executeQuery_pb2.ExecuteQueryResponse()
+        response.commandResponse.Unpack(query_response)
+        assert query_response.status == executeQuery_pb2.ExecuteQueryResponse.Status.Error
+        assert "maximum of 5 rows" in query_response.message
+
+
+def _query_request(query: str, features: tuple = ()) -> common_pb2.DriverRequest:
+    """Build a DriverRequest for ExecuteQueryCommand on project 'proj'."""
+    from proto import credentials_pb2
+
+    cmd = executeQuery_pb2.ExecuteQueryCommand()
+    cmd.query = query
+    cmd.pathRestriction.append("proj")
+
+    request = common_pb2.DriverRequest()
+    request.command.Pack(cmd)
+    request.features.extend(features)
+
+    creds = credentials_pb2.GenericBackendCredentials()
+    creds.host = "proj"
+    request.credentials.Pack(creds)
+    return request
+
+
+class TestExecuteQueryStream:
+    """Tests for the server-streaming ExecuteQueryStream RPC."""
+
+    def test_stream_emits_bounded_batches(self, servicer, metadata_db, monkeypatch):
+        """Each DriverResponse carries at most query_result_batch_rows rows."""
+        monkeypatch.setattr("src.config.settings.query_result_batch_rows", 4)
+        metadata_db.create_project("proj", "Project")
+
+        context = MockContext()
+        responses = list(servicer.ExecuteQueryStream(
+            _query_request("SELECT range AS n FROM range(10)"), context
+        ))
+
+        assert context.code is None
+        chunks = []
+        for response in responses:
+            chunk = executeQuery_pb2.ExecuteQueryResponse()
+            response.commandResponse.Unpack(chunk)
+            chunks.append(chunk)
+
+        data_chunks = chunks[:-1]
+        assert all(len(c.data.rows) <= 4 for c in data_chunks)
+        values = [row.fields["n"] for c in data_chunks for row in c.data.rows]
+        assert values == [str(i) for i in range(10)]
+        assert list(data_chunks[0].data.columns) == ["n"]
+
+        summary = chunks[-1]
+        assert summary.status == executeQuery_pb2.ExecuteQueryResponse.Status.Success
+        assert summary.message == "Query returned 10 rows"
+        assert len(responses[-1].messages) > 0
+
+    def test_stream_arrow_ipc(self, servicer, metadata_db):
+        """With the Arrow feature, BytesValue chunks form one IPC stream."""
+        import pyarrow as pa
+        from google.protobuf import wrappers_pb2
+        from src.grpc.handlers.query import ARROW_RESULT_FEATURE
+
+        metadata_db.create_project("proj", "Project")
+
+        context = MockContext()
+        responses = list(servicer.ExecuteQueryStream(
+            _query_request(
+                "SELECT range AS n, 'x' AS s FROM range(1000)",
+                features=(ARROW_RESULT_FEATURE,),
+            ),
+            context,
+        ))
+
+        assert context.code is None
+        payload = b""
+        for response in responses:
+            if response.commandResponse.Is(wrappers_pb2.BytesValue.DESCRIPTOR):
+                chunk = wrappers_pb2.BytesValue()
+                response.commandResponse.Unpack(chunk)
+                payload += chunk.value
+
+        table = pa.ipc.open_stream(payload).read_all()
+        assert table.column_names == ["n", "s"]
+        assert table.num_rows == 1000
+
+    def test_stream_max_rows_guard(self, servicer, metadata_db, monkeypatch):
+        """Exceeding the row cap ends the stream with INVALID_ARGUMENT."""
+        import grpc
+
+        monkeypatch.setattr("src.config.settings.query_result_batch_rows", 4)
+        monkeypatch.setattr("src.config.settings.query_result_max_rows", 6)
+        metadata_db.create_project("proj", "Project")
+
+        context = MockContext()
+        responses = list(servicer.ExecuteQueryStream(
+            _query_request("SELECT * FROM range(100)"), context
+        ))
+
+        assert context.code == grpc.StatusCode.INVALID_ARGUMENT
+        assert "maximum of 6 rows" in context.details
+        assert responses[-1].commandResponse.ByteSize() == 0
+
+    def test_stream_unknown_project(self, servicer, metadata_db):
+        """Unknown project maps to NOT_FOUND."""
+        import grpc
+
+        context = MockContext()
+        list(servicer.ExecuteQueryStream(_query_request("SELECT 1"), context))
+
+        assert context.code == grpc.StatusCode.NOT_FOUND
@@ -518,3 +518,82 @@ class TestIdempotencyMiddleware:
         response2 = client.delete(f"/projects/{project_id}", headers=headers)
         assert response2.status_code == 204
         assert response2.headers.get("X-Idempotency-Replay") == "true"
+
+
+class TestIdempotencyStore:
+    """Test the in-process tier, body size cap and in-flight tracking."""
+
+    def test_replay_served_from_memory(self, client, initialized_backend, admin_headers, monkeypatch):
+        """Replay of a key stored by this process does not read metadata DB."""
+        idempotency_key = f"memory_{uuid.uuid4()}"
+        headers = {**admin_headers, "X-Idempotency-Key": idempotency_key}
+        body = {"id": "memory_test", "name": "Memory Test"}
+        assert client.post("/projects", json=body, headers=headers).status_code == 201
+
+        def fail_lookup(key):
+            raise AssertionError("replay should be served from memory")
+
+        monkeypatch.setattr(metadata_db, "get_idempotency_key", fail_lookup)
+        response = client.post("/projects", json=body, headers=headers)
+
+        assert response.status_code == 201
+        assert response.json()["id"] == "memory_test"
+        assert response.headers["content-type"] == "application/json"
+
+    def test_replay_falls_back_to_database(self, client, initialized_backend, admin_headers):
+        """A key missing from memory (other process, restart) is found in metadata DB."""
+        from src.middleware.idempotency import idempotency_store
+
+        idempotency_key = f"db_tier_{uuid.uuid4()}"
+        headers = {**admin_headers, "X-Idempotency-Key": idempotency_key}
+        body = {"id": "db_tier_test"}
+        assert client.post("/projects", json=body, headers=headers).status_code == 201
+        idempotency_store.clear()
+
+        response = client.post("/projects", json=body, headers=headers)
+
+        assert response.status_code == 201
+        assert response.headers.get("X-Idempotency-Replay") == "true"
+        assert response.json()["id"] == "db_tier_test"
+
+    def test_large_body_stores_status_only(self, client, initialized_backend, admin_headers, monkeypatch):
+        """Bodies over the cap are streamed through but not stored."""
+        from src.config import settings
+
+        monkeypatch.setattr(settings, "idempotency_max_response_bytes", 16)
+        idempotency_key = f"large_{uuid.uuid4()}"
+        headers = {**admin_headers, "X-Idempotency-Key": idempotency_key}
+        body = {"id": "large_body_test", "name": "Large Body"}
+
+        response1 = client.post("/projects", json=body, headers=headers)
+        assert response1.status_code == 201
+        assert response1.json()["id"] == "large_body_test"
+
+        stored = metadata_db.get_idempotency_key(idempotency_key)
+        assert stored["response_status"] == 201
+        assert stored["response_body"] is None
+
+        response2 = client.post("/projects", json=body, headers=headers)
+        assert response2.status_code == 201
+        assert response2.headers.get("X-Idempotency-Body-Omitted") == "true"
+        assert response2.content == b""
+
+    def test_in_flight_key_waits_for_release(self):
+        """A second claim of an in-flight key fails until the first is released."""
+        import asyncio
+
+        from src.middleware.idempotency import IdempotencyStore
+
+        async def scenario():
+            store = IdempotencyStore(max_entries=10)
+            assert store.claim("k")
+            assert not store.claim("k")
+            assert not await store.wait("k", 0.01)
+
+            waiter = asyncio.create_task(store.wait("k", 5))
+            await asyncio.sleep(0)
+            store.release("k")
+            assert await waiter
+            assert store.claim("k")
+
+        asyncio.run(scenario())
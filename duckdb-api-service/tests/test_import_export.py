@@ -267,6 +267,210 @@ class TestImportFromFile:
         assert response.status_code == 400
         assert response.json()["detail"]["error"] == "invalid_format"
 
+    def test_import_without_primary_key_skips_staging(self, client, project_with_table, monkeypatch):
+        """Test that plain loads are copied straight into the table."""
+        from src.routers import table_import
+
+        def fail_upsert(*args, **kwargs):
+            raise AssertionError("plain loads should not merge from staging")
+
+        monkeypatch.setattr(table_import, "_build_upsert_sql", fail_upsert)
+        headers = {"Authorization": f"Bearer {project_with_table['api_key']}"}
+        tables_url = f"/projects/{project_with_table['project_id']}/branches/default/buckets/{project_with_table['bucket_name']}/tables"
+        response = client.post(
+            tables_url,
+            json={"name": "events", "columns": [{"name": "id", "type": "INTEGER"}, {"name": "kind", "type": "VARCHAR"}]},
+            headers=headers,
+        )
+        assert response.status_code == 201
+
+        for content, incremental, imported, rows_after in [
+            (b"id,kind\n1,a\n2,b\n", False, 2, 2),
+            (b"id,kind\n2,b\n3,c\n4,d\n", True, 3, 5),
+            (b"id,kind\n9,z\n", False, 1, 1),
+        ]:
+            file_id = _upload_file(client, project_with_table["project_id"], project_with_table["api_key"], content)
+            response = client.post(
+                f"{tables_url}/events/import/file",
+                json={"file_id": file_id, "format": "csv", "import_options": {"incremental": incremental}},
+                headers=headers,
+            )
+            assert response.status_code == 200
+            assert response.json()["imported_rows"] == imported
+            assert response.json()["table_rows_after"] == rows_after
+
+    def test_import_fail_on_duplicates_rolls_back(self, client, project_with_table):
+        """Test that a duplicate key during a direct copy leaves the table unchanged."""
+        headers = {"Authorization": f"Bearer {project_with_table['api_key']}"}
+        import_url = f"/projects/{project_with_table['project_id']}/branches/default/buckets/{project_with_table['bucket_name']}/tables/{project_with_table['table_name']}/import/file"
+        file_id = _upload_file(
+            client, project_with_table["project_id"], project_with_table["api_key"],
+            b"id,name,email\n1,Alice,alice@test.com\n",
+        )
+        assert client.post(import_url, json={"file_id": file_id, "format": "csv"}, headers=headers).status_code == 200
+
+        file_id = _upload_file(
+            client, project_with_table["project_id"], project_with_table["api_key"],
+            b"id,name,email\n2,Bob,bob@test.com\n1,Alice,alice@test.com\n",
+        )
+        response = client.post(
+            import_url,
+            json={
+                "file_id": file_id,
+                "format": "csv",
+                "import_options": {"incremental": True, "dedup_mode": "fail_on_duplicates"},
+            },
+            headers=headers,
+        )
+
+        assert response.status_code == 409
+        assert response.json()["detail"]["error"] == "duplicate_key"
+        preview = client.get(import_url.replace("/import/file", "/preview"), headers=headers)
+        assert [row["id"] for row in preview.json()["rows"]] == [1]
+
+    def test_import_bad_file_keeps_table_on_full_load(self, client, project_with_table):
+        """Test that a failed full load does not leave the table truncated."""
+        headers = {"Authorization": f"Bearer {project_with_table['api_key']}"}
+        import_url = f"/projects/{project_with_table['project_id']}/branches/default/buckets/{project_with_table['bucket_name']}/tables/{project_with_table['table_name']}/import/file"
+        file_id = _upload_file(
+            client, project_with_table["project_id"], project_with_table["api_key"],
+            b"id,name,email\n1,Alice,alice@test.com\n",
+        )
+        assert client.post(import_url, json={"file_id": file_id, "format": "csv"}, headers=headers).status_code == 200
+
+        file_id = _upload_file(
+            client, project_with_table["project_id"], project_with_table["api_key"],
+            b"id,name,email\nnot-a-number,Bob,bob@test.com\n",
+        )
+        response = client.post(
+            import_url,
+            json={"file_id": file_id, "format": "csv", "import_options": {"dedup_mode": "fail_on_duplicates"}},
+            headers=headers,
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"]["error"] == "import_failed"
+        preview = client.get(import_url.replace("/import/file", "/preview"), headers=headers)
+        assert preview.json()["total_row_count"] == 1
+
+
+class TestImportMultipleFiles:
+    """Test importing several files (slices) in one request."""
+
+    def _import_url(self, table: dict) -> str:
+        return (
+            f"/projects/{table['project_id']}/branches/default/buckets/"
+            f"{table['bucket_name']}/tables/{table['table_name']}/import/file"
+        )
+
+    def test_import_file_ids_reports_per_file_rows(self, client, project_with_table):
+        """Test that file_ids are loaded together, with per-file counts on request."""
+        slices = [
+            b"id,name,email\n1,Alice,a@test.com\n2,Bob,b@test.com\n",
+            b"id,name,email\n3,Carol,c@test.com\n",
+            b"id,name,email\n",
+        ]
+        file_ids = [
+            _upload_file(client, project_with_table["project_id"], project_with_table["api_key"], content, f"part_{i}.csv")
+            for i, content in enumerate(slices)
+        ]
+
+        response = client.post(
+            self._import_url(project_with_table),
+            json={"file_ids": file_ids, "format": "csv", "report_file_rows": True},
+            headers={"Authorization": f"Bearer {project_with_table['api_key']}"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["imported_rows"] == 3
+        assert data["table_rows_after"] == 3
+        assert [(f["file_id"], f["name"], f["rows"]) for f in data["files"]] == [
+            (file_ids[0], "part_0.csv", 2),
+            (file_ids[1], "part_1.csv", 1),
+            (file_ids[2], "part_2.csv", 0),
+        ]
+
+    def test_import_file_pattern_upsert(self, client, project_with_table):
+        """Test that a glob over file names selects the slices (staging path)."""
+        for name, content in [
+            ("orders_1.csv", b"id,name,email\n1,Alice,a@test.com\n"),
+            ("orders_2.csv", b"id,name,email\n2,Bob,b@test.com\n"),
+            ("other.csv", b"id,name,email\n9,Zed,z@test.com\n"),
+        ]:
+            _upload_file(client, project_with_table["project_id"], project_with_table["api_key"], content, name)
+
+        response = client.post(
+            self._import_url(project_with_table),
+            json={"file_pattern": "orders_*.csv", "format": "csv", "import_options": {"incremental": True}},
+            headers={"Authorization": f"Bearer {project_with_table['api_key']}"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["imported_rows"] == 2
+        # CSV slices are read once; per-file counts were not requested
+        assert [(f["name"], f["rows"]) for f in data["files"]] == [("orders_1.csv", None), ("orders_2.csv", None)]
+
+    def test_import_parquet_file_ids(self, client, project_with_table, tmp_path):
+        """Test multi-file Parquet import takes per-file counts from the footers."""
+        import duckdb
+
+        file_ids = []
+        for i, count in enumerate([3, 2]):
+            path = tmp_path / f"slice_{i}.parquet"
+            duckdb.sql(
+                f"COPY (SELECT range::INTEGER + {i * 10} AS id, 'n' AS name, 'e' AS email FROM range({count})) "
+                f"TO '{path}' (FORMAT PARQUET)"
+            )
+            file_ids.append(_upload_file(
+                client, project_with_table["project_id"], project_with_table["api_key"],
+                path.read_bytes(), path.name,
+            ))
+
+        response = client.post(
+            self._import_url(project_with_table),
+            json={"file_ids": file_ids, "format": "parquet", "import_options": {"dedup_mode": "fail_on_duplicates"}},
+            headers={"Authorization": f"Bearer {project_with_table['api_key']}"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["table_rows_after"] == 5
+        assert [f["rows"] for f in response.json()["files"]] == [3, 2]
+
+    def test_import_missing_file_id(self, client, project_with_table):
+        """Test that an unknown ID in file_ids fails before anything is loaded."""
+        file_id = _upload_file(
+            client, project_with_table["project_id"], project_with_table["api_key"],
+            b"id,name,email\n1,Alice,a@test.com\n",
+        )
+
+        response = client.post(
+            self._import_url(project_with_table),
+            json={"file_ids": [file_id, "nonexistent"], "format": "csv"},
+            headers={"Authorization": f"Bearer {project_with_table['api_key']}"},
+        )
+
+        assert response.status_code == 404
+        assert response.json()["detail"]["error"] == "file_not_found"
+        assert response.json()["detail"]["details"]["missing"] == ["nonexistent"]
+
+    @pytest.mark.parametrize("selection", [
+        {},
+        {"file_ids": []},
+        {"file_id": "a", "file_pattern": "*.csv"},
+    ])
+    def test_import_invalid_file_selection(self, client, project_with_table, selection):
+        """Test that exactly one file selector is required."""
+        response = client.post(
+            self._import_url(project_with_table),
+            json={**selection, "format": "csv"},
+            headers={"Authorization": f"Bearer {project_with_table['api_key']}"},
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"]["error"] == "invalid_file_selection"
+
 
 class TestExportToFile:
     """Test export to file endpoint."""
@@ -434,6 +638,119 @@ class TestExportToFile:
         assert response.json()["detail"]["error"] == "invalid_where_clause"
 
 
+class TestExportArrowStream:
+    """Test Arrow IPC streaming export endpoint."""
+
+    def _import_users(self, client, project_with_table):
+        csv_content = b"id,name,email\n1,Alice,alice@test.com\n2,Bob,bob@test.com\n3,Charlie,charlie@test.com\n"
+        file_id = _upload_file(
+            client,
+            project_with_table["project_id"],
+            project_with_table["api_key"],
+            csv_content,
+        )
+        client.post(
+            f"/projects/{project_with_table['project_id']}/branches/default/buckets/{project_with_table['bucket_name']}/tables/{project_with_table['table_name']}/import/file",
+            json={"file_id": file_id, "format": "csv"},
+            headers={"Authorization": f"Bearer {project_with_table['api_key']}"},
+        )
+
+    def _stream_url(self, project_with_table) -> str:
+        return (
+            f"/projects/{project_with_table['project_id']}/branches/default/buckets/"
+            f"{project_with_table['bucket_name']}/tables/{project_with_table['table_name']}/export/stream"
+        )
+
+    def test_stream_all_rows(self, client, project_with_table):
+        """Test that the stream is a valid Arrow IPC stream with all rows."""
+        import pyarrow as pa
+
+        self._import_users(client, project_with_table)
+
+        response = client.get(
+            self._stream_url(project_with_table),
+            params={"batch_size": 2},
+            headers={"Authorization": f"Bearer {project_with_table['api_key']}"},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/vnd.apache.arrow.stream"
+
+        table = pa.ipc.open_stream(response.content).read_all()
+        assert table.num_rows == 3
+        assert table.column_names == ["id", "name", "email"]
+
+    def test_stream_projection_filter_limit(self, client, project_with_table):
+        """Test column projection, WHERE filter and limit."""
+        import pyarrow as pa
+
+        self._import_users(client, project_with_table)
+
+        response = client.get(
+            self._stream_url(project_with_table),
+            params={"columns": ["id", "name"], "where_filter": "id > 1", "limit": 1},
+            headers={"Authorization": f"Bearer {project_with_table['api_key']}"},
+        )
+        assert response.status_code == 200
+
+        table = pa.ipc.open_stream(response.content).read_all()
+        assert table.column_names == ["id", "name"]
+        assert table.num_rows == 1
+        assert table.column("id")[0].as_py() > 1
+
+    def test_stream_empty_table(self, client, project_with_table):
+        """Test that an empty table still yields a schema."""
+        import pyarrow as pa
+
+        response = client.get(
+            self._stream_url(project_with_table),
+            headers={"Authorization": f"Bearer {project_with_table['api_key']}"},
+        )
+        assert response.status_code == 200
+
+        table = pa.ipc.open_stream(response.content).read_all()
+        assert table.num_rows == 0
+        assert table.column_names == ["id", "name", "email"]
+
+    def test_stream_unknown_column(self, client, project_with_table):
+        """Test that unknown columns are rejected before streaming."""
+        response = client.get(
+            self._stream_url(project_with_table),
+            params={"columns": ["id", "missing"]},
+            headers={"Authorization": f"Bearer {project_with_table['api_key']}"},
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"]["error"] == "invalid_stream_request"
+
+    def test_stream_invalid_where_clause(self, client, project_with_table):
+        """Test that the WHERE filter goes through the same validation as export."""
+        response = client.get(
+            self._stream_url(project_with_table),
+            params={"where_filter": "1=1; DROP TABLE users;"},
+            headers={"Authorization": f"Bearer {project_with_table['api_key']}"},
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"]["error"] == "invalid_where_clause"
+
+    def test_preview_arrow_accept_header(self, client, project_with_table):
+        """Test that preview returns Arrow IPC when asked via Accept."""
+        import pyarrow as pa
+
+        self._import_users(client, project_with_table)
+
+        response = client.get(
+            f"/projects/{project_with_table['project_id']}/branches/default/buckets/{project_with_table['bucket_name']}/tables/{project_with_table['table_name']}/preview",
+            params={"limit": 2},
+            headers={
+                "Authorization": f"Bearer {project_with_table['api_key']}",
+                "Accept": "application/vnd.apache.arrow.stream",
+            },
+        )
+        assert response.status_code == 200
+
+        table = pa.ipc.open_stream(response.content).read_all()
+        assert table.num_rows == 2
+
+
 class TestImportExportAuth:
     """Test Import/Export authentication."""
 
@@ -0,0 +1,95 @@
+"""Tests for MetadataDB long-lived connection and cursor pool."""
+
+import threading
+
+from src import metrics
+from src.config import settings
+
+
+def _counter_value(counter, **labels) -> float:
+    """Read current value of a prometheus counter."""
+    if labels:
+        counter = counter.labels(**labels)
+    return counter._value.get()
+
+
+class TestMetadataConnectionPool:
+    """Unit tests for pooled metadata connections."""
+
+    def test_connection_is_reused_across_queries(self, metadata_db):
+        """Test that repeated queries don't reopen metadata.duckdb."""
+        metadata_db.execute("SELECT 1")
+        opens_before = _counter_value(metrics.METADATA_CONNECTION_OPENS)
+        reused_before = _counter_value(metrics.METADATA_CURSOR_CHECKOUTS, result="reused")
+
+        for _ in range(20):
+            metadata_db.execute_one("SELECT COUNT(*) FROM projects")
+
+        assert _counter_value(metrics.METADATA_CONNECTION_OPENS) == opens_before
+        assert _counter_value(metrics.METADATA_CURSOR_CHECKOUTS, result="reused") >= reused_before + 20
+
+    def test_writes_visible_to_subsequent_reads(self, metadata_db):
+        """Test that writes on the write lane are visible to pooled readers."""
+        metadata_db.create_project("pool_test", "Pool Test")
+        metadata_db.update_project("pool_test", name="Renamed")
+
+        project = metadata_db.get_project("pool_test")
+        assert project["name"] == "Renamed"
+
+    def test_reconnects_when_path_changes(self, metadata_db, tmp_path, monkeypatch):
+        """Test that a new metadata path opens a new database."""
+        metadata_db.create_project("old_path_project")
+
+        monkeypatch.setattr(settings, "metadata_db_path", tmp_path / "other.duckdb")
+        metadata_db.initialize()
+
+        assert metadata_db.get_project("old_path_project") is None
+
+    def test_close_and_lazy_reopen(self, metadata_db):
+        """Test that close() releases the connection and next query reopens it."""
+        metadata_db.create_project("reopen_test")
+        metadata_db.close()
+
+        assert metadata_db.get_project("reopen_test") is not None
+
+    def test_concurrent_writes_serialized(self, metadata_db):
+        """Test that concurrent writers don't hit transaction conflicts."""
+        metadata_db.create_project("concurrent_test")
+        errors: list[Exception] = []
+
+        def writer(i: int) -> None:
+            try:
+                for j in range(10):
+                    metadata_db.update_project("concurrent_test", table_count=i * 10 + j)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=writer, args=(i,)) for i in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+
+    def test_non_persistent_mode(self, metadata_db, monkeypatch):
+        """Test fallback to connect-per-query mode."""
+        metadata_db.close()
+        monkeypatch.setattr(settings, "metadata_persistent_connection", False)
+
+        metadata_db.create_project("no_pool_test")
+        assert metadata_db.get_project("no_pool_test") is not None
+
+    def test_close_deferred_while_cursor_in_use(self, metadata_db):
+        """Test that close() does not invalidate a cursor that is checked out."""
+        metadata_db.create_project("deferred_close")
+
+        with metadata_db.connection() as conn:
+            metadata_db.close()
+            row = conn.execute(
+                "SELECT id FROM projects WHERE id = ?", ["deferred_close"]
+            ).fetchone()
+
+        assert row[0] == "deferred_close"
+        assert metadata_db._retired == {}
+        assert metadata_db.get_project("deferred_close") is not None
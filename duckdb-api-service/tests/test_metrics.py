@@ -255,6 +255,105 @@ class TestStorageMetricsCollection:
         assert 'duckdb_storage_size_bytes{type="tables"}' in content
 
 
+class TestStorageUsage:
+    """Tests for incrementally maintained storage gauges."""
+
+    def _create_table(self, client, headers, project_id):
+        client.post("/projects", json={"id": project_id}, headers=headers)
+        response = client.post(
+            f"/projects/{project_id}/branches/default/buckets",
+            json={"name": "bucket"},
+            headers=headers,
+        )
+        assert response.status_code == 201
+        response = client.post(
+            f"/projects/{project_id}/branches/default/buckets/bucket/tables",
+            json={"name": "events", "columns": [{"name": "id", "type": "INTEGER"}]},
+            headers=headers,
+        )
+        assert response.status_code == 201
+
+    def test_write_paths_adjust_gauges(self, client, initialized_backend, admin_headers):
+        """Creating and deleting buckets and tables updates the counts without a scan."""
+        from src.database import storage_usage
+
+        before = storage_usage.snapshot()
+        self._create_table(client, admin_headers, "usage_writes")
+
+        after_create = storage_usage.snapshot()
+        assert after_create["buckets"] == before["buckets"] + 1
+        assert after_create["tables"] == before["tables"] + 1
+        assert after_create["table_bytes"] > before["table_bytes"]
+
+        response = client.delete(
+            "/projects/usage_writes/branches/default/buckets/bucket/tables/events",
+            headers=admin_headers,
+        )
+        assert response.status_code == 204
+        after_delete = storage_usage.snapshot()
+        assert after_delete["tables"] == before["tables"]
+        assert after_delete["table_bytes"] == before["table_bytes"]
+
+        response = client.delete(
+            "/projects/usage_writes/branches/default/buckets/bucket",
+            headers=admin_headers,
+        )
+        assert response.status_code == 204
+        assert storage_usage.snapshot()["buckets"] == before["buckets"]
+
+    def test_rescan_matches_tracked_values(self, client, initialized_backend, admin_headers):
+        """A rescan after tracked writes finds no drift."""
+        from src.database import storage_usage
+
+        storage_usage.rescan()
+        self._create_table(client, admin_headers, "usage_rescan")
+
+        result = storage_usage.rescan()
+        assert result["buckets"] == 1
+        assert result["tables"] == 1
+        assert result["buckets_drift"] == 0
+        assert result["tables_drift"] == 0
+        assert result["table_bytes_drift"] == 0
+
+    def test_first_stats_record_after_rescan_not_counted_twice(
+        self, client, initialized_backend, admin_headers
+    ):
+        """Tables counted by a rescan before they had stats are not added again."""
+        from src.database import metadata_db, project_db_manager, storage_usage
+
+        self._create_table(client, admin_headers, "usage_upgrade")
+        table_path = project_db_manager.get_table_path("usage_upgrade", "bucket", "events")
+        # As after an upgrade: the file exists but was never recorded
+        metadata_db.delete_table_stats(project_db_manager._stats_key(table_path))
+        storage_usage.rescan()
+
+        project_db_manager.record_table_stats(table_path)
+        assert storage_usage.snapshot()["tables"] == 1
+        assert storage_usage.rescan()["tables_drift"] == 0
+
+        # Forgetting an unrecorded table removes what the rescan counted
+        metadata_db.delete_table_stats(project_db_manager._stats_key(table_path))
+        storage_usage.rescan()
+        project_db_manager.forget_table_stats(table_path)
+        assert storage_usage.snapshot()["tables"] == 0
+        assert storage_usage.snapshot()["table_bytes"] == 0
+
+    def test_scrape_does_not_scan(self, client, initialized_backend, admin_headers, monkeypatch):
+        """/metrics reports the tracked values without walking the filesystem."""
+        from src.database import storage_usage
+
+        def fail_scan():
+            raise AssertionError("scrape must not scan storage")
+
+        monkeypatch.setattr(storage_usage, "scan", fail_scan)
+        self._create_table(client, admin_headers, "usage_scrape")
+
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        tables = storage_usage.snapshot()["tables"]
+        assert f"duckdb_tables_total {float(tables)}" in response.text
+
+
 class TestIdempotencyCacheMetrics:
     """Tests for idempotency cache metrics."""
 
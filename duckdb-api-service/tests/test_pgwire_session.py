@@ -0,0 +1,107 @@
+"""Tests for WorkspaceSession (on-demand ATTACH of project tables over PG Wire)."""
+
+import duckdb
+import pytest
+
+from src.config import settings
+from src.database import TABLE_DATA_NAME, project_db_manager
+from src.pgwire_server import WorkspaceSession
+
+PROJECT_ID = "pgw_proj"
+
+
+def _create_table(path, rows: int):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with duckdb.connect(str(path)) as conn:
+        conn.execute(f"CREATE TABLE main.{TABLE_DATA_NAME} AS SELECT range AS id FROM range({rows})")
+
+
+@pytest.fixture
+def project_tables(temp_data_dir):
+    """Project with three tables in one bucket plus a workspace file."""
+    for name, rows in (("orders", 3), ("customers", 2), ("items", 5)):
+        _create_table(project_db_manager.get_table_path(PROJECT_ID, "in_c_sales", name), rows)
+
+    workspace_path = project_db_manager.get_workspace_path(PROJECT_ID, "ws_pgw")
+    workspace_path.parent.mkdir(parents=True, exist_ok=True)
+    return workspace_path
+
+
+@pytest.fixture
+def session(project_tables):
+    """Workspace session with the project table index built."""
+    conn = duckdb.connect(str(project_tables))
+    session = WorkspaceSession(
+        conn=conn,
+        workspace_id="ws_pgw",
+        project_id=PROJECT_ID,
+        branch_id=None,
+        session_id="pgw_test",
+    )
+    session.index_project_tables()
+    yield session
+    session.close()
+    conn.close()
+
+
+def _fetch(result) -> list:
+    return [row for row in result.rows()]
+
+
+class TestWorkspaceSession:
+    """Unit tests for WorkspaceSession."""
+
+    def test_index_skips_workspaces_and_prefers_branch_copy(self, project_tables):
+        """Test that the alias index covers bucket tables and uses branch copies."""
+        branch_path = project_db_manager.get_branch_table_path(
+            PROJECT_ID, "dev", "in_c_sales", "orders"
+        )
+        _create_table(branch_path, 1)
+
+        conn = duckdb.connect(str(project_tables))
+        session = WorkspaceSession(conn, "ws_pgw", PROJECT_ID, "dev", "pgw_branch")
+        try:
+            assert session.index_project_tables() == 3
+            assert session._table_index["in_c_sales_orders"] == ("in_c_sales_orders", branch_path)
+            assert not any(key.startswith("_") for key in session._table_index)
+            # Indexing does not ATTACH anything
+            assert session._attached_tables == {}
+        finally:
+            session.close()
+            conn.close()
+
+    def test_execute_sql_attaches_referenced_tables(self, session):
+        """Test that execute_sql ATTACHes only the aliases a query references."""
+        result = session.execute_sql(
+            f'SELECT COUNT(*) FROM "in_c_sales_orders".main.{TABLE_DATA_NAME}'
+        )
+
+        assert _fetch(result) == [[3]]
+        assert list(session._attached_tables) == ["in_c_sales_orders"]
+
+        # Referencing the same table again reuses the attachment
+        assert session.attach_referenced_tables("SELECT * FROM IN_C_SALES_ORDERS.data") == 0
+
+    def test_least_recently_used_tables_are_detached(self, session, monkeypatch):
+        """Test that attachments above the cap are evicted in LRU order."""
+        monkeypatch.setattr(settings, "pgwire_max_attached_tables", 2)
+
+        session.execute_sql(f"SELECT * FROM in_c_sales_orders.{TABLE_DATA_NAME}")
+        session.execute_sql(f"SELECT * FROM in_c_sales_customers.{TABLE_DATA_NAME}")
+        session.execute_sql(f"SELECT * FROM in_c_sales_orders.{TABLE_DATA_NAME}")
+        session.execute_sql(f"SELECT * FROM in_c_sales_items.{TABLE_DATA_NAME}")
+
+        assert list(session._attached_tables) == ["in_c_sales_orders", "in_c_sales_items"]
+        attached = {
+            name for (name,) in session._conn.execute(
+                "SELECT database_name FROM duckdb_databases()"
+            ).fetchall()
+        }
+        assert "in_c_sales_customers" not in attached
+
+    def test_query_timeout_interrupts(self, session):
+        """Test that queries running past the session timeout are interrupted."""
+        session.query_timeout = 0.2
+
+        with pytest.raises(duckdb.InterruptException):
+            session.execute_sql("SELECT COUNT(*) FROM range(100000000) a, range(100000) b")
@@ -7,11 +7,13 @@ and are compatible with AWS S3 SDK behavior.
 import base64
 import hashlib
 import io
+import urllib.parse
 from xml.etree import ElementTree as ET
 
 import pytest
 from fastapi.testclient import TestClient
 
+from src import metrics
 from src.main import app
 from src.config import settings
 
@@ -239,6 +241,188 @@ class TestHeadObject:
         assert response.status_code == 404
 
 
+class TestRangeAndConditionalRequests:
+    """Test Range and conditional headers on GetObject/HeadObject."""
+
+    CONTENT = bytes(range(256)) * 4
+
+    @pytest.fixture
+    def object_url(self, client, project_with_auth):
+        """Upload a 1 KiB object and return (url, auth headers, etag)."""
+        url = f"/s3/project_{project_with_auth['project_id']}/range/data.bin"
+        headers = {"Authorization": f"Bearer {project_with_auth['api_key']}"}
+        response = client.put(url, content=self.CONTENT, headers=headers)
+        return url, headers, response.headers["ETag"]
+
+    def test_single_range(self, client, object_url):
+        """Test that a single byte range returns 206 with Content-Range."""
+        url, headers, _ = object_url
+
+        response = client.get(url, headers={**headers, "Range": "bytes=1000-"})
+
+        assert response.status_code == 206
+        assert response.headers["Content-Range"] == "bytes 1000-1023/1024"
+        assert response.headers["Accept-Ranges"] == "bytes"
+        assert response.content == self.CONTENT[1000:]
+
+    def test_suffix_range(self, client, object_url):
+        """Test reading the last N bytes (Parquet footer access pattern)."""
+        url, headers, _ = object_url
+
+        response = client.get(url, headers={**headers, "Range": "bytes=-8"})
+
+        assert response.status_code == 206
+        assert response.content == self.CONTENT[-8:]
+
+    def test_multiple_ranges(self, client, object_url):
+        """Test that several ranges return a multipart/byteranges body."""
+        url, headers, _ = object_url
+
+        response = client.get(url, headers={**headers, "Range": "bytes=0-9,100-109"})
+
+        assert response.status_code == 206
+        content_type = response.headers["Content-Type"]
+        assert content_type.startswith("multipart/byteranges; boundary=")
+        boundary = content_type.split("boundary=")[1]
+        assert int(response.headers["Content-Length"]) == len(response.content)
+        parts = response.content.split(f"--{boundary}".encode())
+        assert parts[-1] == b"--\r\n"
+        assert b"Content-Range: bytes 0-9/1024\r\n\r\n" + self.CONTENT[0:10] in parts[1]
+        assert b"Content-Range: bytes 100-109/1024\r\n\r\n" + self.CONTENT[100:110] in parts[2]
+
+    def test_unsatisfiable_range(self, client, object_url):
+        """Test that a range past the end returns 416."""
+        url, headers, _ = object_url
+
+        response = client.get(url, headers={**headers, "Range": "bytes=5000-6000"})
+
+        assert response.status_code == 416
+        assert response.headers["Content-Range"] == "*/1024"
+
+    def test_if_range_mismatch_returns_full_object(self, client, object_url):
+        """Test that a stale If-Range validator serves the whole object."""
+        url, headers, _ = object_url
+
+        response = client.get(
+            url, headers={**headers, "Range": "bytes=0-9", "If-Range": '"stale"'}
+        )
+
+        assert response.status_code == 200
+        assert response.content == self.CONTENT
+
+    def test_if_none_match_returns_304(self, client, object_url):
+        """Test revalidation with the current ETag."""
+        url, headers, etag = object_url
+
+        response = client.get(url, headers={**headers, "If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+
+    def test_if_modified_since_returns_304(self, client, object_url):
+        """Test revalidation with Last-Modified."""
+        url, headers, _ = object_url
+        last_modified = client.head(url, headers=headers).headers["Last-Modified"]
+
+        response = client.get(url, headers={**headers, "If-Modified-Since": last_modified})
+
+        assert response.status_code == 304
+
+    def test_if_none_match_wins_over_if_modified_since(self, client, object_url):
+        """Test that If-Modified-Since is ignored when If-None-Match is sent."""
+        url, headers, _ = object_url
+        last_modified = client.head(url, headers=headers).headers["Last-Modified"]
+
+        response = client.get(
+            url,
+            headers={**headers, "If-None-Match": '"other"', "If-Modified-Since": last_modified},
+        )
+
+        assert response.status_code == 200
+
+    def test_if_match_mismatch_returns_412(self, client, object_url):
+        """Test that If-Match with a different ETag fails the precondition."""
+        url, headers, etag = object_url
+
+        assert client.get(url, headers={**headers, "If-Match": '"other"'}).status_code == 412
+        assert client.get(url, headers={**headers, "If-Match": etag}).status_code == 200
+
+    def test_head_conditional_and_range(self, client, object_url):
+        """Test that HEAD honours If-None-Match and Range like GET."""
+        url, headers, etag = object_url
+
+        assert client.head(url, headers={**headers, "If-None-Match": etag}).status_code == 304
+
+        response = client.head(url, headers={**headers, "Range": "bytes=0-99"})
+        assert response.status_code == 206
+        assert response.headers["Content-Length"] == "100"
+        assert response.content == b""
+
+
+class TestObjectETagCache:
+    """Test that ETags are computed at write time and not on HEAD/GET."""
+
+    def test_head_and_get_do_not_hash_file(self, client, project_with_auth, monkeypatch):
+        """Test that HEAD/GET after PutObject use the stored ETag."""
+        from src.routers import s3_compat
+
+        content = b"cached etag content"
+        project_id = project_with_auth["project_id"]
+        headers = {"Authorization": f"Bearer {project_with_auth['api_key']}"}
+        put = client.put(f"/s3/project_{project_id}/etag/a.txt", content=content, headers=headers)
+
+        def fail_hash(file_path):
+            raise AssertionError("object should not be hashed on read")
+
+        monkeypatch.setattr(s3_compat, "file_md5", fail_hash)
+        head = client.head(f"/s3/project_{project_id}/etag/a.txt", headers=headers)
+        get = client.get(f"/s3/project_{project_id}/etag/a.txt", headers=headers)
+
+        expected = f'"{hashlib.md5(content).hexdigest()}"'
+        assert put.headers["ETag"] == expected
+        assert head.headers["ETag"] == expected
+        assert get.headers["ETag"] == expected
+
+    def test_file_changed_on_disk_gets_new_etag(self, client, project_with_auth):
+        """Test that a stored ETag is ignored once the file's size/mtime change."""
+        project_id = project_with_auth["project_id"]
+        headers = {"Authorization": f"Bearer {project_with_auth['api_key']}"}
+        client.put(f"/s3/project_{project_id}/etag/b.txt", content=b"old", headers=headers)
+
+        file_path = settings.files_dir / f"project_{project_id}" / "etag" / "b.txt"
+        file_path.write_bytes(b"new content")
+
+        response = client.head(f"/s3/project_{project_id}/etag/b.txt", headers=headers)
+
+        assert response.headers["ETag"] == f'"{hashlib.md5(b"new content").hexdigest()}"'
+
+    def test_file_from_other_writer_hashed_once(self, client, project_with_auth, monkeypatch):
+        """Test that a file not written through the API is hashed only on first access."""
+        from src.routers import s3_compat
+
+        project_id = project_with_auth["project_id"]
+        headers = {"Authorization": f"Bearer {project_with_auth['api_key']}"}
+        file_path = settings.files_dir / f"project_{project_id}" / "etag" / "c.txt"
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(b"external")
+
+        calls = []
+        original = s3_compat.file_md5
+        monkeypatch.setattr(
+            s3_compat, "file_md5", lambda p: calls.append(p) or original(p)
+        )
+        for _ in range(3):
+            response = client.head(f"/s3/project_{project_id}/etag/c.txt", headers=headers)
+            assert response.headers["ETag"] == f'"{hashlib.md5(b"external").hexdigest()}"'
+
+        listing = client.get(f"/s3/project_{project_id}?list-type=2", headers=headers)
+
+        assert listing.status_code == 200
+        assert hashlib.md5(b"external").hexdigest() in listing.text
+        assert len(calls) == 1
+
+
 class TestDeleteObject:
     """Test S3 DeleteObject operation."""
 
@@ -436,6 +620,285 @@ class TestListObjectsV2:
         keys = [elem.text for elem in root.findall(".//Contents/Key")]
         assert "root.txt" in keys
 
+    def _list(self, client, project_with_auth, query: str) -> ET.Element:
+        response = client.get(
+            f"/s3/project_{project_with_auth['project_id']}?list-type=2&{query}",
+            headers={"Authorization": f"Bearer {project_with_auth['api_key']}"},
+        )
+        assert response.status_code == 200
+        return ET.fromstring(response.content)
+
+    def test_list_objects_continuation_token(self, client, project_with_auth):
+        """Test that continuation tokens page through every key exactly once."""
+        project_id = project_with_auth["project_id"]
+        expected = [f"page/file{i:02d}.txt" for i in range(7)]
+        for key in reversed(expected):
+            client.put(
+                f"/s3/project_{project_id}/{key}",
+                content=b"x",
+                headers={"Authorization": f"Bearer {project_with_auth['api_key']}"},
+            )
+
+        keys = []
+        query = "max-keys=3"
+        while True:
+            root = self._list(client, project_with_auth, query)
+            keys += [elem.text for elem in root.findall(".//Contents/Key")]
+            if root.find("IsTruncated").text == "false":
+                assert root.find("NextContinuationToken") is None
+                break
+            token = root.find("NextContinuationToken").text
+            query = f"max-keys=3&continuation-token={urllib.parse.quote(token)}"
+
+        assert keys == expected
+
+    def test_list_objects_paginates_common_prefixes(self, client, project_with_auth):
+        """Test that a page ending on a common prefix resumes after it."""
+        project_id = project_with_auth["project_id"]
+        for key in ["a/1.txt", "a/2.txt", "b/1.txt", "c.txt"]:
+            client.put(
+                f"/s3/project_{project_id}/{key}",
+                content=b"x",
+                headers={"Authorization": f"Bearer {project_with_auth['api_key']}"},
+            )
+
+        first = self._list(client, project_with_auth, "delimiter=/&max-keys=1")
+        assert [e.text for e in first.findall(".//CommonPrefixes/Prefix")] == ["a/"]
+        assert first.find("KeyCount").text == "1"
+
+        token = urllib.parse.quote(first.find("NextContinuationToken").text)
+        second = self._list(client, project_with_auth, f"delimiter=/&continuation-token={token}")
+        assert [e.text for e in second.findall(".//CommonPrefixes/Prefix")] == ["b/"]
+        assert [e.text for e in second.findall(".//Contents/Key")] == ["c.txt"]
+
+    def test_list_objects_start_after(self, client, project_with_auth):
+        """Test that start-after skips keys up to and including it."""
+        project_id = project_with_auth["project_id"]
+        for name in ["a.txt", "b.txt", "c.txt"]:
+            client.put(
+                f"/s3/project_{project_id}/{name}",
+                content=b"x",
+                headers={"Authorization": f"Bearer {project_with_auth['api_key']}"},
+            )
+
+        root = self._list(client, project_with_auth, "start-after=a.txt")
+
+        assert [e.text for e in root.findall(".//Contents/Key")] == ["b.txt", "c.txt"]
+        assert root.find("StartAfter").text == "a.txt"
+
+    def test_list_objects_invalid_continuation_token(self, client, project_with_auth):
+        """Test that a malformed continuation token is rejected."""
+        response = client.get(
+            f"/s3/project_{project_with_auth['project_id']}?list-type=2&continuation-token=%25%25",
+            headers={"Authorization": f"Bearer {project_with_auth['api_key']}"},
+        )
+
+        assert response.status_code == 400
+        assert ET.fromstring(response.content).find("Code").text == "InvalidArgument"
+
+    def test_list_objects_tracks_writes_without_rescanning(self, client, project_with_auth):
+        """Test that puts and deletes update the index instead of walking the tree."""
+        project_id = project_with_auth["project_id"]
+        headers = {"Authorization": f"Bearer {project_with_auth['api_key']}"}
+        client.put(f"/s3/project_{project_id}/idx/old.txt", content=b"x", headers=headers)
+        self._list(client, project_with_auth, "prefix=idx/")
+        builds_before = metrics.S3_OBJECT_INDEX_BUILDS._value.get()
+
+        client.put(f"/s3/project_{project_id}/idx/new.txt", content=b"x", headers=headers)
+        client.delete(f"/s3/project_{project_id}/idx/old.txt", headers=headers)
+        root = self._list(client, project_with_auth, "prefix=idx/")
+
+        assert [e.text for e in root.findall(".//Contents/Key")] == ["idx/new.txt"]
+        assert metrics.S3_OBJECT_INDEX_BUILDS._value.get() == builds_before
+
+    def test_list_objects_drops_files_removed_on_disk(self, client, project_with_auth):
+        """Test that keys whose file vanished outside the API are skipped."""
+        project_id = project_with_auth["project_id"]
+        headers = {"Authorization": f"Bearer {project_with_auth['api_key']}"}
+        client.put(f"/s3/project_{project_id}/gone.txt", content=b"x", headers=headers)
+        self._list(client, project_with_auth, "")
+
+        (settings.files_dir / f"project_{project_id}" / "gone.txt").unlink()
+        root = self._list(client, project_with_auth, "")
+
+        assert root.find("KeyCount").text == "0"
+
+
+class TestMultipartUpload:
+    """Test S3 multipart upload operations."""
+
+    @staticmethod
+    def _create_upload(client, project_id, key, headers) -> str:
+        response = client.post(f"/s3/project_{project_id}/{key}?uploads", headers=headers)
+        assert response.status_code == 200
+        return ET.fromstring(response.content).find("UploadId").text
+
+    @staticmethod
+    def _complete_xml(parts: list[tuple[int, str]]) -> str:
+        body = "".join(
+            f"<Part><PartNumber>{n}</PartNumber><ETag>{etag}</ETag></Part>" for n, etag in parts
+        )
+        return (
+            '<CompleteMultipartUpload xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+            f"{body}</CompleteMultipartUpload>"
+        )
+
+    def test_multipart_upload_roundtrip(self, client, project_with_auth):
+        """Test create, upload parts, complete, then GET the concatenated object."""
+        project_id = project_with_auth["project_id"]
+        headers = {"Authorization": f"Bearer {project_with_auth['api_key']}"}
+        upload_id = self._create_upload(client, project_id, "mp/data.csv", headers)
+
+        chunks = [b"a" * 1000, b"b" * 500, b"c" * 10]
+        parts = []
+        for number, chunk in enumerate(chunks, start=1):
+            response = client.put(
+                f"/s3/project_{project_id}/mp/data.csv?partNumber={number}&uploadId={upload_id}",
+                content=chunk,
+                headers=headers,
+            )
+            assert response.status_code == 200
+            assert response.headers["ETag"] == f'"{hashlib.md5(chunk).hexdigest()}"'
+            parts.append((number, response.headers["ETag"]))
+
+        # Parts are not visible as objects before completion
+        assert client.head(f"/s3/project_{project_id}/mp/data.csv", headers=headers).status_code == 404
+
+        response = client.post(
+            f"/s3/project_{project_id}/mp/data.csv?uploadId={upload_id}",
+            content=self._complete_xml(parts),
+            headers=headers,
+        )
+        assert response.status_code == 200
+        expected_etag = hashlib.md5(
+            b"".join(hashlib.md5(chunk).digest() for chunk in chunks)
+        ).hexdigest()
+        assert ET.fromstring(response.content).find("ETag").text == f'"{expected_etag}-3"'
+
+        get = client.get(f"/s3/project_{project_id}/mp/data.csv", headers=headers)
+        assert get.content == b"".join(chunks)
+        assert get.headers["ETag"] == f'"{expected_etag}-3"'
+
+        # The upload is gone after completion
+        response = client.put(
+            f"/s3/project_{project_id}/mp/data.csv?partNumber=1&uploadId={upload_id}",
+            content=b"late",
+            headers=headers,
+        )
+        assert response.status_code == 404
+
+    def test_complete_with_wrong_etag_fails(self, client, project_with_auth):
+        """Test that completing with an ETag that doesn't match the part is rejected."""
+        project_id = project_with_auth["project_id"]
+        headers = {"Authorization": f"Bearer {project_with_auth['api_key']}"}
+        upload_id = self._create_upload(client, project_id, "mp/bad.bin", headers)
+        client.put(
+            f"/s3/project_{project_id}/mp/bad.bin?partNumber=1&uploadId={upload_id}",
+            content=b"part",
+            headers=headers,
+        )
+
+        response = client.post(
+            f"/s3/project_{project_id}/mp/bad.bin?uploadId={upload_id}",
+            content=self._complete_xml([(1, '"' + "0" * 32 + '"')]),
+            headers=headers,
+        )
+
+        assert response.status_code == 400
+        assert b"InvalidPart" in response.content
+
+    def test_abort_removes_upload(self, client, project_with_auth):
+        """Test that AbortMultipartUpload discards the upload."""
+        project_id = project_with_auth["project_id"]
+        headers = {"Authorization": f"Bearer {project_with_auth['api_key']}"}
+        upload_id = self._create_upload(client, project_id, "mp/aborted.bin", headers)
+        client.put(
+            f"/s3/project_{project_id}/mp/aborted.bin?partNumber=1&uploadId={upload_id}",
+            content=b"part",
+            headers=headers,
+        )
+
+        response = client.delete(
+            f"/s3/project_{project_id}/mp/aborted.bin?uploadId={upload_id}", headers=headers
+        )
+        assert response.status_code == 204
+
+        response = client.delete(
+            f"/s3/project_{project_id}/mp/aborted.bin?uploadId={upload_id}", headers=headers
+        )
+        assert response.status_code == 404
+
+    def test_uploads_not_listed(self, client, project_with_auth):
+        """Test that in-progress uploads don't appear in ListObjectsV2."""
+        project_id = project_with_auth["project_id"]
+        headers = {"Authorization": f"Bearer {project_with_auth['api_key']}"}
+        upload_id = self._create_upload(client, project_id, "mp/pending.bin", headers)
+        client.put(
+            f"/s3/project_{project_id}/mp/pending.bin?partNumber=1&uploadId={upload_id}",
+            content=b"part",
+            headers=headers,
+        )
+
+        response = client.get(f"/s3/project_{project_id}?list-type=2", headers=headers)
+
+        assert ET.fromstring(response.content).findall(".//Contents") == []
+
+    def test_cleanup_stale_uploads(self, client, project_with_auth):
+        """Test that abandoned uploads are removed by the periodic cleanup."""
+        from src.routers.s3_compat import cleanup_stale_multipart_uploads
+
+        project_id = project_with_auth["project_id"]
+        headers = {"Authorization": f"Bearer {project_with_auth['api_key']}"}
+        upload_id = self._create_upload(client, project_id, "mp/stale.bin", headers)
+
+        assert cleanup_stale_multipart_uploads(max_age_seconds=3600) == 0
+        assert cleanup_stale_multipart_uploads(max_age_seconds=-1) == 1
+
+        response = client.delete(
+            f"/s3/project_{project_id}/mp/stale.bin?uploadId={upload_id}", headers=headers
+        )
+        assert response.status_code == 404
+
+    def test_cleanup_resyncs_active_uploads_gauge(self, client, project_with_auth):
+        """Test that cleanup sets the active-uploads gauge from disk, never below zero."""
+        from src import metrics
+        from src.routers.s3_compat import cleanup_stale_multipart_uploads
+
+        project_id = project_with_auth["project_id"]
+        headers = {"Authorization": f"Bearer {project_with_auth['api_key']}"}
+        self._create_upload(client, project_id, "mp/kept.bin", headers)
+        self._create_upload(client, project_id, "mp/old.bin", headers)
+
+        # As after a restart: uploads on disk, gauge started at 0
+        metrics.S3_MULTIPART_UPLOADS_ACTIVE.set(0)
+        cleanup_stale_multipart_uploads(max_age_seconds=3600)
+        assert metrics.S3_MULTIPART_UPLOADS_ACTIVE._value.get() == 2
+
+        metrics.S3_MULTIPART_UPLOADS_ACTIVE.set(0)
+        assert cleanup_stale_multipart_uploads(max_age_seconds=-1) == 2
+        assert metrics.S3_MULTIPART_UPLOADS_ACTIVE._value.get() == 0
+
+    async def test_cleanup_task_resyncs_gauge_at_startup(self, client, project_with_auth):
+        """Test that the cleanup task re-syncs the gauge before its first sleep."""
+        import asyncio
+
+        from src.main import cleanup_multipart_uploads_task
+
+        project_id = project_with_auth["project_id"]
+        headers = {"Authorization": f"Bearer {project_with_auth['api_key']}"}
+        self._create_upload(client, project_id, "mp/startup.bin", headers)
+        metrics.S3_MULTIPART_UPLOADS_ACTIVE.set(0)
+
+        task = asyncio.create_task(cleanup_multipart_uploads_task())
+        for _ in range(100):
+            if metrics.S3_MULTIPART_UPLOADS_ACTIVE._value.get() == 1:
+                break
+            await asyncio.sleep(0.01)
+        task.cancel()
+        await task
+
+        assert metrics.S3_MULTIPART_UPLOADS_ACTIVE._value.get() == 1
+
 
 class TestAuthentication:
     """Test S3 API authentication."""
@@ -537,3 +537,96 @@ class TestAutoSnapshot:
         data = response.json()
         assert data["total"] == 1
         assert data["snapshots"][0]["snapshot_type"] == "auto_predrop_column"
+
+
+class TestBackgroundAndIncrementalSnapshots:
+    """Test background auto-snapshot export and incremental snapshots."""
+
+    def _snapshots_url(self, data):
+        return f"/projects/{data['project_id']}/branches/default/snapshots"
+
+    def test_restore_auto_snapshot_after_drop(self, client, project_with_data):
+        """Restoring waits for the background export of an auto-snapshot."""
+        response = client.delete(
+            f"/projects/{project_with_data['project_id']}/branches/default/buckets/{project_with_data['bucket_name']}/tables/{project_with_data['table_name']}",
+            headers=project_with_data["project_headers"],
+        )
+        assert response.status_code == 204
+
+        response = client.get(
+            f"{self._snapshots_url(project_with_data)}?type=auto_predrop",
+            headers=project_with_data["project_headers"],
+        )
+        snapshot = response.json()["snapshots"][0]
+        assert snapshot["row_count"] == 3
+
+        response = client.post(
+            f"{self._snapshots_url(project_with_data)}/{snapshot['id']}/restore",
+            json={},
+            headers=project_with_data["project_headers"],
+        )
+        assert response.status_code == 200
+        assert response.json()["row_count"] == 3
+
+        from src.config import settings
+
+        snapshot_dir = settings.snapshots_dir / project_with_data["project_id"] / snapshot["id"]
+        assert (snapshot_dir / "data.parquet").exists()
+        assert not (snapshot_dir / "staging.duckdb").exists()
+
+    def test_incremental_snapshot_reuses_unchanged_parts(self, client, project_with_data):
+        """A second incremental snapshot of an unchanged table rewrites nothing."""
+        import json
+        from src.config import settings
+
+        response = client.put(
+            f"/projects/{project_with_data['project_id']}/branches/default/buckets/{project_with_data['bucket_name']}/tables/{project_with_data['table_name']}/settings/snapshots",
+            json={"storage": {"incremental": True, "part_rows": 1024, "compression": "snappy"}},
+            headers=project_with_data["project_headers"],
+        )
+        assert response.status_code == 200
+
+        snapshot_ids = []
+        for _ in range(2):
+            response = client.post(
+                self._snapshots_url(project_with_data),
+                json={
+                    "bucket": project_with_data["bucket_name"],
+                    "table": project_with_data["table_name"],
+                },
+                headers=project_with_data["project_headers"],
+            )
+            assert response.status_code == 201
+            assert response.json()["row_count"] == 3
+            snapshot_ids.append(response.json()["id"])
+
+        snapshots_dir = settings.snapshots_dir / project_with_data["project_id"]
+        with open(snapshots_dir / snapshot_ids[1] / "metadata.json") as f:
+            manifest = json.load(f)
+        assert manifest["base_snapshot_id"] == snapshot_ids[0]
+        assert manifest["storage"]["compression"] == "snappy"
+        assert all(part["reused_from"] == snapshot_ids[0] for part in manifest["parts"])
+
+        # Deleting the base must not break the snapshot built on it
+        response = client.delete(
+            f"{self._snapshots_url(project_with_data)}/{snapshot_ids[0]}",
+            headers=project_with_data["project_headers"],
+        )
+        assert response.status_code == 204
+
+        response = client.post(
+            f"{self._snapshots_url(project_with_data)}/{snapshot_ids[1]}/restore",
+            json={"target_table": "users_restored"},
+            headers=project_with_data["project_headers"],
+        )
+        assert response.status_code == 200
+        assert response.json()["row_count"] == 3
+
+    def test_invalid_storage_compression_rejected(self, client, project_with_data):
+        """Unknown Parquet codecs are rejected by settings validation."""
+        response = client.put(
+            f"/projects/{project_with_data['project_id']}/settings/snapshots",
+            json={"storage": {"compression": "zip"}},
+            headers=project_with_data["project_headers"],
+        )
+        assert response.status_code == 400
@@ -0,0 +1,154 @@
+"""Tests for the in-process table catalog cache."""
+
+import duckdb
+import pytest
+
+from src import metrics
+from src.database import TABLE_DATA_NAME, TableCatalogCache, table_catalog_cache
+
+
+def _counter_value(counter) -> float:
+    """Read current value of a prometheus counter."""
+    return counter._value.get()
+
+
+@pytest.fixture
+def cached_table(metadata_db, project_db_manager) -> tuple[str, str, str]:
+    """Create a table with a few rows and return (project_id, bucket_name, table_name)."""
+    project_id, bucket_name, table_name = "catalog_proj", "in_c_catalog", "orders"
+
+    table_catalog_cache.clear()
+    metadata_db.create_project(project_id, "Catalog Cache")
+    project_db_manager.create_project_db(project_id)
+    project_db_manager.create_bucket(project_id, bucket_name)
+    project_db_manager.create_table(
+        project_id=project_id,
+        bucket_name=bucket_name,
+        table_name=table_name,
+        columns=[
+            {"name": "id", "type": "INTEGER", "nullable": False},
+            {"name": "amount", "type": "DOUBLE", "nullable": True},
+        ],
+        primary_key=["id"],
+    )
+    with project_db_manager.table_connection(project_id, bucket_name, table_name) as conn:
+        conn.execute(f"INSERT INTO main.{TABLE_DATA_NAME} VALUES (1, 1.5), (2, 2.5)")
+
+    yield project_id, bucket_name, table_name
+
+    table_catalog_cache.clear()
+
+
+class TestTableCatalogCache:
+    """Tests for TableCatalogCache and its use by ProjectDBManager."""
+
+    def test_repeated_get_table_served_from_cache(self, cached_table, project_db_manager):
+        """Test that the second get_table() does not reopen the table file."""
+        project_db_manager.get_table(*cached_table)
+        misses_before = _counter_value(metrics.TABLE_CATALOG_CACHE_MISSES)
+        hits_before = _counter_value(metrics.TABLE_CATALOG_CACHE_HITS)
+
+        table = project_db_manager.get_table(*cached_table)
+
+        assert table["row_count"] == 2
+        assert table["primary_key"] == ["id"]
+        assert _counter_value(metrics.TABLE_CATALOG_CACHE_MISSES) == misses_before
+        assert _counter_value(metrics.TABLE_CATALOG_CACHE_HITS) == hits_before + 1
+
+    def test_list_tables_uses_cache(self, cached_table, project_db_manager):
+        """Test that listing a bucket twice only reads table files once."""
+        project_id, bucket_name, _ = cached_table
+        project_db_manager.list_tables(project_id, bucket_name)
+        misses_before = _counter_value(metrics.TABLE_CATALOG_CACHE_MISSES)
+
+        tables = project_db_manager.list_tables(project_id, bucket_name)
+
+        assert [t["name"] for t in tables] == ["orders"]
+        assert _counter_value(metrics.TABLE_CATALOG_CACHE_MISSES) == misses_before
+
+    def test_returned_dict_is_a_copy(self, cached_table, project_db_manager):
+        """Test that mutating a returned dict doesn't leak into the cache."""
+        table = project_db_manager.get_table(*cached_table)
+        table["source"] = "main"
+        table["columns"].clear()
+
+        again = project_db_manager.get_table(*cached_table)
+
+        assert "source" not in again
+        assert len(again["columns"]) == 2
+
+    def test_schema_change_invalidates(self, cached_table, project_db_manager):
+        """Test that schema operations are visible immediately."""
+        project_db_manager.get_table(*cached_table)
+
+        table = project_db_manager.add_column(*cached_table, "note", "VARCHAR")
+
+        assert [c["name"] for c in table["columns"]] == ["id", "amount", "note"]
+
+    def test_delete_rows_invalidates(self, cached_table, project_db_manager):
+        """Test that deleting rows refreshes the cached row count."""
+        project_db_manager.get_table(*cached_table)
+
+        project_db_manager.delete_table_rows(*cached_table, where_clause="id = 1")
+
+        assert project_db_manager.get_table(*cached_table)["row_count"] == 1
+
+    def test_external_write_detected_by_signature(self, cached_table, project_db_manager):
+        """Test that writes bypassing invalidation are caught by file mtime/size."""
+        project_db_manager.get_table(*cached_table)
+        table_path = project_db_manager.get_table_path(*cached_table)
+
+        conn = duckdb.connect(str(table_path))
+        try:
+            conn.execute(
+                f"INSERT INTO main.{TABLE_DATA_NAME} SELECT i, i FROM range(10, 5000) t(i)"
+            )
+        finally:
+            conn.close()
+
+        assert project_db_manager.get_table(*cached_table)["row_count"] == 4992
+
+    def test_deleted_table_not_served(self, cached_table, project_db_manager):
+        """Test that a deleted table is not returned from cache."""
+        project_db_manager.get_table(*cached_table)
+
+        project_db_manager.delete_table(*cached_table)
+
+        assert project_db_manager.get_table(*cached_table) is None
+
+    def test_branch_listing_cached_and_invalidated_by_cow(
+        self, cached_table, metadata_db, project_db_manager
+    ):
+        """Test list_tables_with_source caching across a CoW copy."""
+        project_id, bucket_name, table_name = cached_table
+        branch_id = "catalog_branch"
+
+        tables = project_db_manager.list_tables_with_source(project_id, branch_id, bucket_name)
+        assert tables[0]["source"] == "main"
+
+        project_db_manager.copy_table_to_branch(project_id, branch_id, bucket_name, table_name)
+        with project_db_manager.branch_table_connection(
+            project_id, branch_id, bucket_name, table_name
+        ) as conn:
+            conn.execute(f"DELETE FROM main.{TABLE_DATA_NAME} WHERE id = 2")
+
+        tables = project_db_manager.list_tables_with_source(project_id, branch_id, bucket_name)
+        assert tables[0]["source"] == "branch"
+        assert tables[0]["row_count"] == 1
+        # Main table is untouched
+        assert project_db_manager.get_table(*cached_table)["row_count"] == 2
+
+    def test_lru_eviction(self, tmp_path):
+        """Test that the cache is bounded."""
+        cache = TableCatalogCache(max_entries=2)
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"t{i}.duckdb"
+            path.write_bytes(b"x")
+            paths.append(path)
+            cache.get_or_load(path, "object_info", lambda i=i: {"name": f"t{i}"})
+
+        assert len(cache) == 2
+        calls = []
+        cache.get_or_load(paths[0], "object_info", lambda: calls.append(1) or {"name": "t0"})
+        assert calls == [1]
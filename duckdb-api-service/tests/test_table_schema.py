@@ -702,6 +702,258 @@ class TestProfileTable:
             assert "max" in stat
             assert "approx_unique" in stat
 
+    def test_profile_full_mode(self, client: TestClient, initialized_backend, admin_headers):
+        """Full mode returns distributions, outliers and patterns for every column."""
+        client.post("/projects", json={"id": "profile_4"}, headers=admin_headers)
+        client.post("/projects/profile_4/branches/default/buckets", json={"name": "test_bucket"}, headers=admin_headers)
+        client.post(
+            "/projects/profile_4/branches/default/buckets/test_bucket/tables",
+            json={
+                "name": "test_table",
+                "columns": [
+                    {"name": "id", "type": "INTEGER"},
+                    {"name": "email", "type": "VARCHAR"},
+                    {"name": "amount", "type": "DOUBLE"},
+                ],
+            },
+            headers=admin_headers,
+        )
+
+        from src.database import project_db_manager
+        import duckdb
+
+        table_path = project_db_manager.get_table_path("profile_4", "test_bucket", "test_table")
+        conn = duckdb.connect(str(table_path))
+        try:
+            conn.execute("""
+                INSERT INTO main.data
+                SELECT i, 'user' || i || '@example.com', CASE WHEN i = 20 THEN 1000.0 ELSE i END
+                FROM range(1, 21) t(i)
+            """)
+        finally:
+            conn.close()
+
+        response = client.post(
+            "/projects/profile_4/branches/default/buckets/test_bucket/tables/test_table/profile?mode=full",
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 200
+        stats = {stat["column_name"]: stat for stat in response.json()["statistics"]}
+
+        assert stats["id"]["approx_unique"] == 20
+        assert stats["id"]["cardinality_class"] == "unique"
+        assert stats["id"]["avg"] == 10.5
+        assert stats["id"]["q50"] == 10.5
+        assert stats["id"]["histogram"]
+
+        assert stats["amount"]["outlier_count"] == 1
+        assert stats["amount"]["max"] == 1000.0
+
+        assert stats["email"]["min_length"] == len("user1@example.com")
+        assert stats["email"]["detected_patterns"] == [
+            {"pattern": "email", "match_count": 20, "match_percentage": 100.0}
+        ]
+        assert stats["id"]["detected_patterns"] is None
+
+    def test_profile_basic_mode_confirms_unique_columns(
+        self, client: TestClient, initialized_backend, admin_headers
+    ):
+        """Basic mode estimates distinct counts but still reports exact unique columns."""
+        client.post("/projects", json={"id": "profile_5"}, headers=admin_headers)
+        client.post("/projects/profile_5/branches/default/buckets", json={"name": "test_bucket"}, headers=admin_headers)
+        client.post(
+            "/projects/profile_5/branches/default/buckets/test_bucket/tables",
+            json={
+                "name": "test_table",
+                "columns": [
+                    {"name": "id", "type": "BIGINT"},
+                    {"name": "bucket", "type": "VARCHAR"},
+                ],
+            },
+            headers=admin_headers,
+        )
+
+        from src.database import project_db_manager
+        import duckdb
+
+        table_path = project_db_manager.get_table_path("profile_5", "test_bucket", "test_table")
+        conn = duckdb.connect(str(table_path))
+        try:
+            conn.execute("INSERT INTO main.data SELECT i, 'b' || (i % 3) FROM range(1000) t(i)")
+        finally:
+            conn.close()
+
+        response = client.post(
+            "/projects/profile_5/branches/default/buckets/test_bucket/tables/test_table/profile",
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        stats = {stat["column_name"]: stat for stat in data["statistics"]}
+        assert stats["id"]["approx_unique"] == 1000
+        assert stats["id"]["cardinality_class"] == "unique"
+        assert stats["bucket"]["approx_unique"] == 3
+        assert stats["bucket"].get("detected_patterns") is None
+        assert any(
+            issue["column"] == "id" and issue["type"] == "pk_candidate"
+            for issue in data["quality_issues"]
+        )
+
+    def test_profile_is_cached_until_table_changes(
+        self, client: TestClient, initialized_backend, admin_headers
+    ):
+        """A repeated profile request returns the stored profile until the table is written."""
+        client.post("/projects", json={"id": "profile_6"}, headers=admin_headers)
+        client.post("/projects/profile_6/branches/default/buckets", json={"name": "test_bucket"}, headers=admin_headers)
+        client.post(
+            "/projects/profile_6/branches/default/buckets/test_bucket/tables",
+            json={
+                "name": "test_table",
+                "columns": [
+                    {"name": "id", "type": "INTEGER"},
+                    {"name": "name", "type": "VARCHAR"},
+                    {"name": "amount", "type": "DOUBLE"},
+                    {"name": "active", "type": "BOOLEAN"},
+                ],
+            },
+            headers=admin_headers,
+        )
+        self._insert_profile_data(client, "profile_6", "test_bucket", "test_table")
+        url = "/projects/profile_6/branches/default/buckets/test_bucket/tables/test_table/profile"
+
+        first = client.post(url, headers=admin_headers).json()
+        assert first["cached"] is False
+        assert first["sampled"] is False
+        assert first["profiled_rows"] == 5
+
+        second = client.post(url, headers=admin_headers).json()
+        assert second["cached"] is True
+        assert second["profiled_at"] == first["profiled_at"]
+        assert second["statistics"] == first["statistics"]
+
+        # Other modes are stored separately
+        assert client.post(f"{url}?mode=full", headers=admin_headers).json()["cached"] is False
+
+        # refresh recomputes
+        assert client.post(f"{url}?refresh=true", headers=admin_headers).json()["cached"] is False
+
+        # Writing the table invalidates the stored profile
+        response = client.request(
+            "DELETE",
+            "/projects/profile_6/branches/default/buckets/test_bucket/tables/test_table/rows",
+            json={"where_clause": "id = 5"},
+            headers=admin_headers,
+        )
+        assert response.status_code == 200
+        third = client.post(url, headers=admin_headers).json()
+        assert third["cached"] is False
+        assert third["row_count"] == 4
+
+    def test_profile_sampled(self, client: TestClient, initialized_backend, admin_headers):
+        """sample_size profiles a row sample and reports its margin of error."""
+        client.post("/projects", json={"id": "profile_7"}, headers=admin_headers)
+        client.post("/projects/profile_7/branches/default/buckets", json={"name": "test_bucket"}, headers=admin_headers)
+        client.post(
+            "/projects/profile_7/branches/default/buckets/test_bucket/tables",
+            json={
+                "name": "test_table",
+                "columns": [
+                    {"name": "id", "type": "BIGINT"},
+                    {"name": "flag", "type": "VARCHAR"},
+                ],
+            },
+            headers=admin_headers,
+        )
+
+        from src.database import project_db_manager
+        import duckdb
+
+        table_path = project_db_manager.get_table_path("profile_7", "test_bucket", "test_table")
+        conn = duckdb.connect(str(table_path))
+        try:
+            conn.execute(
+                "INSERT INTO main.data SELECT i, CASE WHEN i % 2 = 0 THEN NULL ELSE 'x' END FROM range(10000) t(i)"
+            )
+        finally:
+            conn.close()
+
+        response = client.post(
+            "/projects/profile_7/branches/default/buckets/test_bucket/tables/test_table/profile?sample_size=1000",
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["row_count"] == 10000
+        assert data["sampled"] is True
+        assert data["profiled_rows"] == 1000
+        assert 0 < data["margin_of_error"] < 5
+        stats = {stat["column_name"]: stat for stat in data["statistics"]}
+        assert stats["id"]["count"] == 1000
+        assert abs(stats["flag"]["null_percentage"] - 50) < 3 * data["margin_of_error"]
+        # Uniqueness of a sample is not reported as a primary key candidate
+        assert not any(issue["type"] == "pk_candidate" for issue in data["quality_issues"])
+
+        # A sample larger than the table profiles the whole table
+        response = client.post(
+            "/projects/profile_7/branches/default/buckets/test_bucket/tables/test_table/profile?sample_size=20000",
+            headers=admin_headers,
+        )
+        assert response.json()["sampled"] is False
+        assert response.json()["margin_of_error"] is None
+
+    def test_profile_correlation_matrix(
+        self, client: TestClient, initialized_backend, admin_headers, monkeypatch
+    ):
+        """Quality mode returns the correlation matrix of the first N numeric columns."""
+        from src.config import settings
+
+        client.post("/projects", json={"id": "profile_8"}, headers=admin_headers)
+        client.post("/projects/profile_8/branches/default/buckets", json={"name": "test_bucket"}, headers=admin_headers)
+        client.post(
+            "/projects/profile_8/branches/default/buckets/test_bucket/tables",
+            json={
+                "name": "test_table",
+                "columns": [
+                    {"name": "x", "type": "INTEGER"},
+                    {"name": "double_x", "type": "DOUBLE"},
+                    {"name": "neg_x", "type": "BIGINT"},
+                    {"name": "constant", "type": "INTEGER"},
+                    {"name": "extra", "type": "INTEGER"},
+                ],
+            },
+            headers=admin_headers,
+        )
+
+        from src.database import project_db_manager
+        import duckdb
+
+        table_path = project_db_manager.get_table_path("profile_8", "test_bucket", "test_table")
+        conn = duckdb.connect(str(table_path))
+        try:
+            conn.execute("INSERT INTO main.data SELECT i, i * 2.0, -i, 7, i % 3 FROM range(1, 51) t(i)")
+        finally:
+            conn.close()
+
+        monkeypatch.setattr(settings, "profile_max_correlation_columns", 4)
+        response = client.post(
+            "/projects/profile_8/branches/default/buckets/test_bucket/tables/test_table/profile?mode=quality",
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        matrix = data["correlation_matrix"]
+        assert matrix["columns"] == ["x", "double_x", "neg_x", "constant"]
+        assert matrix["values"][0] == [1.0, 1.0, -1.0, None]
+        assert matrix["values"][2][1] == -1.0
+        assert matrix["values"][3][3] == 1.0
+
+        pairs = {(c["column1"], c["column2"]): c["correlation"] for c in data["correlations"]}
+        assert pairs == {("x", "double_x"): 1.0, ("x", "neg_x"): -1.0, ("double_x", "neg_x"): -1.0}
+
     def test_profile_empty_table(self, client: TestClient, initialized_backend, admin_headers):
         """Test profiling an empty table."""
         client.post("/projects", json={"id": "profile_2"}, headers=admin_headers)
@@ -0,0 +1,147 @@
+"""Tests for persisted per-table stats and the stats reconciler."""
+
+import duckdb
+import pytest
+
+from src import metrics
+from src.database import TABLE_DATA_NAME, table_catalog_cache
+
+
+def _lookups(result: str) -> float:
+    """Read current value of the table stats lookup counter."""
+    return metrics.TABLE_STATS_LOOKUPS.labels(result=result)._value.get()
+
+
+@pytest.fixture
+def stats_table(metadata_db, project_db_manager) -> tuple[str, str, str]:
+    """Create a table with persisted stats and return (project_id, bucket_name, table_name)."""
+    project_id, bucket_name, table_name = "stats_proj", "in_c_stats", "events"
+
+    table_catalog_cache.clear()
+    metadata_db.create_project(project_id, "Table Stats")
+    project_db_manager.create_project_db(project_id)
+    project_db_manager.create_bucket(project_id, bucket_name)
+    project_db_manager.create_table(
+        project_id=project_id,
+        bucket_name=bucket_name,
+        table_name=table_name,
+        columns=[
+            {"name": "id", "type": "INTEGER", "nullable": False},
+            {"name": "kind", "type": "VARCHAR", "nullable": True},
+        ],
+        primary_key=["id"],
+    )
+
+    yield project_id, bucket_name, table_name
+
+    table_catalog_cache.clear()
+
+
+def _insert_rows(project_db_manager, table: tuple[str, str, str], count: int) -> None:
+    """Insert rows directly, bypassing the instrumented write paths."""
+    table_path = project_db_manager.get_table_path(*table)
+    conn = duckdb.connect(str(table_path))
+    try:
+        conn.execute(
+            f"INSERT INTO main.{TABLE_DATA_NAME} SELECT i, 'k' FROM range({count}) t(i)"
+        )
+    finally:
+        conn.close()
+
+
+class TestPersistedTableStats:
+    """Tests for table_stats maintenance and use on reads."""
+
+    def test_create_table_records_stats(self, stats_table, metadata_db, project_db_manager):
+        """Test that a new table has stats without any read."""
+        stats = metadata_db.get_table_stats("project_stats_proj/in_c_stats/events.duckdb")
+
+        assert stats["row_count"] == 0
+        assert [c["name"] for c in stats["columns"]] == ["id", "kind"]
+        assert stats["primary_key"] == ["id"]
+
+    def test_get_table_served_from_stats(self, stats_table, project_db_manager):
+        """Test that get_table uses fresh stats instead of the data file."""
+        table_catalog_cache.clear()
+        fresh_before = _lookups("fresh")
+
+        table = project_db_manager.get_table(*stats_table)
+
+        assert _lookups("fresh") == fresh_before + 1
+        assert table["row_count"] == 0
+        assert table["primary_key"] == ["id"]
+        assert table["columns"][0] == {
+            "name": "id",
+            "type": "INTEGER",
+            "nullable": False,
+            "ordinal_position": 1,
+        }
+        assert table["size_bytes"] == project_db_manager.get_table_path(*stats_table).stat().st_size
+
+    def test_write_paths_update_stats(self, stats_table, project_db_manager):
+        """Test that row deletes and schema ops keep stats current."""
+        _insert_rows(project_db_manager, stats_table, 10)
+
+        project_db_manager.delete_table_rows(*stats_table, where_clause="id < 3")
+        project_db_manager.add_column(*stats_table, "score", "DOUBLE")
+        table_catalog_cache.clear()
+        fresh_before = _lookups("fresh")
+
+        table = project_db_manager.get_table(*stats_table)
+
+        assert _lookups("fresh") == fresh_before + 1
+        assert table["row_count"] == 7
+        assert [c["name"] for c in table["columns"]] == ["id", "kind", "score"]
+
+    def test_untracked_write_falls_back_to_file(self, stats_table, project_db_manager):
+        """Test that stats are ignored when the file changed behind our back."""
+        _insert_rows(project_db_manager, stats_table, 5)
+        stale_before = _lookups("stale")
+
+        table = project_db_manager.get_table(*stats_table)
+
+        assert _lookups("stale") == stale_before + 1
+        assert table["row_count"] == 5
+
+    def test_preview_uses_stats_row_count(self, stats_table, project_db_manager):
+        """Test that preview total_row_count comes from stats when fresh."""
+        project_db_manager.delete_table_rows(*stats_table, where_clause="id < 0")
+
+        preview = project_db_manager.get_table_preview(*stats_table, limit=10)
+
+        assert preview["total_row_count"] == 0
+
+    def test_reconciler_repairs_drift(self, stats_table, metadata_db, project_db_manager):
+        """Test that the reconciler rewrites stale stats."""
+        _insert_rows(project_db_manager, stats_table, 3)
+
+        result = project_db_manager.reconcile_table_stats()
+
+        assert result["repaired"] == 1
+        stats = metadata_db.get_table_stats("project_stats_proj/in_c_stats/events.duckdb")
+        assert stats["row_count"] == 3
+        assert project_db_manager.reconcile_table_stats()["repaired"] == 0
+
+    def test_reconciler_removes_orphans(self, stats_table, metadata_db, project_db_manager):
+        """Test that stats for files deleted outside the API are removed."""
+        project_db_manager.get_table_path(*stats_table).unlink()
+
+        result = project_db_manager.reconcile_table_stats()
+
+        assert result["removed"] == 1
+        assert metadata_db.get_table_stats("project_stats_proj/in_c_stats/events.duckdb") is None
+
+    def test_delete_table_forgets_stats(self, stats_table, metadata_db, project_db_manager):
+        """Test that deleting a table removes its stats."""
+        project_db_manager.delete_table(*stats_table)
+
+        assert metadata_db.get_table_stats("project_stats_proj/in_c_stats/events.duckdb") is None
+
+    def test_reconciler_skips_workspaces(self, stats_table, project_db_manager):
+        """Test that workspace files are not treated as tables."""
+        project_id = stats_table[0]
+        project_db_manager.create_workspace_db(project_id, "ws_stats")
+
+        result = project_db_manager.reconcile_table_stats()
+
+        assert result["checked"] == 1
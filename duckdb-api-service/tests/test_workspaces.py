@@ -700,6 +700,151 @@ class TestWorkspaceLoad:
         result = data["loaded"][0]
         assert result["rows"] == 0  # No rows loaded for missing table
 
+    def test_load_table_as_view(self, client, project_with_tables):
+        """mode=view creates a view over the source without copying data."""
+        import duckdb
+        from src.database import project_db_manager
+
+        project_id = project_with_tables["project_id"]
+        response = client.post(
+            f"/projects/{project_id}/workspaces",
+            json={"name": "view-test"},
+            headers=project_with_tables["project_headers"],
+        )
+        assert response.status_code == 201
+        workspace_id = response.json()["id"]
+
+        response = client.post(
+            f"/projects/{project_id}/workspaces/{workspace_id}/load",
+            json={
+                "tables": [
+                    {"source": f"{project_with_tables['bucket_name']}.orders", "mode": "view"},
+                    {
+                        "source": f"{project_with_tables['bucket_name']}.orders",
+                        "destination": "big_orders",
+                        "mode": "view",
+                        "where": "amount > 80",
+                    },
+                ]
+            },
+            headers=project_with_tables["project_headers"],
+        )
+        assert response.status_code == 200
+        loaded = response.json()["loaded"]
+        assert [(r["destination"], r["mode"], r["rows"]) for r in loaded] == [
+            ("orders", "view", 3),
+            ("big_orders", "view", 2),
+        ]
+
+        # Views stay readable after the loading connection is gone
+        response = client.get(
+            f"/projects/{project_id}/workspaces/{workspace_id}",
+            headers=project_with_tables["project_headers"],
+        )
+        objects = {o["name"]: o for o in response.json()["workspace_objects"]}
+        assert objects["orders"]["type"] == "view"
+        assert objects["orders"]["rows"] == 3
+        assert objects["big_orders"]["rows"] == 2
+
+        # Any new connection re-ATTACHes the view sources
+        workspace_path = project_db_manager.get_workspace_path(project_id, workspace_id)
+        conn = duckdb.connect(str(workspace_path))
+        try:
+            aliases = project_db_manager.attach_workspace_sources(conn, project_id)
+            assert aliases == [f"{project_with_tables['bucket_name']}_orders"]
+            assert conn.execute("SELECT SUM(amount) FROM orders").fetchone()[0] == 425.75
+            # No table data was written into the workspace
+            assert conn.execute(
+                "SELECT COUNT(*) FROM duckdb_tables() WHERE table_name = 'orders'"
+            ).fetchone()[0] == 0
+        finally:
+            conn.close()
+
+    def test_view_source_attach_failure_is_skipped(self, client, project_with_tables):
+        """A view source that can't be attached doesn't fail the workspace listing."""
+        import duckdb
+        from src.database import project_db_manager
+
+        project_id = project_with_tables["project_id"]
+        response = client.post(
+            f"/projects/{project_id}/workspaces",
+            json={"name": "view-conflict-test"},
+            headers=project_with_tables["project_headers"],
+        )
+        workspace_id = response.json()["id"]
+        response = client.post(
+            f"/projects/{project_id}/workspaces/{workspace_id}/load",
+            json={
+                "tables": [
+                    {"source": f"{project_with_tables['bucket_name']}.orders", "mode": "view"}
+                ]
+            },
+            headers=project_with_tables["project_headers"],
+        )
+        assert response.json()["loaded"][0]["rows"] == 3
+
+        # Source table held open for writing in-process (e.g. an import)
+        source_path = project_db_manager.get_table_path(
+            project_id, project_with_tables["bucket_name"], "orders"
+        )
+        writer = duckdb.connect(str(source_path))
+        try:
+            response = client.get(
+                f"/projects/{project_id}/workspaces/{workspace_id}",
+                headers=project_with_tables["project_headers"],
+            )
+        finally:
+            writer.close()
+
+        assert response.status_code == 200
+        objects = {o["name"]: o for o in response.json()["workspace_objects"]}
+        assert objects["orders"] == {"name": "orders", "type": "view", "rows": 0}
+
+    def test_load_clone_replaces_view(self, client, project_with_tables):
+        """mode=clone writes only the filtered/projected rows, replacing a view."""
+        project_id = project_with_tables["project_id"]
+        response = client.post(
+            f"/projects/{project_id}/workspaces",
+            json={"name": "clone-test"},
+            headers=project_with_tables["project_headers"],
+        )
+        assert response.status_code == 201
+        workspace_id = response.json()["id"]
+        load_url = f"/projects/{project_id}/workspaces/{workspace_id}/load"
+        source = f"{project_with_tables['bucket_name']}.orders"
+
+        response = client.post(
+            load_url,
+            json={"tables": [{"source": source, "mode": "view"}]},
+            headers=project_with_tables["project_headers"],
+        )
+        assert response.json()["loaded"][0]["rows"] == 3
+
+        response = client.post(
+            load_url,
+            json={
+                "tables": [
+                    {
+                        "source": source,
+                        "mode": "clone",
+                        "columns": ["id", "amount"],
+                        "where": "amount < 200",
+                    }
+                ]
+            },
+            headers=project_with_tables["project_headers"],
+        )
+        result = response.json()["loaded"][0]
+        assert result["mode"] == "clone"
+        assert result["rows"] == 2
+
+        response = client.get(
+            f"/projects/{project_id}/workspaces/{workspace_id}",
+            headers=project_with_tables["project_headers"],
+        )
+        objects = {o["name"]: o for o in response.json()["workspace_objects"]}
+        assert objects["orders"] == {"name": "orders", "type": "table", "rows": 2}
+
 
 class TestWorkspaceCredentialsReset:
     """Test resetting workspace credentials."""
@@ -0,0 +1,183 @@
+"""Tests for TableWriteQueue (per-table write queue with batching, ADR-005)."""
+
+import threading
+
+import duckdb
+import pytest
+
+from src import metrics
+from src.database import TABLE_DATA_NAME, TableWriteQueue, project_db_manager
+
+
+def _queue_depth(project_id: str) -> float:
+    return metrics.WRITE_QUEUE_DEPTH.labels(project_id=project_id)._value.get()
+
+
+def _create_table(path):
+    with duckdb.connect(str(path)) as conn:
+        conn.execute(f"CREATE TABLE main.{TABLE_DATA_NAME} (id INTEGER PRIMARY KEY)")
+    return path
+
+
+@pytest.fixture
+def table_path(tmp_path):
+    """Create a standalone table file with an id column."""
+    return _create_table(tmp_path / "events.duckdb")
+
+
+def _insert(value: int):
+    """Job inserting one row; returns the connection it ran on."""
+
+    def job(conn):
+        conn.execute(f"INSERT INTO main.{TABLE_DATA_NAME} VALUES ({value})")
+        return conn
+
+    return job
+
+
+def _count(table_path) -> int:
+    with duckdb.connect(str(table_path), read_only=True) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM main.{TABLE_DATA_NAME}").fetchone()[0]
+
+
+def _hold_worker(queue: TableWriteQueue, table_path, release: threading.Event):
+    """Submit a job that blocks the table's worker until release is set."""
+    started = threading.Event()
+
+    def job(conn):
+        started.set()
+        release.wait(5)
+
+    future = queue.submit("wq_proj", "in_c_wq", "events", table_path, job)
+    assert started.wait(5)
+    return future
+
+
+class TestTableWriteQueue:
+    """Unit tests for TableWriteQueue."""
+
+    def test_run_commits_job(self, table_path):
+        """Test that a queued job runs and its changes are committed."""
+        queue = TableWriteQueue()
+
+        queue.run("wq_proj", "in_c_wq", "events", table_path, _insert(1))
+
+        assert _count(table_path) == 1
+
+    def test_compatible_jobs_share_transaction(self, table_path):
+        """Test that consecutive jobs with the same batch key run on one connection."""
+        queue = TableWriteQueue()
+        release = threading.Event()
+        blocker = _hold_worker(queue, table_path, release)
+
+        futures = [
+            queue.submit("wq_proj", "in_c_wq", "events", table_path, _insert(i), "append")
+            for i in range(3)
+        ]
+        assert queue.depth(table_path) == 3
+
+        release.set()
+        blocker.result(timeout=5)
+        connections = {id(f.result(timeout=5)) for f in futures}
+
+        assert len(connections) == 1
+        assert _count(table_path) == 3
+        assert queue.depth(table_path) == 0
+
+    def test_unbatched_jobs_run_separately(self, table_path):
+        """Test that jobs without a batch key each get their own transaction."""
+        queue = TableWriteQueue()
+        release = threading.Event()
+        blocker = _hold_worker(queue, table_path, release)
+
+        futures = [
+            queue.submit("wq_proj", "in_c_wq", "events", table_path, _insert(i))
+            for i in range(2)
+        ]
+
+        release.set()
+        blocker.result(timeout=5)
+        results = [f.result(timeout=5) for f in futures]
+
+        assert results[0] is not results[1]
+        assert _count(table_path) == 2
+
+    def test_failed_batch_retried_individually(self, table_path):
+        """Test that one failing job does not fail the rest of its batch."""
+        queue = TableWriteQueue()
+        release = threading.Event()
+        blocker = _hold_worker(queue, table_path, release)
+
+        ok_first = queue.submit("wq_proj", "in_c_wq", "events", table_path, _insert(1), "append")
+        duplicate = queue.submit("wq_proj", "in_c_wq", "events", table_path, _insert(1), "append")
+        ok_last = queue.submit("wq_proj", "in_c_wq", "events", table_path, _insert(2), "append")
+
+        release.set()
+        blocker.result(timeout=5)
+
+        ok_first.result(timeout=5)
+        ok_last.result(timeout=5)
+        with pytest.raises(duckdb.ConstraintException):
+            duplicate.result(timeout=5)
+        assert _count(table_path) == 2
+
+    def test_depth_metric_tracks_queue(self, table_path):
+        """Test that WRITE_QUEUE_DEPTH rises while jobs wait and returns to baseline."""
+        queue = TableWriteQueue()
+        depth_before = _queue_depth("wq_proj")
+        release = threading.Event()
+        blocker = _hold_worker(queue, table_path, release)
+
+        future = queue.submit("wq_proj", "in_c_wq", "events", table_path, _insert(1))
+        assert _queue_depth("wq_proj") == depth_before + 1
+
+        release.set()
+        blocker.result(timeout=5)
+        future.result(timeout=5)
+
+        assert _queue_depth("wq_proj") == depth_before
+
+    def test_branch_and_main_jobs_write_their_own_files(self, tmp_path, table_path):
+        """Test that a branch job queued behind a main job lands in the branch file."""
+        branch_path = _create_table(tmp_path / "branch_events.duckdb")
+        queue = TableWriteQueue()
+        release = threading.Event()
+        blocker = _hold_worker(queue, table_path, release)
+
+        # Same project/bucket/table as the running main job, different file
+        branch_job = queue.submit("wq_proj", "in_c_wq", "events", branch_path, _insert(1))
+        main_job = queue.submit("wq_proj", "in_c_wq", "events", table_path, _insert(2))
+
+        release.set()
+        blocker.result(timeout=5)
+        branch_job.result(timeout=5)
+        main_job.result(timeout=5)
+
+        with duckdb.connect(str(branch_path), read_only=True) as conn:
+            assert conn.execute(f"SELECT id FROM main.{TABLE_DATA_NAME}").fetchall() == [(1,)]
+        with duckdb.connect(str(table_path), read_only=True) as conn:
+            assert conn.execute(f"SELECT id FROM main.{TABLE_DATA_NAME}").fetchall() == [(2,)]
+
+    def test_reported_row_count_skips_recount(self, table_path, monkeypatch):
+        """Test that a row count reported by the job is passed to the table stats."""
+        seen = []
+        collect = project_db_manager.collect_table_stats
+
+        def spy(conn, row_count=None):
+            seen.append(row_count)
+            return collect(conn, row_count=row_count)
+
+        monkeypatch.setattr(project_db_manager, "collect_table_stats", spy)
+        queue = TableWriteQueue()
+
+        def job(conn):
+            conn.execute(f"INSERT INTO main.{TABLE_DATA_NAME} VALUES (1), (2)")
+            return {"total_rows": 2}
+
+        queue.run(
+            "wq_proj", "in_c_wq", "events", table_path, job,
+            row_count=lambda result: result["total_rows"],
+        )
+        queue.run("wq_proj", "in_c_wq", "events", table_path, _insert(3))
+
+        assert seen == [2, None]